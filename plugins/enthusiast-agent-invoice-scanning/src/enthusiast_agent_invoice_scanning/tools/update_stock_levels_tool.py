@@ -30,6 +30,7 @@ class UpdateStockLevelsTool(BaseLLMTool):
     )
     ARGS_SCHEMA = StockUpdateBatchInput
     RETURN_DIRECT = False
+    THREAD_SAFE = False
 
     def run(self, items: List[StockUpdateItem]) -> str:
         connector = self._injector.ecommerce_platform_connector
@@ -41,15 +42,19 @@ class UpdateStockLevelsTool(BaseLLMTool):
         response = {}
         success_map: StockUpdateMemoryEntry = {}
 
-        for item in items:
-            try:
-                success = connector.update_stock(item.sku, item.quantity)
-                response[item.sku] = "Stock updated successfully" if success else "Failed to update stock"
-                success_map[item.sku] = success
-            except Exception as e:
-                logger.error("Failed to update stock for SKU %s: %s", item.sku, e)
-                response[item.sku] = f"Error: {e}"
-                success_map[item.sku] = False
+        try:
+            results = connector.update_stock_many([(item.sku, item.quantity) for item in items])
+        except Exception as e:
+            results = {item.sku: e for item in items}
+
+        for sku, result in results.items():
+            if isinstance(result, Exception):
+                logger.error("Failed to update stock for SKU %s: %s", sku, result)
+                response[sku] = f"Error: {result}"
+                success_map[sku] = False
+            else:
+                response[sku] = "Stock updated successfully" if result else "Failed to update stock"
+                success_map[sku] = result
 
         self._injector.tool_scratchpad.record(self.NAME, success_map)
         return json.dumps(response)
@@ -18,6 +18,7 @@ class PlaceOrderTool(BaseLLMTool):
     DESCRIPTION = "It's tool for placing order and returning order URL based on products entry_ids"
     ARGS_SCHEMA = PlaceOrderToolInput
     RETURN_DIRECT = False
+    THREAD_SAFE = False
 
     def __init__(
         self,
@@ -1,19 +1,32 @@
-from typing import Any
+import functools
+import json
+import threading
+from typing import Any, Callable, Hashable, Optional
 
 from enthusiast_agent_tools import FileListTool, FileRetrievalTool
 from enthusiast_common.agents import BaseAgent
 from langchain.agents import create_agent
 from langchain_core.messages import AIMessage, BaseMessage, HumanMessage
+from langchain_core.runnables.config import run_in_executor
 from langchain_core.tools import BaseTool
 from langgraph.graph.state import CompiledStateGraph
 
 from enthusiast_agent_tool_calling.context_window_builder import ContextWindowBuilder
+from enthusiast_agent_tool_calling.turn_binding import (
+    TurnBinding,
+    TurnBindingMiddleware,
+    UnboundChatModel,
+    build_unbound_tool,
+    compiled_graph_cache,
+)
 
 MAX_HISTORY_TOKENS = 3000
 
 
 class BaseToolCallingAgent(BaseAgent):
     DEFAULT_FILE_TOOLS = [FileListTool, FileRetrievalTool]
+    # Tool calls requested in a single model response run concurrently, at most this many at a time.
+    MAX_CONCURRENT_TOOL_CALLS = 4
 
     def __init_subclass__(cls, **kwargs):
         super().__init_subclass__(**kwargs)
@@ -28,24 +41,74 @@ class BaseToolCallingAgent(BaseAgent):
         history = self._injector.chat_history
         compactor = self._injector.memory_compactor
 
-        agent = self._build_agent()
-        context_messages = self._build_context_messages()
-        input_messages = context_messages + [HumanMessage(content=input_text)]
-        result = agent.invoke({"messages": input_messages}, config=self._build_invoke_config())
-
-        new_messages = result["messages"][len(context_messages):]
-        final_message = next(
-            m for m in reversed(new_messages)
-            if isinstance(m, AIMessage) and not m.tool_calls
+        tools = self._build_tools()
+        agent = self._build_agent(tools)
+        result = agent.invoke(
+            self._build_turn_input(input_text),
+            config=self._build_invoke_config(),
+            context=self._build_turn_binding(tools),
         )
 
+        new_messages = self._get_turn_messages(result["messages"])
+        final_message = self._get_final_message(new_messages)
+
         history.add_messages(new_messages)
+        if checkpoint := self._injector.turn_checkpoint:
+            checkpoint.saver.delete_thread(checkpoint.thread_id)
 
         if compactor:
             compactor.compact_if_needed()
 
         return final_message.text
 
+    async def aget_answer(self, input_text: str) -> str:
+        """Runs the turn with the graph's async API, so the model call doesn't hold a thread.
+
+        Loading and persisting the history, which uses synchronous storage, runs in worker threads.
+        """
+        history = self._injector.chat_history
+        compactor = self._injector.memory_compactor
+
+        tools = self._build_tools()
+        agent = self._build_agent(tools)
+        result = await agent.ainvoke(
+            await run_in_executor(None, self._build_turn_input, input_text),
+            config=self._build_invoke_config(),
+            context=self._build_turn_binding(tools),
+        )
+
+        new_messages = self._get_turn_messages(result["messages"])
+        final_message = self._get_final_message(new_messages)
+
+        await history.aadd_messages(new_messages)
+        if checkpoint := self._injector.turn_checkpoint:
+            await checkpoint.saver.adelete_thread(checkpoint.thread_id)
+
+        if compactor:
+            await run_in_executor(None, compactor.compact_if_needed)
+
+        return final_message.text
+
+    def _build_turn_input(self, input_text: str) -> Optional[dict[str, Any]]:
+        """Returns the input of the graph, or None to resume a turn that was interrupted after some of its steps."""
+        checkpoint = self._injector.turn_checkpoint
+        if checkpoint and checkpoint.saver.get_tuple(checkpoint.config):
+            return None
+        return {"messages": self._build_context_messages() + [HumanMessage(content=input_text)]}
+
+    @staticmethod
+    def _get_turn_messages(messages: list[BaseMessage]) -> list[BaseMessage]:
+        """Returns the messages added in the current turn, starting with the user's input."""
+        start = max(index for index, message in enumerate(messages) if isinstance(message, HumanMessage))
+        return messages[start:]
+
+    @staticmethod
+    def _get_final_message(new_messages: list[BaseMessage]) -> AIMessage:
+        return next(
+            m for m in reversed(new_messages)
+            if isinstance(m, AIMessage) and not m.tool_calls
+        )
+
     def _build_context_messages(self) -> list[BaseMessage]:
         return ContextWindowBuilder(
             chat_history=self._injector.chat_history,
@@ -53,20 +116,73 @@ class BaseToolCallingAgent(BaseAgent):
         ).build(max_tokens=MAX_HISTORY_TOKENS)
 
     def _build_tools(self) -> list[BaseTool]:
-        return [tool.as_tool() for tool in self._tools]
+        """Returns the agent's tools, where the ones that aren't thread safe share a lock for the turn."""
+        exclusive_lock = threading.Lock()
+        tools = []
+        for tool in self._tools:
+            langchain_tool = tool.as_tool()
+            if not tool.THREAD_SAFE and getattr(langchain_tool, "func", None):
+                langchain_tool.func = self._run_exclusively(langchain_tool.func, exclusive_lock)
+            tools.append(langchain_tool)
+        return tools
+
+    @staticmethod
+    def _run_exclusively(func: Callable[..., Any], lock: threading.Lock) -> Callable[..., Any]:
+        @functools.wraps(func)
+        def run(*args, **kwargs):
+            with lock:
+                return func(*args, **kwargs)
+
+        return run
 
     def _get_system_prompt(self) -> str:
         return self._system_prompt.format(**self._get_system_prompt_variables())
 
     def _build_invoke_config(self) -> dict[str, Any]:
+        config = {"max_concurrency": self.MAX_CONCURRENT_TOOL_CALLS}
         if self._callback_handler:
-            return {"callbacks": [self._callback_handler]}
+            config["callbacks"] = [self._callback_handler]
+        if checkpoint := self._injector.turn_checkpoint:
+            config.update(checkpoint.config)
 
-        return {}
+        return config
 
-    def _build_agent(self) -> CompiledStateGraph:
-        return create_agent(
+    def _build_turn_binding(self, tools: list[BaseTool]) -> TurnBinding:
+        return TurnBinding(
             model=self._llm,
-            tools=self._build_tools(),
             system_prompt=self._get_system_prompt(),
+            tools={tool.name: tool for tool in tools},
+        )
+
+    def _build_agent(self, tools: list[BaseTool]) -> CompiledStateGraph:
+        """Returns the compiled graph of the agent, shared by all conversations using the same tools.
+
+        Compiling the graph is the slowest part of starting a turn. It is compiled without a system prompt and with
+        stand-ins for the model and tools, which are replaced by the current turn's ones through ``TurnBinding``,
+        so the graph only depends on the agent class and the names and schemas of its tools and keeps no
+        conversation's objects. When the turn is resumable, a copy of the graph saves its progress with the turn's
+        checkpointer.
+        """
+        graph = compiled_graph_cache.get_or_create(
+            self._get_graph_key(tools),
+            lambda: create_agent(
+                model=UnboundChatModel(),
+                tools=[build_unbound_tool(tool) for tool in tools],
+                middleware=[TurnBindingMiddleware()],
+                context_schema=TurnBinding,
+            ),
         )
+        if checkpoint := self._injector.turn_checkpoint:
+            return graph.copy(update={"checkpointer": checkpoint.saver})
+        return graph
+
+    def _get_graph_key(self, tools: list[BaseTool]) -> Hashable:
+        return type(self), tuple(
+            (tool.name, self._get_schema_key(tool.args_schema), tool.return_direct) for tool in tools
+        )
+
+    @staticmethod
+    def _get_schema_key(schema: Any) -> Hashable:
+        if isinstance(schema, type):
+            return schema
+        return json.dumps(schema, sort_keys=True, default=str)
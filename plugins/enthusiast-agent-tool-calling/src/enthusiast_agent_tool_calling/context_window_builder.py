@@ -1,6 +1,6 @@
 from typing import Optional
 
-from enthusiast_common.memory import BaseMemoryCompactor
+from enthusiast_common.memory import BaseMemoryCompactor, BaseWindowedChatHistory
 from langchain_core.chat_history import BaseChatMessageHistory
 from langchain_core.messages import BaseMessage, HumanMessage, SystemMessage, trim_messages
 
@@ -10,7 +10,8 @@ class ContextWindowBuilder:
 
     Trims history to fit within the token budget and prepends a summary SystemMessage
     when a memory compactor has generated one, so context outside the token window is
-    preserved in compressed form.
+    preserved in compressed form. Histories that support it only load the messages
+    that fit the budget.
     """
 
     def __init__(
@@ -24,7 +25,7 @@ class ContextWindowBuilder:
     def build(self, max_tokens: int) -> list[BaseMessage]:
         """Return the trimmed history, optionally preceded by a summary SystemMessage."""
         limited_history = trim_messages(
-            self._chat_history.messages,
+            self._load_history(max_tokens),
             strategy="last",
             token_counter="approximate",
             max_tokens=max_tokens,
@@ -37,6 +38,11 @@ class ContextWindowBuilder:
             return [summary_message] + limited_history
         return limited_history
 
+    def _load_history(self, max_tokens: int) -> list[BaseMessage]:
+        if isinstance(self._chat_history, BaseWindowedChatHistory):
+            return self._chat_history.recent_messages(max_tokens)
+        return self._chat_history.messages
+
     def _build_summary_message(self) -> Optional[SystemMessage]:
         if self._memory_compactor is None:
             return None
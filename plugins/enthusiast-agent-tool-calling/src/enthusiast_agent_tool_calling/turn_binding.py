@@ -0,0 +1,106 @@
+import threading
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Hashable
+
+from langchain.agents.middleware import AgentMiddleware, ModelRequest, ToolCallRequest
+from langchain_core.language_models import BaseChatModel
+from langchain_core.messages import BaseMessage, SystemMessage
+from langchain_core.outputs import ChatResult
+from langchain_core.tools import BaseTool, StructuredTool
+from langgraph.graph.state import CompiledStateGraph
+
+
+@dataclass(frozen=True)
+class TurnBinding:
+    """Per-turn state bound to a shared agent graph through the runtime context of ``invoke``."""
+
+    model: BaseChatModel
+    system_prompt: str
+    tools: dict[str, BaseTool]
+
+
+class UnboundChatModel(BaseChatModel):
+    """Model a shared graph is compiled with. Every call is meant to run against the turn's model instead."""
+
+    @property
+    def _llm_type(self) -> str:
+        return "unbound"
+
+    def bind_tools(self, tools: Any, **kwargs: Any) -> "UnboundChatModel":
+        return self
+
+    def _generate(self, messages: list[BaseMessage], *args: Any, **kwargs: Any) -> ChatResult:
+        raise RuntimeError("The model of a shared agent graph was called without being bound to a turn.")
+
+
+def build_unbound_tool(tool: BaseTool) -> BaseTool:
+    """Returns a tool with the same name and schema as the given one, which a shared graph can be compiled with."""
+    name = tool.name
+
+    def run_unbound(*args: Any, **kwargs: Any) -> Any:
+        raise RuntimeError(f"Tool {name} of a shared agent graph was called without being bound to a turn.")
+
+    return StructuredTool(
+        name=tool.name,
+        description=tool.description,
+        args_schema=tool.args_schema,
+        return_direct=tool.return_direct,
+        func=run_unbound,
+    )
+
+
+class TurnBindingMiddleware(AgentMiddleware):
+    """Replaces the model, system prompt and tools a graph was compiled with by the ones of the current turn.
+
+    The graph is compiled with an ``UnboundChatModel`` and tools built by ``build_unbound_tool``, so it keeps
+    no conversation's objects and can be reused across conversations, while every model and tool call runs
+    against the instances built for the current turn.
+    """
+
+    def wrap_model_call(self, request: ModelRequest, handler: Callable) -> Any:
+        return handler(self._bind_model_request(request))
+
+    async def awrap_model_call(self, request: ModelRequest, handler: Callable[..., Awaitable]) -> Any:
+        return await handler(self._bind_model_request(request))
+
+    def wrap_tool_call(self, request: ToolCallRequest, handler: Callable) -> Any:
+        return handler(self._bind_tool_call_request(request))
+
+    async def awrap_tool_call(self, request: ToolCallRequest, handler: Callable[..., Awaitable]) -> Any:
+        return await handler(self._bind_tool_call_request(request))
+
+    @staticmethod
+    def _bind_model_request(request: ModelRequest) -> ModelRequest:
+        binding: TurnBinding = request.runtime.context
+        return request.override(model=binding.model, system_message=SystemMessage(content=binding.system_prompt))
+
+    @staticmethod
+    def _bind_tool_call_request(request: ToolCallRequest) -> ToolCallRequest:
+        binding: TurnBinding = request.runtime.context
+        tool = binding.tools.get(request.tool_call["name"])
+        if tool is None:
+            return request
+        return request.override(tool=tool)
+
+
+class CompiledGraphCache:
+    """Process-wide cache of compiled agent graphs, keyed by everything the graph's structure depends on."""
+
+    def __init__(self):
+        self._graphs: dict[Hashable, CompiledStateGraph] = {}
+        self._lock = threading.Lock()
+
+    def get_or_create(self, key: Hashable, factory: Callable[[], CompiledStateGraph]) -> CompiledStateGraph:
+        graph = self._graphs.get(key)
+        if graph is None:
+            graph = factory()
+            with self._lock:
+                graph = self._graphs.setdefault(key, graph)
+        return graph
+
+    def clear(self) -> None:
+        with self._lock:
+            self._graphs.clear()
+
+
+compiled_graph_cache = CompiledGraphCache()
@@ -0,0 +1,78 @@
+import threading
+import time
+from typing import Any, Optional
+from unittest.mock import Mock
+
+from enthusiast_common.tools import BaseFunctionTool
+from langchain_core.language_models import BaseChatModel
+from langchain_core.messages import AIMessage, BaseMessage
+from langchain_core.outputs import ChatGeneration, ChatResult
+from pydantic import BaseModel, Field
+
+
+class ScriptedChatModel(BaseChatModel):
+    """Chat model answering with the given messages in turn and remembering what it was asked."""
+
+    responses: list[AIMessage]
+    received: list[list[BaseMessage]] = Field(default_factory=list)
+
+    @property
+    def _llm_type(self) -> str:
+        return "scripted"
+
+    def bind_tools(self, tools: Any, **kwargs: Any) -> "ScriptedChatModel":
+        return self
+
+    def _generate(self, messages: list[BaseMessage], stop: Optional[list[str]] = None, **kwargs: Any) -> ChatResult:
+        self.received.append(messages)
+        return ChatResult(generations=[ChatGeneration(message=self.responses[len(self.received) - 1])])
+
+
+def tool_calls_message(tool_name: str, count: int) -> AIMessage:
+    return AIMessage(
+        content="",
+        tool_calls=[{"id": f"call_{index}", "name": tool_name, "args": {"index": index}} for index in range(count)],
+    )
+
+
+class LookupInput(BaseModel):
+    index: int
+
+
+class LookupTool(BaseFunctionTool):
+    """Tool recording its calls and how many of them run at once. Earlier calls take longer to finish."""
+
+    NAME = "lookup"
+    DESCRIPTION = "Looks up an item"
+    ARGS_SCHEMA = LookupInput
+    RETURN_DIRECT = False
+    DURATION_SECONDS = 0.05
+
+    def __init__(self, label: str = "tool"):
+        self.label = label
+        self.calls: list[int] = []
+        self.running = 0
+        self.max_running = 0
+        self._lock = threading.Lock()
+
+    def run(self, index: int) -> str:
+        with self._lock:
+            self.calls.append(index)
+            self.running += 1
+            self.max_running = max(self.max_running, self.running)
+        time.sleep(self.DURATION_SECONDS / (index + 1))
+        with self._lock:
+            self.running -= 1
+        return f"{self.label} result {index}"
+
+
+class RecordingChatHistory:
+    def __init__(self):
+        self.messages: list[BaseMessage] = []
+
+    def add_messages(self, messages: list[BaseMessage]) -> None:
+        self.messages.extend(messages)
+
+
+def build_injector() -> Mock:
+    return Mock(chat_history=RecordingChatHistory(), memory_compactor=None, turn_checkpoint=None)
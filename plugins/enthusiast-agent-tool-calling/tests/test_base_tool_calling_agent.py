@@ -0,0 +1,71 @@
+import pytest
+from enthusiast_agent_tool_calling import BaseToolCallingAgent
+from enthusiast_agent_tool_calling.turn_binding import compiled_graph_cache
+from langchain_core.messages import AIMessage, ToolMessage
+
+from .fakes import LookupTool, ScriptedChatModel, build_injector, tool_calls_message
+
+TOOL_CALLS_COUNT = 6
+
+
+class LookupAgent(BaseToolCallingAgent):
+    MAX_CONCURRENT_TOOL_CALLS = 2
+
+
+class ExclusiveLookupTool(LookupTool):
+    THREAD_SAFE = False
+
+
+@pytest.fixture(autouse=True)
+def clear_compiled_graphs():
+    compiled_graph_cache.clear()
+    yield
+    compiled_graph_cache.clear()
+
+
+def _run_turn(tool: LookupTool):
+    injector = build_injector()
+    llm = ScriptedChatModel(responses=[tool_calls_message("lookup", TOOL_CALLS_COUNT), AIMessage(content="Done")])
+    agent = LookupAgent(
+        tools=[tool], llm=llm, system_prompt="You look things up.", conversation_id=1, injector=injector
+    )
+    answer = agent.get_answer("Look up all items")
+    return answer, injector.chat_history.messages
+
+
+def test_persists_tool_results_in_call_order():
+    # Given
+    tool = LookupTool()
+
+    # When
+    answer, messages = _run_turn(tool)
+
+    # Then
+    assert answer == "Done"
+    tool_messages = [message for message in messages if isinstance(message, ToolMessage)]
+    assert [message.tool_call_id for message in tool_messages] == [f"call_{i}" for i in range(TOOL_CALLS_COUNT)]
+    assert [message.content for message in tool_messages] == [f"tool result {i}" for i in range(TOOL_CALLS_COUNT)]
+
+
+def test_runs_at_most_max_concurrent_tool_calls_at_once():
+    # Given
+    tool = LookupTool()
+
+    # When
+    _run_turn(tool)
+
+    # Then
+    assert sorted(tool.calls) == list(range(TOOL_CALLS_COUNT))
+    assert tool.max_running == LookupAgent.MAX_CONCURRENT_TOOL_CALLS
+
+
+def test_runs_calls_of_tools_that_are_not_thread_safe_one_at_a_time():
+    # Given
+    tool = ExclusiveLookupTool()
+
+    # When
+    _run_turn(tool)
+
+    # Then
+    assert sorted(tool.calls) == list(range(TOOL_CALLS_COUNT))
+    assert tool.max_running == 1
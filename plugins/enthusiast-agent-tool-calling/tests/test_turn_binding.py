@@ -0,0 +1,65 @@
+import gc
+import weakref
+
+import pytest
+from enthusiast_agent_tool_calling import BaseToolCallingAgent
+from enthusiast_agent_tool_calling.turn_binding import compiled_graph_cache
+from langchain_core.messages import AIMessage, SystemMessage, ToolMessage
+
+from .fakes import LookupTool, ScriptedChatModel, build_injector, tool_calls_message
+
+
+class LookupAgent(BaseToolCallingAgent):
+    pass
+
+
+@pytest.fixture(autouse=True)
+def clear_compiled_graphs():
+    compiled_graph_cache.clear()
+    yield
+    compiled_graph_cache.clear()
+
+
+def _build_turn(label: str):
+    tool = LookupTool(label=label)
+    llm = ScriptedChatModel(responses=[tool_calls_message("lookup", 2), AIMessage(content=f"{label} answer")])
+    injector = build_injector()
+    agent = LookupAgent(
+        tools=[tool], llm=llm, system_prompt=f"You are the {label} agent.", conversation_id=1, injector=injector
+    )
+    return agent, tool, llm, injector
+
+
+def test_turn_on_shared_graph_uses_its_own_model_tools_and_system_prompt():
+    # Given
+    first_agent, first_tool, first_llm, _ = _build_turn("first")
+    first_agent.get_answer("Look up the items")
+    second_agent, second_tool, second_llm, second_injector = _build_turn("second")
+
+    # When
+    answer = second_agent.get_answer("Look up the items")
+
+    # Then
+    assert len(compiled_graph_cache._graphs) == 1
+    assert answer == "second answer"
+    assert (len(first_llm.received), len(second_llm.received)) == (2, 2)
+    assert (first_tool.calls, sorted(second_tool.calls)) == ([0, 1], [0, 1])
+    assert all(messages[0] == SystemMessage(content="You are the second agent.") for messages in second_llm.received)
+    tool_messages = [message for message in second_injector.chat_history.messages if isinstance(message, ToolMessage)]
+    assert [message.content for message in tool_messages] == ["second result 0", "second result 1"]
+
+
+def test_shared_graph_does_not_keep_objects_of_finished_turn():
+    # Given
+    agent, tool, llm, _ = _build_turn("first")
+    agent.get_answer("Look up the items")
+    tool_reference, llm_reference = weakref.ref(tool), weakref.ref(llm)
+
+    # When
+    del agent, tool, llm
+    gc.collect()
+
+    # Then
+    assert len(compiled_graph_cache._graphs) == 1
+    assert tool_reference() is None
+    assert llm_reference() is None
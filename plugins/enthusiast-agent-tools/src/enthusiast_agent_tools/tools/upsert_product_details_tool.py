@@ -3,10 +3,8 @@ import logging
 from enum import StrEnum
 from typing import List, Optional
 
-from enthusiast_common import ProductDetails
-from enthusiast_common.connectors import ECommercePlatformConnector
 from enthusiast_common.injectors import BaseInjector
-from enthusiast_common.structures import ProductUpdateDetails
+from enthusiast_common.structures import ProductUpdateDetails, ProductUpsertOutcome
 from enthusiast_common.tools import BaseLLMTool
 from langchain_core.language_models import BaseLanguageModel
 from pydantic import BaseModel, Field
@@ -47,6 +45,7 @@ class UpsertProductDetailsTool(BaseLLMTool):
     DESCRIPTION = "Tool for creating or updating products based on product SKUs and their properties."
     ARGS_SCHEMA = UpsertProductBatchInput
     RETURN_DIRECT = False
+    THREAD_SAFE = False
 
     def __init__(
             self,
@@ -68,33 +67,27 @@ class UpsertProductDetailsTool(BaseLLMTool):
 
             return "The user needs to configure an ecommerce platform connector first"
 
-        response = {}
-
-        for product in products:
-            product_sku = product.product_sku
-            product_details = ProductUpdateDetails(
-                name=product.name,
-                slug=product.slug,
-                description=product.description,
-                price=float(product.price) if product.price else None,
-                categories=product.categories,
-                properties=product.property_values_by_property_name_as_json
+        product_updates = [
+            (
+                product.product_sku,
+                ProductUpdateDetails(
+                    name=product.name,
+                    slug=product.slug,
+                    description=product.description,
+                    price=float(product.price) if product.price else None,
+                    categories=product.categories,
+                    properties=product.property_values_by_property_name_as_json
+                ),
             )
-            product_upsert_result = None
+            for product in products
+        ]
 
-            try:
-                product_exists = ecommerce_platform_connector.get_product_by_sku(product_sku) is not None
+        try:
+            upsert_results = ecommerce_platform_connector.upsert_products(product_updates)
+        except Exception as e:
+            upsert_results = {sku: e for sku, _ in product_updates}
 
-                if product_exists:
-                    product_upsert_result = self._update_product_details(ecommerce_platform_connector, product_sku, product_details)
-                else:
-                    product_upsert_result = self._create_product(ecommerce_platform_connector, product_sku, product_details)
-
-            except Exception as e:
-                logger.error(e)
-                product_upsert_result = f"Error: {str(e)}"
-
-            response[product_sku] = product_upsert_result
+        response = {sku: self._describe_upsert_result(result) for sku, result in upsert_results.items()}
 
         self._handle_upsert_results_as_tool_memory(response)
         return json.dumps(response)
@@ -109,26 +102,12 @@ class UpsertProductDetailsTool(BaseLLMTool):
         self.injector.tool_scratchpad.record(self.NAME, entry)
 
     @staticmethod
-    def _update_product_details(connector: ECommercePlatformConnector,
-                                product_sku: str,
-                                product_details: ProductUpdateDetails) -> UpsertOutcome:
-        product_updated = connector.update_product(product_sku, product_details)
-        return UpsertOutcome.UPDATED if product_updated else UpsertOutcome.UPDATE_FAILED
-
-    @staticmethod
-    def _create_product(connector: ECommercePlatformConnector,
-                        product_sku: str,
-                        product_details: ProductUpdateDetails) -> UpsertOutcome:
-        product_create_details = ProductDetails(
-            entry_id='',
-            sku=product_sku,
-            name=product_details.name,
-            slug=product_details.slug,
-            description=product_details.description,
-            properties=product_details.properties,
-            categories=product_details.categories,
-            price=product_details.price,
-        )
-
-        connector.create_product(product_create_details)
-        return UpsertOutcome.CREATED
+    def _describe_upsert_result(result: ProductUpsertOutcome | Exception) -> str:
+        if isinstance(result, Exception):
+            logger.error(result)
+            return f"Error: {str(result)}"
+        return {
+            ProductUpsertOutcome.CREATED: UpsertOutcome.CREATED,
+            ProductUpsertOutcome.UPDATED: UpsertOutcome.UPDATED,
+            ProductUpsertOutcome.NOT_UPDATED: UpsertOutcome.UPDATE_FAILED,
+        }[result]
@@ -1,10 +1,19 @@
-from .interfaces import DocumentSourcePlugin, ProductSourcePlugin
-from .structures import DocumentDetails, ProductDetails, RepositoriesInstances
+from .interfaces import DocumentSourcePlugin, ProductSourcePlugin, ProductWebhookHandler
+from .structures import (
+    DocumentDetails,
+    ProductDetails,
+    ProductWebhookAction,
+    ProductWebhookEvent,
+    RepositoriesInstances,
+)
 
 __all__ = [
     "DocumentDetails",
     "DocumentSourcePlugin",
     "ProductSourcePlugin",
+    "ProductWebhookAction",
+    "ProductWebhookEvent",
+    "ProductWebhookHandler",
     "RepositoriesInstances",
     "ProductDetails",
 ]
@@ -39,6 +39,14 @@ class ToolScratchpad:
         """Return the recorded result for the given tool, or ``None`` if not recorded."""
         return self._store.get(tool_name)
 
+    def dump(self) -> dict[str, Any]:
+        """Return a copy of all recorded results, keyed by tool name."""
+        return dict(self._store)
+
+    def load(self, entries: dict[str, Any]) -> None:
+        """Replace all recorded results with the given ones, e.g. ones dumped before the execution was interrupted."""
+        self._store = dict(entries)
+
     def clear(self) -> None:
         """Discard all recorded results.
 
@@ -3,6 +3,7 @@ from typing import Any
 
 from langchain_core.callbacks import BaseCallbackHandler
 from langchain_core.language_models import BaseLanguageModel
+from langchain_core.runnables.config import run_in_executor
 from langchain_core.tools import BaseTool
 from pydantic import BaseModel
 
@@ -63,6 +64,13 @@ class BaseAgent(ABC, ExtraArgsClassBase):
     def get_answer(self, input_text: str) -> str:
         pass
 
+    async def aget_answer(self, input_text: str) -> str:
+        """Async version of ``get_answer``, used when the agent runs on an event loop.
+
+        Runs ``get_answer`` in a worker thread by default. Agents can override it to use their LLM's async APIs.
+        """
+        return await run_in_executor(None, self.get_answer, input_text)
+
     def _get_system_prompt_variables(self) -> dict:
         """Return variables to format into the system prompt template."""
         return {}
@@ -7,7 +7,7 @@ from langchain_core.language_models import BaseLanguageModel
 from langchain_core.tools import BaseTool
 
 from ..agentic_execution.memory import ToolScratchpad
-from ..agents import BaseAgent
+from ..agents import BaseAgent, ConfigType
 from ..config.base import AgentConfig, AgentToolConfig, FunctionToolConfig, LLMConfig, LLMToolConfig
 from ..injectors import BaseInjector
 from ..registry import BaseDBModelsRegistry, BaseEmbeddingProviderRegistry, BaseLanguageModelRegistry
@@ -26,6 +26,9 @@ class BaseAgentBuilder(ABC, Generic[ConfigT]):
         conversation_id: Any,
         streaming: bool = False,
         tool_scratchpad: Optional[ToolScratchpad] = None,
+        callback_handler: Optional[BaseCallbackHandler] = None,
+        turn_id: Optional[str] = None,
+        config_type: ConfigType = ConfigType.CONVERSATION,
     ):
         self._llm_registry = None
         self._llm = None
@@ -37,22 +40,33 @@ class BaseAgentBuilder(ABC, Generic[ConfigT]):
         self.conversation_id = conversation_id
         self.streaming = streaming
         self._tool_scratchpad = tool_scratchpad
+        self._callback_handler = callback_handler
+        self._turn_id = turn_id
+        self._config_type = config_type
 
     def build(self) -> BaseAgent:
-        model_registry = self._build_db_models_registry()
-        self._build_and_set_repositories(model_registry)
-        self._data_set_id = self._repositories.conversation.get_data_set_id(self.conversation_id)
-        self._llm_registry = self._build_llm_registry()
+        self._build_llm_dependencies()
         self._embeddings_registry = self._build_embeddings_registry()
         self._llm = self._build_llm(self._config.llm)
         self._default_llm = self._build_default_llm()
         self._injector = self._build_injector()
         tools = self._build_tools(default_llm=self._default_llm, injector=self._injector)
-        agent_callback_handler = self._build_agent_callback_handler()
+        agent_callback_handler = self._callback_handler or self._build_agent_callback_handler()
         agent_instance = self._build_agent(tools, self._llm, agent_callback_handler)
         self._inject_additional_arguments(agent_instance)
         return agent_instance
 
+    def build_default_llm(self) -> BaseLanguageModel:
+        """Builds only the agent's default language model, for work done for the conversation outside of its turns."""
+        self._build_llm_dependencies()
+        return self._build_default_llm()
+
+    def _build_llm_dependencies(self) -> None:
+        model_registry = self._build_db_models_registry()
+        self._build_and_set_repositories(model_registry)
+        self._data_set_id = self._repositories.conversation.get_data_set_id(self.conversation_id)
+        self._llm_registry = self._build_llm_registry()
+
     def _inject_additional_arguments(self, agent_instance: BaseAgent) -> None:
         agent_configuration_id = self._repositories.conversation.get_agent_id(self.conversation_id)
         runtime_arguments = self._repositories.agent.get_agent_configuration_by_id(agent_configuration_id)
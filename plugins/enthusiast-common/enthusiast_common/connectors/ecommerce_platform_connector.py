@@ -1,7 +1,11 @@
 from abc import ABC, abstractmethod
-from typing import Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Optional, TypeVar, Union
 
-from enthusiast_common.structures import Address, ProductDetails, ProductUpdateDetails
+from enthusiast_common.structures import Address, ProductDetails, ProductUpdateDetails, ProductUpsertOutcome
+
+K = TypeVar("K")
+V = TypeVar("V")
 
 
 class ECommercePlatformConnector(ABC):
@@ -9,6 +13,8 @@ class ECommercePlatformConnector(ABC):
     though a unified interface."""
 
     required_product_create_fields: set[str] = set()
+    # Number of items processed at once by the default implementations of batch methods.
+    max_batch_workers: int = 4
 
     @abstractmethod
     def create_empty_order(self, email: Optional[str] = None, address: Optional[Address] = None) -> str:
@@ -51,6 +57,110 @@ class ECommercePlatformConnector(ABC):
     def get_admin_url_for_order_id(self, order_id: str) -> str:
         pass
 
+    def get_products_by_skus(self, skus: list[str]) -> dict[str, Union[Optional[ProductDetails], Exception]]:
+        """Look up many products by SKU.
+
+        The default implementation calls ``get_product_by_sku`` for up to ``max_batch_workers`` SKUs at once.
+        Connectors whose platform can look up many products in one request should override it.
+
+        Returns:
+            For every SKU: the product, None if it was not found, or the exception raised while looking it up.
+        """
+        return self._map_concurrently(self.get_product_by_sku, list(dict.fromkeys(skus)))
+
+    def upsert_products(
+        self, products: list[tuple[str, ProductUpdateDetails]]
+    ) -> dict[str, Union[ProductUpsertOutcome, Exception]]:
+        """Create products that don't exist yet and update the existing ones.
+
+        The default implementation upserts up to ``max_batch_workers`` products at once. Entries sharing a SKU are
+        applied one after another, in order.
+
+        Args:
+            products: Pairs of SKU and details to set on the product.
+
+        Returns:
+            For every SKU: the outcome of its last upsert, or the exception that stopped it.
+        """
+        details_by_sku: dict[str, list[ProductUpdateDetails]] = {}
+        for sku, product_details in products:
+            details_by_sku.setdefault(sku, []).append(product_details)
+
+        def upsert_all(sku: str) -> ProductUpsertOutcome:
+            outcome = None
+            for product_details in details_by_sku[sku]:
+                outcome = self._upsert_product(sku, product_details)
+            return outcome
+
+        return self._map_concurrently(upsert_all, list(details_by_sku))
+
+    def update_stock_many(self, items: list[tuple[str, int]]) -> dict[str, Union[bool, Exception]]:
+        """Update stock levels of many products.
+
+        The default implementation calls ``update_stock`` for up to ``max_batch_workers`` SKUs at once. Quantities
+        of repeated SKUs are added up first, so concurrent updates never touch the same product.
+
+        Args:
+            items: Pairs of SKU and quantity delta to add to current stock.
+
+        Returns:
+            For every SKU: True if updated, False if the product was not found, or the exception that prevented
+            the update.
+        """
+        quantities: dict[str, int] = {}
+        for sku, quantity in items:
+            quantities[sku] = quantities.get(sku, 0) + quantity
+
+        return self._map_concurrently(lambda sku: self.update_stock(sku, quantities[sku]), list(quantities))
+
+    def create_or_update_product(
+        self, sku: str, product_details: ProductUpdateDetails, exists: bool
+    ) -> ProductUpsertOutcome:
+        """Create or update a product whose existence on the platform is already known.
+
+        Used by ``upsert_products`` after looking the product up, and by wrappers that know it from elsewhere.
+
+        Args:
+            sku: The product's SKU identifier.
+            product_details: Details to set on the product.
+            exists: Whether the platform has a product with this SKU.
+        """
+        if exists:
+            updated = self.update_product(sku, product_details)
+            return ProductUpsertOutcome.UPDATED if updated else ProductUpsertOutcome.NOT_UPDATED
+
+        self.create_product(
+            ProductDetails(
+                entry_id="",
+                sku=sku,
+                name=product_details.name,
+                slug=product_details.slug,
+                description=product_details.description,
+                properties=product_details.properties,
+                categories=product_details.categories,
+                price=product_details.price,
+            )
+        )
+        return ProductUpsertOutcome.CREATED
+
+    def _upsert_product(self, sku: str, product_details: ProductUpdateDetails) -> ProductUpsertOutcome:
+        return self.create_or_update_product(sku, product_details, exists=self.get_product_by_sku(sku) is not None)
+
+    def _map_concurrently(self, fn: Callable[[K], V], keys: list[K]) -> dict[K, Union[V, Exception]]:
+        """Calls ``fn`` for every key in a bounded thread pool, so one failing item doesn't fail the others."""
+        results: dict[K, Union[V, Exception]] = {}
+        if not keys:
+            return results
+
+        with ThreadPoolExecutor(max_workers=min(self.max_batch_workers, len(keys))) as executor:
+            futures = {key: executor.submit(fn, key) for key in keys}
+            for key, future in futures.items():
+                try:
+                    results[key] = future.result()
+                except Exception as e:
+                    results[key] = e
+        return results
+
     def _validate_create_product_data(self, product: ProductDetails) -> None:
         missing = [
             field for field in self.required_product_create_fields
@@ -0,0 +1,5 @@
+from .client import HTTPClient
+from .pagination import fetch_pages
+from .signatures import verify_hmac_signature
+
+__all__ = ["HTTPClient", "fetch_pages", "verify_hmac_signature"]
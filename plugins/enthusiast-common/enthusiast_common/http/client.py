@@ -0,0 +1,108 @@
+from typing import Any, Iterable, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+DEFAULT_TIMEOUT = 30
+DEFAULT_POOL_SIZE = 10
+DEFAULT_MAX_RETRIES = 3
+DEFAULT_BACKOFF_FACTOR = 0.5
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+
+class HTTPClient:
+    """HTTP client for plugins that talk to external REST and GraphQL APIs.
+
+    Wraps a single ``requests.Session``, so every request made through one instance reuses pooled
+    keep-alive connections instead of opening a new TCP/TLS connection per call. Requests answered
+    with 429 or 5xx are retried with exponential backoff, honouring ``Retry-After`` when present.
+    Once retries are exhausted, the last response is returned so callers can translate it into
+    their own errors.
+
+    The session is safe to share between the worker threads used by ``fetch_pages``, as long as
+    ``pool_size`` is not lower than the number of workers.
+    """
+
+    def __init__(
+        self,
+        base_url: str = "",
+        headers: Optional[dict[str, str]] = None,
+        auth: Any = None,
+        timeout: float = DEFAULT_TIMEOUT,
+        pool_size: int = DEFAULT_POOL_SIZE,
+        max_retries: int = DEFAULT_MAX_RETRIES,
+        backoff_factor: float = DEFAULT_BACKOFF_FACTOR,
+        retry_methods: Optional[Iterable[str]] = None,
+        verify: bool = True,
+    ):
+        """
+        Args:
+            base_url: URL prepended to relative paths passed to ``request``.
+            headers: Headers sent with every request.
+            auth: ``requests``-compatible auth sent with every request.
+            timeout: Default timeout in seconds, used unless a request overrides it.
+            pool_size: Maximum number of connections kept alive per host.
+            max_retries: Number of retries for connection errors and retryable statuses.
+            backoff_factor: Base of the exponential backoff between retries, in seconds.
+            retry_methods: HTTP methods that may be retried. Defaults to the idempotent ones;
+                pass e.g. ``{"GET", "POST"}`` for APIs that use POST for read-only searches.
+            verify: Whether to verify TLS certificates.
+        """
+        self._base_url = base_url.rstrip("/")
+        self._timeout = timeout
+        self._session = requests.Session()
+        self._session.verify = verify
+        self._session.auth = auth
+        if headers:
+            self._session.headers.update(headers)
+
+        retry = Retry(
+            total=max_retries,
+            backoff_factor=backoff_factor,
+            status_forcelist=RETRY_STATUSES,
+            allowed_methods=frozenset(retry_methods) if retry_methods else Retry.DEFAULT_ALLOWED_METHODS,
+            respect_retry_after_header=True,
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry)
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
+
+    @property
+    def headers(self) -> dict[str, str]:
+        """Headers sent with every request. Can be updated in place, e.g. after obtaining a token."""
+        return self._session.headers
+
+    def request(self, method: str, path: str, **kwargs) -> requests.Response:
+        """Sends a request and returns the response without checking its status.
+
+        Args:
+            method: HTTP method.
+            path: Path relative to ``base_url``, or an absolute URL.
+            **kwargs: Arguments passed through to ``requests.Session.request``.
+        """
+        kwargs.setdefault("timeout", self._timeout)
+        return self._session.request(method, self._build_url(path), **kwargs)
+
+    def get(self, path: str, **kwargs) -> requests.Response:
+        return self.request("GET", path, **kwargs)
+
+    def post(self, path: str, **kwargs) -> requests.Response:
+        return self.request("POST", path, **kwargs)
+
+    def close(self) -> None:
+        self._session.close()
+
+    def __enter__(self) -> "HTTPClient":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def _build_url(self, path: str) -> str:
+        if not self._base_url or path.startswith(("http://", "https://")):
+            return path
+        if not path:
+            return self._base_url
+        return f"{self._base_url}/{path.lstrip('/')}"
@@ -0,0 +1,41 @@
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+from typing import Callable, Iterable, Iterator, TypeVar
+
+DEFAULT_MAX_WORKERS = 4
+
+P = TypeVar("P")
+T = TypeVar("T")
+
+
+def fetch_pages(
+    fetch_page: Callable[[P], T], pages: Iterable[P], max_workers: int = DEFAULT_MAX_WORKERS
+) -> Iterator[T]:
+    """Fetches pages concurrently and yields their results in the order of ``pages``.
+
+    Meant for paginated APIs once the total number of pages is known (e.g. from the first
+    response). At most ``max_workers`` pages are in flight at any time, and a new page is only
+    requested after the oldest one has been handed to the caller, so memory use stays bounded
+    no matter how many pages there are.
+
+    Args:
+        fetch_page: Fetches a single page, e.g. a page number or an offset.
+        pages: Identifiers of the pages to fetch, passed one by one to ``fetch_page``.
+        max_workers: Maximum number of concurrent requests.
+
+    Yields:
+        The result of ``fetch_page`` for every page, in input order.
+    """
+    pages = iter(pages)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        pending = deque(executor.submit(fetch_page, page) for page in islice(pages, max_workers))
+        try:
+            while pending:
+                result = pending.popleft().result()
+                for page in islice(pages, 1):
+                    pending.append(executor.submit(fetch_page, page))
+                yield result
+        finally:
+            for future in pending:
+                future.cancel()
@@ -0,0 +1,25 @@
+import base64
+import hashlib
+import hmac
+from typing import Literal, Optional
+
+
+def verify_hmac_signature(
+    secret: Optional[str],
+    body: bytes,
+    signature: Optional[str],
+    encoding: Literal["base64", "hex"] = "base64",
+) -> bool:
+    """Checks an HMAC-SHA256 signature of a webhook body in constant time.
+
+    Args:
+        secret: Shared secret configured on both sides, an unset secret never verifies.
+        body: Raw request body.
+        signature: Signature sent by the platform.
+        encoding: How the platform encodes the digest.
+    """
+    if not secret or not signature:
+        return False
+    digest = hmac.new(secret.encode(), body, hashlib.sha256).digest()
+    expected = base64.b64encode(digest).decode() if encoding == "base64" else digest.hex()
+    return hmac.compare_digest(expected, signature.strip())
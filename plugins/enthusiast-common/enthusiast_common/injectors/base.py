@@ -3,7 +3,7 @@ from typing import Optional
 
 from enthusiast_common.agentic_execution import ToolScratchpad
 from enthusiast_common.connectors import ECommercePlatformConnector
-from enthusiast_common.memory import BaseMemoryCompactor
+from enthusiast_common.memory import BaseMemoryCompactor, TurnCheckpoint
 from enthusiast_common.retrievers import BaseProductRetriever, BaseVectorStoreRetriever
 from enthusiast_common.structures import DocumentChunkDetails, RepositoriesInstances
 from langchain_core.chat_history import BaseChatMessageHistory
@@ -41,3 +41,8 @@ class BaseInjector(ABC):
     @abstractmethod
     def tool_scratchpad(self) -> ToolScratchpad:
         pass
+
+    @property
+    def turn_checkpoint(self) -> Optional[TurnCheckpoint]:
+        """Where the agent saves the progress of the current turn, or None if turns aren't resumable."""
+        return None
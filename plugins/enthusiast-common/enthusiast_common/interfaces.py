@@ -1,8 +1,9 @@
 from abc import ABC, ABCMeta, abstractmethod
-from typing import Any
+from datetime import datetime
+from typing import Any, Iterable, Mapping, Optional
 
 from enthusiast_common.connectors import ECommercePlatformConnector
-from enthusiast_common.structures import DocumentDetails, ProductDetails
+from enthusiast_common.structures import DocumentDetails, ProductDetails, ProductWebhookEvent
 from enthusiast_common.utils import RequiredFieldsModel, validate_required_vars
 
 
@@ -40,13 +41,43 @@ class ProductSourcePlugin(ABC, SourceExtraArgsClassBase):
 
     def __init__(self, data_set_id):
         self.data_set_id = data_set_id
+        # Set for incremental syncs. Plugins able to filter by modification date may fetch only products
+        # changed since then, others can ignore it and fetch everything.
+        self.updated_since: Optional[datetime] = None
 
     @abstractmethod
-    def fetch(self) -> list[ProductDetails]:
+    def fetch(self) -> Iterable[ProductDetails]:
         """Fetches products from an external source.
 
+        Products are imported as they are iterated, so large sources can return a generator instead of a list.
+
         Returns:
-            list[ProductDetails]: A list of products to be imported to the database
+            Iterable[ProductDetails]: Products to be imported to the database
+        """
+        pass
+
+
+class ProductWebhookHandler(ABC):
+    """Product source able to apply single-product changes pushed by the platform's webhooks.
+
+    Headers are passed with lower-cased names, the body as the raw bytes the signature was computed for.
+    """
+
+    @abstractmethod
+    def verify_webhook(self, headers: Mapping[str, str], body: bytes) -> bool:
+        """Checks the webhook signature against the secret configured for the source.
+
+        Returns:
+            bool: True if the request was signed by the platform, False otherwise or when no secret is configured.
+        """
+        pass
+
+    @abstractmethod
+    def parse_webhook(self, headers: Mapping[str, str], body: bytes) -> list[ProductWebhookEvent]:
+        """Translates a verified webhook into product changes, fetching product details from the platform if needed.
+
+        Returns:
+            list[ProductWebhookEvent]: Products to upsert or delete, empty for events that don't affect products.
         """
         pass
 
@@ -57,13 +88,18 @@ class DocumentSourcePlugin(ABC, SourceExtraArgsClassBase):
 
     def __init__(self, data_set_id):
         self.data_set_id = data_set_id
+        # Set for incremental syncs. Plugins able to filter by modification date may fetch only documents
+        # changed since then, others can ignore it and fetch everything.
+        self.updated_since: Optional[datetime] = None
 
     @abstractmethod
-    def fetch(self) -> list[DocumentDetails]:
+    def fetch(self) -> Iterable[DocumentDetails]:
         """Fetches documents from an external system.
 
+        Documents are imported as they are iterated, so large sources can return a generator instead of a list.
+
         Returns:
-            list[DocumentDetails]: A list of documents to be imported to the database
+            Iterable[DocumentDetails]: Documents to be imported to the database
         """
         pass
 
@@ -1,3 +1,4 @@
-from .base import BaseMemoryCompactor
+from .base import BaseMemoryCompactor, BaseWindowedChatHistory
+from .checkpoint import TurnCheckpoint
 
-__all__ = ["BaseMemoryCompactor"]
+__all__ = ["BaseMemoryCompactor", "BaseWindowedChatHistory", "TurnCheckpoint"]
@@ -1,6 +1,9 @@
 from abc import ABC, abstractmethod
 from typing import Optional
 
+from langchain_core.chat_history import BaseChatMessageHistory
+from langchain_core.messages import BaseMessage
+
 
 class BaseMemoryCompactor(ABC):
     """
@@ -24,3 +27,22 @@ class BaseMemoryCompactor(ABC):
         Should be called after new messages have been added to history.
         """
         pass
+
+
+class BaseWindowedChatHistory(BaseChatMessageHistory, ABC):
+    """
+    Chat history able to load only the recent part of a conversation that fits a token budget.
+
+    Context window builders use it instead of loading every message and trimming them afterwards,
+    so the cost of a turn doesn't grow with the length of the conversation.
+    """
+
+    @abstractmethod
+    def recent_messages(self, max_tokens: int) -> list[BaseMessage]:
+        """
+        Return the longest run of most recent messages whose approximate token count fits max_tokens, oldest first.
+
+        Token counts must match langchain's ``count_tokens_approximately``, so that trimming the result with
+        ``trim_messages(token_counter="approximate")`` gives the same messages as trimming the whole history.
+        """
+        pass
@@ -0,0 +1,22 @@
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from langgraph.checkpoint.base import BaseCheckpointSaver
+
+
+@dataclass(frozen=True)
+class TurnCheckpoint:
+    """Where the graph of an agent saves its progress during a single turn.
+
+    When a turn is retried with the same ``thread_id``, agents resume it from the last completed step instead
+    of calling the LLM and the tools that already succeeded again.
+    """
+
+    saver: "BaseCheckpointSaver"
+    thread_id: str
+
+    @property
+    def config(self) -> dict[str, Any]:
+        """Config that selects the turn's thread when invoking the graph."""
+        return {"configurable": {"thread_id": self.thread_id}}
@@ -1,3 +1,4 @@
+from .clients import ClientPool, client_pool
 from .embeddings import BaseEmbeddingProviderRegistry, EmbeddingProvider
 from .llm import BaseLanguageModelRegistry, LanguageModelProvider
 from .models import BaseDBModelsRegistry
@@ -6,6 +7,8 @@ __all__ = [
     "BaseEmbeddingProviderRegistry",
     "BaseDBModelsRegistry",
     "BaseLanguageModelRegistry",
+    "ClientPool",
     "EmbeddingProvider",
     "LanguageModelProvider",
+    "client_pool",
 ]
@@ -0,0 +1,55 @@
+import hashlib
+import os
+import threading
+from typing import Any, Callable, Hashable, Optional
+
+
+class ClientPool:
+    """Process-wide pool of SDK clients and language models created by providers.
+
+    Providers used to create a new client (and with it a new HTTP connection pool) for every call, so each
+    embedding or completion paid for a TCP and TLS handshake. Clients are now created once per key, typically
+    (provider class, model, streaming, credentials fingerprint), and shared by every task handled by the process.
+    The pool is emptied in forked children, so worker processes never share sockets with their parent.
+    """
+
+    def __init__(self):
+        self._clients: dict[Hashable, Any] = {}
+        self._lock = threading.Lock()
+
+    def get_or_create(self, key: Hashable, factory: Callable[[], Any]) -> Any:
+        client = self._clients.get(key)
+        if client is None:
+            with self._lock:
+                client = self._clients.get(key)
+                if client is None:
+                    client = factory()
+                    self._clients[key] = client
+        return client
+
+    def clear(self) -> None:
+        with self._lock:
+            self._clients.clear()
+
+    def _reset_after_fork(self) -> None:
+        # The parent's lock may have been held by another thread at fork time, so it's replaced rather than taken.
+        self._clients = {}
+        self._lock = threading.Lock()
+
+
+def credentials_fingerprint(env_vars: tuple[str, ...]) -> Optional[str]:
+    """Returns a digest of the given environment variables' values, so rotated credentials get a new client.
+
+    Args:
+        env_vars (tuple[str, ...]): Names of the environment variables a provider's SDK reads its credentials from.
+    """
+    if not env_vars:
+        return None
+    values = "\0".join(os.environ.get(name, "") for name in env_vars)
+    return hashlib.sha256(values.encode()).hexdigest()
+
+
+client_pool = ClientPool()
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=client_pool._reset_after_fork)
@@ -1,5 +1,9 @@
 from abc import ABC, abstractmethod
-from typing import Any, Type
+from typing import Any, Callable, Type, TypeVar
+
+from .clients import client_pool, credentials_fingerprint
+
+ClientT = TypeVar("ClientT")
 
 
 class EmbeddingProvider(ABC):
@@ -11,6 +15,8 @@ class EmbeddingProvider(ABC):
     """
 
     NAME: str = None
+    # Environment variables the provider's SDK reads its credentials and endpoint from.
+    CREDENTIAL_ENV_VARS: tuple[str, ...] = ()
 
     def __init__(self, model: str, dimensions: int):
         super(EmbeddingProvider, self).__init__()
@@ -26,6 +32,16 @@ class EmbeddingProvider(ABC):
         """
         pass
 
+    @classmethod
+    def _get_pooled_client(cls, factory: Callable[[], ClientT]) -> ClientT:
+        """Returns the provider's SDK client shared by the process, creating it with ``factory`` on first use.
+
+        Clients are pooled per provider and credentials, so consecutive embedding requests reuse the client's
+        HTTP connection pool instead of opening a new connection each time.
+        """
+        key = (cls, None, False, credentials_fingerprint(cls.CREDENTIAL_ENV_VARS))
+        return client_pool.get_or_create(key, factory)
+
     @staticmethod
     @abstractmethod
     def available_models() -> list[str]:
@@ -1,10 +1,11 @@
 from abc import ABC, abstractmethod
-from typing import Any, Type
+from typing import Any, Callable, Type
 
 from langchain_core.callbacks import BaseCallbackHandler
 from langchain_core.language_models import BaseLanguageModel
 
 from ..structures import BaseFileContent, BaseImageContent, FileTypes, LLMFile
+from .clients import client_pool, credentials_fingerprint
 
 
 class LanguageModelProvider(ABC):
@@ -17,6 +18,8 @@ class LanguageModelProvider(ABC):
 
     NAME: str = None
     STREAMING_AVAILABLE = True
+    # Environment variables the provider's SDK reads its credentials and endpoint from.
+    CREDENTIAL_ENV_VARS: tuple[str, ...] = ()
 
     def __init__(self, model: str):
         super(LanguageModelProvider, self).__init__()
@@ -36,6 +39,27 @@ class LanguageModelProvider(ABC):
     ) -> BaseLanguageModel:
         raise NotImplementedError()
 
+    def _get_pooled_language_model(
+        self,
+        factory: Callable[[], BaseLanguageModel],
+        callbacks: list[BaseCallbackHandler] | None = None,
+        streaming: bool = False,
+    ) -> BaseLanguageModel:
+        """Returns a language model sharing its SDK clients with other instances of this provider and model.
+
+        The model created by ``factory`` is pooled per process, keyed by the provider, model, streaming flag and
+        credentials. Every call gets a shallow copy with its own callbacks, which keeps the pooled instance's
+        HTTP connection pools.
+
+        Args:
+            factory: Creates the language model, without callbacks, when the pool doesn't hold one yet.
+            callbacks: Callback handlers of the caller.
+            streaming: Whether the factory creates a streaming model.
+        """
+        key = (type(self), self._model, streaming, credentials_fingerprint(self.CREDENTIAL_ENV_VARS))
+        language_model = client_pool.get_or_create(key, factory)
+        return language_model.model_copy(update={"callbacks": callbacks})
+
     @abstractmethod
     def model_name(self) -> str:
         """Returns the name of the model that will be provided.
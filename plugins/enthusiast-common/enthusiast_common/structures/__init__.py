@@ -8,7 +8,9 @@ from .file_types import FileTypes
 from .llm_file import LLMFile
 from .product_details import ProductDetails
 from .product_update_details import ProductUpdateDetails
+from .product_upsert_outcome import ProductUpsertOutcome
+from .product_webhook_event import ProductWebhookAction, ProductWebhookEvent
 from .repositories_instances import RepositoriesInstances
 from .text_content import TextContent
 
-__all__ = ["Address", "BaseContent", "BaseFileContent", "BaseImageContent", "DocumentChunkDetails", "DocumentDetails", "FileTypes", "LLMFile", "ProductDetails", "ProductUpdateDetails", "RepositoriesInstances", "TextContent"]
\ No newline at end of file
+__all__ = ["Address", "BaseContent", "BaseFileContent", "BaseImageContent", "DocumentChunkDetails", "DocumentDetails", "FileTypes", "LLMFile", "ProductDetails", "ProductUpdateDetails", "ProductUpsertOutcome", "ProductWebhookAction", "ProductWebhookEvent", "RepositoriesInstances", "TextContent"]
\ No newline at end of file
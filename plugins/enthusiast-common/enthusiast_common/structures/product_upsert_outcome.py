@@ -0,0 +1,7 @@
+from enum import Enum
+
+
+class ProductUpsertOutcome(Enum):
+    CREATED = "created"
+    UPDATED = "updated"
+    NOT_UPDATED = "not_updated"
@@ -0,0 +1,17 @@
+from dataclasses import dataclass
+from enum import Enum
+from typing import Optional
+
+from .product_details import ProductDetails
+
+
+class ProductWebhookAction(Enum):
+    UPSERT = "upsert"
+    DELETE = "delete"
+
+
+@dataclass
+class ProductWebhookEvent:
+    action: ProductWebhookAction
+    entry_id: str
+    product: Optional[ProductDetails] = None
@@ -38,6 +38,9 @@ class BaseTool(metaclass=ToolMeta):
     ARGS_SCHEMA: Type[BaseModel]
     RETURN_DIRECT: bool
     CONFIGURATION_ARGS = None
+    # Agents may run several calls of tools at once. Tools that aren't safe to run alongside each other, e.g. ones
+    # writing through a shared connector, set this to False and are run one at a time.
+    THREAD_SAFE: bool = True
 
     REQUIRED_CLASS_VARS = {
         "NAME": str,
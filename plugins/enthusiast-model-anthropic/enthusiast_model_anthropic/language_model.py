@@ -8,6 +8,7 @@ from langchain_core.language_models import BaseLanguageModel
 from pydantic import BaseModel
 
 PRIORITIZED_MODELS = ["claude-sonnet-4-6", "claude-opus-4-6"]
+CREDENTIAL_ENV_VAR_NAMES = ("ANTHROPIC_API_KEY", "ANTHROPIC_BASE_URL", "ANTHROPIC_API_URL")
 
 
 class AnthropicImageSource(BaseModel):
@@ -38,9 +39,10 @@ class AnthropicLanguageModelProvider(LanguageModelProvider):
     # has no mechanism to filter these out, we treat Anthropic as non-streaming to avoid surfacing
     # partial tool-call preamble to the user.
     STREAMING_AVAILABLE = False
+    CREDENTIAL_ENV_VARS = CREDENTIAL_ENV_VAR_NAMES
 
     def provide_language_model(self, callbacks: list[BaseCallbackHandler] | None = None) -> BaseLanguageModel:
-        return ChatAnthropic(model=self._model, callbacks=callbacks)
+        return self._get_pooled_language_model(lambda: ChatAnthropic(model=self._model), callbacks)
 
     def model_name(self) -> str:
         return self._model
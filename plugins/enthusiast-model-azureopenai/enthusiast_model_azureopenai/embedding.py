@@ -3,10 +3,17 @@ from enthusiast_common.utils import prioritize_items
 from openai import AzureOpenAI
 
 PRIORITIZED_MODELS = ["text-embedding-3-large", "text-embedding-3-small"]
+CREDENTIAL_ENV_VAR_NAMES = (
+    "AZURE_OPENAI_API_KEY",
+    "AZURE_OPENAI_AD_TOKEN",
+    "AZURE_OPENAI_ENDPOINT",
+    "OPENAI_API_VERSION",
+)
 
 
 class AzureOpenAIEmbeddingProvider(EmbeddingProvider):
     NAME = "Azure OpenAI"
+    CREDENTIAL_ENV_VARS = CREDENTIAL_ENV_VAR_NAMES
 
     def generate_embeddings(self, content: str) -> list[float]:
         """
@@ -15,7 +22,7 @@ class AzureOpenAIEmbeddingProvider(EmbeddingProvider):
         Args:
             content (str): The input text for which the embedding vector is to be generated.
         """
-        openai_embedding = AzureOpenAI().embeddings.create(
+        openai_embedding = self._get_pooled_client(AzureOpenAI).embeddings.create(
             model=self._model, dimensions=self._dimensions, input=content
         )
 
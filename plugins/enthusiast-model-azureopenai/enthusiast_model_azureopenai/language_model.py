@@ -7,6 +7,8 @@ from langchain_openai import AzureChatOpenAI
 from openai import AzureOpenAI
 from pydantic import BaseModel
 
+from .embedding import CREDENTIAL_ENV_VAR_NAMES
+
 PRIORITIZED_MODELS = ["gpt-4.1", "gpt-4.1-mini", "gpt-5", "gpt-5.2"]
 
 
@@ -29,12 +31,15 @@ class AzureOpenAIFileContent(BaseContent):
 
 class AzureOpenAILanguageModelProvider(LanguageModelProvider):
     NAME = "Azure OpenAI"
+    CREDENTIAL_ENV_VARS = CREDENTIAL_ENV_VAR_NAMES
 
     def provide_language_model(self, callbacks: list[BaseCallbackHandler] | None = None) -> BaseLanguageModel:
-        return AzureChatOpenAI(model=self._model, callbacks=callbacks)
+        return self._get_pooled_language_model(lambda: AzureChatOpenAI(model=self._model), callbacks)
 
     def provide_streaming_language_model(self, callbacks: list[BaseCallbackHandler] | None = None, **kwargs) -> BaseLanguageModel:
-        return AzureChatOpenAI(model=self._model, callbacks=callbacks, streaming=True)
+        return self._get_pooled_language_model(
+            lambda: AzureChatOpenAI(model=self._model, streaming=True), callbacks, streaming=True
+        )
 
     def model_name(self) -> str:
         return self._model
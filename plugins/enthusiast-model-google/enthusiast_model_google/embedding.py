@@ -4,10 +4,18 @@ from google import genai
 from google.genai.types import EmbedContentConfig
 
 PRIORITIZED_MODELS = ["models/embedding-001", "models/text-embedding-004"]
+CREDENTIAL_ENV_VAR_NAMES = (
+    "GOOGLE_API_KEY",
+    "GEMINI_API_KEY",
+    "GOOGLE_GENAI_USE_VERTEXAI",
+    "GOOGLE_CLOUD_PROJECT",
+    "GOOGLE_CLOUD_LOCATION",
+)
 
 
 class GoogleEmbeddingProvider(EmbeddingProvider):
     NAME = "Google"
+    CREDENTIAL_ENV_VARS = CREDENTIAL_ENV_VAR_NAMES
 
     def generate_embeddings(self, content: str) -> list[float]:
         """
@@ -17,12 +25,11 @@ class GoogleEmbeddingProvider(EmbeddingProvider):
             content (str): The input text for which the embedding vector is to be generated.
         """
         config = EmbedContentConfig(output_dimensionality=self._dimensions)
-        with genai.Client() as client:
-            google_embedding = client.models.embed_content(
-                model=self._model,
-                config=config,
-                contents=content,
-            )
+        google_embedding = self._get_pooled_client(genai.Client).models.embed_content(
+            model=self._model,
+            config=config,
+            contents=content,
+        )
 
         return google_embedding.embeddings[0].values
 
@@ -6,6 +6,8 @@ from langchain_core.callbacks import BaseCallbackHandler
 from langchain_core.language_models import BaseLanguageModel
 from langchain_google_genai import ChatGoogleGenerativeAI
 
+from .embedding import CREDENTIAL_ENV_VAR_NAMES
+
 PRIORITIZED_MODELS = ["models/gemini-2.0-flash", "models/gemini-1.5-flash"]
 
 
@@ -21,9 +23,10 @@ class GoogleAIFileContent(BaseContent):
 class GoogleLanguageModelProvider(LanguageModelProvider):
     NAME = "Google"
     STREAMING_AVAILABLE = False
+    CREDENTIAL_ENV_VARS = CREDENTIAL_ENV_VAR_NAMES
 
     def provide_language_model(self, callbacks: list[BaseCallbackHandler] | None = None) -> BaseLanguageModel:
-        return ChatGoogleGenerativeAI(model=self._model)
+        return self._get_pooled_language_model(lambda: ChatGoogleGenerativeAI(model=self._model))
 
     def model_name(self) -> str:
         return self._model
@@ -5,6 +5,7 @@ from enthusiast_common.utils import prioritize_items
 from mistralai import Mistral
 
 PRIORITIZED_MODELS = ["mistral-embed"]
+CREDENTIAL_ENV_VAR_NAMES = ("MISTRAL_API_KEY",)
 
 # These models produce a fixed-size output vector and do not accept the
 # output_dimension parameter in the Mistral embeddings API.
@@ -16,6 +17,7 @@ FIXED_DIMENSION_MODELS: dict[str, list[int]] = {
 
 class MistralAIEmbeddingProvider(EmbeddingProvider):
     NAME = "Mistral AI"
+    CREDENTIAL_ENV_VARS = CREDENTIAL_ENV_VAR_NAMES
 
     def generate_embeddings(self, content: str) -> list[float]:
         """
@@ -24,7 +26,7 @@ class MistralAIEmbeddingProvider(EmbeddingProvider):
         Args:
             content (str): The input text for which the embedding vector is to be generated.
         """
-        client = Mistral(api_key=os.environ["MISTRAL_API_KEY"])
+        client = self._get_pooled_client(lambda: Mistral(api_key=os.environ["MISTRAL_API_KEY"]))
 
         kwargs = {"inputs": content, "model": self._model}
         if self._model not in FIXED_DIMENSION_MODELS:
@@ -8,6 +8,8 @@ from langchain_core.language_models import BaseLanguageModel
 from langchain_mistralai import ChatMistralAI
 from mistralai import Mistral
 
+from .embedding import CREDENTIAL_ENV_VAR_NAMES
+
 PRIORITIZED_MODELS = ["mistral-medium-2508", "mistral-medium-2505"]
 
 
@@ -21,12 +23,15 @@ class MistralAIFileContent(BaseContent):
 
 class MistralAILanguageModelProvider(LanguageModelProvider):
     NAME = "Mistral AI"
+    CREDENTIAL_ENV_VARS = CREDENTIAL_ENV_VAR_NAMES
 
     def provide_language_model(self, callbacks: list[BaseCallbackHandler] | None = None) -> BaseLanguageModel:
-        return ChatMistralAI(model=self._model, callbacks=callbacks)
+        return self._get_pooled_language_model(lambda: ChatMistralAI(model=self._model), callbacks)
 
     def provide_streaming_language_model(self, callbacks: list[BaseCallbackHandler] | None) -> BaseLanguageModel:
-        return ChatMistralAI(model=self._model, callbacks=callbacks, streaming=True)
+        return self._get_pooled_language_model(
+            lambda: ChatMistralAI(model=self._model, streaming=True), callbacks, streaming=True
+        )
 
     def model_name(self) -> str:
         return self._model
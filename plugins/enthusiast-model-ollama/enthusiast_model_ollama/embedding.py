@@ -1,9 +1,12 @@
 from enthusiast_common.registry.embeddings import EmbeddingProvider
 from ollama import Client
 
+CREDENTIAL_ENV_VAR_NAMES = ("OLLAMA_HOST",)
+
 
 class OllamaEmbeddingProvider(EmbeddingProvider):
     NAME = "Ollama"
+    CREDENTIAL_ENV_VARS = CREDENTIAL_ENV_VAR_NAMES
 
     def generate_embeddings(self, content: str) -> list[float]:
         """
@@ -12,7 +15,7 @@ class OllamaEmbeddingProvider(EmbeddingProvider):
         Args:
             content (str): The input text for which the embedding vector is to be generated.
         """
-        embedding_response = Client().embed(self._model, input=content)
+        embedding_response = self._get_pooled_client(Client).embed(self._model, input=content)
 
         return list(embedding_response.embeddings[0])
 
@@ -5,7 +5,7 @@ from langchain_core.language_models import BaseLanguageModel
 from langchain_ollama import ChatOllama
 from ollama import Client
 
-from .embedding import OllamaEmbeddingProvider
+from .embedding import CREDENTIAL_ENV_VAR_NAMES, OllamaEmbeddingProvider
 
 
 class OllamaImageContent(BaseContent):
@@ -16,9 +16,10 @@ class OllamaImageContent(BaseContent):
 class OllamaLanguageModelProvider(LanguageModelProvider):
     NAME = "Ollama"
     STREAMING_AVAILABLE = False
+    CREDENTIAL_ENV_VARS = CREDENTIAL_ENV_VAR_NAMES
 
     def provide_language_model(self, callbacks: list[BaseCallbackHandler] | None = None) -> BaseLanguageModel:
-        return ChatOllama(model=self._model)
+        return self._get_pooled_language_model(lambda: ChatOllama(model=self._model))
 
     def model_name(self) -> str:
         return self._model
@@ -3,10 +3,19 @@ from enthusiast_common.utils import prioritize_items
 from openai import OpenAI
 
 PRIORITIZED_MODELS = ["text-embedding-3-large", "text-embedding-3-small"]
+CREDENTIAL_ENV_VAR_NAMES = (
+    "OPENAI_API_KEY",
+    "OPENAI_BASE_URL",
+    "OPENAI_API_BASE",
+    "OPENAI_ORG_ID",
+    "OPENAI_ORGANIZATION",
+    "OPENAI_PROJECT_ID",
+)
 
 
 class OpenAIEmbeddingProvider(EmbeddingProvider):
     NAME = "OpenAI"
+    CREDENTIAL_ENV_VARS = CREDENTIAL_ENV_VAR_NAMES
 
     def generate_embeddings(self, content: str) -> list[float]:
         """
@@ -15,7 +24,9 @@ class OpenAIEmbeddingProvider(EmbeddingProvider):
         Args:
             content (str): The input text for which the embedding vector is to be generated.
         """
-        openai_embedding = OpenAI().embeddings.create(model=self._model, dimensions=self._dimensions, input=content)
+        openai_embedding = self._get_pooled_client(OpenAI).embeddings.create(
+            model=self._model, dimensions=self._dimensions, input=content
+        )
 
         return openai_embedding.data[0].embedding
 
@@ -0,0 +1,2 @@
+from .document_source import FileDocumentSource as FileDocumentSource
+from .product_source import FileProductSource as FileProductSource
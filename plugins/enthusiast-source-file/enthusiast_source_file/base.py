@@ -0,0 +1,90 @@
+import json
+import os
+from pathlib import Path
+from typing import Any, Iterator, Optional
+
+from enthusiast_common.utils import RequiredFieldsModel
+from pydantic import Field, field_validator
+
+from .readers import DEFAULT_BATCH_SIZE, read_batches
+
+ROOT_ENV_VAR = "ENTHUSIAST_FILE_SOURCE_ROOT"
+
+
+def resolve_source_path(path: str) -> Path:
+    """Resolves a configured file path, allowing only files inside the directory set in ENTHUSIAST_FILE_SOURCE_ROOT.
+
+    Relative paths are resolved against that directory. Symlinks and `..` segments are resolved before the check,
+    so neither can be used to reach files outside of it.
+    """
+    root = os.environ.get(ROOT_ENV_VAR)
+    if not root:
+        raise ValueError(f"Set {ROOT_ENV_VAR} to the directory files may be imported from")
+    try:
+        root_path = Path(root).resolve(strict=True)
+    except FileNotFoundError:
+        raise ValueError(f"Directory {root} set in {ROOT_ENV_VAR} does not exist")
+    try:
+        resolved = (root_path / path).resolve(strict=True)
+    except FileNotFoundError:
+        raise ValueError(f"File {path} does not exist")
+    if not resolved.is_relative_to(root_path):
+        raise ValueError(f"File {path} is outside of {ROOT_ENV_VAR}")
+    if not resolved.is_file():
+        raise ValueError(f"{path} is not a file")
+    return resolved
+
+
+class FileSourceConfig(RequiredFieldsModel):
+    path: str = Field(
+        title="File path",
+        description="Path of a CSV, NDJSON or Parquet file, relative to the directory files are imported from",
+    )
+    file_format: Optional[str] = Field(
+        title="File format",
+        description="(Optional) csv, ndjson or parquet, detected from the file extension by default",
+        default=None,
+    )
+    column_mapping: dict[str, str] = Field(
+        title="Column mapping",
+        description='(Optional) Columns to read fields from, e.g. {"entry_id": "ID"}. '
+        "Fields that aren't mapped are read from columns of the same name",
+        default_factory=dict,
+    )
+    batch_size: int = Field(
+        title="Batch size",
+        description="(Optional) Number of rows read from the file at once",
+        default=DEFAULT_BATCH_SIZE,
+    )
+
+    @field_validator("path")
+    @classmethod
+    def _path_inside_root(cls, path: str) -> str:
+        resolve_source_path(path)
+        return path
+
+
+class FileSourceMixin:
+    """Reads rows of the configured file in batches and maps their columns to fields of synced items."""
+
+    FIELDS: tuple[str, ...] = ()
+    CONFIGURATION_ARGS: FileSourceConfig
+
+    def _read_rows(self) -> Iterator[dict[str, Any]]:
+        config = self.CONFIGURATION_ARGS
+        columns = [self._column_for(field) for field in self.FIELDS]
+        # Resolved again at read time, as the file may have been replaced with a symlink since it was configured.
+        path = resolve_source_path(config.path)
+        for batch in read_batches(path, config.file_format, columns, config.batch_size):
+            yield from batch
+
+    def _column_for(self, field: str) -> str:
+        return self.CONFIGURATION_ARGS.column_mapping.get(field, field)
+
+    def _get_text(self, row: dict[str, Any], field: str) -> str:
+        value = row.get(self._column_for(field))
+        if value is None:
+            return ""
+        if isinstance(value, (dict, list)):
+            return json.dumps(value)
+        return str(value)
@@ -0,0 +1,30 @@
+import logging
+from typing import Any, Iterator
+
+from enthusiast_common import DocumentDetails, DocumentSourcePlugin
+
+from .base import FileSourceConfig, FileSourceMixin
+
+logger = logging.getLogger(__name__)
+
+
+class FileDocumentSource(FileSourceMixin, DocumentSourcePlugin):
+    NAME = "File Document Source"
+    CONFIGURATION_ARGS = FileSourceConfig
+    FIELDS = ("url", "title", "content")
+
+    def __init__(self, data_set_id: Any):
+        super().__init__(data_set_id)
+
+    def fetch(self) -> Iterator[DocumentDetails]:
+        """Yields documents read from the file, which is never loaded into memory as a whole.
+
+        Rows without a URL are skipped.
+        """
+        for row in self._read_rows():
+            url = self._get_text(row, "url")
+            if not url:
+                logger.warning(f"Skipping a row without {self._column_for('url')} in {self.CONFIGURATION_ARGS.path}")
+                continue
+
+            yield DocumentDetails(url=url, title=self._get_text(row, "title"), content=self._get_text(row, "content"))
@@ -0,0 +1,42 @@
+import logging
+from typing import Any, Iterator
+
+from enthusiast_common import ProductDetails, ProductSourcePlugin
+
+from .base import FileSourceConfig, FileSourceMixin
+
+logger = logging.getLogger(__name__)
+
+
+class FileProductSource(FileSourceMixin, ProductSourcePlugin):
+    NAME = "File Product Source"
+    CONFIGURATION_ARGS = FileSourceConfig
+    FIELDS = ("entry_id", "name", "slug", "description", "sku", "properties", "categories", "price")
+
+    def __init__(self, data_set_id: Any):
+        super().__init__(data_set_id)
+
+    def fetch(self) -> Iterator[ProductDetails]:
+        """Yields products read from the file, which is never loaded into memory as a whole.
+
+        Rows without an entry ID are skipped.
+        """
+        for row in self._read_rows():
+            entry_id = self._get_text(row, "entry_id")
+            if not entry_id:
+                logger.warning(
+                    f"Skipping a row without {self._column_for('entry_id')} in {self.CONFIGURATION_ARGS.path}"
+                )
+                continue
+
+            price = row.get(self._column_for("price"))
+            yield ProductDetails(
+                entry_id=entry_id,
+                name=self._get_text(row, "name"),
+                slug=self._get_text(row, "slug"),
+                description=self._get_text(row, "description"),
+                sku=self._get_text(row, "sku"),
+                properties=self._get_text(row, "properties"),
+                categories=self._get_text(row, "categories"),
+                price=float(price) if price not in (None, "") else 0.0,
+            )
@@ -0,0 +1,92 @@
+import csv
+import json
+from pathlib import Path
+from typing import Any, Iterable, Iterator, Optional
+
+CSV = "csv"
+NDJSON = "ndjson"
+PARQUET = "parquet"
+
+FORMATS_BY_EXTENSION = {
+    ".csv": CSV,
+    ".ndjson": NDJSON,
+    ".jsonl": NDJSON,
+    ".parquet": PARQUET,
+}
+
+DEFAULT_BATCH_SIZE = 1000
+
+
+def detect_format(path: Path) -> str:
+    try:
+        return FORMATS_BY_EXTENSION[path.suffix.lower()]
+    except KeyError:
+        raise ValueError(
+            f"Can't tell the format of {path.name}, set it explicitly to one of: {', '.join([CSV, NDJSON, PARQUET])}"
+        )
+
+
+def read_batches(
+    path: Path,
+    file_format: Optional[str] = None,
+    columns: Optional[Iterable[str]] = None,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+) -> Iterator[list[dict[str, Any]]]:
+    """Reads rows of a file as dictionaries, in batches of at most ``batch_size`` rows.
+
+    Only the current batch is held in memory, so files of any size can be read.
+
+    Args:
+        path: Path of the file.
+        file_format: One of "csv", "ndjson" or "parquet". Detected from the file extension if not given.
+        columns: Columns to read. Parquet files only read these columns from disk, other formats read all of them.
+        batch_size: Maximum number of rows in a batch.
+    """
+    file_format = file_format or detect_format(path)
+    if file_format == CSV:
+        rows = _read_csv(path)
+    elif file_format == NDJSON:
+        rows = _read_ndjson(path)
+    elif file_format == PARQUET:
+        yield from _read_parquet(path, columns, batch_size)
+        return
+    else:
+        raise ValueError(f"Unsupported file format: {file_format}")
+
+    batch = []
+    for row in rows:
+        batch.append(row)
+        if len(batch) == batch_size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def _read_csv(path: Path) -> Iterator[dict[str, Any]]:
+    with open(path, newline="", encoding="utf-8-sig") as csv_file:
+        yield from csv.DictReader(csv_file)
+
+
+def _read_ndjson(path: Path) -> Iterator[dict[str, Any]]:
+    with open(path, encoding="utf-8") as ndjson_file:
+        for line in ndjson_file:
+            if line.strip():
+                yield json.loads(line)
+
+
+def _read_parquet(path: Path, columns: Optional[Iterable[str]], batch_size: int) -> Iterator[list[dict[str, Any]]]:
+    try:
+        import pyarrow.parquet as pq
+    except ImportError:
+        raise ImportError(
+            "Reading Parquet files requires pyarrow, install it with the parquet extra: enthusiast-source-file[parquet]"
+        )
+
+    # Memory mapping lets the OS page row groups in and out, instead of reading the whole file into memory.
+    parquet_file = pq.ParquetFile(path, memory_map=True)
+    if columns is not None:
+        available_columns = set(parquet_file.schema_arrow.names)
+        columns = [column for column in columns if column in available_columns]
+    for record_batch in parquet_file.iter_batches(batch_size=batch_size, columns=columns):
+        yield record_batch.to_pylist()
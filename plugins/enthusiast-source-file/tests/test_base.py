@@ -0,0 +1,63 @@
+import pytest
+from enthusiast_source_file import FileProductSource
+from enthusiast_source_file.base import ROOT_ENV_VAR, FileSourceConfig
+from pydantic import ValidationError
+
+
+@pytest.fixture
+def feeds(tmp_path, monkeypatch):
+    root = tmp_path / "feeds"
+    root.mkdir()
+    (root / "products.csv").write_text("entry_id,name,price\n1,Trail Shoe,120.00\n")
+    (tmp_path / "secrets.csv").write_text("entry_id,name\n1,SECRET_KEY\n")
+    monkeypatch.setenv(ROOT_ENV_VAR, str(root))
+    return root
+
+
+def test_reads_file_relative_to_root(feeds):
+    # Given
+    source = FileProductSource(data_set_id=1)
+    source.set_runtime_arguments({"configuration_args": {"path": "products.csv"}})
+
+    # When
+    products = list(source.fetch())
+
+    # Then
+    assert [(product.entry_id, product.name, product.price) for product in products] == [("1", "Trail Shoe", 120.0)]
+
+
+@pytest.mark.parametrize("path", ["../secrets.csv", "/etc/passwd", "missing.csv", "."])
+def test_rejects_paths_outside_root(feeds, path):
+    # When & Then
+    with pytest.raises(ValidationError):
+        FileSourceConfig(path=path)
+
+
+def test_rejects_symlinks_leading_outside_root(feeds):
+    # Given
+    (feeds / "linked.csv").symlink_to(feeds.parent / "secrets.csv")
+
+    # When & Then
+    with pytest.raises(ValidationError, match="outside"):
+        FileSourceConfig(path="linked.csv")
+
+
+def test_rejects_files_replaced_with_symlinks_after_configuring(feeds):
+    # Given
+    source = FileProductSource(data_set_id=1)
+    source.set_runtime_arguments({"configuration_args": {"path": "products.csv"}})
+    (feeds / "products.csv").unlink()
+    (feeds / "products.csv").symlink_to(feeds.parent / "secrets.csv")
+
+    # When & Then
+    with pytest.raises(ValueError, match="outside"):
+        list(source.fetch())
+
+
+def test_rejects_all_paths_without_root(feeds, monkeypatch):
+    # Given
+    monkeypatch.delenv(ROOT_ENV_VAR)
+
+    # When & Then
+    with pytest.raises(ValidationError, match=ROOT_ENV_VAR):
+        FileSourceConfig(path="products.csv")
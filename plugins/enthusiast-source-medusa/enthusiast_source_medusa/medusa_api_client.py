@@ -3,12 +3,13 @@ from typing import Any
 
 import requests
 from enthusiast_common.errors import ECommerceConnectorError
+from enthusiast_common.http import HTTPClient
 
 
 class MedusaAPIClient:
     def __init__(self, base_url: str, api_key: str):
         self._base_url = base_url
-        self._headers = self._build_headers(api_key)
+        self._http_client = HTTPClient(base_url, headers=self._build_headers(api_key))
 
     def get(self, path: str, body: dict[str, Any] = None, params: dict[str, Any] = None) -> dict[str, Any]:
         return self._request("GET", path, json=body, params=params)
@@ -20,7 +21,7 @@ class MedusaAPIClient:
         """Execute an HTTP request and raise ECommerceConnectorError for any failure."""
         url = f"{self._base_url}{path}"
         try:
-            response = requests.request(method, url, headers=self._headers, **kwargs)
+            response = self._http_client.request(method, path, **kwargs)
         except requests.exceptions.RequestException as e:
             self._propagate_request_error(url, e)
 
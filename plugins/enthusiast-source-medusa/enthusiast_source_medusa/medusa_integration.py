@@ -13,6 +13,7 @@ class MedusaIntegrationConfig(RequiredFieldsModel):
     base_url: str = Field(title="Base URL", description="Medusa API URL")
     api_key: str = Field(title="API key", description="Medusa API Key")
     admin_base_url: Optional[str] = Field(title="Admin base URL", description="(Optional) Medusa Admin URL, if different than the API URL", default=None)
+    webhook_secret: Optional[str] = Field(title="Webhook secret", description="(Optional) Secret used to sign product event webhooks", default=None)
 
 
 class MedusaIntegration(ECommerceIntegrationPlugin):
@@ -27,5 +28,6 @@ class MedusaIntegration(ECommerceIntegrationPlugin):
     def build_product_source(self) -> ProductSourcePlugin:
         source = MedusaProductSource(self.data_set_id)
         source.set_runtime_arguments({"configuration_args": {"base_url": self.CONFIGURATION_ARGS.base_url,
-                                                             "api_key": self.CONFIGURATION_ARGS.api_key}})
+                                                             "api_key": self.CONFIGURATION_ARGS.api_key,
+                                                             "webhook_secret": self.CONFIGURATION_ARGS.webhook_secret}})
         return source
@@ -1,12 +1,13 @@
 import json
 import logging
-from typing import Optional
+from typing import Iterator, Optional, Union
 
 from enthusiast_common.connectors import ECommercePlatformConnector
 from enthusiast_common.errors import ECommerceConnectorError
 from enthusiast_common.structures import Address, ProductDetails, ProductUpdateDetails
 
 from .medusa_api_client import MedusaAPIClient
+from .medusa_cache import medusa_cache
 from .medusa_product_source import MedusaProductSource
 
 logger = logging.getLogger(__name__)
@@ -24,13 +25,14 @@ DEFAULT_ADDRESS = Address(
 class MedusaPlatformConnector(ECommercePlatformConnector):
 
     required_product_create_fields = { 'name', 'sku', 'price' }
+    # Number of SKUs or product IDs sent in a single list or batch request.
+    MAX_BATCH_SIZE = 100
 
     def __init__(self, base_url: str, admin_base_url: str, api_key: str, region_id: Optional[str] = None):
         self._client = MedusaAPIClient(base_url, api_key)
         self._base_url = base_url.rstrip("/")
         self._admin_base_url = admin_base_url.rstrip("/")
         self._region_id = region_id
-        self._stock_location_id: Optional[str] = None
 
     def create_empty_order(self, email: Optional[str] = None, address: Optional[Address] = None) -> str:
         raise NotImplementedError
@@ -42,13 +44,14 @@ class MedusaPlatformConnector(ECommercePlatformConnector):
         email_or_default = email or DEFAULT_EMAIL
         address_or_default = address or DEFAULT_ADDRESS
 
+        variant_ids = self._get_default_variant_ids_for_product_ids([product_id for product_id, _ in items])
         payload = {
             "region_id": self._get_default_region_id(),
             "email": email_or_default,
             "billing_address": self._address_to_payload_dict(address_or_default),
             "shipping_address": self._address_to_payload_dict(address_or_default),
             "items": [
-                {"variant_id": self._get_default_variant_id_for_product_id(product_id), "quantity": int(quantity)}
+                {"variant_id": variant_ids[product_id], "quantity": int(quantity)}
                 for product_id, quantity in items
             ]
         }
@@ -153,11 +156,13 @@ class MedusaPlatformConnector(ECommercePlatformConnector):
 
     def update_stock(self, sku: str, quantity: int) -> bool:
         """Returns True if updated, False if the SKU was not found."""
-        product = self.get_product_by_sku(sku)
-        if not product:
-            return False
+        inventory_item_id = medusa_cache.get(self._cache_key("inventory_item_id", sku))
+        if inventory_item_id is None:
+            product = self.get_product_by_sku(sku)
+            if not product:
+                return False
+            inventory_item_id = self._get_inventory_item_id_by_sku(sku)
 
-        inventory_item_id = self._get_inventory_item_id_by_sku(sku)
         location_id = self._get_default_stock_location_id()
 
         current_quantity = self._get_stocked_quantity(inventory_item_id, location_id)
@@ -166,12 +171,82 @@ class MedusaPlatformConnector(ECommercePlatformConnector):
         if new_quantity < 0:
             raise ValueError(f"Insufficient stock: {current_quantity} available, {abs(quantity)} requested")
 
-        self._client.post(
-            f"/admin/inventory-items/{inventory_item_id}/location-levels/{location_id}",
-            {"stocked_quantity": new_quantity},
-        )
+        try:
+            self._client.post(
+                f"/admin/inventory-items/{inventory_item_id}/location-levels/{location_id}",
+                {"stocked_quantity": new_quantity},
+            )
+        except ECommerceConnectorError:
+            # The inventory item may have been removed since it was cached.
+            medusa_cache.delete(self._cache_key("inventory_item_id", sku))
+            raise
         return True
 
+    def update_stock_many(self, items: list[tuple[str, int]]) -> dict[str, Union[bool, Exception]]:
+        """Updates stock levels of many SKUs at once.
+
+        Inventory items and their current levels are read with one request per chunk of SKUs, and all new levels
+        of a chunk are written with a single batch request, instead of four requests per SKU. Quantities of
+        repeated SKUs are added up.
+
+        Args:
+            items: Pairs of SKU and quantity delta to add to current stock.
+
+        Returns:
+            For every SKU: True if updated, False if no inventory item was found for it, or the error that
+            prevented the update.
+        """
+        quantities: dict[str, int] = {}
+        for sku, quantity in items:
+            quantities[sku] = quantities.get(sku, 0) + quantity
+
+        location_id = self._get_default_stock_location_id()
+        results: dict[str, Union[bool, Exception]] = {}
+        for skus in self._chunks(list(quantities), self.MAX_BATCH_SIZE):
+            inventory_items = self._get_inventory_items_by_skus(skus)
+            levels_to_create, levels_to_update = [], []
+
+            for sku in skus:
+                inventory_item = inventory_items.get(sku)
+                if inventory_item is None:
+                    results[sku] = False
+                    continue
+
+                levels = inventory_item.get("location_levels") or []
+                level = next((level for level in levels if level.get("location_id") == location_id), None)
+                current_quantity = level.get("stocked_quantity", 0) if level else 0
+                new_quantity = current_quantity + quantities[sku]
+                if new_quantity < 0:
+                    results[sku] = ValueError(
+                        f"Insufficient stock: {current_quantity} available, {abs(quantities[sku])} requested"
+                    )
+                    continue
+
+                level_payload = {
+                    "inventory_item_id": inventory_item["id"],
+                    "location_id": location_id,
+                    "stocked_quantity": new_quantity,
+                }
+                (levels_to_update if level else levels_to_create).append((sku, level_payload))
+
+            batch = levels_to_create + levels_to_update
+            if not batch:
+                continue
+            try:
+                self._client.post(
+                    "/admin/inventory-items/location-levels/batch",
+                    {
+                        "create": [payload for _, payload in levels_to_create],
+                        "update": [payload for _, payload in levels_to_update],
+                    },
+                )
+            except ECommerceConnectorError as e:
+                results.update({sku: e for sku, _ in batch})
+            else:
+                results.update({sku: True for sku, _ in batch})
+
+        return {sku: results[sku] for sku in quantities}
+
     def _get_stocked_quantity(self, inventory_item_id: str, location_id: str) -> int:
         response = self._client.get(
             f"/admin/inventory-items/{inventory_item_id}/location-levels",
@@ -185,6 +260,11 @@ class MedusaPlatformConnector(ECommercePlatformConnector):
     def _get_inventory_item_id_by_sku(self, sku: str) -> str:
         # Inventory items can't be queried by variant_id. They inherit the variant's sku
         # field, which we set explicitly at creation time alongside ean for this purpose.
+        cache_key = self._cache_key("inventory_item_id", sku)
+        inventory_item_id = medusa_cache.get(cache_key)
+        if inventory_item_id is not None:
+            return inventory_item_id
+
         response = self._client.get("/admin/inventory-items", params={"sku": sku})
         inventory_items = response.get("inventory_items", [])
         if not inventory_items:
@@ -192,18 +272,32 @@ class MedusaPlatformConnector(ECommercePlatformConnector):
                 f"No inventory item found for SKU '{sku}'. "
                 "Ensure the product variant was created with manage_inventory enabled."
             )
+        medusa_cache.set(cache_key, inventory_items[0]["id"])
         return inventory_items[0]["id"]
 
+    def _get_inventory_items_by_skus(self, skus: list[str]) -> dict[str, dict]:
+        """Returns inventory items of the given SKUs together with their current location levels."""
+        response = self._client.get(
+            "/admin/inventory-items",
+            params={"sku[]": skus, "fields": "id,sku,*location_levels", "limit": len(skus)},
+        )
+        inventory_items = {}
+        for inventory_item in response.get("inventory_items", []):
+            inventory_items.setdefault(inventory_item.get("sku"), inventory_item)
+            medusa_cache.set(self._cache_key("inventory_item_id", inventory_item.get("sku")), inventory_item["id"])
+        return inventory_items
+
     def _get_default_stock_location_id(self) -> str:
-        if self._stock_location_id is None:
-            response = self._client.get("/admin/stock-locations")
-            locations = response.get("stock_locations", [])
-            if not locations:
-                raise ECommerceConnectorError(
-                    "No stock locations configured in Medusa. At least one stock location must exist to update inventory."
-                )
-            self._stock_location_id = locations[0]["id"]
-        return self._stock_location_id
+        return medusa_cache.get_or_set(self._cache_key("stock_location_id"), self._fetch_default_stock_location_id)
+
+    def _fetch_default_stock_location_id(self) -> str:
+        response = self._client.get("/admin/stock-locations")
+        locations = response.get("stock_locations", [])
+        if not locations:
+            raise ECommerceConnectorError(
+                "No stock locations configured in Medusa. At least one stock location must exist to update inventory."
+            )
+        return locations[0]["id"]
 
     def get_admin_url_for_order_id(self, order_id: str) -> str:
         return f"{self._admin_base_url}/app/draft-orders/{order_id}"
@@ -215,6 +309,9 @@ class MedusaPlatformConnector(ECommercePlatformConnector):
         return self._get_default_region_id()
 
     def _get_default_region_id(self) -> str:
+        return medusa_cache.get_or_set(self._cache_key("region_id"), self._fetch_default_region_id)
+
+    def _fetch_default_region_id(self) -> str:
         response = self._client.get("/admin/regions")
         regions = response.get("regions", [])
         if not regions:
@@ -238,11 +335,33 @@ class MedusaPlatformConnector(ECommercePlatformConnector):
         return { key: value for key, value in payload.items() if value is not None }
 
     def _get_default_variant_id_for_product_id(self, product_id: str) -> str:
-        response = self._client.get(f"/admin/products/{product_id}")
-        variants = response.get("product", {}).get("variants", [])
-        if not variants:
-            raise ECommerceConnectorError(f"Product '{product_id}' has no variants and cannot be ordered.")
-        return variants[0]["id"]
+        return self._get_default_variant_ids_for_product_ids([product_id])[product_id]
+
+    def _get_default_variant_ids_for_product_ids(self, product_ids: list[str]) -> dict[str, str]:
+        """Resolves default variants of products, fetching the ones not cached yet with one request per chunk."""
+        variant_ids = {}
+        for product_id in product_ids:
+            variant_id = medusa_cache.get(self._cache_key("default_variant_id", product_id))
+            if variant_id is not None:
+                variant_ids[product_id] = variant_id
+
+        missing_product_ids = [product_id for product_id in dict.fromkeys(product_ids) if product_id not in variant_ids]
+        for chunk in self._chunks(missing_product_ids, self.MAX_BATCH_SIZE):
+            response = self._client.get(
+                "/admin/products", params={"id[]": chunk, "fields": "id,variants.id", "limit": len(chunk)}
+            )
+            for product in response.get("products", []):
+                variants = product.get("variants") or []
+                if variants:
+                    variant_ids[product["id"]] = variants[0]["id"]
+                    medusa_cache.set(self._cache_key("default_variant_id", product["id"]), variants[0]["id"])
+
+        for product_id in product_ids:
+            if product_id not in variant_ids:
+                raise ECommerceConnectorError(
+                    f"Product '{product_id}' was not found or has no variants and cannot be ordered."
+                )
+        return variant_ids
 
     def _get_default_store_currency_code(self) -> str:
         store_data = self._get_default_store_data()
@@ -255,6 +374,9 @@ class MedusaPlatformConnector(ECommercePlatformConnector):
         return default_currency["currency_code"]
 
     def _get_default_store_data(self):
+        return medusa_cache.get_or_set(self._cache_key("store"), self._fetch_default_store_data)
+
+    def _fetch_default_store_data(self):
         response = self._client.get("/admin/stores")
         try:
             return response["stores"][0]
@@ -278,6 +400,15 @@ class MedusaPlatformConnector(ECommercePlatformConnector):
     def _default_product_options() -> list[dict[str, str | list[str]]]:
         return [{ "title": "Default", "values": ["Default"] }]
 
+    def _cache_key(self, *parts: str) -> tuple[str, ...]:
+        # Connectors of the same Medusa instance share cached data.
+        return (self._base_url, *parts)
+
+    @staticmethod
+    def _chunks(values: list, size: int) -> Iterator[list]:
+        for start in range(0, len(values), size):
+            yield values[start:start + size]
+
     @staticmethod
     def _remove_none_values(d: dict) -> dict:
         return {k: v for k, v in d.items() if v is not None}
@@ -1,7 +1,15 @@
 import json
-from typing import Any, Optional
-
-from enthusiast_common import ProductDetails, ProductSourcePlugin
+from typing import Any, Mapping, Optional
+
+from enthusiast_common import (
+    ProductDetails,
+    ProductSourcePlugin,
+    ProductWebhookAction,
+    ProductWebhookEvent,
+    ProductWebhookHandler,
+)
+from enthusiast_common.errors import ECommerceConnectorError
+from enthusiast_common.http import fetch_pages, verify_hmac_signature
 from enthusiast_common.utils import RequiredFieldsModel
 from pydantic import Field
 
@@ -11,11 +19,18 @@ from .medusa_api_client import MedusaAPIClient
 class MedusaProductSourceConfig(RequiredFieldsModel):
     api_key: str = Field(title="API key", description="Medusa API key")
     base_url: str = Field(title="Base url", description="Medusa API base url")
+    webhook_secret: Optional[str] = Field(
+        title="Webhook secret", description="(Optional) Secret used to sign product event webhooks", default=None
+    )
 
 
-class MedusaProductSource(ProductSourcePlugin):
+class MedusaProductSource(ProductSourcePlugin, ProductWebhookHandler):
     NAME = "Medusa"
     CONFIGURATION_ARGS = MedusaProductSourceConfig
+    PAGE_SIZE = 100
+    MAX_CONCURRENT_REQUESTS = 4
+    UPSERT_EVENTS = ("product.created", "product.updated")
+    DELETE_EVENTS = ("product.deleted",)
 
     def __init__(self, data_set_id):
         """
@@ -68,27 +83,59 @@ class MedusaProductSource(ProductSourcePlugin):
     def fetch(self) -> list[ProductDetails]:
         """Fetch product list.
 
+        The first page tells how many products there are, the remaining pages are then fetched concurrently.
+
         Returns:
             list[ProductDetails]: A list of products.
         """
+        client = self._build_api_client()
+        first_page = self._fetch_page(client, offset=0)
+        products = [self.get_product(medusa_product) for medusa_product in first_page.get("products", [])]
 
-        products = []
-        offset = 0  # Starting point for product list pagination.
-        limit = 100  # Page size.
+        total_count = first_page.get("count", len(products))
+        offsets = range(self.PAGE_SIZE, total_count, self.PAGE_SIZE)
+        pages = fetch_pages(
+            lambda offset: self._fetch_page(client, offset), offsets, max_workers=self.MAX_CONCURRENT_REQUESTS
+        )
+        for page in pages:
+            products.extend(self.get_product(medusa_product) for medusa_product in page.get("products", []))
 
-        client = self._build_api_client()
-        while True:
-            data = client.get("/admin/products?expand=categories", params={"limit": limit, "offset": offset})
+        return products
 
-            medusa_products = data.get("products", [])
-            for medusa_product in medusa_products:
-                products.append(self.get_product(medusa_product))
-            if len(medusa_products) < limit:
-                break
+    def verify_webhook(self, headers: Mapping[str, str], body: bytes) -> bool:
+        return verify_hmac_signature(
+            self.CONFIGURATION_ARGS.webhook_secret, body, headers.get("x-medusa-signature"), encoding="hex"
+        )
 
-            offset += limit
+    def parse_webhook(self, headers: Mapping[str, str], body: bytes) -> list[ProductWebhookEvent]:
+        """Handles product events forwarded by a Medusa subscriber.
 
-        return products
+        Expects ``{"event": "product.updated", "data": {"id": "prod_..."}}`` signed with a hex HMAC-SHA256 of the
+        body in the ``X-Medusa-Signature`` header. Created and updated products are fetched from the admin API.
+        """
+        payload = json.loads(body)
+        event = payload.get("event")
+        entry_id = payload.get("data", {}).get("id")
+
+        if event in self.DELETE_EVENTS:
+            return [ProductWebhookEvent(action=ProductWebhookAction.DELETE, entry_id=entry_id)]
+        if event not in self.UPSERT_EVENTS:
+            return []
+
+        try:
+            medusa_product = self._build_api_client().get(f"/admin/products/{entry_id}?expand=categories")["product"]
+        except ECommerceConnectorError as e:
+            if e.status_code == 404:
+                return [ProductWebhookEvent(action=ProductWebhookAction.DELETE, entry_id=entry_id)]
+            raise
+        return [
+            ProductWebhookEvent(
+                action=ProductWebhookAction.UPSERT, entry_id=entry_id, product=self.get_product(medusa_product)
+            )
+        ]
+
+    def _fetch_page(self, client: MedusaAPIClient, offset: int) -> dict[str, Any]:
+        return client.get("/admin/products?expand=categories", params={"limit": self.PAGE_SIZE, "offset": offset})
 
     def _build_api_client(self) -> MedusaAPIClient:
         return MedusaAPIClient(self.CONFIGURATION_ARGS.base_url.rstrip("/"), self.CONFIGURATION_ARGS.api_key)
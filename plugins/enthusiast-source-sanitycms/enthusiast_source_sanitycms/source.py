@@ -1,5 +1,8 @@
-import requests
+import json
+from typing import Any, Iterator, Optional
+
 from enthusiast_common import DocumentDetails, DocumentSourcePlugin
+from enthusiast_common.http import HTTPClient
 from enthusiast_common.utils import RequiredFieldsModel
 from pydantic import Field
 
@@ -16,50 +19,72 @@ class SanityCMSConfig(RequiredFieldsModel):
 class SanityCMSDocumentSource(DocumentSourcePlugin):
     NAME = "Sanity CMS"
     CONFIGURATION_ARGS = SanityCMSConfig
+    PAGE_SIZE = 100
 
     def __init__(self, data_set_id, **kwargs):
         super().__init__(data_set_id)
 
     def fetch(self) -> list[DocumentDetails]:
-        results = []
-        offset = 0  # Starting point for product list pagination.
-        limit = 100  # Page size.
+        """Fetch document list.
+
+        Documents are read in (_createdAt, _id) order, each page starting right after the last document of the
+        previous one. Unlike offset slices, which Sanity evaluates from the start of the collection, every page
+        costs the same, so a full sync takes linear time. Incremental syncs only read documents updated since
+        ``updated_since``.
+
+        Returns:
+            list[DocumentDetails]: A list of documents.
+        """
+        with self._build_http_client() as client:
+            return [self._get_document(sanity_post) for sanity_post in self._fetch_documents(client)]
 
+    def _fetch_documents(self, client: HTTPClient) -> Iterator[dict]:
+        cursor = None
+        while True:
+            page = self._fetch_page(client, cursor)
+            yield from page
+            if len(page) < self.PAGE_SIZE:
+                return
+            cursor = (page[-1]["_createdAt"], page[-1]["_id"])
+
+    def _fetch_page(self, client: HTTPClient, cursor: Optional[tuple[str, str]]) -> list[dict]:
+        conditions = ["_type == $schemaType"]
+        params = {"schemaType": self.CONFIGURATION_ARGS.schema_type}
+        if cursor is not None:
+            conditions.append("(_createdAt > $lastCreatedAt || (_createdAt == $lastCreatedAt && _id > $lastId))")
+            params["lastCreatedAt"], params["lastId"] = cursor
+        if self.updated_since is not None:
+            conditions.append("_updatedAt >= $updatedSince")
+            params["updatedSince"] = self.updated_since.isoformat()
+
+        query = (
+            f"*[{' && '.join(conditions)}] | order(_createdAt asc, _id asc) [0...{self.PAGE_SIZE}] {{"
+            f" _createdAt, _id,"
+            f' "content": {self.CONFIGURATION_ARGS.content_field_name},'
+            f' "title": {self.CONFIGURATION_ARGS.title_field_name},'
+            f' "url": _type + "/" + _id'
+            f" }}"
+        )
+        return self._query(client, query, params) or []
+
+    @staticmethod
+    def _query(client: HTTPClient, query: str, params: dict[str, Any]):
+        # Query parameters are passed JSON-encoded as $-prefixed URL parameters, so values never end up in GROQ.
+        url_params = {"query": query, **{f"${name}": json.dumps(value) for name, value in params.items()}}
+        response = client.get("", params=url_params)
+        response.raise_for_status()
+        return response.json().get("result")
+
+    def _build_http_client(self) -> HTTPClient:
         base_url = f"https://{self.CONFIGURATION_ARGS.project_id}.api.sanity.io/v1/data/query/{self.CONFIGURATION_ARGS.dataset}"
         headers = (
             {"Authorization": f"Bearer {self.CONFIGURATION_ARGS.api_key}"} if self.CONFIGURATION_ARGS.api_key else {}
         )
-
-        while True:
-            query = (
-                f'*[_type == "{self.CONFIGURATION_ARGS.schema_type}"] | order(_createdAt asc) '
-                f"[{offset}...{offset + limit}] {{"
-                f' "content": {self.CONFIGURATION_ARGS.content_field_name},'
-                f' "title": {self.CONFIGURATION_ARGS.title_field_name},'
-                f' "url": _type + "/" + _id'
-                f" }}"
-            )
-            response = requests.get(base_url, headers=headers, params={"query": query})
-            response.raise_for_status()
-            data = response.json()
-
-            sanity_posts = data.get("result", [])
-
-            # Loop through each blog post in the response
-            for sanity_post in sanity_posts:
-                document = self._get_document(sanity_post)
-                results.append(document)
-
-            if len(sanity_posts) < limit:
-                break
-
-            offset += limit
-
-        return results
+        return HTTPClient(base_url, headers=headers)
 
     def _get_document(self, sanity_post: dict) -> DocumentDetails:
-        title = sanity_post.get(f"{self.CONFIGURATION_ARGS.title_field_name}")
-        content_blocks = sanity_post.get(f"{self.CONFIGURATION_ARGS.content_field_name}", [])
+        title = sanity_post.get("title")
+        content_blocks = sanity_post.get("content") or []
         content = self._extract_content(content_blocks)
         url = sanity_post.get("url")
         document = DocumentDetails(url=url, title=title, content=content)
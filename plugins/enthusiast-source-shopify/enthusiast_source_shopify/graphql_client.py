@@ -0,0 +1,73 @@
+import time
+from typing import Any, Iterator, Optional
+
+from enthusiast_common.http import HTTPClient
+
+
+class ShopifyAPIError(Exception):
+    pass
+
+
+class BulkOperationNotStartedError(ShopifyAPIError):
+    pass
+
+
+class ShopifyGraphQLClient:
+    """Client of the Shopify Admin GraphQL API.
+
+    Talks to ``<shop_url>/admin/api/<version>/graphql.json`` over a pooled session instead of the global session
+    of the ``shopify`` library, so any URL can be used, including a local stand-in server in tests.
+    Queries rejected by the cost-based rate limiter are retried once the bucket had time to refill.
+    """
+
+    MAX_THROTTLE_RETRIES = 5
+    THROTTLE_BACKOFF_SECONDS = 2.0
+
+    def __init__(self, shop_url: str, access_token: str, api_version: str):
+        if "://" not in shop_url:
+            shop_url = f"https://{shop_url}"
+        self._http_client = HTTPClient(
+            f"{shop_url.rstrip('/')}/admin/api/{api_version}",
+            headers={"X-Shopify-Access-Token": access_token, "Content-Type": "application/json"},
+            retry_methods={"GET", "POST"},
+        )
+
+    def execute(self, query: str, variables: Optional[dict[str, Any]] = None) -> dict[str, Any]:
+        """Runs a query or mutation and returns its ``data``.
+
+        Raises:
+            ShopifyAPIError: When the request fails or the response contains errors.
+        """
+        for attempt in range(self.MAX_THROTTLE_RETRIES + 1):
+            response = self._http_client.post("graphql.json", json={"query": query, "variables": variables or {}})
+            if response.status_code != 200:
+                raise ShopifyAPIError(f"Shopify API request failed with status {response.status_code}: {response.text}")
+
+            result = response.json()
+            errors = result.get("errors")
+            if not errors:
+                return result.get("data", {})
+            if not self._is_throttled(errors) or attempt == self.MAX_THROTTLE_RETRIES:
+                raise ShopifyAPIError(f"Shopify API returned errors: {errors}")
+            time.sleep(self.THROTTLE_BACKOFF_SECONDS * (attempt + 1))
+
+    @staticmethod
+    def stream_lines(url: str) -> Iterator[str]:
+        """Streams a text file, e.g. the JSONL result of a bulk operation, line by line.
+
+        The file is served from signed cloud storage URLs, so no Shopify credentials are sent along.
+        """
+        with HTTPClient() as http_client:
+            with http_client.get(url, stream=True) as response:
+                if response.status_code != 200:
+                    raise ShopifyAPIError(f"Failed to download {url}, status {response.status_code}")
+                response.encoding = "utf-8"
+                for line in response.iter_lines(decode_unicode=True):
+                    if line:
+                        yield line
+
+    @staticmethod
+    def _is_throttled(errors: Any) -> bool:
+        if not isinstance(errors, list):
+            return False
+        return any(error.get("extensions", {}).get("code") == "THROTTLED" for error in errors)
@@ -1,59 +1,121 @@
 import json
+import logging
+import time
+from typing import Any, Iterable, Iterator, Mapping, Optional
 
-import shopify
-from enthusiast_common import ProductDetails, ProductSourcePlugin
+from enthusiast_common import (
+    ProductDetails,
+    ProductSourcePlugin,
+    ProductWebhookAction,
+    ProductWebhookEvent,
+    ProductWebhookHandler,
+)
+from enthusiast_common.http import verify_hmac_signature
 from enthusiast_common.utils import RequiredFieldsModel
 from pydantic import Field
 
+from .graphql_client import BulkOperationNotStartedError, ShopifyAPIError, ShopifyGraphQLClient
+
+logger = logging.getLogger(__name__)
+
+PRODUCT_FIELDS = """
+    id
+    title
+    description
+    productType
+    tags
+    handle
+    category {fullName}
+"""
+
+VARIANT_FIELDS = """
+    id
+    title
+    price
+    sku
+"""
+
+PAGED_PRODUCTS_QUERY = f"""query ($first: Int!, $after: String) {{
+    products(first: $first, after: $after) {{
+        edges {{
+            node {{
+                {PRODUCT_FIELDS}
+                variants(first: 50) {{ edges {{ node {{{VARIANT_FIELDS}}} }} }}
+            }}
+        }}
+        pageInfo {{
+            hasNextPage
+            endCursor
+        }}
+    }}
+}}
+"""
+
+PRODUCT_QUERY = f"""query ($id: ID!) {{
+    product(id: $id) {{
+        {PRODUCT_FIELDS}
+        variants(first: 50) {{ edges {{ node {{{VARIANT_FIELDS}}} }} }}
+    }}
+}}
+"""
+
+# Connections in bulk queries aren't paginated, so every variant of every product is exported.
+BULK_PRODUCTS_QUERY = f"""{{
+    products {{
+        edges {{
+            node {{
+                {PRODUCT_FIELDS}
+                variants {{ edges {{ node {{{VARIANT_FIELDS}}} }} }}
+            }}
+        }}
+    }}
+}}
+"""
+
+BULK_OPERATION_RUN_MUTATION = """mutation ($query: String!) {
+    bulkOperationRunQuery(query: $query) {
+        bulkOperation { id status }
+        userErrors { field message }
+    }
+}
+"""
+
+BULK_OPERATION_STATUS_QUERY = """query ($id: ID!) {
+    node(id: $id) {
+        ... on BulkOperation { id status errorCode objectCount url }
+    }
+}
+"""
+
 
 class ShopifyConfig(RequiredFieldsModel):
     shop_url: str = Field(title="Shop URL", description="Shopify shop URL")
     access_token: str = Field(title="Access token", description="Shopify access token")
+    webhook_secret: Optional[str] = Field(
+        title="Webhook secret",
+        description="(Optional) Secret used to sign product webhooks, shown under Settings > Notifications > Webhooks",
+        default=None,
+    )
+    bulk_export: bool = Field(
+        title="Bulk export",
+        description="Export products with a bulk operation instead of paging through them, recommended for large shops",
+        default=False,
+    )
 
 
-class ShopifyProductSource(ProductSourcePlugin):
+class ShopifyProductSource(ProductSourcePlugin, ProductWebhookHandler):
     NAME = "Shopify"
     CONFIGURATION_ARGS = ShopifyConfig
+    API_VERSION = "2024-10"
+    PAGE_SIZE = 50
+    BULK_OPERATION_POLL_INTERVAL_SECONDS = 5
+    BULK_OPERATION_TIMEOUT_SECONDS = 4 * 60 * 60
+    UPSERT_TOPICS = ("products/create", "products/update")
+    DELETE_TOPICS = ("products/delete",)
 
     def __init__(self, data_set_id, **kwargs):
         super().__init__(data_set_id)
-
-    def get_query_template(self):
-        """Prepares template for querying shopify platform.
-
-        Template is used to run queries to loop through all pages returned by Shopify.
-        """
-
-        return """query ($first: Int!, $after: String) {
-            products(first: $first, after: $after) {
-                edges {
-                    node {
-                        id
-                        title
-                        description
-                        productType
-                        tags
-                        handle
-                        productType
-                        category {fullName}
-                        variants(first: 50) {
-                            edges {
-                                node {
-                                    title
-                                    price
-                                    sku
-                                }
-                            }
-                        }
-                    }
-                }
-                pageInfo {
-                    hasNextPage
-                    endCursor
-                }
-            }
-        }
-    """
+        self._client = None
 
     def get_product(self, shopify_product) -> ProductDetails:
         """Translates product definition received from Shopify into ECL product.
@@ -96,32 +158,124 @@ class ShopifyProductSource(ProductSourcePlugin):
     def fetch(self) -> list[ProductDetails]:
         """Fetch product list.
 
+        With bulk export enabled, Shopify exports the whole catalog into a JSONL file in the background, which is
+        then streamed line by line. Otherwise, or when a bulk operation can't be started (e.g. another one is
+        already running), products are paged through 50 at a time.
+
         Returns:
             list[ProductDetails]: A list of products.
         """
+        if self.CONFIGURATION_ARGS.bulk_export:
+            try:
+                return list(self._fetch_bulk())
+            except BulkOperationNotStartedError as e:
+                logger.warning(f"Shopify bulk operation could not be started, falling back to paging: {e}")
+        return list(self._fetch_paged())
 
-        session = shopify.Session(self.CONFIGURATION_ARGS.shop_url, "2024-10", self.CONFIGURATION_ARGS.access_token)
-        shopify.ShopifyResource.activate_session(session)
-
-        query = self.get_query_template()
-        products = []
+    def _fetch_paged(self) -> Iterator[ProductDetails]:
         has_next_page = True
         cursor = None
 
         while has_next_page:
-            variables = {"first": 50, "after": cursor}
+            data = self._get_client().execute(PAGED_PRODUCTS_QUERY, {"first": self.PAGE_SIZE, "after": cursor})
+            products_data = data.get("products", {})
 
-            response = shopify.GraphQL().execute(query, variables=variables)
+            for product_edge in products_data.get("edges", []):
+                yield self.get_product(product_edge["node"])
 
-            result_data = json.loads(response)
-            products_data = result_data.get("data", {}).get("products", {})
-            product_edges = products_data.get("edges", [])
             page_info = products_data.get("pageInfo", {})
-
-            for product_edge in product_edges:
-                products.append(self.get_product(product_edge["node"]))
-
             has_next_page = page_info.get("hasNextPage", False)
             cursor = page_info.get("endCursor")
 
-        return products
+    def _fetch_bulk(self) -> Iterator[ProductDetails]:
+        url = self._run_bulk_operation(BULK_PRODUCTS_QUERY)
+        if url is None:
+            # Shopify doesn't create a file when the query returned no objects.
+            return
+        yield from self._assemble_products(json.loads(line) for line in ShopifyGraphQLClient.stream_lines(url))
+
+    def _run_bulk_operation(self, query: str) -> Optional[str]:
+        """Starts a bulk query and waits for it to finish.
+
+        Returns:
+            Optional[str]: URL of the JSONL file with results, None if there are no results.
+        """
+        client = self._get_client()
+        result = client.execute(BULK_OPERATION_RUN_MUTATION, {"query": query})["bulkOperationRunQuery"]
+        if result.get("userErrors"):
+            raise BulkOperationNotStartedError(str(result["userErrors"]))
+        operation_id = result["bulkOperation"]["id"]
+
+        deadline = time.monotonic() + self.BULK_OPERATION_TIMEOUT_SECONDS
+        while time.monotonic() < deadline:
+            operation = client.execute(BULK_OPERATION_STATUS_QUERY, {"id": operation_id})["node"]
+            if operation["status"] == "COMPLETED":
+                return operation.get("url")
+            if operation["status"] in ("FAILED", "CANCELED", "EXPIRED"):
+                raise ShopifyAPIError(
+                    f"Shopify bulk operation {operation_id} {operation['status'].lower()}: {operation.get('errorCode')}"
+                )
+            time.sleep(self.BULK_OPERATION_POLL_INTERVAL_SECONDS)
+        raise ShopifyAPIError(f"Shopify bulk operation {operation_id} did not finish in time")
+
+    def _assemble_products(self, objects: Iterable[dict[str, Any]]) -> Iterator[ProductDetails]:
+        """Rebuilds products from bulk operation results.
+
+        Each line of the file holds a single object, variants reference their product with ``__parentId`` and
+        follow it in the file, so a product is complete once the next product starts.
+        """
+        current = None
+        for obj in objects:
+            if "__parentId" not in obj:
+                if current is not None:
+                    yield self.get_product(current)
+                current = {**obj, "variants": {"edges": []}}
+            elif current is not None and obj["__parentId"] == current["id"]:
+                current["variants"]["edges"].append({"node": obj})
+            else:
+                logger.warning(f"Skipping Shopify object {obj.get('id')} whose parent wasn't exported before it.")
+        if current is not None:
+            yield self.get_product(current)
+
+    def verify_webhook(self, headers: Mapping[str, str], body: bytes) -> bool:
+        return verify_hmac_signature(
+            self.CONFIGURATION_ARGS.webhook_secret, body, headers.get("x-shopify-hmac-sha256")
+        )
+
+    def parse_webhook(self, headers: Mapping[str, str], body: bytes) -> list[ProductWebhookEvent]:
+        """Handles products/create, products/update and products/delete webhooks.
+
+        Webhook payloads use the REST representation, so created and updated products are fetched again
+        through GraphQL to get the same details as a full sync.
+        """
+        topic = headers.get("x-shopify-topic")
+        entry_id = self._to_global_id(json.loads(body)["id"])
+
+        if topic in self.DELETE_TOPICS:
+            return [ProductWebhookEvent(action=ProductWebhookAction.DELETE, entry_id=entry_id)]
+        if topic not in self.UPSERT_TOPICS:
+            return []
+
+        shopify_product = self._fetch_product(entry_id)
+        if shopify_product is None:
+            return [ProductWebhookEvent(action=ProductWebhookAction.DELETE, entry_id=entry_id)]
+        return [
+            ProductWebhookEvent(
+                action=ProductWebhookAction.UPSERT, entry_id=entry_id, product=self.get_product(shopify_product)
+            )
+        ]
+
+    def _fetch_product(self, entry_id: str) -> Optional[dict]:
+        return self._get_client().execute(PRODUCT_QUERY, {"id": entry_id}).get("product")
+
+    def _get_client(self) -> ShopifyGraphQLClient:
+        if self._client is None:
+            self._client = ShopifyGraphQLClient(
+                self.CONFIGURATION_ARGS.shop_url, self.CONFIGURATION_ARGS.access_token, self.API_VERSION
+            )
+        return self._client
+
+    @staticmethod
+    def _to_global_id(product_id) -> str:
+        """Webhooks identify products by numeric IDs, while GraphQL (and so synced products) use global IDs."""
+        return f"gid://shopify/Product/{product_id}"
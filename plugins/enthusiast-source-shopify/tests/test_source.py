@@ -0,0 +1,204 @@
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+from enthusiast_source_shopify.graphql_client import ShopifyAPIError
+from enthusiast_source_shopify.source import ShopifyProductSource
+
+BULK_RESULT = [
+    {"id": "gid://shopify/Product/1", "title": "Trail Shoe", "handle": "trail-shoe", "description": "Grippy"},
+    {
+        "id": "gid://shopify/ProductVariant/11",
+        "sku": "TS-42",
+        "price": "120.00",
+        "__parentId": "gid://shopify/Product/1",
+    },
+    {
+        "id": "gid://shopify/ProductVariant/12",
+        "sku": "TS-43",
+        "price": "99.50",
+        "__parentId": "gid://shopify/Product/1",
+    },
+    {"id": "gid://shopify/Product/2", "title": "Road Shoe", "handle": "road-shoe", "description": "Light"},
+    {
+        "id": "gid://shopify/ProductVariant/21",
+        "sku": "RS-40",
+        "price": "80.00",
+        "__parentId": "gid://shopify/Product/2",
+    },
+    {"id": "gid://shopify/ProductVariant/99", "sku": "LOST", "price": "1.00", "__parentId": "gid://shopify/Product/9"},
+]
+
+PAGES = {
+    None: {
+        "edges": [
+            {
+                "node": {
+                    "id": "gid://shopify/Product/1",
+                    "title": "Trail Shoe",
+                    "handle": "trail-shoe",
+                    "description": "Grippy",
+                    "variants": {"edges": [{"node": {"sku": "TS-42", "price": "120.00"}}]},
+                }
+            }
+        ],
+        "pageInfo": {"hasNextPage": True, "endCursor": "cursor-1"},
+    },
+    "cursor-1": {
+        "edges": [
+            {
+                "node": {
+                    "id": "gid://shopify/Product/2",
+                    "title": "Road Shoe",
+                    "handle": "road-shoe",
+                    "description": "Light",
+                    "variants": {"edges": [{"node": {"sku": "RS-40", "price": "80.00"}}]},
+                }
+            }
+        ],
+        "pageInfo": {"hasNextPage": False, "endCursor": "cursor-2"},
+    },
+}
+
+
+class StandInShop:
+    """Local stand-in for the Shopify Admin GraphQL API and the storage serving bulk operation results."""
+
+    def __init__(self):
+        self.bulk_user_errors = []
+        self.bulk_statuses = ["RUNNING", "COMPLETED"]
+        self.bulk_result = BULK_RESULT
+        self.queries = []
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), self._build_handler())
+        self.url = f"http://127.0.0.1:{self._server.server_port}"
+
+    def __enter__(self):
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+        return self
+
+    def __exit__(self, *args):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def respond(self, query: str, variables: dict) -> dict:
+        self.queries.append(query)
+        if "bulkOperationRunQuery" in query:
+            return {
+                "bulkOperationRunQuery": {
+                    "bulkOperation": {"id": "gid://shopify/BulkOperation/1", "status": "CREATED"},
+                    "userErrors": self.bulk_user_errors,
+                }
+            }
+        if "BulkOperation" in query:
+            status = self.bulk_statuses.pop(0)
+            url = f"{self.url}/bulk.jsonl" if status == "COMPLETED" and self.bulk_result else None
+            return {"node": {"id": variables["id"], "status": status, "errorCode": None, "url": url}}
+        return {"products": PAGES[variables["after"]]}
+
+    def _build_handler(self):
+        shop = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self):
+                request = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+                self._send(
+                    "application/json", json.dumps({"data": shop.respond(request["query"], request["variables"])})
+                )
+
+            def do_GET(self):
+                self._send("application/jsonl", "\n".join(json.dumps(obj) for obj in shop.bulk_result) + "\n")
+
+            def _send(self, content_type: str, body: str):
+                encoded = body.encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", content_type)
+                self.send_header("Content-Length", str(len(encoded)))
+                self.end_headers()
+                self.wfile.write(encoded)
+
+            def log_message(self, *args):
+                pass
+
+        return Handler
+
+
+@pytest.fixture
+def shop():
+    with StandInShop() as shop:
+        yield shop
+
+
+def _build_source(shop: StandInShop, bulk_export: bool) -> ShopifyProductSource:
+    source = ShopifyProductSource(data_set_id=1)
+    source.BULK_OPERATION_POLL_INTERVAL_SECONDS = 0
+    source.set_runtime_arguments(
+        {"configuration_args": {"shop_url": shop.url, "access_token": "token", "bulk_export": bulk_export}}
+    )
+    return source
+
+
+def test_bulk_export_attaches_variants_to_their_products(shop):
+    # Given
+    source = _build_source(shop, bulk_export=True)
+
+    # When
+    products = source.fetch()
+
+    # Then
+    assert [(product.entry_id, product.sku, product.price) for product in products] == [
+        ("gid://shopify/Product/1", "TS-42, TS-43", 99.5),
+        ("gid://shopify/Product/2", "RS-40", 80.0),
+    ]
+    assert not any("products(first" in query for query in shop.queries)
+
+
+def test_bulk_export_without_results_returns_no_products(shop):
+    # Given
+    shop.bulk_result = []
+    source = _build_source(shop, bulk_export=True)
+
+    # When
+    products = source.fetch()
+
+    # Then
+    assert products == []
+
+
+def test_bulk_export_raises_when_operation_fails(shop):
+    # Given
+    shop.bulk_statuses = ["RUNNING", "FAILED"]
+    source = _build_source(shop, bulk_export=True)
+
+    # When & Then
+    with pytest.raises(ShopifyAPIError, match="failed"):
+        source.fetch()
+
+
+def test_falls_back_to_paging_when_bulk_operation_is_not_started(shop):
+    # Given
+    shop.bulk_user_errors = [
+        {"field": None, "message": "A bulk query operation for this app and shop is already in progress"}
+    ]
+    source = _build_source(shop, bulk_export=True)
+
+    # When
+    products = source.fetch()
+
+    # Then
+    assert [(product.entry_id, product.sku) for product in products] == [
+        ("gid://shopify/Product/1", "TS-42"),
+        ("gid://shopify/Product/2", "RS-40"),
+    ]
+
+
+def test_pages_through_products_without_bulk_export(shop):
+    # Given
+    source = _build_source(shop, bulk_export=False)
+
+    # When
+    products = source.fetch()
+
+    # Then
+    assert [product.name for product in products] == ["Trail Shoe", "Road Shoe"]
+    assert not any("bulkOperationRunQuery" in query for query in shop.queries)
@@ -1,5 +1,15 @@
-import requests
-from enthusiast_common import ProductDetails, ProductSourcePlugin
+import json
+import math
+from typing import Iterator, Mapping, Optional
+
+from enthusiast_common import (
+    ProductDetails,
+    ProductSourcePlugin,
+    ProductWebhookAction,
+    ProductWebhookEvent,
+    ProductWebhookHandler,
+)
+from enthusiast_common.http import HTTPClient, fetch_pages, verify_hmac_signature
 from enthusiast_common.utils import RequiredFieldsModel
 from pydantic import Field
 
@@ -9,43 +19,55 @@ class ShopwareConfig(RequiredFieldsModel):
     currency_iso_code: str = Field(title="Currency ISO code", description="Currency ISO code (e.g., EUR, USD)")
     client_id: str = Field(title="Client ID", description="Shopware client ID")
     api_key: str = Field(title="API key", description="Shopware API key")
+    webhook_secret: Optional[str] = Field(
+        title="Webhook secret", description="(Optional) Secret of the app sending product webhooks", default=None
+    )
 
 
-class ShopwareProductSource(ProductSourcePlugin):
+class ShopwareProductSource(ProductSourcePlugin, ProductWebhookHandler):
     NAME = "Shopware"
     CONFIGURATION_ARGS = ShopwareConfig
+    WEBHOOK_EVENTS = ("product.written", "product.deleted")
+    PAGE_SIZE = 100
+    MAX_CONCURRENT_REQUESTS = 4
+    # Total count mode that makes the search API return the exact number of matching records.
+    TOTAL_COUNT_MODE_EXACT = 1
+    # Only fields used to build products are returned, which keeps pages with associations small.
+    INCLUDES = {
+        "product": ["id", "parentId", "name", "description", "productNumber", "price", "categories", "properties"],
+        "category": ["breadcrumb"],
+        "property_group_option": ["name", "group"],
+        "property_group": ["name"],
+    }
+    ASSOCIATIONS = {
+        "categories": {},
+        "properties": {"associations": {"group": {}}},
+    }
 
     def __init__(self, data_set_id, **kwargs):
         super().__init__(data_set_id)
 
+        self._http_client = None
         self._access_token = None
-        self._categories = None
         self._currency_id = None
-        self._properties = None
-        self._property_options = None
 
     def _get_product(self, product_details):
         """Translates product definition received from Shopware into Enthusiast product.
 
         Args:
-            product_details: a product returned by Shopware API
+            product_details: a product returned by Shopware search API
         Returns:
             ProductDetails: product definition used by ECL to sync a product.
         """
         return ProductDetails(
             entry_id=product_details.get("id"),
-            name=product_details.get("attributes", {}).get("name"),
-            slug=product_details.get("attributes", {}).get("name").replace(" ", "-"),
-            description=product_details.get("attributes", {}).get("description", "-"),
-            sku=product_details.get("attributes", {}).get("productNumber"),
+            name=product_details.get("name"),
+            slug=product_details.get("name").replace(" ", "-"),
+            description=product_details.get("description") or "-",
+            sku=product_details.get("productNumber"),
             price=self._product_price(product_details),
             properties=self._product_properties(product_details),
-            categories=str(
-                [
-                    self._product_category(category_id)
-                    for category_id in product_details.get("attributes", {}).get("categoryTree")
-                ]
-            ),
+            categories=str(self._product_categories(product_details)),
         )
 
     def _get_access_token(self):
@@ -56,125 +78,114 @@ class ShopwareProductSource(ProductSourcePlugin):
             "client_id": self.CONFIGURATION_ARGS.client_id,
             "client_secret": self.CONFIGURATION_ARGS.api_key,
         }
-        response = requests.post(f"{self.CONFIGURATION_ARGS.base_url}/api/oauth/token", body)
+        response = self._get_http_client().post("/api/oauth/token", data=body)
         if response.status_code != 200:
             raise Exception("Failed to acquire access token. Please verify the client ID and API key.")
 
         self._access_token = response.json().get("access_token")
         return self._access_token
 
+    def _get_http_client(self) -> HTTPClient:
+        if self._http_client is None:
+            # The search API is read-only, so its POST requests are safe to retry.
+            self._http_client = HTTPClient(self.CONFIGURATION_ARGS.base_url, retry_methods={"GET", "POST"})
+        return self._http_client
+
     def _build_headers(self):
-        return {"Authorization": f"Bearer {self._get_access_token()}"}
+        # Plain JSON instead of the default JSON:API format, which puts associations in a separate list.
+        return {"Authorization": f"Bearer {self._get_access_token()}", "Accept": "application/json"}
 
-    def _fetch_products(self):
-        response = requests.get(f"{self.CONFIGURATION_ARGS.base_url}/api/product", headers=self._build_headers())
+    def _search(self, entity: str, criteria: dict) -> dict:
+        response = self._get_http_client().post(f"/api/search/{entity}", json=criteria, headers=self._build_headers())
         if response.status_code != 200:
-            raise Exception("Failed to fetch products")
-
-        data = response.json().get("data", [])
-
-        # filtering out product variants
-        data = filter(
-            lambda o: o.get("type") == "product"
-            and o.get("attributes", {}).get("productNumber")
-            and "." not in o.get("attributes", {}).get("productNumber"),
-            data,
+            raise Exception(f"Failed to search {entity}")
+        return response.json()
+
+    def _search_products(self, criteria: dict) -> dict:
+        return self._search("product", {**criteria, "associations": self.ASSOCIATIONS, "includes": self.INCLUDES})
+
+    def _fetch_products_page(self, page: int, total_count_mode: int = 0) -> dict:
+        return self._search_products(
+            {
+                "page": page,
+                "limit": self.PAGE_SIZE,
+                # Variants aren't synced as separate products.
+                "filter": [{"type": "equals", "field": "parentId", "value": None}],
+                "sort": [{"field": "id", "order": "ASC"}],
+                "total-count-mode": total_count_mode,
+            }
         )
-        return list(data)
 
-    def _fetch_categories(self):
-        if self._categories:
-            return self._categories
+    def _fetch_products(self) -> Iterator[dict]:
+        """Yields main products page by page.
 
-        response = requests.get(f"{self.CONFIGURATION_ARGS.base_url}/api/category", headers=self._build_headers())
-        if response.status_code != 200:
-            raise Exception("Failed to fetch categories")
+        The first page tells how many products there are, the remaining pages are then fetched concurrently.
+        """
+        first_page = self._fetch_products_page(1, total_count_mode=self.TOTAL_COUNT_MODE_EXACT)
+        yield from first_page.get("data", [])
+
+        total = first_page.get("total", 0)
+        pages = fetch_pages(
+            self._fetch_products_page,
+            range(2, math.ceil(total / self.PAGE_SIZE) + 1),
+            max_workers=self.MAX_CONCURRENT_REQUESTS,
+        )
+        for page in pages:
+            yield from page.get("data", [])
 
-        self._categories = {
-            category_data.get("id"): category_data.get("attributes", {}).get("name")
-            for category_data in response.json().get("data")
-        }
+    def _fetch_product(self, product_id: str) -> Optional[dict]:
+        data = self._search_products({"ids": [product_id]}).get("data", [])
+        return data[0] if data else None
 
-        return self._categories
+    @staticmethod
+    def _is_main_product(product_details: dict) -> bool:
+        return product_details.get("parentId") is None
 
     def _fetch_currency_id(self):
         if self._currency_id:
             return self._currency_id
 
-        response = requests.get(f"{self.CONFIGURATION_ARGS.base_url}/api/currency", headers=self._build_headers())
-        if response.status_code != 200:
-            raise Exception("Failed to fetch currency id")
-
-        data = response.json().get("data", [])
-        self._currency_id = next(
-            (
-                c.get("id")
-                for c in data
-                if c.get("attributes", {}).get("isoCode") == self.CONFIGURATION_ARGS.currency_iso_code
-            ),
-            None,
-        )
+        data = self._search(
+            "currency",
+            {
+                "limit": 1,
+                "filter": [{"type": "equals", "field": "isoCode", "value": self.CONFIGURATION_ARGS.currency_iso_code}],
+                "includes": {"currency": ["id"]},
+            },
+        ).get("data", [])
+        self._currency_id = data[0].get("id") if data else None
 
         return self._currency_id
 
-    def _fetch_properties(self):
-        if self._properties:
-            return self._properties
-
-        response = requests.get(f"{self.CONFIGURATION_ARGS.base_url}/api/property-group", headers=self._build_headers())
-        if response.status_code != 200:
-            raise Exception("Failed to fetch properties")
-
-        data = response.json().get("data", [])
-        self._properties = {
-            property_data.get("id"): property_data.get("attributes", {}).get("name") for property_data in data
-        }
-
-        return self._properties
-
-    def _fetch_property_options(self):
-        if self._property_options:
-            return self._property_options
-
-        response = requests.get(
-            f"{self.CONFIGURATION_ARGS.base_url}/api/property-group-option", headers=self._build_headers()
-        )
-        if response.status_code != 200:
-            raise Exception("Failed to fetch property options")
-
-        data = response.json().get("data", [])
-        self._property_options = {
-            property_option_data.get("id"): {
-                "name": property_option_data.get("attributes", {}).get("name"),
-                "property_id": property_option_data.get("attributes", {}).get("groupId"),
-            }
-            for property_option_data in data
-        }
-
-        return self._property_options
-
-    def _product_category(self, category_id):
-        return self._fetch_categories().get(category_id)
+    @staticmethod
+    def _product_categories(product_details):
+        """Returns names of the product's categories together with their parents, as in the category tree."""
+        names = []
+        for category in product_details.get("categories") or []:
+            for name in category.get("breadcrumb") or []:
+                if name not in names:
+                    names.append(name)
+        return names
 
     def _product_price(self, product_details):
         price = next(
             (
                 price.get("gross")
-                for price in product_details.get("attributes", {}).get("price")
+                for price in product_details.get("price") or []
                 if price.get("currencyId") == self._fetch_currency_id()
             ),
             None,
         )
         return float(price) if price else None
 
-    def _product_properties(self, product_details):
-        if not product_details.get("attributes", {}).get("propertyIds"):
+    @staticmethod
+    def _product_properties(product_details):
+        if not product_details.get("properties"):
             return "-"
         product_properties = {}
 
-        for property_option_id in product_details.get("attributes", {}).get("propertyIds"):
-            property_option = self._fetch_property_options().get(property_option_id)
-            property_name = self._fetch_properties().get(property_option.get("property_id"))
+        for property_option in product_details.get("properties"):
+            property_name = (property_option.get("group") or {}).get("name")
 
             if property_name not in product_properties.keys():
                 product_properties[property_name] = []
@@ -193,8 +204,41 @@ class ShopwareProductSource(ProductSourcePlugin):
         Returns:
             list[ProductDetails]: A list of products.
         """
-        products = []
-        for product_details in self._fetch_products():
-            products.append(self._get_product(product_details))
+        return [self._get_product(product_details) for product_details in self._fetch_products()]
 
-        return products
+    def verify_webhook(self, headers: Mapping[str, str], body: bytes) -> bool:
+        return verify_hmac_signature(
+            self.CONFIGURATION_ARGS.webhook_secret, body, headers.get("shopware-shop-signature"), encoding="hex"
+        )
+
+    def parse_webhook(self, headers: Mapping[str, str], body: bytes) -> list[ProductWebhookEvent]:
+        """Handles product.written and product.deleted app webhooks.
+
+        Webhooks only carry IDs of changed products, so written products are fetched from the API one by one.
+        Variants are skipped, as they aren't synced as separate products.
+        """
+        data = json.loads(body).get("data", {})
+        if data.get("event") not in self.WEBHOOK_EVENTS:
+            return []
+
+        events = []
+        for change in data.get("payload", []):
+            product_id = change.get("primaryKey")
+            if change.get("entity") != "product" or not isinstance(product_id, str):
+                continue
+            if change.get("operation") == "delete":
+                events.append(ProductWebhookEvent(action=ProductWebhookAction.DELETE, entry_id=product_id))
+                continue
+
+            product_details = self._fetch_product(product_id)
+            if product_details is None:
+                events.append(ProductWebhookEvent(action=ProductWebhookAction.DELETE, entry_id=product_id))
+            elif self._is_main_product(product_details):
+                events.append(
+                    ProductWebhookEvent(
+                        action=ProductWebhookAction.UPSERT,
+                        entry_id=product_id,
+                        product=self._get_product(product_details),
+                    )
+                )
+        return events
@@ -1,5 +1,5 @@
-import requests
 from enthusiast_common import ProductDetails, ProductSourcePlugin
+from enthusiast_common.http import HTTPClient, fetch_pages
 from enthusiast_common.utils import RequiredFieldsModel
 from pydantic import Field
 
@@ -12,6 +12,7 @@ class SolidusConfig(RequiredFieldsModel):
 class SolidusProductSource(ProductSourcePlugin):
     NAME = "Solidus"
     CONFIGURATION_ARGS = SolidusConfig
+    MAX_CONCURRENT_REQUESTS = 4
 
     def __init__(self, data_set_id, **kwargs):
         super().__init__(data_set_id)
@@ -49,31 +50,34 @@ class SolidusProductSource(ProductSourcePlugin):
     def fetch(self) -> list[ProductDetails]:
         """Fetch product list.
 
+        The first page tells how many pages there are, the remaining pages are then fetched concurrently.
+
         Returns:
             list[ProductDetails]: A list of products.
         """
+        client = HTTPClient(
+            self.CONFIGURATION_ARGS.base_url, headers={"Authorization": f"Bearer {self.CONFIGURATION_ARGS.api_key}"}
+        )
+        first_page = self._fetch_page(client, page=1)
+        products = [self.get_product(solidus_product) for solidus_product in first_page.get("products", [])]
 
-        endpoint = f"{self.CONFIGURATION_ARGS.base_url}/api/products"
-
-        products = []
-        page = 1
-        headers = {"Authorization": f"Bearer {self.CONFIGURATION_ARGS.api_key}"}
-
-        while True:
-            response = requests.get(endpoint, headers=headers, params={"page": page})
+        pages = fetch_pages(
+            lambda page: self._fetch_page(client, page),
+            range(2, first_page["pages"] + 1),
+            max_workers=self.MAX_CONCURRENT_REQUESTS,
+        )
+        for data in pages:
+            products.extend(self.get_product(solidus_product) for solidus_product in data.get("products", []))
 
-            if response.status_code == 404:
-                raise Exception("The endpoint was not found. Please verify the URL.")
-            elif response.status_code != 200:
-                raise Exception(f"Failed to fetch products: {response.status_code} - {response.text}")
+        return products
 
-            data = response.json()
-            solidus_products = data.get("products", [])
-            for solidus_product in solidus_products:
-                products.append(self.get_product(solidus_product))
-            if page >= data["pages"]:
-                break
+    @staticmethod
+    def _fetch_page(client: HTTPClient, page: int) -> dict:
+        response = client.get("/api/products", params={"page": page})
 
-            page += 1
+        if response.status_code == 404:
+            raise Exception("The endpoint was not found. Please verify the URL.")
+        elif response.status_code != 200:
+            raise Exception(f"Failed to fetch products: {response.status_code} - {response.text}")
 
-        return products
+        return response.json()
@@ -1,9 +1,19 @@
+import json
 import logging
+from typing import Mapping, Optional
 from urllib.parse import urlparse
 
-from enthusiast_common import ProductDetails, ProductSourcePlugin
+from enthusiast_common import (
+    ProductDetails,
+    ProductSourcePlugin,
+    ProductWebhookAction,
+    ProductWebhookEvent,
+    ProductWebhookHandler,
+)
+from enthusiast_common.http import fetch_pages, verify_hmac_signature
 from enthusiast_common.utils import RequiredFieldsModel
 from pydantic import Field
+from requests import Response
 from woocommerce import API
 
 logger = logging.getLogger(__name__)
@@ -14,11 +24,17 @@ class WoocommerceConfig(RequiredFieldsModel):
     per_page: int = Field(title="Products per page", default=20, description="Number of products per page (10-100)")
     consumer_key: str = Field(title="Consumer key", description="WooCommerce consumer key")
     consumer_secret: str = Field(title="Consumer secret", description="WooCommerce consumer secret")
+    webhook_secret: Optional[str] = Field(
+        title="Webhook secret", description="(Optional) Secret set on the product webhooks in WooCommerce", default=None
+    )
 
 
-class WoocommerceProductSource(ProductSourcePlugin):
+class WoocommerceProductSource(ProductSourcePlugin, ProductWebhookHandler):
     NAME = "WooCommerce"
     CONFIGURATION_ARGS = WoocommerceConfig
+    MAX_CONCURRENT_REQUESTS = 4
+    UPSERT_TOPICS = ("product.created", "product.updated", "product.restored")
+    DELETE_TOPICS = ("product.deleted",)
 
     def __init__(self, data_set_id, **kwargs):
         super().__init__(data_set_id)
@@ -58,35 +74,75 @@ class WoocommerceProductSource(ProductSourcePlugin):
         )
 
     def fetch(self) -> list[ProductDetails]:
-        wcapi = self._initialize_api()
-        results = []
-        page = 1
-        while True:
-            try:
-                response = wcapi.get(
-                    "products",
-                    params={"page": page, "per_page": self._validate_per_page(self.CONFIGURATION_ARGS.per_page)},
-                )
-
-                if response.status_code != 200:
-                    logger.error(f"Failed to fetch products. Status code: {response.status_code}")
-                    break
-
-                products = response.json()
-
-                if not products:
-                    break
+        """Fetch product list.
 
-                for product in products:
-                    results.append(self._convert_to_product_details(product))
+        The first page tells how many pages there are (``X-WP-TotalPages``), the remaining pages are then fetched
+        concurrently. Fetching stops at the first page that fails, returning the products collected so far.
 
-                page += 1
-            except Exception as e:
-                logger.error(f"Error fetching products: {str(e)}")
+        Returns:
+            list[ProductDetails]: A list of products.
+        """
+        wcapi = self._initialize_api()
+        first_page = self._fetch_page(wcapi, page=1)
+        if first_page is None:
+            return []
+
+        results = [self._convert_to_product_details(product) for product in first_page.json()]
+        total_pages = int(first_page.headers.get("X-WP-TotalPages", 1))
+        pages = fetch_pages(
+            lambda page: self._fetch_page(wcapi, page),
+            range(2, total_pages + 1),
+            max_workers=self.MAX_CONCURRENT_REQUESTS,
+        )
+        for response in pages:
+            if response is None:
                 break
+            results.extend(self._convert_to_product_details(product) for product in response.json())
 
         return results
 
+    def _fetch_page(self, wcapi: API, page: int) -> Optional[Response]:
+        try:
+            response = wcapi.get(
+                "products",
+                params={"page": page, "per_page": self._validate_per_page(self.CONFIGURATION_ARGS.per_page)},
+            )
+        except Exception as e:
+            logger.error(f"Error fetching products: {str(e)}")
+            return None
+
+        if response.status_code != 200:
+            logger.error(f"Failed to fetch products. Status code: {response.status_code}")
+            return None
+
+        return response
+
+    def verify_webhook(self, headers: Mapping[str, str], body: bytes) -> bool:
+        return verify_hmac_signature(
+            self.CONFIGURATION_ARGS.webhook_secret, body, headers.get("x-wc-webhook-signature")
+        )
+
+    def parse_webhook(self, headers: Mapping[str, str], body: bytes) -> list[ProductWebhookEvent]:
+        """Handles product.created, product.updated, product.restored and product.deleted webhooks.
+
+        WooCommerce sends the whole product, so no API call is needed. Trashed products are treated as deleted.
+        """
+        topic = headers.get("x-wc-webhook-topic")
+        if topic not in self.UPSERT_TOPICS + self.DELETE_TOPICS:
+            return []
+
+        woo_product = json.loads(body)
+        entry_id = str(woo_product["id"])
+        if topic in self.DELETE_TOPICS or woo_product.get("status") == "trash":
+            return [ProductWebhookEvent(action=ProductWebhookAction.DELETE, entry_id=entry_id)]
+        return [
+            ProductWebhookEvent(
+                action=ProductWebhookAction.UPSERT,
+                entry_id=entry_id,
+                product=self._convert_to_product_details(woo_product),
+            )
+        ]
+
     def _convert_to_product_details(self, woo_product: dict) -> ProductDetails:
         return ProductDetails(
             entry_id=str(woo_product["id"]),
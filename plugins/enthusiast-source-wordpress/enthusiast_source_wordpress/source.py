@@ -1,12 +1,11 @@
 import logging
-import re
 import urllib.parse
+from typing import Iterator
 
-import requests
 from enthusiast_common import DocumentDetails, DocumentSourcePlugin
+from enthusiast_common.http import HTTPClient, fetch_pages
 from enthusiast_common.utils import RequiredFieldsModel
 from pydantic import Field
-from requests import Response
 
 logger = logging.getLogger(__name__)
 
@@ -19,43 +18,56 @@ class WordpressConfig(RequiredFieldsModel):
 class WordpressDocumentSource(DocumentSourcePlugin):
     NAME = "WordPress"
     CONFIGURATION_ARGS = WordpressConfig
+    # The largest page size allowed by the WordPress REST API.
+    PAGE_SIZE = 100
+    MAX_CONCURRENT_REQUESTS = 4
+    # Only fields used to build documents, so embeds, links and metadata aren't serialized at all.
+    FIELDS = "link,title,content,modified"
 
     def __init__(self, data_set_id, **kwargs):
         super().__init__(data_set_id)
 
     def fetch(self) -> list[DocumentDetails]:
-        session = self._create_http_session()
-        results = []
-
-        current_url = self._posts_url()
-        while current_url:
-            logger.info(f"Fetching {current_url}")
-            response = session.get(current_url)
-            posts = response.json()
-            results.extend(
-                [
-                    DocumentDetails(
-                        url=post["link"], title=post["title"]["rendered"], content=post["content"]["rendered"]
-                    )
-                    for post in posts
-                ]
-            )
-            current_url = self._next_page_link_from_headers(response)
-        return results
-
-    def _next_page_link_from_headers(self, response: Response) -> str:
-        link_header = response.headers["Link"]
-
-        match = re.search(r'<(\S+?)>; rel="next"', link_header)
-        if match:
-            return match.group(1)
-        return ""
+        """Fetch document list.
+
+        The first page tells how many pages there are, the remaining pages are then fetched concurrently.
+        Incremental syncs only fetch posts modified since ``updated_since``.
+
+        Returns:
+            list[DocumentDetails]: A list of documents.
+        """
+        with self._create_http_client() as client:
+            return [
+                DocumentDetails(url=post["link"], title=post["title"]["rendered"], content=post["content"]["rendered"])
+                for post in self._fetch_posts(client)
+            ]
+
+    def _fetch_posts(self, client: HTTPClient) -> Iterator[dict]:
+        first_page = self._fetch_page(client, 1)
+        yield from first_page.json()
+
+        total_pages = int(first_page.headers.get("X-WP-TotalPages", 1))
+        pages = fetch_pages(
+            lambda page: self._fetch_page(client, page).json(),
+            range(2, total_pages + 1),
+            max_workers=self.MAX_CONCURRENT_REQUESTS,
+        )
+        for posts in pages:
+            yield from posts
+
+    def _fetch_page(self, client: HTTPClient, page: int):
+        params = {"per_page": self.PAGE_SIZE, "page": page, "_fields": self.FIELDS}
+        if self.updated_since is not None:
+            params["modified_after"] = self.updated_since.isoformat()
+
+        logger.info(f"Fetching page {page} of {self._posts_url()}")
+        response = client.get(self._posts_url(), params=params)
+        response.raise_for_status()
+        return response
 
     def _posts_url(self):
         return urllib.parse.urljoin(self.CONFIGURATION_ARGS.base_url, "wp-json/wp/v2/posts")
 
-    def _create_http_session(self):
-        session = requests.Session()
-        if self.CONFIGURATION_ARGS.user_agent:
-            session.headers.update({"User-Agent": self.CONFIGURATION_ARGS.user_agent})
-        return session
+    def _create_http_client(self) -> HTTPClient:
+        headers = {"User-Agent": self.CONFIGURATION_ARGS.user_agent} if self.CONFIGURATION_ARGS.user_agent else None
+        return HTTPClient(headers=headers, pool_size=self.MAX_CONCURRENT_REQUESTS)
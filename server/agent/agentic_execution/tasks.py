@@ -1,27 +1,67 @@
+from typing import Optional
+
 from celery import Task, shared_task
+from django.conf import settings
 from enthusiast_common.agentic_execution import ExecutionConversationInterface, ExecutionFailureCode
 from enthusiast_common.agentic_execution.memory import ToolScratchpad
 from enthusiast_common.agents import ConfigType
 
 from agent.agentic_execution.registry import AgenticExecutionDefinitionRegistry
 from agent.conversation import ConversationManager
-from agent.models.agentic_execution import AgenticExecution
+from agent.core.memory import DjangoCheckpointSaver
+from agent.models.agentic_execution import AgenticExecution, AgenticExecutionTurn
 from agent.models.conversation import Conversation
 
+_serde = DjangoCheckpointSaver().serde
+
+
+def get_execution_turn_id_prefix(execution_id: int) -> str:
+    return f"agentic_execution:{execution_id}:"
+
 
 class ExecutionConversation(ExecutionConversationInterface):
-    def __init__(self, conversation: Conversation) -> None:
+    def __init__(self, conversation: Conversation, execution: Optional[AgenticExecution] = None) -> None:
         self._conversation = conversation
+        self._execution = execution
         self._tool_scratchpad = ToolScratchpad()
+        self._turn_count = 0
+        self._completed_turns = {turn.index: turn for turn in execution.turns.all()} if execution else {}
 
     def ask(self, message: str) -> str:
-        return ConversationManager().get_answer(
+        """Asks the agent, resuming the turn from its last completed step if the task was interrupted during it.
+
+        Turns of an execution that were completed before the task was interrupted aren't asked again. Their answers
+        and the results tools recorded in them are replayed instead.
+        """
+        turn_index = self._turn_count
+        self._turn_count += 1
+        if completed_turn := self._completed_turns.get(turn_index):
+            self._tool_scratchpad.load(
+                _serde.loads_typed((completed_turn.tool_scratchpad_type, bytes(completed_turn.tool_scratchpad)))
+            )
+            return completed_turn.answer
+
+        turn_id = None
+        if self._execution is not None:
+            turn_id = f"{get_execution_turn_id_prefix(self._execution.pk)}{turn_index}"
+        answer = ConversationManager().get_answer(
             self._conversation,
             message,
             streaming=False,
             config_type=ConfigType.AGENTIC_EXECUTION_DEFINITION,
             tool_scratchpad=self._tool_scratchpad,
+            turn_id=turn_id,
         )
+        if self._execution is not None:
+            tool_scratchpad_type, tool_scratchpad = _serde.dumps_typed(self._tool_scratchpad.dump())
+            AgenticExecutionTurn.objects.create(
+                execution=self._execution,
+                index=turn_index,
+                answer=answer,
+                tool_scratchpad_type=tool_scratchpad_type,
+                tool_scratchpad=tool_scratchpad,
+            )
+        return answer
 
     @property
     def tool_scratchpad(self) -> ToolScratchpad:
@@ -34,6 +74,8 @@ class MarkExecutionFailedOnErrorTask(Task):
         execution_id = args[0] if args else kwargs.get("execution_id")
         if execution_id is None:
             return
+        DjangoCheckpointSaver().delete_threads(get_execution_turn_id_prefix(execution_id))
+        AgenticExecutionTurn.objects.filter(execution_id=execution_id).delete()
         try:
             AgenticExecution.objects.get(pk=execution_id).mark_failed(
                 failure_code=ExecutionFailureCode.RUNTIME_ERROR,
@@ -43,16 +85,31 @@ class MarkExecutionFailedOnErrorTask(Task):
             pass
 
 
-@shared_task(base=MarkExecutionFailedOnErrorTask, max_retries=0)
+# Acknowledged once it's done, so that the task is delivered again when its worker dies and the execution resumes
+# from the last step its agent completed. It's stopped before the broker's visibility timeout runs out, as the broker
+# would then deliver it to another worker while it's still running. The soft time limit fails the execution through
+# on_failure, the hard one only kills it if it doesn't stop, which leaves the execution in progress.
+@shared_task(
+    base=MarkExecutionFailedOnErrorTask,
+    max_retries=0,
+    acks_late=True,
+    reject_on_worker_lost=True,
+    soft_time_limit=settings.AGENTIC_EXECUTION_TIME_LIMIT_SECONDS,
+    time_limit=settings.AGENTIC_EXECUTION_HARD_TIME_LIMIT_SECONDS,
+)
 def run_agentic_execution_task(execution_id: int):
     execution = AgenticExecution.objects.select_related("agent", "conversation").get(pk=execution_id)
+    if execution.status in (AgenticExecution.Status.FINISHED, AgenticExecution.Status.FAILED):
+        return
     execution.mark_in_progress()
 
     registry = AgenticExecutionDefinitionRegistry()
     execution_cls = registry.get_by_key(execution.execution_key)
     input_data = execution_cls.INPUT_TYPE(**execution.input)
 
-    result = execution_cls().run(input_data, ExecutionConversation(execution.conversation))
+    conversation = ExecutionConversation(execution.conversation, execution)
+    result = execution_cls().run(input_data, conversation)
+    execution.turns.all().delete()
 
     if result.success:
         execution.mark_finished(result.output)
@@ -0,0 +1,143 @@
+from unittest.mock import patch
+
+import pytest
+from celery.exceptions import SoftTimeLimitExceeded
+from django.conf import settings
+from enthusiast_common.agentic_execution import BaseAgenticExecutionDefinition, ExecutionFailureCode, ExecutionInputType
+from model_bakery import baker
+
+from agent.agentic_execution.tasks import ExecutionConversation, run_agentic_execution_task
+from agent.models.agent import Agent
+from agent.models.agentic_execution import AgenticExecution, AgenticExecutionTurn
+from agent.models.conversation import Conversation
+from catalog.models import DataSet
+
+pytestmark = pytest.mark.django_db
+
+
+class TwoTurnExecutionInput(ExecutionInputType):
+    pass
+
+
+class TwoTurnExecution(BaseAgenticExecutionDefinition):
+    EXECUTION_KEY = "two-turns"
+    AGENT_KEY = "dummy-agent-type"
+    NAME = "Two turns"
+    INPUT_TYPE = TwoTurnExecutionInput
+
+    def execute(self, input_data, conversation):
+        conversation.ask("Enrich the products")
+        return conversation.ask("Summarize what you did")
+
+
+@pytest.fixture
+def execution():
+    data_set = baker.make(DataSet)
+    agent = baker.make(Agent, dataset=data_set)
+    conversation = baker.make(Conversation, agent=agent, data_set=data_set)
+    return baker.make(AgenticExecution, agent=agent, conversation=conversation, execution_key="two-turns", input={})
+
+
+@pytest.fixture
+def get_answer():
+    with patch("agent.agentic_execution.tasks.ConversationManager.get_answer") as mock:
+        yield mock
+
+
+def _record_upsert(*args, tool_scratchpad, **kwargs):
+    tool_scratchpad.record("upsert_product", {"skus": ["TS-42"]})
+    return "Enriched"
+
+
+class TestExecutionConversation:
+    def test_stores_completed_turns(self, execution, get_answer):
+        # Given
+        get_answer.side_effect = _record_upsert
+        conversation = ExecutionConversation(execution.conversation, execution)
+
+        # When
+        answer = conversation.ask("Enrich the products")
+
+        # Then
+        turn = execution.turns.get()
+        assert (turn.index, turn.answer) == (0, "Enriched")
+        assert get_answer.call_args.kwargs["turn_id"] == f"agentic_execution:{execution.pk}:0"
+        assert answer == "Enriched"
+
+    def test_replays_turns_completed_before_interruption(self, execution, get_answer):
+        # Given
+        get_answer.side_effect = _record_upsert
+        ExecutionConversation(execution.conversation, execution).ask("Enrich the products")
+        get_answer.reset_mock(side_effect=True)
+        get_answer.return_value = "Summary"
+        redelivered_conversation = ExecutionConversation(execution.conversation, execution)
+
+        # When
+        first_answer = redelivered_conversation.ask("Enrich the products")
+        second_answer = redelivered_conversation.ask("Summarize what you did")
+
+        # Then
+        assert (first_answer, second_answer) == ("Enriched", "Summary")
+        get_answer.assert_called_once()
+        assert get_answer.call_args.kwargs["turn_id"] == f"agentic_execution:{execution.pk}:1"
+        assert redelivered_conversation.tool_scratchpad.read("upsert_product") == {"skus": ["TS-42"]}
+
+    def test_does_not_store_turns_outside_of_execution(self, execution, get_answer):
+        # Given
+        get_answer.return_value = "Answer"
+        conversation = ExecutionConversation(execution.conversation)
+
+        # When
+        conversation.ask("Hello")
+
+        # Then
+        assert get_answer.call_args.kwargs["turn_id"] is None
+        assert not AgenticExecutionTurn.objects.exists()
+
+
+class TestRunAgenticExecutionTask:
+    @pytest.fixture(autouse=True)
+    def registry(self):
+        with patch(
+            "agent.agentic_execution.tasks.AgenticExecutionDefinitionRegistry.get_by_key",
+            return_value=TwoTurnExecution,
+        ):
+            yield
+
+    def test_resumes_after_last_completed_turn_and_forgets_turns_once_finished(self, execution, get_answer):
+        # Given
+        get_answer.return_value = "Enriched"
+        ExecutionConversation(execution.conversation, execution).ask("Enrich the products")
+        get_answer.reset_mock()
+        get_answer.return_value = '{"status": "done"}'
+
+        # When
+        run_agentic_execution_task(execution.pk)
+
+        # Then
+        execution.refresh_from_db()
+        assert execution.status == AgenticExecution.Status.FINISHED
+        get_answer.assert_called_once()
+        assert get_answer.call_args.args[1] == "Summarize what you did"
+        assert not execution.turns.exists()
+
+    def test_is_stopped_before_broker_delivers_it_again(self):
+        # Then
+        assert run_agentic_execution_task.soft_time_limit < run_agentic_execution_task.time_limit
+        assert run_agentic_execution_task.time_limit < settings.CELERY_BROKER_TRANSPORT_OPTIONS["visibility_timeout"]
+
+    def test_marks_timed_out_execution_as_failed(self, execution, get_answer):
+        # Given
+        get_answer.return_value = "Enriched"
+        ExecutionConversation(execution.conversation, execution).ask("Enrich the products")
+        get_answer.side_effect = SoftTimeLimitExceeded()
+
+        # When
+        run_agentic_execution_task.apply(args=[execution.pk])
+
+        # Then
+        execution.refresh_from_db()
+        assert execution.status == AgenticExecution.Status.FAILED
+        assert execution.failure_code == ExecutionFailureCode.RUNTIME_ERROR
+        assert "SoftTimeLimitExceeded" in execution.failure_explanation
+        assert not execution.turns.exists()
@@ -35,7 +35,9 @@ class ChatConsumer(AsyncWebsocketConsumer):
         await self.send(json.dumps({"event": "on_parser_start", "data": {"run_id": event.get("run_id")}}))
 
     async def handle_stream(self, event):
-        await self.send(json.dumps({"event": "on_parser_stream", "data": {"chunk": event.get("token")}}))
+        # Coalesced stream events carry a batch of tokens, which is forwarded to the client as a single chunk.
+        chunk = "".join(event["tokens"]) if "tokens" in event else event.get("token")
+        await self.send(json.dumps({"event": "on_parser_stream", "data": {"chunk": chunk}}))
 
     async def handle_end(self, event):
         await self.send(json.dumps({"event": "on_parser_end", "data": {"output": event.get("output")}}))
@@ -0,0 +1,117 @@
+import asyncio
+import json
+import logging
+import weakref
+from typing import Any, AsyncIterator
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from langchain_core.callbacks import BaseCallbackHandler
+
+from agent.conversation.manager import ConversationManager
+
+logger = logging.getLogger(__name__)
+
+# Answers are limited per event loop, since an asyncio semaphore can't be shared between loops.
+_limiters: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]" = weakref.WeakKeyDictionary()
+# The event loop only keeps weak references to tasks, and answers keep running when their client disconnects.
+_running_answers: set[asyncio.Task] = set()
+_DONE = object()
+
+
+def in_process_chat_enabled() -> bool:
+    return settings.CHAT_IN_PROCESS_MAX_CONCURRENCY > 0
+
+
+def _get_limiter() -> asyncio.Semaphore:
+    loop = asyncio.get_running_loop()
+    if (limiter := _limiters.get(loop)) is None:
+        limiter = _limiters[loop] = asyncio.Semaphore(settings.CHAT_IN_PROCESS_MAX_CONCURRENCY)
+    return limiter
+
+
+class ChatEventQueueHandler(BaseCallbackHandler):
+    """Puts the agent's events on an asyncio queue, in the format ChatConsumer sends them to the client."""
+
+    run_inline = True
+
+    def __init__(self, queue: asyncio.Queue):
+        self._queue = queue
+        self._loop = asyncio.get_running_loop()
+
+    def on_llm_new_token(self, token: str, **kwargs) -> None:
+        if token:
+            self.put("on_parser_stream", {"chunk": token})
+
+    def on_tool_start(self, serialized: dict, input_str: str, **kwargs) -> None:
+        self.put("tool_call", {"tool_name": serialized.get("name", "tool")})
+
+    def on_tool_end(self, output: Any, **kwargs) -> None:
+        self.put("tool_done", {})
+
+    def on_tool_error(self, error: BaseException, **kwargs) -> None:
+        self.put("tool_done", {})
+
+    def put(self, event: str, data: dict) -> None:
+        # Tools may run in worker threads, while the queue can only be used from its loop.
+        self._loop.call_soon_threadsafe(self._queue.put_nowait, {"event": event, "data": data})
+
+    def finish(self) -> None:
+        """Marks the end of the stream, after the events that were put before."""
+        self._loop.call_soon_threadsafe(self._queue.put_nowait, _DONE)
+
+
+class InProcessChatResponder:
+    """Answers a question on the ASGI server's event loop and streams the agent's events as NDJSON lines.
+
+    Unlike respond_to_user_message_task, the answer doesn't wait for a Celery worker and isn't relayed through
+    the channel layer. At most CHAT_IN_PROCESS_MAX_CONCURRENCY answers run at once per event loop, further
+    requests wait for a slot. The answer is completed and stored even if the client disconnects.
+    """
+
+    def __init__(self, conversation_id: int, data_set_id: int, user_id: int, message: str, streaming: bool):
+        self._conversation_id = conversation_id
+        self._data_set_id = data_set_id
+        self._user_id = user_id
+        self._message = message
+        self._streaming = streaming
+
+    async def stream(self) -> AsyncIterator[str]:
+        queue = asyncio.Queue()
+        limiter = _get_limiter()
+        await limiter.acquire()
+        task = asyncio.create_task(self._answer(ChatEventQueueHandler(queue)))
+        _running_answers.add(task)
+        task.add_done_callback(_running_answers.discard)
+        task.add_done_callback(lambda _: limiter.release())
+
+        while (event := await queue.get()) is not _DONE:
+            yield json.dumps(event) + "\n"
+
+    async def _answer(self, handler: ChatEventQueueHandler) -> None:
+        manager = ConversationManager()
+        try:
+            answer = await manager.arespond_to_user_message(
+                conversation_id=self._conversation_id,
+                data_set_id=self._data_set_id,
+                user_id=self._user_id,
+                message=self._message,
+                streaming=self._streaming,
+                callback_handler=handler,
+            )
+            handler.put("on_parser_end", {"output": answer.text})
+            handler.put("message_id", {"output": answer.id})
+        except Exception as e:
+            logger.exception(f"Failed to answer in conversation {self._conversation_id}")
+            await self._record_failure(manager, e)
+            handler.put("error", {"output": manager.DEFAULT_ERROR_MESSAGE})
+        finally:
+            handler.finish()
+
+    async def _record_failure(self, manager: ConversationManager, error: Exception) -> None:
+        try:
+            await sync_to_async(manager.record_failed_message)(
+                self._conversation_id, self._user_id, self._data_set_id, self._message, error
+            )
+        except Exception:
+            logger.exception(f"Failed to record the error in conversation {self._conversation_id}")
@@ -1,14 +1,15 @@
 from datetime import datetime
 from typing import Optional
 
+from asgiref.sync import sync_to_async
 from enthusiast_common.agentic_execution.memory import ToolScratchpad
 from enthusiast_common.agents import ConfigType
+from langchain_core.callbacks import BaseCallbackHandler
 
 from account.models import User
 from agent.core.registries.agents.agent_registry import AgentRegistry
 from agent.models import Conversation, Message
 from agent.models.agent import Agent
-from catalog.models import DataSet
 
 
 class ConversationManager:
@@ -21,17 +22,19 @@ class ConversationManager:
         streaming: bool,
         config_type: ConfigType = ConfigType.CONVERSATION,
         tool_scratchpad: Optional[ToolScratchpad] = None,
+        turn_id: Optional[str] = None,
     ) -> str:
         """Formulate an answer to a given question and store the decision-making process.
 
         Engine calculates embedding for a question and using similarity search collects documents that may contain
-        relevant content.
+        relevant content. Asking again with the same ``turn_id`` resumes a turn that failed halfway.
         """
         agent = AgentRegistry().get_conversation_agent(
             conversation,
             streaming,
             config_type=config_type,
             tool_scratchpad=tool_scratchpad,
+            turn_id=turn_id,
         )
         response = agent.get_answer(question_message)
 
@@ -50,13 +53,47 @@ class ConversationManager:
         return conversation
 
     def get_conversation(self, user_id: int, data_set_id: int, conversation_id: int) -> Conversation:
-        user = User.objects.get(id=user_id)
-        data_set = DataSet.objects.get(id=data_set_id)
-        return Conversation.objects.select_related("agent").get(id=conversation_id, data_set=data_set, user=user)
+        return Conversation.objects.select_related("agent", "data_set", "user").get(
+            id=conversation_id, data_set_id=data_set_id, user_id=user_id
+        )
 
     def respond_to_user_message(
-        self, conversation_id: int, data_set_id: int, user_id: int, message: str, streaming: bool
+        self,
+        conversation_id: int,
+        data_set_id: int,
+        user_id: int,
+        message: str,
+        streaming: bool,
+        turn_id: Optional[str] = None,
+    ) -> Message:
+        conversation = self._start_response(conversation_id, data_set_id, user_id, message)
+        self.get_answer(conversation, message, streaming, turn_id=turn_id)
+        response = conversation.messages.order_by("created_at").last()
+
+        return response
+
+    async def arespond_to_user_message(
+        self,
+        conversation_id: int,
+        data_set_id: int,
+        user_id: int,
+        message: str,
+        streaming: bool,
+        callback_handler: Optional[BaseCallbackHandler] = None,
     ) -> Message:
+        """Async version of respond_to_user_message, which runs the agent on the caller's event loop.
+
+        Database queries run on the thread used for sync code. The agent's events are sent to ``callback_handler``
+        instead of the conversation's WebSocket group when it's given.
+        """
+        conversation = await sync_to_async(self._start_response)(conversation_id, data_set_id, user_id, message)
+        agent = await sync_to_async(AgentRegistry().get_conversation_agent)(
+            conversation, streaming, callback_handler=callback_handler
+        )
+        await agent.aget_answer(message)
+        return await sync_to_async(lambda: conversation.messages.order_by("created_at").last())()
+
+    def _start_response(self, conversation_id: int, data_set_id: int, user_id: int, message: str) -> Conversation:
         conversation = self.get_conversation(user_id=user_id, data_set_id=data_set_id, conversation_id=conversation_id)
 
         # Set the conversation summary if it's the first message
@@ -64,10 +101,20 @@ class ConversationManager:
             conversation.summary = message
             conversation.save()
 
-        self.get_answer(conversation, message, streaming)
-        response = conversation.messages.order_by("created_at").last()
+        return conversation
 
-        return response
+    def record_failed_message(
+        self, conversation_id: int, user_id: int, data_set_id: int, message: str, error: Exception
+    ):
+        """Store a question that couldn't be answered, followed by the error message shown to the user."""
+        Message.objects.create(
+            conversation_id=conversation_id,
+            created_at=datetime.now(),
+            type=Message.MessageType.HUMAN,
+            text=message,
+            answer_failed=True,
+        )
+        self.record_error(conversation_id, user_id, data_set_id, error)
 
     def record_error(self, conversation_id: int, user_id: int, data_set_id: int, error: Exception):
         conversation = self.get_conversation(user_id=user_id, data_set_id=data_set_id, conversation_id=conversation_id)
@@ -4,6 +4,8 @@ from unittest.mock import patch
 import pytest
 from django.contrib.auth import get_user_model
 from django.core.exceptions import ObjectDoesNotExist
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from model_bakery import baker
 
 from agent.conversation.manager import ConversationManager
@@ -78,6 +80,27 @@ class TestConversationManager:
         assert retrieved_conversation.user == self.user
         assert retrieved_conversation.data_set == self.data_set
 
+    def test_get_conversation_loads_related_objects_in_one_query(self):
+        """Test that the conversation, its agent, user and data set are loaded with a single query."""
+        # Given
+        conversation = Conversation.objects.create(
+            user=self.user,
+            data_set=self.data_set,
+            started_at=datetime.now(),
+            agent=self.agent,
+        )
+
+        # When
+        with CaptureQueriesContext(connection) as queries:
+            retrieved_conversation = self.manager.get_conversation(
+                user_id=self.user.id, data_set_id=self.data_set.id, conversation_id=conversation.id
+            )
+            related = (retrieved_conversation.agent, retrieved_conversation.user, retrieved_conversation.data_set)
+
+        # Then
+        assert len(queries) == 1
+        assert related == (self.agent, self.user, self.data_set)
+
     def test_get_conversation_with_invalid_user_id(self):
         """Test conversation retrieval with invalid user ID."""
         # Given
@@ -181,7 +204,7 @@ class TestConversationManager:
         # Then
         conversation.refresh_from_db()
         assert conversation.summary == message
-        mock_get_answer.assert_called_once_with(conversation, message, streaming)
+        mock_get_answer.assert_called_once_with(conversation, message, streaming, turn_id=None)
 
     @patch("agent.conversation.manager.ConversationManager.get_answer")
     def test_respond_to_user_message_subsequent_message_does_not_change_summary(self, mock_get_answer):
@@ -215,7 +238,7 @@ class TestConversationManager:
         # Then
         conversation.refresh_from_db()
         assert conversation.summary == "Original summary"
-        mock_get_answer.assert_called_once_with(conversation, message, streaming)
+        mock_get_answer.assert_called_once_with(conversation, message, streaming, turn_id=None)
 
     @patch("agent.conversation.manager.ConversationManager.get_answer")
     def test_respond_to_user_message_with_invalid_conversation(self, mock_get_answer):
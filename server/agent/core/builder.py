@@ -1,5 +1,6 @@
 from typing import Optional
 
+from django.conf import settings
 from enthusiast_common.agents import BaseAgent
 from enthusiast_common.builder import BaseAgentBuilder, RepositoriesInstances
 from enthusiast_common.callbacks import ConversationCallbackHandler
@@ -13,6 +14,7 @@ from enthusiast_common.config import (
 )
 from enthusiast_common.connectors import ECommercePlatformConnector
 from enthusiast_common.injectors import BaseInjector
+from enthusiast_common.memory import TurnCheckpoint
 from enthusiast_common.registry import BaseDBModelsRegistry, BaseEmbeddingProviderRegistry, BaseLanguageModelRegistry
 from enthusiast_common.retrievers import BaseRetriever
 from enthusiast_common.tools import BaseAgentTool, BaseFileTool, BaseFunctionTool, BaseLLMTool
@@ -20,7 +22,7 @@ from langchain_core.callbacks import BaseCallbackHandler
 from langchain_core.language_models import BaseLanguageModel
 from langchain_core.tools import BaseTool
 
-from agent.core.memory import LLMMemoryCompactor, PersistentChatHistory
+from agent.core.memory import DeferredMemoryCompactor, DjangoCheckpointSaver, PersistentChatHistory
 from catalog.models import ECommerceIntegration
 
 
@@ -86,16 +88,9 @@ class AgentBuilder(BaseAgentBuilder[AgentConfig]):
         return llm.create(self._data_set_id)
 
     def _build_default_llm(self) -> BaseLanguageModel:
-        llm_registry_class = self._config.registry.llm.registry_class
-        data_set_repo = self._repositories.data_set
-        if providers := self._config.registry.llm.providers:
-            llm_registry = llm_registry_class(providers=providers)
-        else:
-            llm_registry = llm_registry_class(data_set_repo=data_set_repo)
-
         llm = self._config.llm.llm_class(
-            llm_registry=llm_registry,
-            data_set_repo=data_set_repo,
+            llm_registry=self._llm_registry,
+            data_set_repo=self._repositories.data_set,
         )
         return llm.create(self._data_set_id)
 
@@ -153,7 +148,7 @@ class AgentBuilder(BaseAgentBuilder[AgentConfig]):
         document_retriever = self._build_document_retriever()
         product_retriever = self._build_product_retriever()
         chat_history = self._build_chat_history()
-        memory_compactor = self._build_memory_compactor(chat_history)
+        memory_compactor = self._build_memory_compactor()
         ecommerce_platform_connector = self._build_ecommerce_platform_connector()
         return self._config.injector(
             product_retriever=product_retriever,
@@ -163,6 +158,7 @@ class AgentBuilder(BaseAgentBuilder[AgentConfig]):
             chat_history=chat_history,
             memory_compactor=memory_compactor,
             tool_scratchpad=self._tool_scratchpad,
+            turn_checkpoint=self._build_turn_checkpoint(),
         )
 
     def _build_agent_callback_handler(self) -> Optional[BaseCallbackHandler]:
@@ -187,13 +183,12 @@ class AgentBuilder(BaseAgentBuilder[AgentConfig]):
         return handlers
 
     def _build_product_retriever(self) -> BaseRetriever:
-        llm = self._build_default_llm()
         return self._config.retrievers.product.retriever_class.create(
             config=self._config,
             data_set_id=self._data_set_id,
             repositories=self._repositories,
             embeddings_registry=self._embeddings_registry,
-            llm=llm,
+            llm=self._default_llm,
         )
 
     def _build_document_retriever(self) -> BaseRetriever:
@@ -211,18 +206,28 @@ class AgentBuilder(BaseAgentBuilder[AgentConfig]):
         except ECommerceIntegration.DoesNotExist:
             return None
 
+        from sync.ecommerce.connector import CatalogCachedConnector
         from sync.ecommerce.registry import ECommerceIntegrationPluginRegistry
         ecommerce_integration_registry = ECommerceIntegrationPluginRegistry()
         ecommerce_integration_plugin = ecommerce_integration_registry.get_plugin_instance(ecommerce_integration)
 
-        return ecommerce_integration_plugin.build_connector()
+        connector = ecommerce_integration_plugin.build_connector()
+        if not settings.ECOMMERCE_PRODUCT_CACHE_MAX_AGE_SECONDS:
+            return connector
+        return CatalogCachedConnector(connector, self._data_set_id, settings.ECOMMERCE_PRODUCT_CACHE_MAX_AGE_SECONDS)
 
     def _build_chat_history(self) -> PersistentChatHistory:
         return PersistentChatHistory(self._repositories.conversation, self.conversation_id)
 
-    def _build_memory_compactor(self, chat_history: PersistentChatHistory) -> Optional[LLMMemoryCompactor]:
+    def _build_turn_checkpoint(self) -> Optional[TurnCheckpoint]:
+        if self._turn_id is None:
+            return None
+        return TurnCheckpoint(saver=DjangoCheckpointSaver(), thread_id=self._turn_id)
+
+    def _build_memory_compactor(self) -> Optional[DeferredMemoryCompactor]:
         if not self._config.memory_compactor_enabled:
             return None
-        llm = self._build_default_llm()
-        return LLMMemoryCompactor(self._repositories.conversation, self.conversation_id, llm, chat_history)
+        return DeferredMemoryCompactor(
+            self._repositories.conversation, self.conversation_id, config_type=self._config_type
+        )
 
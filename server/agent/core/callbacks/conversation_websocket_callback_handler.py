@@ -1,15 +1,47 @@
-from typing import Any
+from typing import Any, Optional
+
+from django.conf import settings
 
 from agent.core.callbacks.base_websocket_handler import BaseWebSocketHandler
+from agent.core.callbacks.token_buffer import CoalescingTokenBuffer
 
 
 class ConversationWebSocketCallbackHandler(BaseWebSocketHandler):
-    """Streams LLM tokens and tool events to the WebSocket group for a conversation."""
+    """Streams LLM tokens and tool events to the WebSocket group for a conversation.
+
+    Unless CHAT_STREAM_FLUSH_INTERVAL_MS is 0, tokens are coalesced and sent as batched stream events, every
+    CHAT_STREAM_FLUSH_INTERVAL_MS or once CHAT_STREAM_FLUSH_MAX_CHARS characters are buffered. Buffered tokens
+    are always sent before any other event, and when the LLM call ends.
+    """
+
+    def __init__(self, conversation_id: int):
+        super().__init__(conversation_id)
+        self._token_buffer: Optional[CoalescingTokenBuffer] = None
+        if settings.CHAT_STREAM_FLUSH_INTERVAL_MS:
+            self._token_buffer = CoalescingTokenBuffer(
+                send=self._send_tokens,
+                flush_interval=settings.CHAT_STREAM_FLUSH_INTERVAL_MS / 1000,
+                max_chars=settings.CHAT_STREAM_FLUSH_MAX_CHARS,
+            )
+
+    def send_message(self, message_data: Any) -> None:
+        if self._token_buffer is not None:
+            self._token_buffer.flush()
+        super().send_message(message_data)
 
     def on_llm_new_token(self, token: str, **kwargs):
         if not token:
             return
-        self.send_message({"type": "chat_message", "event": "stream", "token": token})
+        if self._token_buffer is None:
+            self.send_message({"type": "chat_message", "event": "stream", "token": token})
+        else:
+            self._token_buffer.add(token)
+
+    def on_llm_end(self, response: Any, **kwargs) -> None:
+        self._close_token_buffer()
+
+    def on_llm_error(self, error: BaseException, **kwargs) -> None:
+        self._close_token_buffer()
 
     def on_tool_start(self, serialized: dict, input_str: str, **kwargs) -> None:
         tool_name = serialized.get("name", "tool")
@@ -20,3 +52,10 @@ class ConversationWebSocketCallbackHandler(BaseWebSocketHandler):
 
     def on_tool_error(self, error: Any, **kwargs) -> None:
         self.send_message({"type": "chat_message", "event": "tool_done"})
+
+    def _close_token_buffer(self) -> None:
+        if self._token_buffer is not None:
+            self._token_buffer.close()
+
+    def _send_tokens(self, tokens: list[str]) -> None:
+        super().send_message({"type": "chat_message", "event": "stream", "tokens": tokens})
@@ -0,0 +1,117 @@
+import json
+import threading
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from asgiref.sync import async_to_sync
+
+from agent.consumers import ChatConsumer
+from agent.core.callbacks import BaseWebSocketHandler, ConversationWebSocketCallbackHandler
+
+
+@pytest.fixture
+def sent_messages():
+    messages = []
+    with patch("agent.core.callbacks.base_websocket_handler.get_channel_layer"):
+        with patch.object(
+            BaseWebSocketHandler, "send_message", lambda handler, message_data: messages.append(message_data)
+        ):
+            yield messages
+
+
+def test_sends_each_token_when_coalescing_is_disabled(settings, sent_messages):
+    # Given
+    settings.CHAT_STREAM_FLUSH_INTERVAL_MS = 0
+    handler = ConversationWebSocketCallbackHandler(conversation_id=1)
+
+    # When
+    handler.on_llm_new_token("Hel")
+    handler.on_llm_new_token("lo")
+
+    # Then
+    assert sent_messages == [
+        {"type": "chat_message", "event": "stream", "token": "Hel"},
+        {"type": "chat_message", "event": "stream", "token": "lo"},
+    ]
+
+
+def test_coalesces_tokens_until_llm_call_ends(settings, sent_messages):
+    # Given
+    settings.CHAT_STREAM_FLUSH_INTERVAL_MS = 60_000
+    settings.CHAT_STREAM_FLUSH_MAX_CHARS = 256
+    handler = ConversationWebSocketCallbackHandler(conversation_id=1)
+
+    # When
+    for token in ["Hel", "lo", ""]:
+        handler.on_llm_new_token(token)
+    buffered_messages = list(sent_messages)
+    handler.on_llm_end(response=None)
+
+    # Then
+    assert buffered_messages == []
+    assert sent_messages == [{"type": "chat_message", "event": "stream", "tokens": ["Hel", "lo"]}]
+
+
+def test_flushes_when_max_chars_are_buffered(settings, sent_messages):
+    # Given
+    settings.CHAT_STREAM_FLUSH_INTERVAL_MS = 60_000
+    settings.CHAT_STREAM_FLUSH_MAX_CHARS = 4
+    handler = ConversationWebSocketCallbackHandler(conversation_id=1)
+
+    # When
+    for token in ["ab", "cd", "e"]:
+        handler.on_llm_new_token(token)
+
+    # Then
+    assert sent_messages == [{"type": "chat_message", "event": "stream", "tokens": ["ab", "cd"]}]
+    handler.on_llm_end(response=None)
+
+
+def test_sends_buffered_tokens_before_tool_events(settings, sent_messages):
+    # Given
+    settings.CHAT_STREAM_FLUSH_INTERVAL_MS = 60_000
+    handler = ConversationWebSocketCallbackHandler(conversation_id=1)
+    handler.on_llm_new_token("Searching")
+
+    # When
+    handler.on_tool_start({"name": "search_products"}, "shoes")
+
+    # Then
+    assert [message["event"] for message in sent_messages] == ["stream", "tool_call"]
+    handler.on_llm_end(response=None)
+
+
+def test_background_flusher_sends_tokens_after_interval(settings, sent_messages):
+    # Given
+    settings.CHAT_STREAM_FLUSH_INTERVAL_MS = 10
+    handler = ConversationWebSocketCallbackHandler(conversation_id=1)
+    flushed = threading.Event()
+    handler._token_buffer._send = lambda tokens: (handler._send_tokens(tokens), flushed.set())
+
+    # When
+    handler.on_llm_new_token("Hello")
+
+    # Then
+    assert flushed.wait(timeout=5)
+    assert sent_messages == [{"type": "chat_message", "event": "stream", "tokens": ["Hello"]}]
+    handler.on_llm_end(response=None)
+
+
+@pytest.mark.parametrize(
+    "event",
+    [
+        {"type": "chat_message", "event": "stream", "token": "Hello"},
+        {"type": "chat_message", "event": "stream", "tokens": ["Hel", "lo"]},
+    ],
+)
+def test_consumer_forwards_stream_event_as_single_frame(event):
+    # Given
+    consumer = ChatConsumer()
+    consumer.send = AsyncMock()
+
+    # When
+    async_to_sync(consumer.chat_message)(event)
+
+    # Then
+    consumer.send.assert_awaited_once()
+    assert json.loads(consumer.send.await_args.args[0]) == {"event": "on_parser_stream", "data": {"chunk": "Hello"}}
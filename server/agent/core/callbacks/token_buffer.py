@@ -0,0 +1,59 @@
+import threading
+from typing import Callable, Optional
+
+
+class CoalescingTokenBuffer:
+    """Collects streamed tokens and hands them over in batches instead of one by one.
+
+    Tokens are flushed when ``max_chars`` characters are buffered, and otherwise by a background thread every
+    ``flush_interval`` seconds. The thread only runs while tokens are being streamed: it's started by the first
+    token and stopped by ``close``, which also flushes what's left. Flushes are serialized, so batches are sent
+    in the order their tokens arrived.
+    """
+
+    def __init__(self, send: Callable[[list[str]], None], flush_interval: float, max_chars: int):
+        self._send = send
+        self._flush_interval = flush_interval
+        self._max_chars = max_chars
+        self._tokens: list[str] = []
+        self._chars = 0
+        self._lock = threading.Lock()
+        self._stopped = threading.Event()
+        self._flusher: Optional[threading.Thread] = None
+
+    def add(self, token: str) -> None:
+        with self._lock:
+            self._tokens.append(token)
+            self._chars += len(token)
+            if self._chars >= self._max_chars:
+                self._flush_locked()
+            if self._flusher is None:
+                self._start_flusher()
+
+    def flush(self) -> None:
+        with self._lock:
+            self._flush_locked()
+
+    def close(self) -> None:
+        """Stops the background flusher and sends the tokens that are still buffered."""
+        with self._lock:
+            flusher, self._flusher = self._flusher, None
+            self._stopped.set()
+            self._flush_locked()
+        if flusher is not None and flusher is not threading.current_thread():
+            flusher.join()
+
+    def _start_flusher(self) -> None:
+        self._stopped = threading.Event()
+        self._flusher = threading.Thread(target=self._run_flusher, args=(self._stopped,), daemon=True)
+        self._flusher.start()
+
+    def _run_flusher(self, stopped: threading.Event) -> None:
+        while not stopped.wait(self._flush_interval):
+            self.flush()
+
+    def _flush_locked(self) -> None:
+        if not self._tokens:
+            return
+        tokens, self._tokens, self._chars = self._tokens, [], 0
+        self._send(tokens)
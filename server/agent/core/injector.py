@@ -3,7 +3,7 @@ from typing import Optional
 from enthusiast_common.agentic_execution.memory import ToolScratchpad
 from enthusiast_common.connectors import ECommercePlatformConnector
 from enthusiast_common.injectors import BaseInjector
-from enthusiast_common.memory import BaseMemoryCompactor
+from enthusiast_common.memory import BaseMemoryCompactor, TurnCheckpoint
 from enthusiast_common.retrievers import BaseProductRetriever, BaseVectorStoreRetriever
 from enthusiast_common.structures import RepositoriesInstances
 from langchain_core.chat_history import BaseChatMessageHistory
@@ -22,6 +22,7 @@ class Injector(BaseInjector):
         chat_history: PersistentChatHistory,
         tool_scratchpad: Optional[ToolScratchpad],
         memory_compactor: Optional[LLMMemoryCompactor] = None,
+        turn_checkpoint: Optional[TurnCheckpoint] = None,
     ):
         super().__init__(repositories)
         self._document_retriever = document_retriever
@@ -30,6 +31,7 @@ class Injector(BaseInjector):
         self._chat_history = chat_history
         self._memory_compactor = memory_compactor
         self._tool_scratchpad = tool_scratchpad or ToolScratchpad()
+        self._turn_checkpoint = turn_checkpoint
 
     @property
     def document_retriever(self) -> BaseVectorStoreRetriever[DocumentChunk]:
@@ -54,3 +56,7 @@ class Injector(BaseInjector):
     @property
     def tool_scratchpad(self) -> ToolScratchpad:
         return self._tool_scratchpad
+
+    @property
+    def turn_checkpoint(self) -> Optional[TurnCheckpoint]:
+        return self._turn_checkpoint
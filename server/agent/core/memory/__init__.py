@@ -1,4 +1,6 @@
+from .deferred_memory_compactor import DeferredMemoryCompactor
+from .graph_checkpoint_saver import DjangoCheckpointSaver
 from .llm_memory_compactor import LLMMemoryCompactor
 from .persistent_chat_history import PersistentChatHistory
 
-__all__ = ["LLMMemoryCompactor", "PersistentChatHistory"]
+__all__ = ["DeferredMemoryCompactor", "DjangoCheckpointSaver", "LLMMemoryCompactor", "PersistentChatHistory"]
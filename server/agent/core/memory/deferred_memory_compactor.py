@@ -0,0 +1,106 @@
+from typing import Any, Optional
+
+import redis
+from django.conf import settings
+from django.db import transaction
+from enthusiast_common.agents import ConfigType
+from enthusiast_common.memory import BaseMemoryCompactor
+from enthusiast_common.repositories import BaseConversationRepository
+from redis.exceptions import LockError
+
+from agent.core.memory.llm_memory_compactor import COMPACTION_INTERVAL, LLMMemoryCompactor
+from agent.core.memory.persistent_chat_history import PersistentChatHistory
+from agent.core.repositories import DjangoConversationRepository
+from agent.models import Conversation, Message
+from sync.locks import get_redis_client
+
+
+class DeferredMemoryCompactor(BaseMemoryCompactor):
+    """
+    Schedules conversation summaries in a background task instead of generating them during the turn.
+
+    The threshold is checked with a single count of the human messages added since the last summary.
+    Once it's reached, a compaction task is scheduled MEMORY_COMPACTION_DEBOUNCE_SECONDS later, and further
+    turns in that window don't schedule another one, so a burst of messages results in a single summary.
+    The task summarizes with the default language model of the agent's config of the given type.
+    """
+
+    def __init__(
+        self,
+        conversation_repo: BaseConversationRepository,
+        conversation_id: Any,
+        client: Optional[redis.Redis] = None,
+        config_type: ConfigType = ConfigType.CONVERSATION,
+    ):
+        self._conversation = conversation_repo.get_by_id(conversation_id)
+        self._client = client
+        self._config_type = config_type
+
+    def get_summary(self) -> Optional[str]:
+        """Return the current persisted summary, or None if one has not been generated yet."""
+        return self._conversation.conversation_summary or None
+
+    def compact_if_needed(self) -> None:
+        """Schedule a compaction task if COMPACTION_INTERVAL human messages have been added since the last summary."""
+        if self._count_unsummarized_human_messages() < COMPACTION_INTERVAL:
+            return
+
+        debounce_seconds = settings.MEMORY_COMPACTION_DEBOUNCE_SECONDS
+        client = self._client or get_redis_client()
+        if not client.set(f"memory_compaction:scheduled:{self._conversation.id}", "1", nx=True, ex=debounce_seconds):
+            return
+
+        from agent.tasks import compact_conversation_memory_task
+
+        conversation_id = self._conversation.id
+        config_type = str(self._config_type)
+        transaction.on_commit(
+            lambda: compact_conversation_memory_task.apply_async(
+                (conversation_id, config_type), countdown=debounce_seconds
+            )
+        )
+
+    def _count_unsummarized_human_messages(self) -> int:
+        messages = Message.objects.filter(
+            conversation_id=self._conversation.id,
+            answer_failed=False,
+            type__in=[Message.MessageType.HUMAN, Message.MessageType.FILE],
+        )
+        if self._conversation.last_summarized_message_id is not None:
+            messages = messages.filter(id__gt=self._conversation.last_summarized_message_id)
+        return messages.count()
+
+
+def compact_conversation_memory(
+    conversation_id: int,
+    client: Optional[redis.Redis] = None,
+    config_type: ConfigType = ConfigType.CONVERSATION,
+) -> bool:
+    """Summarize the messages of the conversation added since its last summary, if there are enough of them.
+
+    The summary is generated by the default language model of the agent's config of the given type, the same one
+    the agent's tools use during its turns.
+
+    Runs under a per-conversation lock, so a conversation is never summarized by two workers at once.
+    Returns False when the lock is held by another worker.
+    """
+    from agent.core.registries.agents.agent_registry import AgentRegistry
+
+    client = client or get_redis_client()
+    lock = client.lock(
+        f"memory_compaction:lock:{conversation_id}", timeout=settings.MEMORY_COMPACTION_LOCK_TIMEOUT_SECONDS
+    )
+    if not lock.acquire(blocking=False):
+        return False
+    try:
+        conversation_repo = DjangoConversationRepository(Conversation)
+        conversation = conversation_repo.get_by_id(conversation_id)
+        llm = AgentRegistry().get_conversation_default_llm(conversation, ConfigType(config_type))
+        chat_history = PersistentChatHistory(conversation_repo, conversation_id)
+        LLMMemoryCompactor(conversation_repo, conversation_id, llm, chat_history).compact_if_needed()
+    finally:
+        try:
+            lock.release()
+        except LockError:
+            pass  # the lock expired and may already be held by another worker
+    return True
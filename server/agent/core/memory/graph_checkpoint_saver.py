@@ -0,0 +1,212 @@
+from datetime import datetime
+from typing import Any, AsyncIterator, Iterator, Optional, Sequence
+
+from asgiref.sync import sync_to_async
+from langchain_core.runnables import RunnableConfig
+from langgraph.checkpoint.base import (
+    WRITES_IDX_MAP,
+    BaseCheckpointSaver,
+    ChannelVersions,
+    Checkpoint,
+    CheckpointMetadata,
+    CheckpointTuple,
+    get_checkpoint_id,
+    get_checkpoint_metadata,
+    writes_sort_key,
+)
+
+from agent.models import GraphCheckpoint, GraphCheckpointWrite
+
+
+class DjangoCheckpointSaver(BaseCheckpointSaver[str]):
+    """Saves the checkpoints of agent graphs in the database.
+
+    Checkpoints are only kept for the duration of a turn, so each one is stored whole, with the values of all
+    channels, instead of being split into versioned channel blobs.
+    """
+
+    def get_tuple(self, config: RunnableConfig) -> Optional[CheckpointTuple]:
+        configurable = config["configurable"]
+        checkpoints = GraphCheckpoint.objects.filter(
+            thread_id=configurable["thread_id"], checkpoint_ns=configurable.get("checkpoint_ns", "")
+        )
+        if checkpoint_id := get_checkpoint_id(config):
+            checkpoints = checkpoints.filter(checkpoint_id=checkpoint_id)
+        checkpoint = checkpoints.order_by("-checkpoint_id").first()
+        return self._to_checkpoint_tuple(checkpoint) if checkpoint else None
+
+    def list(
+        self,
+        config: Optional[RunnableConfig],
+        *,
+        filter: Optional[dict[str, Any]] = None,
+        before: Optional[RunnableConfig] = None,
+        limit: Optional[int] = None,
+    ) -> Iterator[CheckpointTuple]:
+        checkpoints = GraphCheckpoint.objects.order_by("thread_id", "checkpoint_ns", "-checkpoint_id")
+        if config:
+            configurable = config["configurable"]
+            checkpoints = checkpoints.filter(thread_id=configurable["thread_id"])
+            if (checkpoint_ns := configurable.get("checkpoint_ns")) is not None:
+                checkpoints = checkpoints.filter(checkpoint_ns=checkpoint_ns)
+            if checkpoint_id := get_checkpoint_id(config):
+                checkpoints = checkpoints.filter(checkpoint_id=checkpoint_id)
+        if before and (before_checkpoint_id := get_checkpoint_id(before)):
+            checkpoints = checkpoints.filter(checkpoint_id__lt=before_checkpoint_id)
+
+        for checkpoint in checkpoints.iterator():
+            metadata = self.serde.loads_typed((checkpoint.metadata_type, bytes(checkpoint.metadata)))
+            if filter and any(metadata.get(key) != value for key, value in filter.items()):
+                continue
+            if limit is not None:
+                if limit <= 0:
+                    return
+                limit -= 1
+            yield self._to_checkpoint_tuple(checkpoint)
+
+    def put(
+        self,
+        config: RunnableConfig,
+        checkpoint: Checkpoint,
+        metadata: CheckpointMetadata,
+        new_versions: ChannelVersions,
+    ) -> RunnableConfig:
+        configurable = config["configurable"]
+        thread_id = configurable["thread_id"]
+        checkpoint_ns = configurable.get("checkpoint_ns", "")
+        checkpoint_type, checkpoint_data = self.serde.dumps_typed(checkpoint)
+        metadata_type, metadata_data = self.serde.dumps_typed(get_checkpoint_metadata(config, metadata))
+        GraphCheckpoint.objects.update_or_create(
+            thread_id=thread_id,
+            checkpoint_ns=checkpoint_ns,
+            checkpoint_id=checkpoint["id"],
+            defaults={
+                "parent_checkpoint_id": configurable.get("checkpoint_id"),
+                "checkpoint_type": checkpoint_type,
+                "checkpoint": checkpoint_data,
+                "metadata_type": metadata_type,
+                "metadata": metadata_data,
+            },
+        )
+        return {
+            "configurable": {"thread_id": thread_id, "checkpoint_ns": checkpoint_ns, "checkpoint_id": checkpoint["id"]}
+        }
+
+    def put_writes(
+        self,
+        config: RunnableConfig,
+        writes: Sequence[tuple[str, Any]],
+        task_id: str,
+        task_path: str = "",
+    ) -> None:
+        configurable = config["configurable"]
+        rows = []
+        for idx, (channel, value) in enumerate(writes):
+            value_type, value_data = self.serde.dumps_typed(value)
+            rows.append(
+                GraphCheckpointWrite(
+                    thread_id=configurable["thread_id"],
+                    checkpoint_ns=configurable.get("checkpoint_ns", ""),
+                    checkpoint_id=configurable["checkpoint_id"],
+                    task_id=task_id,
+                    task_path=task_path,
+                    idx=WRITES_IDX_MAP.get(channel, idx),
+                    channel=channel,
+                    value_type=value_type,
+                    value=value_data,
+                )
+            )
+
+        # Regular writes of a task are saved once, while special ones (errors, interrupts) replace earlier values.
+        GraphCheckpointWrite.objects.bulk_create([row for row in rows if row.idx >= 0], ignore_conflicts=True)
+        if special_rows := [row for row in rows if row.idx < 0]:
+            GraphCheckpointWrite.objects.bulk_create(
+                special_rows,
+                update_conflicts=True,
+                unique_fields=["thread_id", "checkpoint_ns", "checkpoint_id", "task_id", "idx"],
+                update_fields=["task_path", "channel", "value_type", "value"],
+            )
+
+    def delete_thread(self, thread_id: str) -> None:
+        GraphCheckpoint.objects.filter(thread_id=thread_id).delete()
+        GraphCheckpointWrite.objects.filter(thread_id=thread_id).delete()
+
+    def delete_threads(self, thread_id_prefix: str) -> None:
+        """Deletes the checkpoints of all threads whose ID starts with the given prefix."""
+        GraphCheckpoint.objects.filter(thread_id__startswith=thread_id_prefix).delete()
+        GraphCheckpointWrite.objects.filter(thread_id__startswith=thread_id_prefix).delete()
+
+    def delete_created_before(self, created_before: datetime) -> None:
+        """Deletes checkpoints left behind by turns that were never completed nor retried."""
+        GraphCheckpoint.objects.filter(created_at__lt=created_before).delete()
+        GraphCheckpointWrite.objects.filter(created_at__lt=created_before).delete()
+
+    async def aget_tuple(self, config: RunnableConfig) -> Optional[CheckpointTuple]:
+        return await sync_to_async(self.get_tuple)(config)
+
+    async def alist(
+        self,
+        config: Optional[RunnableConfig],
+        *,
+        filter: Optional[dict[str, Any]] = None,
+        before: Optional[RunnableConfig] = None,
+        limit: Optional[int] = None,
+    ) -> AsyncIterator[CheckpointTuple]:
+        checkpoints = await sync_to_async(lambda: list(self.list(config, filter=filter, before=before, limit=limit)))()
+        for checkpoint in checkpoints:
+            yield checkpoint
+
+    async def aput(
+        self,
+        config: RunnableConfig,
+        checkpoint: Checkpoint,
+        metadata: CheckpointMetadata,
+        new_versions: ChannelVersions,
+    ) -> RunnableConfig:
+        return await sync_to_async(self.put)(config, checkpoint, metadata, new_versions)
+
+    async def aput_writes(
+        self,
+        config: RunnableConfig,
+        writes: Sequence[tuple[str, Any]],
+        task_id: str,
+        task_path: str = "",
+    ) -> None:
+        await sync_to_async(self.put_writes)(config, writes, task_id, task_path)
+
+    async def adelete_thread(self, thread_id: str) -> None:
+        await sync_to_async(self.delete_thread)(thread_id)
+
+    def _to_checkpoint_tuple(self, checkpoint: GraphCheckpoint) -> CheckpointTuple:
+        config = {
+            "configurable": {
+                "thread_id": checkpoint.thread_id,
+                "checkpoint_ns": checkpoint.checkpoint_ns,
+                "checkpoint_id": checkpoint.checkpoint_id,
+            }
+        }
+        parent_config = None
+        if checkpoint.parent_checkpoint_id:
+            parent_config = {
+                "configurable": {
+                    "thread_id": checkpoint.thread_id,
+                    "checkpoint_ns": checkpoint.checkpoint_ns,
+                    "checkpoint_id": checkpoint.parent_checkpoint_id,
+                }
+            }
+        writes = GraphCheckpointWrite.objects.filter(
+            thread_id=checkpoint.thread_id,
+            checkpoint_ns=checkpoint.checkpoint_ns,
+            checkpoint_id=checkpoint.checkpoint_id,
+        )
+        writes = sorted(writes, key=lambda write: writes_sort_key(write.task_path, write.task_id, write.idx))
+        return CheckpointTuple(
+            config=config,
+            checkpoint=self.serde.loads_typed((checkpoint.checkpoint_type, bytes(checkpoint.checkpoint))),
+            metadata=self.serde.loads_typed((checkpoint.metadata_type, bytes(checkpoint.metadata))),
+            parent_config=parent_config,
+            pending_writes=[
+                (write.task_id, write.channel, self.serde.loads_typed((write.value_type, bytes(write.value))))
+                for write in writes
+            ],
+        )
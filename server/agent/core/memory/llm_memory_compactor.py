@@ -49,7 +49,9 @@ class LLMMemoryCompactor(BaseMemoryCompactor):
     def compact_if_needed(self) -> None:
         """Generate a new summary if COMPACTION_INTERVAL human messages have been added since the last one."""
         last_summarized_message_id = self._conversation.last_summarized_message_id
-        new_messages = self._chat_history.messages_after(last_summarized_message_id)
+        # Messages added while the summary is generated aren't part of it, so they're left for the next one.
+        last_message_id = self._chat_history.last_message_database_id
+        new_messages = self._chat_history.messages_after(last_summarized_message_id, up_to_message_id=last_message_id)
 
         if not new_messages:
             return
@@ -60,7 +62,7 @@ class LLMMemoryCompactor(BaseMemoryCompactor):
 
         summary = self._generate_summary(new_messages, self._conversation.conversation_summary)
         self._conversation.conversation_summary = summary
-        self._conversation.last_summarized_message_id = self._chat_history.last_message_database_id
+        self._conversation.last_summarized_message_id = last_message_id
         self._conversation.save(update_fields=["conversation_summary", "last_summarized_message_id"])
 
     def _generate_summary(self, new_messages: list[BaseMessage], existing_summary: Optional[str]) -> str:
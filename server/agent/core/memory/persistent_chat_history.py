@@ -1,13 +1,16 @@
 from typing import Any, Dict, Optional
 
+from enthusiast_common.memory import BaseWindowedChatHistory
 from enthusiast_common.repositories import BaseConversationRepository
-from langchain_core.chat_history import BaseChatMessageHistory
 from langchain_core.messages import AIMessage, BaseMessage, ToolMessage, messages_from_dict
+from langchain_core.messages.utils import count_tokens_approximately
 
 from agent.models import Message
 
+WINDOW_BATCH_SIZE = 50  # number of messages fetched per query while filling the token window
 
-class PersistentChatHistory(BaseChatMessageHistory):
+
+class PersistentChatHistory(BaseWindowedChatHistory):
     """
     A chat history implementation that persists messages in the database.
     Inject it into the agent to enable conversation persistence.
@@ -22,18 +25,21 @@ class PersistentChatHistory(BaseChatMessageHistory):
         LLMs can invoke tools in parallel, producing an AIMessage with multiple tool_calls
         followed by multiple ToolMessages. This reorders them so each tool call is immediately
         followed by its result, which allows straightforward one-to-one reconstruction.
+        All messages of the turn are inserted with a single query.
         """
         tool_messages = {m.tool_call_id: m for m in messages if isinstance(m, ToolMessage)}
+        db_messages = []
         for message in messages:
             if isinstance(message, AIMessage) and message.tool_calls:
                 for tool_call in message.tool_calls:
-                    self.add_message(AIMessage(content="", tool_calls=[tool_call]))
+                    db_messages.extend(self._build_db_messages(AIMessage(content="", tool_calls=[tool_call])))
                     if tool_call["id"] in tool_messages:
-                        self.add_message(tool_messages[tool_call["id"]])
+                        db_messages.extend(self._build_db_messages(tool_messages[tool_call["id"]]))
             elif isinstance(message, ToolMessage):
                 pass  # already persisted paired with its tool call above
             else:
-                self.add_message(message)
+                db_messages.extend(self._build_db_messages(message))
+        Message.objects.bulk_create(db_messages)
 
     def add_message(self, message: BaseMessage) -> None:
         """Persist a message to the database.
@@ -42,29 +48,44 @@ class PersistentChatHistory(BaseChatMessageHistory):
         ToolMessages (tool results) are stored as FUNCTION records.
         All other standard message types are stored using their LangChain type string directly.
         """
+        Message.objects.bulk_create(self._build_db_messages(message))
+
+    def create_tool_message(self, message: ToolMessage) -> None:
+        Message.objects.bulk_create([self._build_tool_message(message)])
+
+    def _build_db_messages(self, message: BaseMessage) -> list[Message]:
         if isinstance(message, AIMessage) and message.tool_calls:
-            self._create_intermediate_step_message(message)
+            db_messages = self._build_intermediate_step_messages(message)
         elif isinstance(message, ToolMessage):
-            self.create_tool_message(message)
+            db_messages = [self._build_tool_message(message)]
         else:
-            self._conversation.messages.create(
-                type=message.type,
-                text=message.text,
-                function_name=getattr(message, "name", None),
-            )
-
-    def _create_intermediate_step_message(self, message: AIMessage) -> None:
-        for tool_call in message.tool_calls:
-            text = f"Invoking `{tool_call['name']}` with `{tool_call['args']}`."
-            self._conversation.messages.create(
+            db_messages = [
+                Message(
+                    conversation=self._conversation,
+                    type=message.type,
+                    text=message.text,
+                    function_name=getattr(message, "name", None),
+                )
+            ]
+        for db_message in db_messages:
+            db_message.token_count = self._count_tokens(db_message)
+        return db_messages
+
+    def _build_intermediate_step_messages(self, message: AIMessage) -> list[Message]:
+        return [
+            Message(
+                conversation=self._conversation,
                 type=Message.MessageType.INTERMEDIATE_STEP,
-                text=text,
+                text=f"Invoking `{tool_call['name']}` with `{tool_call['args']}`.",
                 function_name=tool_call["name"],
                 tool_call_id=tool_call["id"],
             )
+            for tool_call in message.tool_calls
+        ]
 
-    def create_tool_message(self, message: ToolMessage) -> None:
-        self._conversation.messages.create(
+    def _build_tool_message(self, message: ToolMessage) -> Message:
+        return Message(
+            conversation=self._conversation,
             type=Message.MessageType.FUNCTION,
             text=message.text,
             function_name=message.name,
@@ -73,11 +94,32 @@ class PersistentChatHistory(BaseChatMessageHistory):
 
     @property
     def messages(self) -> list[BaseMessage]:
-        messages = list(self._conversation.messages.filter(answer_failed=False).order_by("id"))
-        message_dicts = []
-        for msg in messages:
-            message_dicts.append(self._parse_message_to_dict(msg))
-        return messages_from_dict(message_dicts)
+        return self._to_langchain_messages(self._conversation.messages.filter(answer_failed=False).order_by("id"))
+
+    def recent_messages(self, max_tokens: int) -> list[BaseMessage]:
+        """Return the most recent messages whose approximate token count fits max_tokens, oldest first.
+
+        Messages are read newest first in batches of WINDOW_BATCH_SIZE, so only the rows that can end up
+        in the context window are fetched and converted. Token counts are stored when a message is saved;
+        messages saved without one are counted when read.
+        """
+        queryset = self._conversation.messages.filter(answer_failed=False).order_by("-id")
+        window = []
+        used_tokens = 0
+        batch = list(queryset[:WINDOW_BATCH_SIZE])
+        while batch:
+            for db_message in batch:
+                token_count = db_message.token_count
+                if token_count is None:
+                    token_count = self._count_tokens(db_message)
+                if used_tokens + token_count > max_tokens:
+                    return self._to_langchain_messages(reversed(window))
+                used_tokens += token_count
+                window.append(db_message)
+            if len(batch) < WINDOW_BATCH_SIZE:
+                break
+            batch = list(queryset.filter(id__lt=batch[-1].id)[:WINDOW_BATCH_SIZE])
+        return self._to_langchain_messages(reversed(window))
 
     @property
     def last_message_database_id(self) -> Optional[int]:
@@ -85,8 +127,8 @@ class PersistentChatHistory(BaseChatMessageHistory):
         last = self._conversation.messages.filter(answer_failed=False).order_by("id").last()
         return last.id if last else None
 
-    def messages_after(self, message_id: Optional[int]) -> list[BaseMessage]:
-        """Return messages after the given message ID.
+    def messages_after(self, message_id: Optional[int], up_to_message_id: Optional[int] = None) -> list[BaseMessage]:
+        """Return messages after the given message ID, up to and including up_to_message_id if it's given.
 
         If message_id is None, returns all messages. Used by the memory compactor to fetch
         only messages that have not yet been included in the conversation summary.
@@ -94,10 +136,18 @@ class PersistentChatHistory(BaseChatMessageHistory):
         queryset = self._conversation.messages.filter(answer_failed=False).order_by("id")
         if message_id is not None:
             queryset = queryset.filter(id__gt=message_id)
-        db_messages = list(queryset)
-        if not db_messages:
-            return []
-        return messages_from_dict([self._parse_message_to_dict(m) for m in db_messages])
+        if up_to_message_id is not None:
+            queryset = queryset.filter(id__lte=up_to_message_id)
+        return self._to_langchain_messages(queryset)
+
+    @classmethod
+    def _to_langchain_messages(cls, db_messages) -> list[BaseMessage]:
+        return messages_from_dict([cls._parse_message_to_dict(m) for m in db_messages])
+
+    @classmethod
+    def _count_tokens(cls, message: Message) -> int:
+        """Count tokens the way ``trim_messages(token_counter="approximate")`` does, on the message as it's loaded."""
+        return count_tokens_approximately(cls._to_langchain_messages([message]))
 
     @staticmethod
     def _parse_message_to_dict(message: BaseMessage) -> Dict[str, Any]:
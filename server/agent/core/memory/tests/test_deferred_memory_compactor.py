@@ -0,0 +1,173 @@
+from unittest.mock import MagicMock, patch
+
+import pytest
+from django.contrib.auth import get_user_model
+from enthusiast_common.agents import ConfigType
+from model_bakery import baker
+
+from agent.core.memory.deferred_memory_compactor import DeferredMemoryCompactor, compact_conversation_memory
+from agent.core.memory.llm_memory_compactor import COMPACTION_INTERVAL
+from agent.core.repositories import DjangoConversationRepository
+from agent.models import Agent, Conversation, Message
+from agent.tasks import compact_conversation_memory_task
+from catalog.models import DataSet
+
+
+@pytest.fixture
+def conversation():
+    user = baker.make(get_user_model())
+    data_set = baker.make(DataSet, users=[user], language_model_provider="OpenAI", language_model="gpt-4.1")
+    agent = baker.make(Agent, dataset=data_set)
+    return baker.make(Conversation, user=user, data_set=data_set, agent=agent)
+
+
+@pytest.fixture
+def redis_client():
+    client = MagicMock()
+    client.set.return_value = True
+    return client
+
+
+@pytest.fixture
+def apply_async():
+    with patch.object(compact_conversation_memory_task, "apply_async") as mock_apply_async:
+        yield mock_apply_async
+
+
+def _make_human_messages(conversation, count, **kwargs):
+    return baker.make(
+        Message, conversation=conversation, type=Message.MessageType.HUMAN, text="Hello", _quantity=count, **kwargs
+    )
+
+
+@pytest.mark.django_db
+class TestDeferredMemoryCompactorCompactIfNeeded:
+    def test_does_not_schedule_below_threshold(self, conversation, redis_client, apply_async):
+        # Given
+        _make_human_messages(conversation, COMPACTION_INTERVAL - 1)
+        _make_human_messages(conversation, 1, answer_failed=True)
+        compactor = DeferredMemoryCompactor(DjangoConversationRepository(Conversation), conversation.id, redis_client)
+
+        # When
+        compactor.compact_if_needed()
+
+        # Then
+        redis_client.set.assert_not_called()
+        apply_async.assert_not_called()
+
+    def test_counts_only_messages_after_last_summary(self, conversation, redis_client, apply_async):
+        # Given
+        summarized = _make_human_messages(conversation, COMPACTION_INTERVAL)
+        _make_human_messages(conversation, COMPACTION_INTERVAL - 1)
+        conversation.last_summarized_message = summarized[-1]
+        conversation.save()
+        compactor = DeferredMemoryCompactor(DjangoConversationRepository(Conversation), conversation.id, redis_client)
+
+        # When
+        compactor.compact_if_needed()
+
+        # Then
+        apply_async.assert_not_called()
+
+    def test_schedules_debounced_task_at_threshold(
+        self, conversation, redis_client, apply_async, settings, django_capture_on_commit_callbacks
+    ):
+        # Given
+        settings.MEMORY_COMPACTION_DEBOUNCE_SECONDS = 30
+        _make_human_messages(conversation, COMPACTION_INTERVAL)
+        compactor = DeferredMemoryCompactor(DjangoConversationRepository(Conversation), conversation.id, redis_client)
+
+        # When
+        with django_capture_on_commit_callbacks(execute=True):
+            compactor.compact_if_needed()
+
+        # Then
+        redis_client.set.assert_called_once_with(f"memory_compaction:scheduled:{conversation.id}", "1", nx=True, ex=30)
+        apply_async.assert_called_once_with((conversation.id, ConfigType.CONVERSATION), countdown=30)
+
+    def test_schedules_task_for_agent_config_type(
+        self, conversation, redis_client, apply_async, django_capture_on_commit_callbacks
+    ):
+        # Given
+        _make_human_messages(conversation, COMPACTION_INTERVAL)
+        compactor = DeferredMemoryCompactor(
+            DjangoConversationRepository(Conversation),
+            conversation.id,
+            redis_client,
+            config_type=ConfigType.AGENTIC_EXECUTION_DEFINITION,
+        )
+
+        # When
+        with django_capture_on_commit_callbacks(execute=True):
+            compactor.compact_if_needed()
+
+        # Then
+        assert apply_async.call_args.args[0] == (conversation.id, ConfigType.AGENTIC_EXECUTION_DEFINITION)
+
+    def test_does_not_schedule_again_within_debounce_window(
+        self, conversation, redis_client, apply_async, django_capture_on_commit_callbacks
+    ):
+        # Given
+        redis_client.set.return_value = None
+        _make_human_messages(conversation, COMPACTION_INTERVAL)
+        compactor = DeferredMemoryCompactor(DjangoConversationRepository(Conversation), conversation.id, redis_client)
+
+        # When
+        with django_capture_on_commit_callbacks(execute=True):
+            compactor.compact_if_needed()
+
+        # Then
+        apply_async.assert_not_called()
+
+
+@pytest.mark.django_db
+class TestCompactConversationMemory:
+    @pytest.fixture
+    def agent_registry(self):
+        with patch("agent.core.registries.agents.agent_registry.AgentRegistry") as registry_class:
+            yield registry_class.return_value
+
+    @pytest.fixture
+    def llm_memory_compactor(self, agent_registry):
+        with patch("agent.core.memory.deferred_memory_compactor.LLMMemoryCompactor") as compactor_class:
+            yield compactor_class
+
+    def test_summarizes_with_default_llm_of_agent_config(
+        self, conversation, redis_client, agent_registry, llm_memory_compactor
+    ):
+        # Given
+        redis_client.lock.return_value.acquire.return_value = True
+
+        # When
+        compact_conversation_memory(conversation.id, redis_client, ConfigType.AGENTIC_EXECUTION_DEFINITION)
+
+        # Then
+        agent_registry.get_conversation_default_llm.assert_called_once_with(
+            conversation, ConfigType.AGENTIC_EXECUTION_DEFINITION
+        )
+        llm = llm_memory_compactor.call_args.args[2]
+        assert llm is agent_registry.get_conversation_default_llm.return_value
+
+    def test_compacts_under_lock(self, conversation, redis_client, llm_memory_compactor):
+        # Given
+        lock = redis_client.lock.return_value
+        lock.acquire.return_value = True
+
+        # When
+        compacted = compact_conversation_memory(conversation.id, redis_client)
+
+        # Then
+        assert compacted is True
+        llm_memory_compactor.return_value.compact_if_needed.assert_called_once()
+        lock.release.assert_called_once()
+
+    def test_skips_when_conversation_is_being_compacted(self, conversation, redis_client, llm_memory_compactor):
+        # Given
+        redis_client.lock.return_value.acquire.return_value = False
+
+        # When
+        compacted = compact_conversation_memory(conversation.id, redis_client)
+
+        # Then
+        assert compacted is False
+        llm_memory_compactor.assert_not_called()
@@ -0,0 +1,113 @@
+from datetime import timedelta
+from typing import Annotated, TypedDict
+
+import pytest
+from django.utils import timezone
+from langchain_core.messages import AIMessage, HumanMessage
+from langgraph.graph import END, START, StateGraph
+from langgraph.graph.message import add_messages
+
+from agent.core.memory import DjangoCheckpointSaver
+from agent.models import GraphCheckpoint, GraphCheckpointWrite
+
+# The graph saves its checkpoints from background threads, which don't share the test's transaction.
+pytestmark = pytest.mark.django_db(transaction=True)
+
+
+class State(TypedDict):
+    messages: Annotated[list, add_messages]
+
+
+class FlakyGraph:
+    """Graph with two steps, where the second one fails until it's told to succeed."""
+
+    def __init__(self):
+        self.calls = {"search": 0, "answer": 0}
+        self.fail = True
+        graph = StateGraph(State)
+        graph.add_node("search", self._search)
+        graph.add_node("answer", self._answer)
+        graph.add_edge(START, "search")
+        graph.add_edge("search", "answer")
+        graph.add_edge("answer", END)
+        self.graph = graph.compile(checkpointer=DjangoCheckpointSaver())
+
+    def _search(self, state: State) -> dict:
+        self.calls["search"] += 1
+        return {"messages": [AIMessage(content="", tool_calls=[{"name": "search", "args": {}, "id": "call_1"}])]}
+
+    def _answer(self, state: State) -> dict:
+        self.calls["answer"] += 1
+        if self.fail:
+            raise RuntimeError("LLM unavailable")
+        return {"messages": [AIMessage(content="Found it")]}
+
+
+def _config(thread_id: str) -> dict:
+    return {"configurable": {"thread_id": thread_id}}
+
+
+def test_resumes_turn_from_last_completed_step():
+    # Given
+    flaky = FlakyGraph()
+    with pytest.raises(RuntimeError):
+        flaky.graph.invoke({"messages": [HumanMessage(content="Any shoes?")]}, _config("turn-1"))
+    flaky.fail = False
+
+    # When
+    result = flaky.graph.invoke(None, _config("turn-1"))
+
+    # Then
+    assert flaky.calls == {"search": 1, "answer": 2}
+    assert [message.content for message in result["messages"]] == ["Any shoes?", "", "Found it"]
+    assert result["messages"][1].tool_calls[0]["id"] == "call_1"
+
+
+def test_get_tuple_returns_latest_checkpoint_of_thread():
+    # Given
+    flaky = FlakyGraph()
+    flaky.fail = False
+    flaky.graph.invoke({"messages": [HumanMessage(content="Any shoes?")]}, _config("turn-1"))
+    saver = DjangoCheckpointSaver()
+
+    # When
+    checkpoint = saver.get_tuple(_config("turn-1"))
+    history = list(saver.list(_config("turn-1")))
+
+    # Then
+    assert checkpoint.checkpoint["id"] == history[0].checkpoint["id"]
+    assert checkpoint.parent_config["configurable"]["checkpoint_id"] == history[1].checkpoint["id"]
+    assert len(checkpoint.checkpoint["channel_values"]["messages"]) == 3
+    assert saver.get_tuple(_config("turn-2")) is None
+
+
+def test_delete_threads_removes_only_matching_threads():
+    # Given
+    flaky = FlakyGraph()
+    flaky.fail = False
+    for thread_id in ["agentic_execution:1:0", "agentic_execution:1:1", "agentic_execution:12:0"]:
+        flaky.graph.invoke({"messages": [HumanMessage(content="Any shoes?")]}, _config(thread_id))
+
+    # When
+    DjangoCheckpointSaver().delete_threads("agentic_execution:1:")
+
+    # Then
+    assert set(GraphCheckpoint.objects.values_list("thread_id", flat=True)) == {"agentic_execution:12:0"}
+    assert set(GraphCheckpointWrite.objects.values_list("thread_id", flat=True)) == {"agentic_execution:12:0"}
+
+
+def test_delete_created_before_removes_stale_checkpoints():
+    # Given
+    flaky = FlakyGraph()
+    with pytest.raises(RuntimeError):
+        flaky.graph.invoke({"messages": [HumanMessage(content="Any shoes?")]}, _config("stale"))
+    GraphCheckpoint.objects.update(created_at=timezone.now() - timedelta(days=2))
+    GraphCheckpointWrite.objects.update(created_at=timezone.now() - timedelta(days=2))
+    with pytest.raises(RuntimeError):
+        flaky.graph.invoke({"messages": [HumanMessage(content="Any shoes?")]}, _config("recent"))
+
+    # When
+    DjangoCheckpointSaver().delete_created_before(timezone.now() - timedelta(days=1))
+
+    # Then
+    assert set(GraphCheckpoint.objects.values_list("thread_id", flat=True)) == {"recent"}
@@ -99,7 +99,7 @@ class TestLLMMemoryCompactorCompactIfNeeded:
     def test_does_not_compact_again_before_next_interval(self, conversation, compactor, llm, chat_history):
         db_message = baker.make(Message, conversation=conversation, type=Message.MessageType.HUMAN, text="Hello")
 
-        def messages_after_side_effect(message_id):
+        def messages_after_side_effect(message_id, up_to_message_id=None):
             if message_id is None:
                 return _make_langchain_messages(human_count=COMPACTION_INTERVAL)
             return _make_langchain_messages(human_count=COMPACTION_INTERVAL - 1)
@@ -172,3 +172,26 @@ class TestLLMMemoryCompactorCompactIfNeeded:
         assert isinstance(call_args[0], SystemMessage)
         assert "Existing summary" in call_args[1].content
         assert "This is a summary." in call_args[1].content
+
+    def test_leaves_messages_added_during_summarization_for_next_summary(
+        self, conversation, compactor, llm, chat_history
+    ):
+        # Given
+        summarized_message = baker.make(Message, conversation=conversation, type=Message.MessageType.HUMAN, text="Hello")
+        chat_history.messages_after.return_value = _make_langchain_messages(human_count=COMPACTION_INTERVAL)
+        chat_history.last_message_database_id = summarized_message.id
+
+        def add_message_during_summarization(messages):
+            new_message = baker.make(Message, conversation=conversation, type=Message.MessageType.HUMAN, text="Late")
+            chat_history.last_message_database_id = new_message.id
+            return AIMessage(content="This is a summary.")
+
+        llm.invoke.side_effect = add_message_during_summarization
+
+        # When
+        compactor.compact_if_needed()
+
+        # Then
+        conversation.refresh_from_db()
+        assert conversation.last_summarized_message_id == summarized_message.id
+        chat_history.messages_after.assert_called_once_with(None, up_to_message_id=summarized_message.id)
@@ -1,8 +1,12 @@
 import pytest
 from django.contrib.auth import get_user_model
-from langchain_core.messages import AIMessage, HumanMessage, SystemMessage, ToolMessage
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from langchain_core.messages import AIMessage, HumanMessage, SystemMessage, ToolMessage, trim_messages
+from langchain_core.messages.utils import count_tokens_approximately
 from model_bakery import baker
 
+from agent.core.memory import persistent_chat_history
 from agent.core.memory.persistent_chat_history import PersistentChatHistory
 from agent.core.repositories import DjangoConversationRepository
 from agent.models import Agent, Conversation, Message
@@ -215,3 +219,120 @@ class TestPersistentChatHistory:
         assert len(messages) == 1
         assert isinstance(messages[0], SystemMessage)
         assert messages[0].content == "An error occurred"
+
+    def test_add_messages_inserts_turn_with_single_query(self, conversation):
+        # Given
+        history = PersistentChatHistory(
+            conversation_repo=DjangoConversationRepository(Conversation),
+            conversation_id=conversation.id,
+        )
+        turn = [
+            HumanMessage(content="Find me shoes"),
+            AIMessage(
+                content="",
+                tool_calls=[
+                    {"id": "call_1", "name": "search_products", "args": {"query": "shoes"}},
+                    {"id": "call_2", "name": "search_documents", "args": {"query": "shoes"}},
+                ],
+            ),
+            ToolMessage(content="Found 3 shoes", tool_call_id="call_1", name="search_products"),
+            ToolMessage(content="No documents", tool_call_id="call_2", name="search_documents"),
+            AIMessage(content="I found 3 shoes for you."),
+        ]
+
+        # When
+        with CaptureQueriesContext(connection) as queries:
+            history.add_messages(turn)
+
+        # Then
+        assert len([query for query in queries if query["sql"].startswith("INSERT")]) == 1
+        assert list(conversation.messages.order_by("id").values_list("type", "tool_call_id")) == [
+            (Message.MessageType.HUMAN, None),
+            (Message.MessageType.INTERMEDIATE_STEP, "call_1"),
+            (Message.MessageType.FUNCTION, "call_1"),
+            (Message.MessageType.INTERMEDIATE_STEP, "call_2"),
+            (Message.MessageType.FUNCTION, "call_2"),
+            (Message.MessageType.AI, None),
+        ]
+
+    def test_add_message_stores_token_count_of_loaded_message(self, conversation):
+        # Given
+        history = PersistentChatHistory(
+            conversation_repo=DjangoConversationRepository(Conversation),
+            conversation_id=conversation.id,
+        )
+
+        # When
+        history.add_message(ToolMessage(content="Found 3 products", tool_call_id="call_abc", name="search_products"))
+
+        # Then
+        assert conversation.messages.get().token_count == count_tokens_approximately(history.messages)
+
+    def test_recent_messages_returns_same_window_as_trimming_all_messages(self, conversation, monkeypatch):
+        # Given
+        monkeypatch.setattr(persistent_chat_history, "WINDOW_BATCH_SIZE", 3)
+        history = PersistentChatHistory(
+            conversation_repo=DjangoConversationRepository(Conversation),
+            conversation_id=conversation.id,
+        )
+        for i in range(10):
+            history.add_messages([HumanMessage(content=f"Question {i} " * 5), AIMessage(content=f"Answer {i} " * 10)])
+        max_tokens = 200
+
+        # When
+        window = history.recent_messages(max_tokens)
+
+        # Then
+        assert 0 < count_tokens_approximately(window) <= max_tokens
+        assert len(window) < len(history.messages)
+        assert window == history.messages[-len(window):]
+        trim = dict(strategy="last", token_counter="approximate", max_tokens=max_tokens, start_on=HumanMessage)
+        assert trim_messages(window, **trim) == trim_messages(history.messages, **trim)
+
+    def test_recent_messages_counts_messages_stored_without_token_count(self, conversation):
+        # Given
+        history = PersistentChatHistory(
+            conversation_repo=DjangoConversationRepository(Conversation),
+            conversation_id=conversation.id,
+        )
+        baker.make(Message, conversation=conversation, type=Message.MessageType.HUMAN, text="a" * 400)
+        baker.make(Message, conversation=conversation, type=Message.MessageType.AI, text="b" * 40)
+
+        # When
+        window = history.recent_messages(max_tokens=50)
+
+        # Then
+        assert [message.content for message in window] == ["b" * 40]
+
+    def test_recent_messages_skips_failed_messages(self, conversation):
+        # Given
+        history = PersistentChatHistory(
+            conversation_repo=DjangoConversationRepository(Conversation),
+            conversation_id=conversation.id,
+        )
+        history.add_message(HumanMessage(content="Will fail"))
+        conversation.messages.update(answer_failed=True)
+        history.add_message(HumanMessage(content="Will succeed"))
+
+        # When
+        window = history.recent_messages(max_tokens=1000)
+
+        # Then
+        assert [message.content for message in window] == ["Will succeed"]
+
+    def test_messages_after_stops_at_given_message(self, conversation):
+        # Given
+        history = PersistentChatHistory(
+            conversation_repo=DjangoConversationRepository(Conversation),
+            conversation_id=conversation.id,
+        )
+        first, _, third, _ = [
+            baker.make(Message, conversation=conversation, type=Message.MessageType.HUMAN, text=text)
+            for text in ["first", "second", "third", "fourth"]
+        ]
+
+        # When
+        messages = history.messages_after(first.id, up_to_message_id=third.id)
+
+        # Then
+        assert [message.content for message in messages] == ["second", "third"]
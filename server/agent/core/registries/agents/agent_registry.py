@@ -1,12 +1,16 @@
 import logging
+import threading
 from abc import ABC, abstractmethod
 from typing import List, Optional, Type
 
 from django.conf import settings
+from django.core.signals import setting_changed
 from enthusiast_common.agentic_execution.memory import ToolScratchpad
 from enthusiast_common.agents import BaseAgent, BaseAgentConfigProvider, ConfigType
 from enthusiast_common.builder import BaseAgentBuilder
 from enthusiast_common.config import AgentConfig
+from langchain_core.callbacks import BaseCallbackHandler
+from langchain_core.language_models import BaseLanguageModel
 from utils.base_registry import BaseRegistry
 
 from agent.core.agents.default_config import merge_config
@@ -32,6 +36,20 @@ class AgentImportError(AgentRegistryError):
     """Raised when an agent module or class cannot be imported."""
 
 
+# Merged configs and builder classes only depend on the agent's code and settings, so they're built once per
+# process instead of on every message. Per-conversation state is created by the builder on each call.
+_agent_artifacts: dict[tuple[str, ConfigType], tuple[Type[BaseAgentBuilder], AgentConfig]] = {}
+_agent_artifacts_lock = threading.Lock()
+
+
+def _clear_agent_artifacts(**kwargs):
+    with _agent_artifacts_lock:
+        _agent_artifacts.clear()
+
+
+setting_changed.connect(_clear_agent_artifacts, dispatch_uid="clear_agent_artifacts")
+
+
 class BaseAgentRegistry(ABC, BaseRegistry[BaseAgent]):
     plugin_base = BaseAgent
 
@@ -52,20 +70,52 @@ class AgentRegistry(BaseAgentRegistry):
         streaming: bool,
         config_type: ConfigType = ConfigType.CONVERSATION,
         tool_scratchpad: Optional[ToolScratchpad] = None,
+        callback_handler: Optional[BaseCallbackHandler] = None,
+        turn_id: Optional[str] = None,
     ) -> BaseAgent:
+        """Builds the agent of the conversation.
+
+        ``callback_handler`` replaces the agent callback handler of the agent's config, e.g. to send its events
+        somewhere else than the conversation's WebSocket group. When ``turn_id`` is given, the agent saves the
+        progress of its turn under that ID, and running the turn again with the same ID resumes it.
+        """
         try:
-            builder = self._get_builder_class_by_name(agent_type=conversation.agent.agent_type)
-            config = self._get_config_by_name(agent_type=conversation.agent.agent_type, config_type=config_type)
-            config = merge_config(partial=config)
+            builder, config = self._get_agent_artifacts(conversation.agent.agent_type, config_type)
             return builder(
                 config=config,
                 conversation_id=conversation.id,
                 streaming=streaming,
                 tool_scratchpad=tool_scratchpad,
+                callback_handler=callback_handler,
+                turn_id=turn_id,
+                config_type=config_type,
             ).build()
         except Exception as e:
             raise AgentRegistryError(f"Failed to build agent for conversation {conversation.id}") from e
 
+    def get_conversation_default_llm(
+        self, conversation: Conversation, config_type: ConfigType = ConfigType.CONVERSATION
+    ) -> BaseLanguageModel:
+        """Builds the default language model the conversation's agent is configured with, without the agent."""
+        try:
+            builder, config = self._get_agent_artifacts(conversation.agent.agent_type, config_type)
+            return builder(config=config, conversation_id=conversation.id, config_type=config_type).build_default_llm()
+        except Exception as e:
+            raise AgentRegistryError(f"Failed to build language model for conversation {conversation.id}") from e
+
+    def _get_agent_artifacts(
+        self, agent_type: str, config_type: ConfigType
+    ) -> tuple[Type[BaseAgentBuilder], AgentConfig]:
+        key = (agent_type, config_type)
+        artifacts = _agent_artifacts.get(key)
+        if artifacts is None:
+            builder = self._get_builder_class_by_name(agent_type=agent_type)
+            config = merge_config(partial=self._get_config_by_name(agent_type=agent_type, config_type=config_type))
+            artifacts = (builder, config)
+            with _agent_artifacts_lock:
+                _agent_artifacts[key] = artifacts
+        return artifacts
+
     def get_agent_class_by_type(self, agent_type: str) -> Type[BaseAgent]:
         agents = [agent for agent in self.get_plugin_classes() if agent.AGENT_KEY == agent_type]
 
@@ -26,15 +26,27 @@ T = TypeVar("T", bound=models.Model)
 
 
 class BaseDjangoRepository(BaseRepository[T]):
+    """Repository backed by a Django model.
+
+    Repositories are built for a single agent turn, so each instance keeps an identity map of the objects it has
+    loaded by primary key. Everything that shares the repository during the turn - chat history, memory compactor,
+    retrievers, registries - gets the same object from ``get_by_id`` without querying the database again.
+    """
+
     def __init__(self, model: Type[T]):
         super(BaseDjangoRepository, self).__init__(model)
         self.model = model
+        self._identity_map: dict[Any, T] = {}
 
     def get_by_id(self, pk: int) -> Optional[T]:
+        if (obj := self._identity_map.get(pk)) is not None:
+            return obj
         try:
-            return self.model.objects.get(pk=pk)
+            obj = self.model.objects.get(pk=pk)
         except self.model.DoesNotExist:
             return None
+        self._identity_map[pk] = obj
+        return obj
 
     def list(self) -> list[T]:
         return list(self.model.objects.all())
@@ -45,6 +57,7 @@ class BaseDjangoRepository(BaseRepository[T]):
     def create(self, **kwargs) -> T:
         instance = self.model(**kwargs)
         instance.save()
+        self._identity_map[instance.pk] = instance
         return instance
 
     def update(self, pk: int, **kwargs) -> Optional[T]:
@@ -56,9 +69,14 @@ class BaseDjangoRepository(BaseRepository[T]):
         return obj
 
     def delete(self, pk: int) -> bool:
+        self._identity_map.pop(pk, None)
         deleted, _ = self.model.objects.filter(pk=pk).delete()
         return deleted > 0
 
+    def clear(self) -> None:
+        """Forgets the loaded objects, so that they're read from the database again."""
+        self._identity_map.clear()
+
 
 class DjangoUserRepository(
     BaseDjangoRepository[User],
@@ -117,10 +135,10 @@ class DjangoMessageRepository(BaseDjangoRepository[Message], BaseMessageReposito
 
 class DjangoConversationRepository(BaseDjangoRepository[Conversation], BaseConversationRepository[Conversation]):
     def get_data_set_id(self, conversation_id: int) -> int:
-        return self.get_by_id(pk=conversation_id).data_set.id
+        return self.get_by_id(pk=conversation_id).data_set_id
 
     def get_agent_id(self, conversation_id: int) -> int:
-        return self.get_by_id(pk=conversation_id).agent.id
+        return self.get_by_id(pk=conversation_id).agent_id
 
     def list_files(self, conversation_id: int) -> list[LLMFile]:
         return [file.get_llm_file_object() for file in self.get_by_id(pk=conversation_id).files.filter(is_hidden=False)]
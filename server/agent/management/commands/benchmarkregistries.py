@@ -0,0 +1,82 @@
+import time
+from typing import Callable
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from utils.base_registry import resolved_class_index
+
+from agent.core.registries.agents.agent_registry import AgentRegistry
+from agent.core.registries.embeddings import EmbeddingProviderRegistry
+from agent.core.registries.language_models import LanguageModelRegistry
+from sync.document.registry import DocumentSourcePluginRegistry
+from sync.product.registry import ProductSourcePluginRegistry
+
+
+class Command(BaseCommand):
+    help = "Measure the time registries spend resolving plugin classes during a chat turn, with and without the index"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--turns", type=int, default=200, help="Number of simulated chat turns")
+
+    def handle(self, *args, **options):
+        turns = options["turns"]
+        lookups = self._get_turn_lookups()
+
+        def run_turn():
+            for lookup in lookups:
+                lookup()
+
+        def measure(clear_between_turns: bool) -> float:
+            started_at = time.perf_counter()
+            for _ in range(turns):
+                if clear_between_turns:
+                    resolved_class_index.clear()
+                run_turn()
+            return (time.perf_counter() - started_at) / turns * 1_000_000
+
+        uncached = measure(clear_between_turns=True)
+        resolved_class_index.clear()
+        run_turn()
+        cached = measure(clear_between_turns=False)
+
+        self.stdout.write(f"Lookups per turn: {len(lookups)}, turns: {turns}")
+        self.stdout.write(f"Resolving classes on every lookup: {uncached:.1f} µs per turn")
+        self.stdout.write(f"Resolved class index: {cached:.1f} µs per turn")
+
+    def _get_turn_lookups(self) -> list[Callable[[], object]]:
+        """Returns the registry lookups of a chat turn, for every plugin that can be imported.
+
+        A turn builds the agent from its class, builder and config, looks up the language model provider and the
+        embedding provider used for retrieval. Source plugin lookups stand for the ones made while syncing.
+        """
+        lookups = []
+        for path in settings.AVAILABLE_AGENTS:
+            agent_type = self._resolve(lambda: AgentRegistry()._get_plugin_class_by_path(path).AGENT_KEY, path)
+            if agent_type is not None:
+                lookups.append(lambda agent_type=agent_type: AgentRegistry().get_agent_class_by_type(agent_type))
+                lookups.append(lambda agent_type=agent_type: AgentRegistry()._get_builder_class_by_name(agent_type))
+                lookups.append(lambda agent_type=agent_type: AgentRegistry()._get_config_by_name(agent_type))
+
+        registries = [
+            (LanguageModelRegistry, settings.CATALOG_LANGUAGE_MODEL_PROVIDERS, "provider_class_by_name"),
+            (EmbeddingProviderRegistry, settings.CATALOG_EMBEDDING_PROVIDERS, "provider_class_by_name"),
+            (ProductSourcePluginRegistry, settings.CATALOG_PRODUCT_SOURCE_PLUGINS, "get_plugin_class_by_name"),
+            (DocumentSourcePluginRegistry, settings.CATALOG_DOCUMENT_SOURCE_PLUGINS, "get_plugin_class_by_name"),
+        ]
+        for registry_class, paths, method_name in registries:
+            for path in paths:
+                name = self._resolve(lambda: registry_class()._get_plugin_class_by_path(path).NAME, path)
+                if name is not None:
+                    lookups.append(
+                        lambda registry_class=registry_class, method_name=method_name, name=name: getattr(
+                            registry_class(), method_name
+                        )(name)
+                    )
+        return lookups
+
+    def _resolve(self, get_key: Callable[[], str], path: str):
+        try:
+            return get_key()
+        except (ModuleNotFoundError, ValueError):
+            self.stderr.write(f"Skipping {path}, it can't be imported")
+            return None
@@ -0,0 +1,28 @@
+# Generated by Django 5.2.18 on 2026-10-19 13:11
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('agent', '0032_graph_checkpoint'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='AgenticExecutionTurn',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('index', models.PositiveIntegerField(help_text='Position of the turn within the execution, starting from 0.')),
+                ('answer', models.TextField(help_text='Final answer of the agent.')),
+                ('tool_scratchpad_type', models.CharField(max_length=32)),
+                ('tool_scratchpad', models.BinaryField(help_text='Results recorded by tools up to the end of the turn.')),
+                ('execution', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='turns', to='agent.agenticexecution')),
+            ],
+            options={
+                'constraints': [models.UniqueConstraint(fields=('execution', 'index'), name='unique_agentic_execution_turn')],
+            },
+        ),
+    ]
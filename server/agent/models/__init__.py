@@ -1,4 +1,7 @@
 from .agent import Agent as Agent
 from .agentic_execution import AgenticExecution as AgenticExecution
+from .agentic_execution import AgenticExecutionTurn as AgenticExecutionTurn
 from .conversation import Conversation as Conversation
+from .graph_checkpoint import GraphCheckpoint as GraphCheckpoint
+from .graph_checkpoint import GraphCheckpointWrite as GraphCheckpointWrite
 from .message import Message as Message
@@ -106,3 +106,26 @@ class AgenticExecution(models.Model):
         self.failure_explanation = failure_explanation
         self.finished_at = timezone.now()
         self.save(update_fields=["status", "failure_code", "failure_explanation", "finished_at"])
+
+
+class AgenticExecutionTurn(models.Model):
+    """Answer to one of the messages an agentic execution sent to its agent.
+
+    Kept until the execution finishes, so that when its task is delivered again after an interruption, the turns
+    that were already completed are replayed instead of being asked again.
+    """
+
+    execution = models.ForeignKey(
+        AgenticExecution,
+        on_delete=models.CASCADE,
+        related_name="turns",
+    )
+    index = models.PositiveIntegerField(help_text="Position of the turn within the execution, starting from 0.")
+    answer = models.TextField(help_text="Final answer of the agent.")
+    tool_scratchpad_type = models.CharField(max_length=32)
+    tool_scratchpad = models.BinaryField(help_text="Results recorded by tools up to the end of the turn.")
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=["execution", "index"], name="unique_agentic_execution_turn"),
+        ]
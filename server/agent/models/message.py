@@ -26,6 +26,7 @@ class Message(models.Model):
     tool_call_id = models.CharField(max_length=255, blank=True, null=True)
     file_name = models.CharField(max_length=256, blank=True, null=True)
     file_type = models.CharField(max_length=50, blank=True, null=True)
+    token_count = models.PositiveIntegerField(null=True)
 
     @classmethod
     def internal_message_types(cls):
@@ -55,6 +56,9 @@ class Message(models.Model):
             raise ValidationError(errors)
 
     class Meta:
+        indexes = [
+            models.Index(fields=["conversation", "answer_failed", "id"], name="message_history_window_idx")
+        ]
         db_table_comment = (
             "A message sent during a conversation. Role describes category of a message, it may be "
             "a question asked by a user, agent's answer, or system message."
@@ -1,20 +1,27 @@
-from datetime import datetime, timedelta
+from datetime import timedelta
 
 from asgiref.sync import async_to_sync
 from celery import Task, shared_task
 from channels.layers import get_channel_layer
 from django.core.files.base import ContentFile
 from django.utils import timezone
+from enthusiast_common.agents import ConfigType
 
 from agent.conversation import ConversationManager
 from agent.core.callbacks import BaseWebSocketHandler
-from agent.models import Message
+from agent.core.memory import DjangoCheckpointSaver
+from agent.core.memory.deferred_memory_compactor import compact_conversation_memory
 from agent.models.conversation import Conversation, ConversationFile
 from agent.serializers.conversation import ConversationFileSerializer
 from agent.services import FileParsingService
 from pecl import settings
 
 
+def get_respond_turn_id(task_id: str) -> str:
+    # Retries keep the task's ID, so they resume the turn that failed instead of starting it over.
+    return f"respond_to_user_message:{task_id}"
+
+
 class SaveMessageOnFailureTask(Task):
     def on_failure(self, exc, task_id, args, kwargs, einfo):
         conversation_id = kwargs.get("conversation_id")
@@ -22,16 +29,9 @@ class SaveMessageOnFailureTask(Task):
         user_id = kwargs.get("user_id")
         message = kwargs.get("message")
 
-        Message.objects.create(
-            conversation_id=conversation_id,
-            created_at=datetime.now(),
-            type=Message.MessageType.HUMAN,
-            text=message,
-            answer_failed=True,
-        )
-
         manager = ConversationManager()
-        manager.record_error(conversation_id, user_id, data_set_id, exc)
+        manager.record_failed_message(conversation_id, user_id, data_set_id, message, exc)
+        DjangoCheckpointSaver().delete_thread(get_respond_turn_id(task_id))
         ws_handler = BaseWebSocketHandler(conversation_id=conversation_id)
         ws_handler.send_message({"type": "chat_message", "event": "error", "output": manager.DEFAULT_ERROR_MESSAGE})
 
@@ -48,6 +48,7 @@ def respond_to_user_message_task(
             user_id=user_id,
             message=message,
             streaming=streaming,
+            turn_id=get_respond_turn_id(self.request.id),
         )
         if streaming:
             channel_layer = get_channel_layer()
@@ -65,6 +66,11 @@ def respond_to_user_message_task(
         self.retry(countdown=1)
 
 
+@shared_task
+def compact_conversation_memory_task(conversation_id: int, config_type: str = ConfigType.CONVERSATION):
+    compact_conversation_memory(conversation_id, config_type=ConfigType(config_type))
+
+
 @shared_task
 def process_file_upload_task(conversation_id: int, file_content: bytes, filename: str, content_type: str):
     try:
@@ -102,3 +108,10 @@ def clean_uploaded_files():
     ConversationFile.objects.filter(
         created_at__lt=timezone.now() - timedelta(hours=settings.UPLOADED_FILE_RETENTION_PERIOD_HOURS)
     ).delete()
+
+
+@shared_task
+def clean_graph_checkpoints():
+    DjangoCheckpointSaver().delete_created_before(
+        timezone.now() - timedelta(hours=settings.GRAPH_CHECKPOINT_RETENTION_PERIOD_HOURS)
+    )
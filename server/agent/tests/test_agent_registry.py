@@ -0,0 +1,88 @@
+from unittest.mock import Mock, patch
+
+import pytest
+from django.test import override_settings
+from enthusiast_common.agents import ConfigType
+
+from agent.core.registries.agents import agent_registry
+from agent.core.registries.agents.agent_registry import AgentRegistry
+
+
+@pytest.fixture(autouse=True)
+def clear_agent_artifacts():
+    agent_registry._clear_agent_artifacts()
+    yield
+    agent_registry._clear_agent_artifacts()
+
+
+@pytest.fixture
+def conversation():
+    conversation = Mock(id=1)
+    conversation.agent.agent_type = "product_search"
+    return conversation
+
+
+@pytest.fixture
+def builder():
+    return Mock()
+
+
+@pytest.fixture
+def registry(builder):
+    with (
+        patch.object(AgentRegistry, "_get_builder_class_by_name", return_value=builder),
+        patch.object(AgentRegistry, "_get_config_by_name") as get_config_by_name,
+        patch.object(agent_registry, "merge_config", side_effect=lambda partial: partial) as merge_config,
+    ):
+        registry = AgentRegistry()
+        registry.get_config_by_name = get_config_by_name
+        registry.merge_config = merge_config
+        yield registry
+
+
+def test_merges_config_once_per_agent_type(registry, builder, conversation):
+    # When
+    registry.get_conversation_agent(conversation, streaming=True)
+    AgentRegistry().get_conversation_agent(conversation, streaming=False)
+
+    # Then
+    registry.get_config_by_name.assert_called_once_with(
+        agent_type="product_search", config_type=ConfigType.CONVERSATION
+    )
+    registry.merge_config.assert_called_once()
+    assert builder.call_count == 2
+    assert builder.call_args.kwargs["streaming"] is False
+
+
+def test_builds_config_per_config_type(registry, conversation):
+    # When
+    registry.get_conversation_agent(conversation, streaming=True)
+    registry.get_conversation_agent(conversation, streaming=True, config_type=ConfigType.AGENTIC_EXECUTION_DEFINITION)
+
+    # Then
+    assert registry.get_config_by_name.call_count == 2
+
+
+def test_rebuilds_config_when_settings_change(registry, conversation):
+    # Given
+    registry.get_conversation_agent(conversation, streaming=True)
+
+    # When
+    with override_settings(AVAILABLE_AGENTS=[]):
+        registry.get_conversation_agent(conversation, streaming=True)
+
+    # Then
+    assert registry.get_config_by_name.call_count == 2
+
+
+def test_builds_default_llm_from_agent_config(registry, builder, conversation):
+    # When
+    llm = registry.get_conversation_default_llm(conversation, ConfigType.AGENTIC_EXECUTION_DEFINITION)
+
+    # Then
+    registry.get_config_by_name.assert_called_once_with(
+        agent_type="product_search", config_type=ConfigType.AGENTIC_EXECUTION_DEFINITION
+    )
+    assert builder.call_args.kwargs["config_type"] == ConfigType.AGENTIC_EXECUTION_DEFINITION
+    assert llm is builder.return_value.build_default_llm.return_value
+    builder.return_value.build.assert_not_called()
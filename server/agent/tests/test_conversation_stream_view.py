@@ -0,0 +1,149 @@
+import json
+from unittest.mock import patch
+
+import pytest
+from asgiref.sync import sync_to_async
+from django.urls import reverse
+from django.utils import timezone
+from model_bakery import baker
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from account.models import User
+from agent.models import Agent, Conversation, Message
+from catalog.models import DataSet
+
+pytestmark = pytest.mark.django_db
+
+
+class FakeAgent:
+    def __init__(self, conversation, callback_handler, error=None):
+        self._conversation = conversation
+        self._callback_handler = callback_handler
+        self._error = error
+
+    async def aget_answer(self, input_text):
+        self._callback_handler.on_tool_start({"name": "search_products"}, input_text)
+        self._callback_handler.on_tool_end("Found")
+        if self._error:
+            raise self._error
+        self._callback_handler.on_llm_new_token("Hel")
+        self._callback_handler.on_llm_new_token("lo")
+        await sync_to_async(Message.objects.create)(
+            conversation=self._conversation, created_at=timezone.now(), type=Message.MessageType.AI, text="Hello"
+        )
+        return "Hello"
+
+
+@pytest.fixture
+def user():
+    return baker.make(User, is_staff=False)
+
+
+@pytest.fixture
+def conversation(user):
+    data_set = baker.make(DataSet, users=[user])
+    agent = baker.make(Agent, deleted_at=None, dataset=data_set)
+    return baker.make(Conversation, user=user, agent=agent, data_set=data_set, summary="")
+
+
+@pytest.fixture
+def api_client(user):
+    client = APIClient()
+    client.force_authenticate(user=user)
+    return client
+
+
+@pytest.fixture
+def url(conversation):
+    return reverse("conversation-stream", kwargs={"conversation_id": conversation.id})
+
+
+@pytest.fixture
+def payload(conversation):
+    return {"data_set_id": conversation.data_set.id, "question_message": "Any shoes?", "streaming": True}
+
+
+@pytest.fixture(autouse=True)
+def enabled(settings):
+    settings.CHAT_IN_PROCESS_MAX_CONCURRENCY = 2
+
+
+@pytest.fixture(autouse=True)
+def provider():
+    with patch("agent.views.LanguageModelRegistry.provider_for_dataset") as mock_provider:
+        mock_provider.return_value = type("obj", (), {"STREAMING_AVAILABLE": True})
+        yield mock_provider
+
+
+def _read_events(response):
+    return [json.loads(line) for line in b"".join(response).decode().splitlines()]
+
+
+def _patch_agent(error=None):
+    return patch(
+        "agent.conversation.manager.AgentRegistry.get_conversation_agent",
+        side_effect=lambda conversation, streaming, callback_handler: FakeAgent(conversation, callback_handler, error),
+    )
+
+
+def test_streams_agent_events_and_answer(api_client, url, payload, conversation):
+    # Given
+    with _patch_agent():
+        # When
+        response = api_client.post(url, payload, format="json")
+        events = _read_events(response)
+
+    # Then
+    answer = conversation.messages.get(type=Message.MessageType.AI)
+    assert response.status_code == status.HTTP_200_OK
+    assert response["Content-Type"] == "application/x-ndjson"
+    assert events == [
+        {"event": "tool_call", "data": {"tool_name": "search_products"}},
+        {"event": "tool_done", "data": {}},
+        {"event": "on_parser_stream", "data": {"chunk": "Hel"}},
+        {"event": "on_parser_stream", "data": {"chunk": "lo"}},
+        {"event": "on_parser_end", "data": {"output": "Hello"}},
+        {"event": "message_id", "data": {"output": answer.id}},
+    ]
+    conversation.refresh_from_db()
+    assert conversation.summary == "Any shoes?"
+
+
+def test_records_failed_question_when_agent_fails(api_client, url, payload, conversation):
+    # Given
+    with _patch_agent(error=RuntimeError("LLM unavailable")):
+        # When
+        response = api_client.post(url, payload, format="json")
+        events = _read_events(response)
+
+    # Then
+    assert events[-1] == {"event": "error", "data": {"output": "We couldn't process your request at this time"}}
+    question = conversation.messages.get(type=Message.MessageType.HUMAN)
+    assert question.text == "Any shoes?"
+    assert question.answer_failed is True
+    assert conversation.messages.filter(type=Message.MessageType.SYSTEM).exists()
+
+
+def test_locked_conversation_returns_400(api_client, url, payload, conversation):
+    # Given
+    conversation.agent.deleted_at = timezone.now()
+    conversation.agent.save()
+
+    # When
+    response = api_client.post(url, payload, format="json")
+
+    # Then
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    assert response.data["detail"] == "Conversation locked."
+
+
+def test_returns_404_when_disabled(api_client, url, payload, settings):
+    # Given
+    settings.CHAT_IN_PROCESS_MAX_CONCURRENCY = 0
+
+    # When
+    response = api_client.post(url, payload, format="json")
+
+    # Then
+    assert response.status_code == status.HTTP_404_NOT_FOUND
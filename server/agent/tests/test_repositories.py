@@ -0,0 +1,105 @@
+import pytest
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from model_bakery import baker
+
+from agent.core.memory import DeferredMemoryCompactor, PersistentChatHistory
+from agent.core.repositories import DjangoConversationRepository, DjangoDataSetRepository
+from agent.models import Agent, Conversation
+from catalog.models import DataSet
+
+
+@pytest.fixture
+def conversation():
+    user = baker.make(get_user_model())
+    data_set = baker.make(DataSet, users=[user])
+    agent = baker.make(Agent, dataset=data_set)
+    return baker.make(Conversation, user=user, data_set=data_set, agent=agent)
+
+
+@pytest.mark.django_db
+class TestBaseDjangoRepository:
+    def test_get_by_id_loads_object_once(self, conversation):
+        # Given
+        repo = DjangoConversationRepository(Conversation)
+
+        # When
+        with CaptureQueriesContext(connection) as queries:
+            first = repo.get_by_id(conversation.id)
+            second = repo.get_by_id(conversation.id)
+
+        # Then
+        assert len(queries) == 1
+        assert first is second
+
+    def test_turn_reads_of_conversation_share_one_query(self, conversation):
+        # Given
+        repo = DjangoConversationRepository(Conversation)
+
+        # When
+        with CaptureQueriesContext(connection) as queries:
+            data_set_id = repo.get_data_set_id(conversation.id)
+            agent_id = repo.get_agent_id(conversation.id)
+            PersistentChatHistory(repo, conversation.id)
+            DeferredMemoryCompactor(repo, conversation.id)
+
+        # Then
+        assert len(queries) == 1
+        assert data_set_id == conversation.data_set_id
+        assert agent_id == conversation.agent_id
+
+    def test_missing_object_is_not_remembered(self, conversation):
+        # Given
+        repo = DjangoDataSetRepository(DataSet)
+        assert repo.get_by_id(99999) is None
+        data_set = baker.make(DataSet, id=99999)
+
+        # When
+        found = repo.get_by_id(99999)
+
+        # Then
+        assert found == data_set
+
+    def test_update_and_create_keep_loaded_objects_current(self, conversation):
+        # Given
+        repo = DjangoDataSetRepository(DataSet)
+        repo.get_by_id(conversation.data_set_id)
+
+        # When
+        with CaptureQueriesContext(connection) as queries:
+            repo.update(conversation.data_set_id, name="Shoes")
+            updated = repo.get_by_id(conversation.data_set_id)
+            created = repo.create(name="Boots")
+            loaded = repo.get_by_id(created.id)
+
+        # Then
+        assert not [query for query in queries if query["sql"].startswith("SELECT")]
+        assert updated.name == "Shoes"
+        assert loaded is created
+
+    def test_delete_forgets_object(self, conversation):
+        # Given
+        repo = DjangoConversationRepository(Conversation)
+        repo.get_by_id(conversation.id)
+
+        # When
+        deleted = repo.delete(conversation.id)
+
+        # Then
+        assert deleted is True
+        assert repo.get_by_id(conversation.id) is None
+
+    def test_clear_reloads_objects_from_database(self, conversation):
+        # Given
+        repo = DjangoConversationRepository(Conversation)
+        loaded = repo.get_by_id(conversation.id)
+        Conversation.objects.filter(id=conversation.id).update(summary="Changed")
+
+        # When
+        repo.clear()
+        reloaded = repo.get_by_id(conversation.id)
+
+        # Then
+        assert reloaded is not loaded
+        assert reloaded.summary == "Changed"
@@ -5,6 +5,11 @@ from . import views
 urlpatterns = (
     path("api/conversations", views.ConversationListView.as_view(), name="conversation-list"),
     path("api/conversations/<int:conversation_id>", views.ConversationView.as_view(), name="conversation-details"),
+    path(
+        "api/conversations/<int:conversation_id>/stream",
+        views.ConversationStreamView.as_view(),
+        name="conversation-stream",
+    ),
     path(
         "api/conversations/<int:conversation_id>/upload/",
         views.ConversationFileUploadView.as_view(),
@@ -3,11 +3,12 @@ import os
 from celery.result import AsyncResult
 from django.conf import settings
 from django.db.models import Prefetch
+from django.http import StreamingHttpResponse
 from django.shortcuts import get_object_or_404
 from drf_yasg import openapi
 from drf_yasg.utils import swagger_auto_schema
 from rest_framework import status
-from rest_framework.exceptions import NotFound
+from rest_framework.exceptions import NotFound, PermissionDenied, ValidationError
 from rest_framework.generics import ListAPIView
 from rest_framework.parsers import MultiPartParser
 from rest_framework.permissions import IsAuthenticated
@@ -16,6 +17,7 @@ from rest_framework.views import APIView
 from utils.functions import get_model_descriptor_from_class_field
 
 from agent.conversation import ConversationManager
+from agent.conversation.in_process import InProcessChatResponder, in_process_chat_enabled
 from agent.core.registries.agents.agent_registry import AgentRegistry
 from agent.core.registries.language_models import LanguageModelRegistry
 from agent.core.repositories import DjangoDataSetRepository
@@ -70,7 +72,49 @@ class GetTaskStatus(APIView):
         return Response(response)
 
 
-class ConversationView(APIView):
+ASK_QUESTION_REQUEST_BODY = openapi.Schema(
+    type=openapi.TYPE_OBJECT,
+    properties={
+        "data_set_id": openapi.Schema(type=openapi.TYPE_INTEGER, description="ID of the data set"),
+        "question_message": openapi.Schema(type=openapi.TYPE_STRING, description="Question message"),
+    },
+)
+
+
+class AskQuestionMixin:
+    def accept_question(self, request, conversation_id: int) -> dict:
+        """Validates a question asked in a conversation and shows the files attached to it.
+
+        Returns the validated question, with streaming disabled if the data set's language model can't stream.
+        """
+        conversation = get_object_or_404(Conversation, id=conversation_id)
+        serializer = AskQuestionSerializer(data=request.data, context={"conversation_id": conversation_id})
+        serializer.is_valid(raise_exception=True)
+        if not request.user.has_dataset_access(conversation.data_set):
+            raise PermissionDenied("No dataset access.")
+        if conversation.agent.deleted_at is not None or hasattr(conversation, "agentic_execution"):
+            raise ValidationError({"detail": "Conversation locked."})
+
+        if file_ids := serializer.validated_data.get("file_ids"):
+            files = ConversationFile.objects.filter(conversation_id=conversation_id, pk__in=file_ids, is_hidden=True)
+            for file in files:
+                ConversationFileMessageService.create_for_file(file)
+                file.is_hidden = False
+                file.save()
+
+        data_set_repo = DjangoDataSetRepository(DataSet)
+        language_model_provider_class = LanguageModelRegistry(data_set_repo).provider_for_dataset(
+            conversation.data_set_id
+        )
+        streaming = language_model_provider_class.STREAMING_AVAILABLE and serializer.validated_data.get("streaming")
+        return {
+            "data_set_id": serializer.validated_data.get("data_set_id"),
+            "question_message": serializer.validated_data.get("question_message"),
+            "streaming": streaming,
+        }
+
+
+class ConversationView(AskQuestionMixin, APIView):
     permission_classes = [IsAuthenticated]
     """
     View to retrieve details of an existing conversation.
@@ -100,54 +144,51 @@ class ConversationView(APIView):
         return Response(serializer.data, status=status.HTTP_200_OK)
 
     @swagger_auto_schema(
-        operation_description="Ask a question in a conversation",
-        request_body=openapi.Schema(
-            type=openapi.TYPE_OBJECT,
-            properties={
-                "data_set_id": openapi.Schema(type=openapi.TYPE_INTEGER, description="ID of the data set"),
-                "question_message": openapi.Schema(type=openapi.TYPE_STRING, description="Question message"),
-            },
-        ),
+        operation_description="Ask a question in a conversation", request_body=ASK_QUESTION_REQUEST_BODY
     )
     def post(self, request, conversation_id):
-        conversation = get_object_or_404(Conversation, id=conversation_id)
-        serializer = AskQuestionSerializer(data=request.data, context={"conversation_id": conversation_id})
-        if not serializer.is_valid():
-            return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
-        if not request.user.has_dataset_access(conversation.data_set):
-            return Response({"detail": "No dataset access."}, status=status.HTTP_403_FORBIDDEN)
-        if conversation.agent.deleted_at is not None or hasattr(conversation, "agentic_execution"):
-            return Response({"detail": "Conversation locked."}, status=status.HTTP_400_BAD_REQUEST)
-
-        if file_ids := serializer.validated_data.get("file_ids"):
-            files = ConversationFile.objects.filter(conversation_id=conversation_id, pk__in=file_ids, is_hidden=True)
-            for file in files:
-                ConversationFileMessageService.create_for_file(file)
-                file.is_hidden = False
-                file.save()
-
-        data_set_id = serializer.validated_data.get("data_set_id")
-        question_message = serializer.validated_data.get("question_message")
-        data_set = Conversation.objects.get(id=conversation_id).data_set
-        data_set_repo = DjangoDataSetRepository(DataSet)
-        language_model_provider_class = LanguageModelRegistry(data_set_repo).provider_for_dataset(data_set.id)
-        streaming = language_model_provider_class.STREAMING_AVAILABLE and serializer.validated_data.get("streaming")
+        question = self.accept_question(request, conversation_id)
         task = respond_to_user_message_task.apply_async(
             kwargs={
                 "conversation_id": conversation_id,
-                "data_set_id": data_set_id,
+                "data_set_id": question["data_set_id"],
                 "user_id": request.user.id,
-                "message": question_message,
-                "streaming": streaming,
+                "message": question["question_message"],
+                "streaming": question["streaming"],
             }
         )
 
         return Response(
-            {"task_id": task.id, "streaming": streaming},
+            {"task_id": task.id, "streaming": question["streaming"]},
             status=status.HTTP_202_ACCEPTED,
         )
 
 
+class ConversationStreamView(AskQuestionMixin, APIView):
+    permission_classes = [IsAuthenticated]
+    """
+    View to ask a question and stream the answer in the response, without going through a background task.
+    """
+
+    @swagger_auto_schema(
+        operation_description="Ask a question in a conversation and stream the agent's events as NDJSON",
+        request_body=ASK_QUESTION_REQUEST_BODY,
+        responses={200: "NDJSON stream of the events sent over the conversation's WebSocket"},
+    )
+    def post(self, request, conversation_id):
+        if not in_process_chat_enabled():
+            raise NotFound("In-process chat streaming is disabled.")
+        question = self.accept_question(request, conversation_id)
+        responder = InProcessChatResponder(
+            conversation_id=conversation_id,
+            data_set_id=question["data_set_id"],
+            user_id=request.user.id,
+            message=question["question_message"],
+            streaming=question["streaming"],
+        )
+        return StreamingHttpResponse(responder.stream(), content_type="application/x-ndjson")
+
+
 class ConversationListView(ListAPIView):
     permission_classes = [IsAuthenticated]
     serializer_class = ConversationSerializer
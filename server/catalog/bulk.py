@@ -0,0 +1,322 @@
+import codecs
+import csv
+import io
+import json
+import os
+from dataclasses import dataclass
+from typing import Any, Iterable, Iterator, Optional
+
+from django.db import DatabaseError, connection, models, transaction
+
+from .models import DataSet, Document, DocumentChunk, Product, ProductContentChunk
+from .tasks import index_document_task, index_product_task
+
+CSV = "csv"
+NDJSON = "ndjson"
+
+FORMATS_BY_EXTENSION = {
+    ".csv": CSV,
+    ".ndjson": NDJSON,
+    ".jsonl": NDJSON,
+}
+
+EXPORT_CHUNK_SIZE = 1000
+
+
+class BulkImportError(Exception):
+    pass
+
+
+@dataclass(frozen=True)
+class CatalogTable:
+    """Describes how items of one catalog model are imported and exported.
+
+    Items are identified by ``key`` within a data set, which is also the conflict target when merging imported rows.
+    """
+
+    model: type[models.Model]
+    chunk_model: type[models.Model]
+    chunk_foreign_key: str
+    key: str
+    columns: tuple[str, ...]
+    index_task: Any
+    float_columns: tuple[str, ...] = ()
+    required_columns: tuple[str, ...] = ()
+
+
+PRODUCTS = CatalogTable(
+    model=Product,
+    chunk_model=ProductContentChunk,
+    chunk_foreign_key="product_id",
+    key="entry_id",
+    columns=("entry_id", "name", "slug", "description", "sku", "properties", "categories", "price"),
+    index_task=index_product_task,
+    float_columns=("price",),
+    required_columns=("entry_id", "price"),
+)
+
+DOCUMENTS = CatalogTable(
+    model=Document,
+    chunk_model=DocumentChunk,
+    chunk_foreign_key="document_id",
+    key="url",
+    columns=("url", "title", "content"),
+    index_task=index_document_task,
+    required_columns=("url",),
+)
+
+
+@dataclass
+class BulkImportResult:
+    created: int
+    updated: int
+    indexing: int
+
+
+def detect_format(file_name: str) -> str:
+    extension = os.path.splitext(file_name)[1].lower()
+    try:
+        return FORMATS_BY_EXTENSION[extension]
+    except KeyError:
+        raise BulkImportError(
+            f"File type {extension} is not supported. Supported types: {', '.join(FORMATS_BY_EXTENSION)}"
+        )
+
+
+class CatalogImporter:
+    """Imports products or documents of a data set from a CSV or NDJSON file.
+
+    Rows are parsed as the file is read and streamed into a temporary staging table with ``COPY``, then merged into
+    the catalog with a single ``INSERT ... ON CONFLICT`` statement, so memory use doesn't depend on the file size.
+    NDJSON rows may carry their ``chunks`` with embeddings, as written by ``CatalogExporter``. These are stored as
+    they are, other imported items are queued for indexing once the import is committed.
+    """
+
+    STAGING_TABLE = "catalog_import_staging"
+
+    def __init__(self, table: CatalogTable, data_set: DataSet):
+        self._table = table
+        self._data_set = data_set
+
+    def import_file(self, file: Iterable[bytes], file_format: str) -> BulkImportResult:
+        lines = codecs.iterdecode(file, "utf-8-sig")
+        if file_format == CSV:
+            rows = csv.DictReader(lines)
+        elif file_format == NDJSON:
+            rows = self._parse_ndjson(lines)
+        else:
+            raise BulkImportError(f"Unsupported file format: {file_format}")
+
+        try:
+            with transaction.atomic(), connection.cursor() as cursor:
+                self._create_staging_table(cursor)
+                self._copy_rows(cursor, rows)
+                return self._merge(cursor)
+        except DatabaseError as e:
+            raise BulkImportError(f"Could not import the file: {e}")
+
+    def _create_staging_table(self, cursor) -> None:
+        columns = ", ".join(
+            f"{column} {'double precision' if column in self._table.float_columns else 'text'}"
+            for column in self._table.columns
+        )
+        cursor.execute(
+            f"CREATE TEMPORARY TABLE {self.STAGING_TABLE} (position bigserial, {columns}, chunks jsonb) ON COMMIT DROP"
+        )
+
+    def _copy_rows(self, cursor, rows: Iterable[dict[str, Any]]) -> None:
+        columns = ", ".join([*self._table.columns, "chunks"])
+        stream = _CsvStream(self._to_staging_row(line_number, row) for line_number, row in enumerate(rows, start=1))
+        try:
+            with connection.wrap_database_errors:
+                cursor.copy_expert(f"COPY {self.STAGING_TABLE} ({columns}) FROM STDIN WITH (FORMAT csv)", stream)
+        except DatabaseError:
+            # psycopg2 cancels COPY when reading fails, report the row that couldn't be read instead.
+            if stream.error:
+                raise stream.error
+            raise
+
+    def _merge(self, cursor) -> BulkImportResult:
+        table = self._table
+        catalog_table = table.model._meta.db_table
+        chunk_table = table.chunk_model._meta.db_table
+        key = table.key
+        data_set_id = self._data_set.id
+        staged_items = (
+            f"{self.STAGING_TABLE} staged JOIN {catalog_table} item "
+            f"ON item.data_set_id = %s AND item.{key} = staged.{key}"
+        )
+
+        # A row can only be merged once per statement, the last one in the file wins.
+        cursor.execute(
+            f"DELETE FROM {self.STAGING_TABLE} earlier USING {self.STAGING_TABLE} later "
+            f"WHERE earlier.{key} = later.{key} AND earlier.position < later.position"
+        )
+        cursor.execute(f"SELECT count(*) FROM {self.STAGING_TABLE}")
+        (total,) = cursor.fetchone()
+        cursor.execute(f"SELECT count(*) FROM {staged_items}", [data_set_id])
+        (updated,) = cursor.fetchone()
+
+        values = ", ".join(
+            column if column in table.float_columns or column == key else f"COALESCE({column}, '')"
+            for column in table.columns
+        )
+        updates = [f"{column} = EXCLUDED.{column}" for column in table.columns if column != key]
+        if table.model is Product:
+            # Imported data wasn't confirmed by the platform, so the connector cache must not trust it.
+            updates.append("synced_at = NULL")
+        cursor.execute(
+            f"INSERT INTO {catalog_table} (data_set_id, {', '.join(table.columns)}) "
+            f"SELECT %s, {values} FROM {self.STAGING_TABLE} "
+            f"ON CONFLICT (data_set_id, {key}) DO UPDATE SET {', '.join(updates)}",
+            [data_set_id],
+        )
+
+        cursor.execute(
+            f"DELETE FROM {chunk_table} chunk USING {staged_items} WHERE chunk.{table.chunk_foreign_key} = item.id",
+            [data_set_id],
+        )
+        cursor.execute(
+            f"INSERT INTO {chunk_table} ({table.chunk_foreign_key}, content, embedding) "
+            f"SELECT item.id, chunk->>'content', (chunk->>'embedding')::vector "
+            f"FROM {staged_items} CROSS JOIN LATERAL jsonb_array_elements(staged.chunks) chunk "
+            f"WHERE staged.chunks IS NOT NULL ORDER BY staged.position",
+            [data_set_id],
+        )
+
+        cursor.execute(f"SELECT item.id FROM {staged_items} WHERE staged.chunks IS NULL", [data_set_id])
+        ids_to_index = [item_id for (item_id,) in cursor.fetchall()]
+        transaction.on_commit(lambda: self._enqueue_indexing(ids_to_index))
+
+        return BulkImportResult(created=total - updated, updated=updated, indexing=len(ids_to_index))
+
+    def _enqueue_indexing(self, ids: list[int]) -> None:
+        for item_id in ids:
+            self._table.index_task.apply_async_for_data_set(self._data_set.id, [item_id])
+
+    def _to_staging_row(self, line_number: int, row: dict[str, Any]) -> list[Any]:
+        for column in self._table.required_columns:
+            if row.get(column) in (None, ""):
+                raise BulkImportError(f"Row {line_number}: {column} is required")
+
+        values = []
+        for column in self._table.columns:
+            value = row.get(column)
+            if column in self._table.float_columns:
+                try:
+                    value = float(value)
+                except (TypeError, ValueError):
+                    raise BulkImportError(f"Row {line_number}: {column} must be a number, got {value!r}")
+            elif value is not None:
+                value = str(value)
+            values.append(value)
+
+        chunks = row.get("chunks")
+        values.append(None if chunks is None else json.dumps(self._validate_chunks(line_number, chunks)))
+        return values
+
+    def _validate_chunks(self, line_number: int, chunks: Any) -> list[dict[str, Any]]:
+        if not isinstance(chunks, list):
+            raise BulkImportError(f"Row {line_number}: chunks must be a list")
+
+        dimensions = self._data_set.embedding_vector_dimensions
+        for chunk in chunks:
+            if not isinstance(chunk, dict) or not isinstance(chunk.get("content"), str):
+                raise BulkImportError(f"Row {line_number}: each chunk needs a content")
+            embedding = chunk.get("embedding")
+            if embedding is not None and (not isinstance(embedding, list) or len(embedding) != dimensions):
+                raise BulkImportError(
+                    f"Row {line_number}: chunk embeddings must be lists of {dimensions} numbers, "
+                    "matching the data set's embedding vector dimensions"
+                )
+        return chunks
+
+    @staticmethod
+    def _parse_ndjson(lines: Iterable[str]) -> Iterator[dict[str, Any]]:
+        for line_number, line in enumerate(lines, start=1):
+            if not line.strip():
+                continue
+            try:
+                row = json.loads(line)
+            except json.JSONDecodeError as e:
+                raise BulkImportError(f"Line {line_number}: invalid JSON: {e}")
+            if not isinstance(row, dict):
+                raise BulkImportError(f"Line {line_number}: expected a JSON object")
+            yield row
+
+
+class CatalogExporter:
+    """Exports products or documents of a data set as NDJSON, one item per line.
+
+    Items are read through a server-side cursor, ``EXPORT_CHUNK_SIZE`` at a time, so exporting large catalogs
+    doesn't load them into memory. With ``include_embeddings`` every item carries its ``chunks`` with their
+    embeddings, which lets ``CatalogImporter`` restore an indexed catalog without generating embeddings again.
+    """
+
+    def __init__(self, table: CatalogTable, data_set: DataSet):
+        self._table = table
+        self._data_set = data_set
+
+    def export(self, include_embeddings: bool = False) -> Iterator[str]:
+        """Yields NDJSON text, each piece holding the lines of up to ``EXPORT_CHUNK_SIZE`` items."""
+        queryset = self._table.model.objects.filter(data_set=self._data_set).order_by("id")
+        if include_embeddings:
+            chunks = models.Prefetch("chunks", queryset=self._table.chunk_model.objects.order_by("id"))
+            queryset = queryset.prefetch_related(chunks)
+
+        lines = []
+        for item in queryset.iterator(chunk_size=EXPORT_CHUNK_SIZE):
+            lines.append(json.dumps(self._to_row(item, include_embeddings)) + "\n")
+            if len(lines) == EXPORT_CHUNK_SIZE:
+                yield "".join(lines)
+                lines = []
+        if lines:
+            yield "".join(lines)
+
+    def _to_row(self, item: models.Model, include_embeddings: bool) -> dict[str, Any]:
+        row = {column: getattr(item, column) for column in self._table.columns}
+        if include_embeddings:
+            row["chunks"] = [
+                {"content": chunk.content, "embedding": _embedding_to_list(chunk.embedding)}
+                for chunk in item.chunks.all()
+            ]
+        return row
+
+
+def _embedding_to_list(embedding: Any) -> Optional[list[float]]:
+    if embedding is None:
+        return None
+    return [float(value) for value in embedding]
+
+
+class _CsvStream:
+    """Read-only file-like object that renders rows as CSV on demand, so ``COPY`` can consume them as they're parsed.
+
+    Empty strings and ``None`` are both written as empty unquoted fields, which ``COPY`` reads as NULL.
+    """
+
+    def __init__(self, rows: Iterable[list[Any]]):
+        self._rows = iter(rows)
+        self._buffer = io.StringIO()
+        self._writer = csv.writer(self._buffer, lineterminator="\n")
+        self.error: Optional[Exception] = None
+
+    def read(self, size: int = -1) -> str:
+        while size < 0 or self._buffer.tell() < size:
+            try:
+                row = next(self._rows, None)
+            except Exception as e:
+                self.error = e
+                raise
+            if row is None:
+                break
+            self._writer.writerow(row)
+
+        data = self._buffer.getvalue()
+        rest = ""
+        if 0 <= size < len(data):
+            data, rest = data[:size], data[size:]
+        self._buffer.seek(0)
+        self._buffer.truncate()
+        self._buffer.write(rest)
+        return data
@@ -0,0 +1,175 @@
+from dataclasses import dataclass
+from typing import Callable, Optional
+
+from django.db import connection, models, transaction
+
+from agent.models import Agent
+from sync.schedules import SyncScheduleService
+
+from .models import (
+    DataSet,
+    Document,
+    DocumentChunk,
+    DocumentSource,
+    ECommerceIntegration,
+    Product,
+    ProductContentChunk,
+    ProductSource,
+)
+
+DEFAULT_BATCH_SIZE = 1000
+
+DATA_SET_SETTINGS_FIELDS = [
+    "language_model_provider",
+    "language_model",
+    "embedding_provider",
+    "embedding_model",
+    "embedding_vector_dimensions",
+    "embedding_chunk_size",
+    "embedding_chunk_overlap",
+]
+SOURCE_FIELDS = ["plugin_name", "config", "sync_interval", "sync_cron", "sync_mode", "last_synced_at"]
+AGENT_FIELDS = ["name", "description", "agent_type", "config", "file_upload", "corrupted"]
+
+
+@dataclass(frozen=True)
+class _ClonedTable:
+    model: type[models.Model]
+    chunk_model: type[models.Model]
+    chunk_foreign_key: str
+    key: str
+    columns: tuple[str, ...]
+
+
+PRODUCTS = _ClonedTable(
+    model=Product,
+    chunk_model=ProductContentChunk,
+    chunk_foreign_key="product_id",
+    key="entry_id",
+    columns=("entry_id", "name", "slug", "description", "sku", "properties", "categories", "price", "synced_at"),
+)
+DOCUMENTS = _ClonedTable(
+    model=Document,
+    chunk_model=DocumentChunk,
+    chunk_foreign_key="document_id",
+    key="url",
+    columns=("url", "title", "content"),
+)
+
+
+@dataclass
+class CloneProgress:
+    stage: str
+    copied: int
+    total: int
+
+
+def create_data_set_clone(data_set: DataSet, name: str) -> DataSet:
+    """Creates an empty data set with the settings and users of ``data_set``, to be filled by ``DataSetCloner``."""
+    clone = DataSet.objects.create(name=name, **{field: getattr(data_set, field) for field in DATA_SET_SETTINGS_FIELDS})
+    clone.users.set(data_set.users.all())
+    return clone
+
+
+class DataSetCloner:
+    """Copies the catalog, sources and agents of a data set into another one, without calling any provider.
+
+    Products and documents are copied together with their chunks and embeddings by ``INSERT ... SELECT`` statements
+    that run in the database, ``batch_size`` items at a time. Every batch is committed on its own, so progress is
+    visible while cloning, and running the clone again after a failure continues where it stopped.
+    Sources are copied last, so their sync schedules only start once the catalog is complete.
+    """
+
+    def __init__(
+        self,
+        source: DataSet,
+        target: DataSet,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        on_progress: Optional[Callable[[CloneProgress], None]] = None,
+    ):
+        self._source = source
+        self._target = target
+        self._batch_size = batch_size
+        self._on_progress = on_progress or (lambda progress: None)
+
+    def clone(self) -> None:
+        self._copy_table(PRODUCTS, "products")
+        self._copy_table(DOCUMENTS, "documents")
+        with transaction.atomic():
+            self._copy_sources()
+            self._copy_agents()
+
+    def _copy_table(self, table: _ClonedTable, stage: str) -> None:
+        total = table.model.objects.filter(data_set=self._source).count()
+        copied = 0
+        last_id = 0
+        self._on_progress(CloneProgress(stage=stage, copied=copied, total=total))
+        while True:
+            with transaction.atomic(), connection.cursor() as cursor:
+                batch = self._copy_batch(cursor, table, last_id)
+            if batch is None:
+                break
+            last_id, batch_count = batch
+            copied += batch_count
+            self._on_progress(CloneProgress(stage=stage, copied=copied, total=total))
+
+    def _copy_batch(self, cursor, table: _ClonedTable, after_id: int) -> Optional[tuple[int, int]]:
+        """Copies the next batch of items with ids above ``after_id`` and their chunks.
+
+        Returns:
+            The id of the last item of the batch and the number of items in it, or None when nothing was left.
+        """
+        item_table = table.model._meta.db_table
+        chunk_table = table.chunk_model._meta.db_table
+        source_id, target_id = self._source.id, self._target.id
+        cursor.execute(
+            f"SELECT max(id), count(*) FROM (SELECT id FROM {item_table} WHERE data_set_id = %s AND id > %s "
+            f"ORDER BY id LIMIT %s) batch",
+            [source_id, after_id, self._batch_size],
+        )
+        last_id, count = cursor.fetchone()
+        if last_id is None:
+            return None
+
+        columns = ", ".join(table.columns)
+        cursor.execute(
+            f"INSERT INTO {item_table} (data_set_id, {columns}) "
+            f"SELECT %s, {columns} FROM {item_table} WHERE data_set_id = %s AND id > %s AND id <= %s ORDER BY id "
+            f"ON CONFLICT (data_set_id, {table.key}) DO NOTHING",
+            [target_id, source_id, after_id, last_id],
+        )
+        # Items are matched by their key, which is unique within a data set. Items that already had chunks were
+        # copied by an earlier, interrupted run.
+        cursor.execute(
+            f"INSERT INTO {chunk_table} ({table.chunk_foreign_key}, content, embedding) "
+            f"SELECT copy.id, chunk.content, chunk.embedding FROM {chunk_table} chunk "
+            f"JOIN {item_table} original ON original.id = chunk.{table.chunk_foreign_key} "
+            f"JOIN {item_table} copy ON copy.data_set_id = %s AND copy.{table.key} = original.{table.key} "
+            f"WHERE original.data_set_id = %s AND original.id > %s AND original.id <= %s "
+            f"AND NOT EXISTS (SELECT 1 FROM {chunk_table} existing "
+            f"WHERE existing.{table.chunk_foreign_key} = copy.id) "
+            f"ORDER BY chunk.id",
+            [target_id, source_id, after_id, last_id],
+        )
+        return last_id, count
+
+    def _copy_sources(self) -> None:
+        for model in [ProductSource, DocumentSource]:
+            for source in model.objects.filter(data_set=self._source):
+                copy = model.objects.create(
+                    data_set=self._target, **{field: getattr(source, field) for field in SOURCE_FIELDS}
+                )
+                SyncScheduleService().apply(copy)
+
+        integration = ECommerceIntegration.objects.filter(data_set=self._source).first()
+        if integration and not ECommerceIntegration.objects.filter(data_set=self._target).exists():
+            copy = ECommerceIntegration.objects.create(
+                data_set=self._target, **{field: getattr(integration, field) for field in SOURCE_FIELDS}
+            )
+            SyncScheduleService().apply(copy)
+
+    def _copy_agents(self) -> None:
+        Agent.objects.bulk_create(
+            Agent(dataset=self._target, **{field: getattr(agent, field) for field in AGENT_FIELDS})
+            for agent in Agent.objects.filter(dataset=self._source)
+        )
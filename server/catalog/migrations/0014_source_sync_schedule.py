@@ -0,0 +1,90 @@
+# Generated by Django 5.2.18 on 2026-10-19 11:59
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('catalog', '0013_ecommerceintegration'),
+        ('django_celery_beat', '0019_alter_periodictasks_options'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='documentsource',
+            name='last_synced_at',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='documentsource',
+            name='sync_cron',
+            field=models.CharField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='documentsource',
+            name='sync_interval',
+            field=models.PositiveIntegerField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='documentsource',
+            name='sync_mode',
+            field=models.CharField(choices=[('full', 'Full'), ('incremental', 'Incremental')], default='full'),
+        ),
+        migrations.AddField(
+            model_name='documentsource',
+            name='sync_periodic_task',
+            field=models.OneToOneField(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to='django_celery_beat.periodictask'),
+        ),
+        migrations.AddField(
+            model_name='ecommerceintegration',
+            name='last_synced_at',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='ecommerceintegration',
+            name='sync_cron',
+            field=models.CharField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='ecommerceintegration',
+            name='sync_interval',
+            field=models.PositiveIntegerField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='ecommerceintegration',
+            name='sync_mode',
+            field=models.CharField(choices=[('full', 'Full'), ('incremental', 'Incremental')], default='full'),
+        ),
+        migrations.AddField(
+            model_name='ecommerceintegration',
+            name='sync_periodic_task',
+            field=models.OneToOneField(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to='django_celery_beat.periodictask'),
+        ),
+        migrations.AddField(
+            model_name='productsource',
+            name='last_synced_at',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='productsource',
+            name='sync_cron',
+            field=models.CharField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='productsource',
+            name='sync_interval',
+            field=models.PositiveIntegerField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='productsource',
+            name='sync_mode',
+            field=models.CharField(choices=[('full', 'Full'), ('incremental', 'Incremental')], default='full'),
+        ),
+        migrations.AddField(
+            model_name='productsource',
+            name='sync_periodic_task',
+            field=models.OneToOneField(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to='django_celery_beat.periodictask'),
+        ),
+    ]
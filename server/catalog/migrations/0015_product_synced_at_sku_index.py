@@ -0,0 +1,22 @@
+# Generated by Django 5.2.18 on 2026-10-19 12:13
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('catalog', '0014_source_sync_schedule'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='product',
+            name='synced_at',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddIndex(
+            model_name='product',
+            index=models.Index(fields=['data_set', 'sku'], name='product_data_set_sku_idx'),
+        ),
+    ]
@@ -6,5 +6,6 @@ from .ecommerce_integration import ECommerceIntegration
 from .product import Product
 from .product_content_chunk import ProductContentChunk
 from .product_source import ProductSource
+from .sync_schedule import ScheduledSyncMixin, SyncMode
 
-__all__ = ["DataSet", "Document", "DocumentChunk", "DocumentSource", "ECommerceIntegration", "Product", "ProductContentChunk", "ProductSource"]
+__all__ = ["DataSet", "Document", "DocumentChunk", "DocumentSource", "ECommerceIntegration", "Product", "ProductContentChunk", "ProductSource", "ScheduledSyncMixin", "SyncMode"]
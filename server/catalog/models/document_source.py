@@ -1,9 +1,10 @@
 from django.db import models
 
 from .data_set import DataSet
+from .sync_schedule import ScheduledSyncMixin
 
 
-class DocumentSource(models.Model):
+class DocumentSource(ScheduledSyncMixin, models.Model):
     plugin_name = models.CharField()
     data_set = models.ForeignKey(DataSet, related_name="document_sources", on_delete=models.PROTECT)
     config = models.JSONField(default=dict, null=True)
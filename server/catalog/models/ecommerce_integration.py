@@ -1,9 +1,10 @@
 from django.db import models
 
 from .data_set import DataSet
+from .sync_schedule import ScheduledSyncMixin
 
 
-class ECommerceIntegration(models.Model):
+class ECommerceIntegration(ScheduledSyncMixin, models.Model):
     plugin_name = models.CharField()
     data_set = models.OneToOneField(DataSet, related_name="ecommerce_integration", on_delete=models.CASCADE)
     config = models.JSONField(default=dict)
@@ -14,10 +14,13 @@ class Product(models.Model):
     properties = models.CharField(max_length=65535, blank=True)
     categories = models.CharField(max_length=65535, blank=True)
     price = models.FloatField()
+    # When the e-commerce platform of the data set last confirmed the product, through a sync or a lookup.
+    synced_at = models.DateTimeField(null=True, blank=True)
 
     class Meta:
         db_table_comment = "List of products from a given data set."
         constraints = [models.UniqueConstraint(fields=["data_set", "entry_id"], name="uq_product")]
+        indexes = [models.Index(fields=["data_set", "sku"], name="product_data_set_sku_idx")]
 
     def get_content(self):
         return f"{self.name} {self.description}"
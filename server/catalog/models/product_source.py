@@ -1,9 +1,10 @@
 from django.db import models
 
 from .data_set import DataSet
+from .sync_schedule import ScheduledSyncMixin
 
 
-class ProductSource(models.Model):
+class ProductSource(ScheduledSyncMixin, models.Model):
     plugin_name = models.CharField()
     data_set = models.ForeignKey(DataSet, related_name="product_sources", on_delete=models.PROTECT)
     config = models.JSONField(default=dict, null=True)
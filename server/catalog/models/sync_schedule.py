@@ -0,0 +1,29 @@
+from django.db import models
+
+
+class SyncMode(models.TextChoices):
+    FULL = "full", "Full"
+    INCREMENTAL = "incremental", "Incremental"
+
+
+class ScheduledSyncMixin(models.Model):
+    """Sync schedule of a source, either every ``sync_interval`` minutes or following the ``sync_cron`` expression.
+
+    Incremental syncs only ask the plugin for items changed since ``last_synced_at``, plugins that can't filter by
+    modification date fetch everything anyway.
+    """
+
+    sync_interval = models.PositiveIntegerField(null=True, blank=True)
+    sync_cron = models.CharField(null=True, blank=True)
+    sync_mode = models.CharField(choices=SyncMode.choices, default=SyncMode.FULL)
+    last_synced_at = models.DateTimeField(null=True, blank=True)
+    sync_periodic_task = models.OneToOneField(
+        "django_celery_beat.PeriodicTask", null=True, blank=True, on_delete=models.SET_NULL, related_name="+"
+    )
+
+    class Meta:
+        abstract = True
+
+    @property
+    def is_sync_scheduled(self) -> bool:
+        return bool(self.sync_interval or self.sync_cron)
@@ -4,6 +4,7 @@ from utils.serializers import ParentDataContextSerializerMixin
 from agent.core.registries.embeddings.embedding_provider_registry import EmbeddingProviderRegistry
 from sync.document.registry import DocumentSourcePluginRegistry
 from sync.product.registry import ProductSourcePluginRegistry
+from sync.schedules import SyncScheduleService, parse_cron
 
 from .models import DataSet, Document, DocumentSource, ECommerceIntegration, Product, ProductSource
 from .utils import PydanticModelField
@@ -91,7 +92,42 @@ class DocumentSourceConfigSerializer(serializers.Serializer):
     )
 
 
-class ProductSourceSerializer(ParentDataContextSerializerMixin, serializers.ModelSerializer):
+class SyncScheduleSerializerMixin:
+    """Validates the sync schedule of a source and registers it with the beat scheduler on save."""
+
+    schedule_fields = ["sync_interval", "sync_cron", "sync_mode", "last_synced_at"]
+    schedule_extra_kwargs = {
+        "sync_interval": {"min_value": 1, "help_text": "Sync every given number of minutes"},
+        "sync_cron": {"help_text": "Cron expression, e.g. '0 2 * * *' to sync every night at 2:00"},
+        "last_synced_at": {"read_only": True},
+    }
+
+    def validate_sync_cron(self, value):
+        if not value:
+            return None
+        try:
+            parse_cron(value)
+        except ValueError as e:
+            raise serializers.ValidationError(str(e))
+        return value
+
+    def validate(self, data):
+        data = super().validate(data)
+        sync_interval = data.get("sync_interval", getattr(self.instance, "sync_interval", None))
+        sync_cron = data.get("sync_cron", getattr(self.instance, "sync_cron", None))
+        if sync_interval and sync_cron:
+            raise serializers.ValidationError("Set either sync_interval or sync_cron, not both.")
+        return data
+
+    def save(self, **kwargs):
+        instance = super().save(**kwargs)
+        SyncScheduleService().apply(instance)
+        return instance
+
+
+class ProductSourceSerializer(
+    SyncScheduleSerializerMixin, ParentDataContextSerializerMixin, serializers.ModelSerializer
+):
     context_keys_to_propagate = ["plugin_name"]
 
     config = ProductSourceConfigSerializer()
@@ -99,10 +135,20 @@ class ProductSourceSerializer(ParentDataContextSerializerMixin, serializers.Mode
 
     class Meta:
         model = ProductSource
-        fields = ["id", "plugin_name", "config", "data_set_id", "corrupted", "task_id"]
-
-
-class DocumentSourceSerializer(ParentDataContextSerializerMixin, serializers.ModelSerializer):
+        fields = [
+            "id",
+            "plugin_name",
+            "config",
+            "data_set_id",
+            "corrupted",
+            "task_id",
+        ] + SyncScheduleSerializerMixin.schedule_fields
+        extra_kwargs = SyncScheduleSerializerMixin.schedule_extra_kwargs
+
+
+class DocumentSourceSerializer(
+    SyncScheduleSerializerMixin, ParentDataContextSerializerMixin, serializers.ModelSerializer
+):
     context_keys_to_propagate = ["plugin_name"]
 
     config = DocumentSourceConfigSerializer()
@@ -110,18 +156,67 @@ class DocumentSourceSerializer(ParentDataContextSerializerMixin, serializers.Mod
 
     class Meta:
         model = DocumentSource
-        fields = ["id", "plugin_name", "config", "data_set_id", "corrupted", "task_id"]
-
-
-class ECommerceIntegrationSerializer(ParentDataContextSerializerMixin, serializers.ModelSerializer):
+        fields = [
+            "id",
+            "plugin_name",
+            "config",
+            "data_set_id",
+            "corrupted",
+            "task_id",
+        ] + SyncScheduleSerializerMixin.schedule_fields
+        extra_kwargs = SyncScheduleSerializerMixin.schedule_extra_kwargs
+
+
+class ECommerceIntegrationSerializer(
+    SyncScheduleSerializerMixin, ParentDataContextSerializerMixin, serializers.ModelSerializer
+):
     context_keys_to_propagate = ["plugin_name"]
 
     task_id = serializers.CharField(read_only=True, required=False, allow_null=True)
 
     class Meta:
         model = ECommerceIntegration
-        fields = ["id", "plugin_name", "config", "data_set_id", "task_id"]
+        fields = ["id", "plugin_name", "config", "data_set_id", "task_id"] + SyncScheduleSerializerMixin.schedule_fields
+        extra_kwargs = SyncScheduleSerializerMixin.schedule_extra_kwargs
 
 
 class SyncResponseSerializer(serializers.Serializer):
     task_id = serializers.CharField()
+
+
+class SyncStatusSerializer(serializers.Serializer):
+    running = serializers.BooleanField()
+    follow_up_requested = serializers.BooleanField()
+    expires_in = serializers.IntegerField(allow_null=True)
+
+
+class CatalogImportSerializer(serializers.Serializer):
+    file = serializers.FileField()
+
+
+class CatalogImportResultSerializer(serializers.Serializer):
+    created = serializers.IntegerField()
+    updated = serializers.IntegerField()
+    indexing = serializers.IntegerField()
+
+
+class CatalogExportQuerySerializer(serializers.Serializer):
+    include_embeddings = serializers.BooleanField(default=False)
+
+
+class DataSetCloneSerializer(serializers.Serializer):
+    name = serializers.CharField(max_length=30)
+
+
+class DataSetCloneResponseSerializer(serializers.Serializer):
+    task_id = serializers.CharField()
+    data_set_id = serializers.IntegerField()
+
+
+class DataSetCloneStatusSerializer(serializers.Serializer):
+    task_id = serializers.CharField()
+    status = serializers.CharField()
+    stage = serializers.CharField(allow_null=True)
+    copied = serializers.IntegerField(allow_null=True)
+    total = serializers.IntegerField(allow_null=True)
+    error = serializers.CharField(allow_null=True)
@@ -19,11 +19,9 @@ class DataSetObjectEmbeddingsGenerator(Generic[T]):
         """
         data_set = obj.data_set
         obj.split(data_set.embedding_chunk_size, data_set.embedding_chunk_overlap)
+        embedding_provider_class = EmbeddingProviderRegistry().provider_for_dataset(data_set.id)
+        embedding_provider = embedding_provider_class(data_set.embedding_model, data_set.embedding_vector_dimensions)
         for chunk in obj.chunks.all():
-            embedding_provider_class = EmbeddingProviderRegistry().provider_for_dataset(data_set.id)
-            embedding_provider = embedding_provider_class(
-                data_set.embedding_model, data_set.embedding_vector_dimensions
-            )
             chunk.set_embedding(embedding_provider.generate_embeddings(chunk.content))
             chunk.save()
 
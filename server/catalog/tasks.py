@@ -1,14 +1,17 @@
 import logging
+from dataclasses import asdict
 
 from celery import shared_task
+from utils.tasks import DataSetFairTask
 
+from .cloning import CloneProgress, DataSetCloner
 from .models import DataSet, Document, Product
 from .services import DocumentEmbeddingGenerator, ProductEmbeddingGenerator
 
 logger = logging.getLogger(__name__)
 
 
-@shared_task
+@shared_task(base=DataSetFairTask)
 def index_document_task(document_id: int):
     document = Document.objects.get(id=document_id)
     DocumentEmbeddingGenerator.index_object(document)
@@ -19,10 +22,23 @@ def index_all_documents_task(data_set_id: int):
     data_set = DataSet.objects.get(id=data_set_id)
     document_ids = data_set.documents.values_list("id", flat=True)
     for document_id in document_ids:
-        index_document_task.apply_async([document_id])
+        index_document_task.apply_async_for_data_set(data_set_id, [document_id])
 
 
-@shared_task
+@shared_task(base=DataSetFairTask)
 def index_product_task(product_id: int):
     product = Product.objects.get(id=product_id)
     ProductEmbeddingGenerator.index_object(product)
+
+
+@shared_task(bind=True)
+def clone_data_set_task(self, source_data_set_id: int, target_data_set_id: int):
+    source = DataSet.objects.get(id=source_data_set_id)
+    target = DataSet.objects.get(id=target_data_set_id)
+
+    def report_progress(progress: CloneProgress):
+        self.update_state(state="PROGRESS", meta=asdict(progress))
+
+    DataSetCloner(source, target, on_progress=report_progress).clone()
+    logger.info(f"Cloned data set {source_data_set_id} into {target_data_set_id}")
+    return {"data_set_id": target_data_set_id}
@@ -0,0 +1,127 @@
+from unittest.mock import patch
+
+import pytest
+from model_bakery import baker
+
+from agent.models import Agent
+from catalog.cloning import CloneProgress, DataSetCloner, create_data_set_clone
+from catalog.models import (
+    DataSet,
+    Document,
+    DocumentChunk,
+    DocumentSource,
+    ECommerceIntegration,
+    Product,
+    ProductContentChunk,
+    ProductSource,
+)
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture
+def source():
+    return baker.make(DataSet, embedding_vector_dimensions=3, embedding_model="text-embedding-3-small")
+
+
+@pytest.fixture
+def target(source):
+    return create_data_set_clone(source, "Staging")
+
+
+@pytest.fixture(autouse=True)
+def sync_schedule_service():
+    with patch("catalog.cloning.SyncScheduleService") as service:
+        yield service
+
+
+def test_creates_clone_with_settings_and_users(source, user):
+    # Given
+    source.users.add(user)
+
+    # When
+    clone = create_data_set_clone(source, "Staging")
+
+    # Then
+    assert clone.name == "Staging"
+    assert clone.embedding_model == "text-embedding-3-small"
+    assert clone.embedding_vector_dimensions == 3
+    assert list(clone.users.all()) == [user]
+
+
+def test_copies_products_and_documents_with_embeddings(source, target):
+    # Given
+    for index in range(5):
+        product = baker.make(Product, data_set=source, entry_id=f"product-{index}", price=index)
+        baker.make(ProductContentChunk, product=product, content=f"Chunk {index}", embedding=[index, 0, 1])
+    document = baker.make(Document, data_set=source, url="https://example.com/a", title="A")
+    baker.make(DocumentChunk, document=document, content="First", embedding=[1, 2, 3])
+    baker.make(DocumentChunk, document=document, content="Second", embedding=None)
+
+    # When
+    DataSetCloner(source, target, batch_size=2).clone()
+
+    # Then
+    products = Product.objects.filter(data_set=target).order_by("entry_id")
+    assert [(product.entry_id, product.price) for product in products] == [(f"product-{i}", i) for i in range(5)]
+    chunk = ProductContentChunk.objects.get(product__data_set=target, product__entry_id="product-3")
+    assert chunk.content == "Chunk 3"
+    assert list(chunk.embedding) == [3, 0, 1]
+    document_chunks = DocumentChunk.objects.filter(document__data_set=target).order_by("id")
+    assert [chunk.content for chunk in document_chunks] == ["First", "Second"]
+    assert Product.objects.filter(data_set=source).count() == 5
+
+
+def test_reports_progress_per_batch(source, target):
+    # Given
+    baker.make(Product, data_set=source, price=1, _quantity=3)
+    progress = []
+
+    # When
+    DataSetCloner(source, target, batch_size=2, on_progress=progress.append).clone()
+
+    # Then
+    assert progress == [
+        CloneProgress(stage="products", copied=0, total=3),
+        CloneProgress(stage="products", copied=2, total=3),
+        CloneProgress(stage="products", copied=3, total=3),
+        CloneProgress(stage="documents", copied=0, total=0),
+    ]
+
+
+def test_continues_an_interrupted_clone_without_duplicates(source, target):
+    # Given
+    for index in range(3):
+        product = baker.make(Product, data_set=source, entry_id=f"product-{index}", price=index)
+        baker.make(ProductContentChunk, product=product, content=f"Chunk {index}", _quantity=2)
+    copied = baker.make(Product, data_set=target, entry_id="product-0", price=0)
+    baker.make(ProductContentChunk, product=copied, content="Chunk 0", _quantity=2)
+
+    # When
+    DataSetCloner(source, target).clone()
+
+    # Then
+    assert Product.objects.filter(data_set=target).count() == 3
+    assert ProductContentChunk.objects.filter(product__data_set=target).count() == 6
+
+
+def test_copies_sources_and_agents(source, target, sync_schedule_service):
+    # Given
+    baker.make(ProductSource, data_set=source, plugin_name="Shopify", config={"shop_url": "shop"}, sync_interval=60)
+    baker.make(DocumentSource, data_set=source, plugin_name="WordPress", config={})
+    baker.make(ECommerceIntegration, data_set=source, plugin_name="Medusa", config={"base_url": "medusa"})
+    baker.make(Agent, dataset=source, name="Assistant", agent_type="product_search", config={"tools": []})
+    baker.make(Agent, dataset=source, name="Deleted", config={}, deleted_at="2026-01-01T00:00:00Z")
+
+    # When
+    DataSetCloner(source, target).clone()
+
+    # Then
+    product_source = ProductSource.objects.get(data_set=target)
+    assert product_source.config == {"shop_url": "shop"}
+    assert product_source.sync_interval == 60
+    assert DocumentSource.objects.get(data_set=target).plugin_name == "WordPress"
+    assert target.ecommerce_integration.config == {"base_url": "medusa"}
+    assert sync_schedule_service.return_value.apply.call_count == 3
+    agent = Agent.objects.get(dataset=target)
+    assert (agent.name, agent.agent_type, agent.config) == ("Assistant", "product_search", {"tools": []})
@@ -0,0 +1,34 @@
+from unittest.mock import patch
+
+import pytest
+from model_bakery import baker
+
+from catalog.models import DataSet, Document, DocumentChunk
+from catalog.services import DocumentEmbeddingGenerator
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture
+def embedding_provider_class():
+    with patch("catalog.services.EmbeddingProviderRegistry") as registry:
+        provider_class = registry.return_value.provider_for_dataset.return_value
+        provider_class.return_value.generate_embeddings.return_value = [0.1, 0.2, 0.3]
+        yield provider_class
+
+
+def test_index_object_builds_embedding_provider_once_per_object(embedding_provider_class):
+    # Given
+    data_set = baker.make(DataSet, embedding_model="text-embedding-3-small", embedding_vector_dimensions=3)
+    document = baker.make(Document, data_set=data_set)
+    baker.make(DocumentChunk, document=document, _quantity=3)
+
+    # When
+    with patch.object(Document, "split"):
+        DocumentEmbeddingGenerator.index_object(document)
+
+    # Then
+    chunks = list(document.chunks.all())
+    embedding_provider_class.assert_called_once_with("text-embedding-3-small", 3)
+    assert embedding_provider_class.return_value.generate_embeddings.call_count == len(chunks)
+    assert all(list(chunk.embedding) == pytest.approx([0.1, 0.2, 0.3]) for chunk in chunks)
@@ -0,0 +1,202 @@
+import json
+from unittest.mock import patch
+
+import pytest
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.urls import reverse
+from model_bakery import baker
+from rest_framework import status
+
+from catalog.models import DataSet, Document, Product, ProductContentChunk
+from catalog.tasks import index_document_task, index_product_task
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture
+def data_set():
+    return baker.make(DataSet, embedding_vector_dimensions=3)
+
+
+@pytest.fixture(autouse=True)
+def enqueue_product_indexing():
+    with patch.object(index_product_task, "apply_async_for_data_set") as apply_async_for_data_set:
+        yield apply_async_for_data_set
+
+
+def ndjson_file(rows, name="products.ndjson"):
+    return SimpleUploadedFile(name, "".join(json.dumps(row) + "\n" for row in rows).encode())
+
+
+def read_ndjson(response):
+    return [json.loads(line) for line in b"".join(response).decode().splitlines()]
+
+
+class TestProductImportView:
+    @pytest.fixture
+    def url(self, data_set):
+        return reverse("data_set_product_import", kwargs={"data_set_id": data_set.id})
+
+    def test_imports_csv_and_queues_indexing(
+        self, admin_api_client, url, data_set, enqueue_product_indexing, django_capture_on_commit_callbacks
+    ):
+        # Given
+        file = SimpleUploadedFile(
+            "products.csv", b'entry_id,name,price,description\n1,Chair,10.5,"Oak, with\na cushion"\n2,Table,99,\n'
+        )
+
+        # When
+        with django_capture_on_commit_callbacks(execute=True):
+            response = admin_api_client.post(url, {"file": file}, format="multipart")
+
+        # Then
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data == {"created": 2, "updated": 0, "indexing": 2}
+        chair = Product.objects.get(data_set=data_set, entry_id="1")
+        assert chair.name == "Chair"
+        assert chair.price == 10.5
+        assert chair.description == "Oak, with\na cushion"
+        assert Product.objects.get(data_set=data_set, entry_id="2").description == ""
+        assert enqueue_product_indexing.call_count == 2
+
+    def test_updates_existing_products_with_the_last_row(self, admin_api_client, url, data_set):
+        # Given
+        baker.make(Product, data_set=data_set, entry_id="1", name="Old", price=1)
+        file = ndjson_file(
+            [{"entry_id": "1", "name": "First", "price": 2}, {"entry_id": "1", "name": "Second", "price": 3}]
+        )
+
+        # When
+        response = admin_api_client.post(url, {"file": file}, format="multipart")
+
+        # Then
+        assert response.data == {"created": 0, "updated": 1, "indexing": 1}
+        product = Product.objects.get(data_set=data_set, entry_id="1")
+        assert product.name == "Second"
+        assert product.price == 3
+
+    def test_restores_chunks_with_embeddings_without_indexing(
+        self, admin_api_client, url, data_set, enqueue_product_indexing, django_capture_on_commit_callbacks
+    ):
+        # Given
+        product = baker.make(Product, data_set=data_set, entry_id="1", price=1)
+        baker.make(ProductContentChunk, product=product, content="Stale")
+        chunks = [{"content": "Chair", "embedding": [0.1, 0.2, 0.3]}, {"content": "Oak", "embedding": None}]
+        file = ndjson_file([{"entry_id": "1", "name": "Chair", "price": 10, "chunks": chunks}])
+
+        # When
+        with django_capture_on_commit_callbacks(execute=True):
+            response = admin_api_client.post(url, {"file": file}, format="multipart")
+
+        # Then
+        assert response.data == {"created": 0, "updated": 1, "indexing": 0}
+        imported_chunks = list(product.chunks.order_by("id"))
+        assert [chunk.content for chunk in imported_chunks] == ["Chair", "Oak"]
+        assert list(imported_chunks[0].embedding) == pytest.approx([0.1, 0.2, 0.3])
+        assert imported_chunks[1].embedding is None
+        enqueue_product_indexing.assert_not_called()
+
+    def test_rejects_embeddings_of_other_dimensions(self, admin_api_client, url, data_set):
+        # Given
+        chunks = [{"content": "Chair", "embedding": [0.1, 0.2]}]
+        file = ndjson_file([{"entry_id": "1", "name": "Chair", "price": 10, "chunks": chunks}])
+
+        # When
+        response = admin_api_client.post(url, {"file": file}, format="multipart")
+
+        # Then
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert "Row 1" in response.data["error"]
+        assert not Product.objects.filter(data_set=data_set).exists()
+
+    def test_rejects_rows_without_price(self, admin_api_client, url, data_set):
+        # Given
+        file = ndjson_file([{"entry_id": "1", "name": "Chair", "price": 10}, {"entry_id": "2", "name": "Table"}])
+
+        # When
+        response = admin_api_client.post(url, {"file": file}, format="multipart")
+
+        # Then
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert response.data["error"] == "Row 2: price is required"
+        assert not Product.objects.filter(data_set=data_set).exists()
+
+    def test_rejects_unsupported_file_types(self, admin_api_client, url):
+        # Given
+        file = SimpleUploadedFile("products.xml", b"<products/>")
+
+        # When
+        response = admin_api_client.post(url, {"file": file}, format="multipart")
+
+        # Then
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    def test_requires_admin_user(self, api_client, url):
+        # When
+        response = api_client.post(url, {"file": ndjson_file([])}, format="multipart")
+
+        # Then
+        assert response.status_code == status.HTTP_403_FORBIDDEN
+
+
+class TestProductExportView:
+    @pytest.fixture
+    def url(self, data_set):
+        return reverse("data_set_product_export", kwargs={"data_set_id": data_set.id})
+
+    def test_exports_products_as_ndjson(self, admin_api_client, url, data_set):
+        # Given
+        baker.make(Product, data_set=data_set, entry_id="1", name="Chair", price=10)
+        baker.make(Product, entry_id="2", price=20)
+
+        # When
+        response = admin_api_client.get(url)
+
+        # Then
+        assert response.status_code == status.HTTP_200_OK
+        assert response["Content-Type"] == "application/x-ndjson"
+        rows = read_ndjson(response)
+        assert [(row["entry_id"], row["name"], row["price"]) for row in rows] == [("1", "Chair", 10)]
+        assert "chunks" not in rows[0]
+
+    def test_exports_chunks_that_import_back(self, admin_api_client, data_set, url):
+        # Given
+        product = baker.make(Product, data_set=data_set, entry_id="1", name="Chair", price=10)
+        baker.make(ProductContentChunk, product=product, content="Chair", embedding=[0.5, 0.25, 1])
+        target_data_set = baker.make(DataSet, embedding_vector_dimensions=3)
+
+        # When
+        export = b"".join(admin_api_client.get(url, {"include_embeddings": "true"}))
+        import_response = admin_api_client.post(
+            reverse("data_set_product_import", kwargs={"data_set_id": target_data_set.id}),
+            {"file": SimpleUploadedFile("products.ndjson", export)},
+            format="multipart",
+        )
+
+        # Then
+        assert json.loads(export)["chunks"] == [{"content": "Chair", "embedding": [0.5, 0.25, 1.0]}]
+        assert import_response.data == {"created": 1, "updated": 0, "indexing": 0}
+        imported_chunk = ProductContentChunk.objects.get(product__data_set=target_data_set)
+        assert list(imported_chunk.embedding) == [0.5, 0.25, 1.0]
+
+    def test_returns_not_found_for_data_sets_of_other_users(self, api_client, url):
+        # When
+        response = api_client.get(url)
+
+        # Then
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
+
+class TestDocumentImportView:
+    @patch.object(index_document_task, "apply_async_for_data_set")
+    def test_imports_documents(self, _apply_async_for_data_set, admin_api_client, data_set):
+        # Given
+        url = reverse("data_set_document_import", kwargs={"data_set_id": data_set.id})
+        file = ndjson_file([{"url": "https://example.com/a", "title": "A", "content": "Text"}], "documents.jsonl")
+
+        # When
+        response = admin_api_client.post(url, {"file": file}, format="multipart")
+
+        # Then
+        assert response.data == {"created": 1, "updated": 0, "indexing": 1}
+        assert Document.objects.get(data_set=data_set).title == "A"
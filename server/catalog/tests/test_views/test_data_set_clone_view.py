@@ -0,0 +1,56 @@
+from unittest.mock import patch
+
+import pytest
+from django.urls import reverse
+from rest_framework import status
+
+from catalog.models import DataSet
+
+pytestmark = pytest.mark.django_db
+
+
+class TestDataSetCloneViewPost:
+    @pytest.fixture
+    def url(self, data_set):
+        return reverse("data_set_clone", kwargs={"data_set_id": data_set.id})
+
+    @patch("catalog.views.clone_data_set_task.apply_async")
+    def test_creates_data_set_and_queues_clone_after_commit(
+        self, mock_task, admin_api_client, url, data_set, django_capture_on_commit_callbacks
+    ):
+        # When
+        with django_capture_on_commit_callbacks(execute=True):
+            response = admin_api_client.post(url, {"name": "Staging"}, format="json")
+
+        # Then
+        assert response.status_code == status.HTTP_202_ACCEPTED
+        clone = DataSet.objects.get(id=response.data["data_set_id"])
+        assert clone.name == "Staging"
+        mock_task.assert_called_once_with(args=[data_set.id, clone.id], task_id=response.data["task_id"])
+
+    def test_requires_admin_user(self, api_client, url):
+        response = api_client.post(url, {"name": "Staging"}, format="json")
+
+        assert response.status_code == status.HTTP_403_FORBIDDEN
+
+
+class TestDataSetCloneStatusViewGet:
+    @patch("catalog.views.AsyncResult")
+    def test_returns_progress(self, mock_async_result, admin_api_client):
+        # Given
+        mock_async_result.return_value.status = "PROGRESS"
+        mock_async_result.return_value.info = {"stage": "products", "copied": 2000, "total": 5000}
+
+        # When
+        response = admin_api_client.get(reverse("data_set_clone_status", kwargs={"task_id": "task-1"}))
+
+        # Then
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data == {
+            "task_id": "task-1",
+            "status": "PROGRESS",
+            "stage": "products",
+            "copied": 2000,
+            "total": 5000,
+            "error": None,
+        }
@@ -20,7 +20,7 @@ class TestDataSetDocumentSourceViewPost:
     def payload(self):
         return {"plugin_name": "Source 1", "config": {}}
 
-    @patch("catalog.views.sync_document_source.apply_async")
+    @patch("catalog.views.sync_document_source.apply_async_for_data_set")
     def test_creates_document_source_and_triggers_task(self, mock_task, admin_api_client, url, payload, data_set):
         fake_task = Mock()
         fake_task.id = "fake_id"
@@ -32,7 +32,7 @@ class TestDataSetDocumentSourceViewPost:
         source = DocumentSource.objects.get()
         assert source.plugin_name == "Source 1"
         assert source.data_set == data_set
-        mock_task.assert_called_once_with(args=[source.id])
+        mock_task.assert_called_once_with(data_set.id, args=[source.id])
 
     def test_requires_admin_user(self, api_client, url, payload):
         response = api_client.post(url, payload, format="json")
@@ -20,7 +20,7 @@ class TestDataSetProductSourceViewPost:
     def payload(self):
         return {"plugin_name": "Source 1", "config": {}}
 
-    @patch("catalog.views.sync_product_source.apply_async")
+    @patch("catalog.views.sync_product_source.apply_async_for_data_set")
     def test_creates_product_source_and_triggers_task(self, mock_task, admin_api_client, url, payload, data_set):
         fake_task = Mock()
         fake_task.id = "fake_id"
@@ -32,7 +32,7 @@ class TestDataSetProductSourceViewPost:
         source = ProductSource.objects.get()
         assert source.plugin_name == "Source 1"
         assert source.data_set == data_set
-        mock_task.assert_called_once_with(args=[source.id])
+        mock_task.assert_called_once_with(data_set.id, args=[source.id])
 
     def test_requires_admin_user(self, api_client, url, payload):
         response = api_client.post(url, payload, format="json")
@@ -56,3 +56,68 @@ class TestDataSetProductSourceViewGet:
         response = api_client.get(url, format="json")
 
         assert response.status_code == status.HTTP_403_FORBIDDEN
+
+
+class TestDataSetProductSourceViewSchedule:
+    @pytest.fixture
+    def source_url(self, data_set):
+        def build(source):
+            return reverse(
+                "data_set_product_source_details",
+                kwargs={"data_set_id": data_set.id, "product_source_id": source.id},
+            )
+
+        return build
+
+    @patch("catalog.views.sync_product_source.apply_async_for_data_set")
+    def test_creates_source_with_schedule(self, mock_task, admin_api_client, url):
+        mock_task.return_value = Mock(id="fake_id")
+        payload = {"plugin_name": "Source 1", "config": {}, "sync_cron": "0 2 * * *", "sync_mode": "incremental"}
+
+        response = admin_api_client.post(url, payload, format="json")
+
+        assert response.status_code == status.HTTP_201_CREATED
+        source = ProductSource.objects.get()
+        assert source.sync_cron == "0 2 * * *"
+        assert source.sync_periodic_task is not None
+
+    def test_rejects_invalid_cron_expression(self, admin_api_client, url):
+        payload = {"plugin_name": "Source 1", "config": {}, "sync_cron": "every night"}
+
+        response = admin_api_client.post(url, payload, format="json")
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert "sync_cron" in response.data
+
+    def test_rejects_both_interval_and_cron(self, admin_api_client, data_set, source_url):
+        source = baker.make(ProductSource, data_set=data_set, sync_interval=60)
+
+        response = admin_api_client.patch(source_url(source), {"sync_cron": "0 2 * * *"}, format="json")
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    def test_clears_schedule(self, admin_api_client, data_set, source_url):
+        source = baker.make(ProductSource, data_set=data_set, sync_interval=60)
+        admin_api_client.patch(source_url(source), {"sync_interval": 30}, format="json")
+
+        response = admin_api_client.patch(source_url(source), {"sync_interval": None}, format="json")
+
+        assert response.status_code == status.HTTP_200_OK
+        source.refresh_from_db()
+        assert source.sync_periodic_task is None
+
+
+class TestSyncDataSetProductSourceView:
+    @patch("catalog.views.sync_product_source.apply_async_for_data_set")
+    def test_routes_sync_to_data_set_queue(self, mock_task, admin_api_client, data_set):
+        mock_task.return_value = Mock(id="fake_id")
+        source = baker.make(ProductSource, data_set=data_set)
+        sync_url = reverse(
+            "data_set_product_source_sync", kwargs={"data_set_id": data_set.id, "product_source_id": source.id}
+        )
+
+        response = admin_api_client.post(sync_url, format="json")
+
+        assert response.status_code == status.HTTP_202_ACCEPTED
+        assert response.data["task_id"] == "fake_id"
+        mock_task.assert_called_once_with(data_set.id, args=[source.id])
@@ -0,0 +1,60 @@
+from unittest.mock import patch
+
+import pytest
+from django.urls import reverse
+from model_bakery import baker
+from rest_framework import status
+
+from catalog.models import ProductSource
+from sync.locks import SyncLeaseState
+from sync.tasks import PRODUCT_SOURCE
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture
+def product_source(data_set):
+    return baker.make(ProductSource, data_set=data_set)
+
+
+@pytest.fixture
+def url(data_set, product_source):
+    return reverse(
+        "data_set_product_source_sync",
+        kwargs={"data_set_id": data_set.id, "product_source_id": product_source.id},
+    )
+
+
+class TestSyncDataSetProductSourceViewGet:
+    @patch("catalog.views.SyncLease")
+    def test_returns_lease_state(self, lease_class, admin_api_client, url, product_source):
+        # Given
+        lease_class.return_value.get_state.return_value = SyncLeaseState(
+            running=True, follow_up_requested=True, expires_in=120
+        )
+
+        # When
+        response = admin_api_client.get(url)
+
+        # Then
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data == {"running": True, "follow_up_requested": True, "expires_in": 120}
+        lease_class.assert_called_once_with(PRODUCT_SOURCE, product_source.id)
+
+    @patch("catalog.views.SyncLease")
+    def test_returns_idle_state(self, lease_class, admin_api_client, url):
+        # Given
+        lease_class.return_value.get_state.return_value = SyncLeaseState(
+            running=False, follow_up_requested=False, expires_in=None
+        )
+
+        # When
+        response = admin_api_client.get(url)
+
+        # Then
+        assert response.data == {"running": False, "follow_up_requested": False, "expires_in": None}
+
+    def test_requires_admin_user(self, api_client, url):
+        response = api_client.get(url)
+
+        assert response.status_code == status.HTTP_403_FORBIDDEN
@@ -6,6 +6,12 @@ urlpatterns = [
     path("api/sync", views.SyncAllSourcesView.as_view(), name="all_sources_sync"),
     path("api/data_sets", views.DataSetListView.as_view(), name="data_set_list"),
     path("api/data_sets/<int:data_set_id>", views.DataSetDetailView.as_view(), name="data_set_detail"),
+    path("api/data_sets/<int:data_set_id>/clone", views.DataSetCloneView.as_view(), name="data_set_clone"),
+    path(
+        "api/data_sets/clone_tasks/<str:task_id>",
+        views.DataSetCloneStatusView.as_view(),
+        name="data_set_clone_status",
+    ),
     path("api/data_sets/<int:data_set_id>/users", views.DataSetUserListView.as_view(), name="data_set_user_list"),
     path(
         "api/data_sets/<int:data_set_id>/users/<int:user_id>",
@@ -13,6 +19,16 @@ urlpatterns = [
         name="data_set_user_details",
     ),
     path("api/data_sets/<int:data_set_id>/products", views.ProductListView.as_view(), name="data_set_product_list"),
+    path(
+        "api/data_sets/<int:data_set_id>/products/import",
+        views.ProductImportView.as_view(),
+        name="data_set_product_import",
+    ),
+    path(
+        "api/data_sets/<int:data_set_id>/products/export",
+        views.ProductExportView.as_view(),
+        name="data_set_product_export",
+    ),
     path(
         "api/data_sets/<int:data_set_id>/product_sources",
         views.DataSetProductSourceListView.as_view(),
@@ -40,6 +56,16 @@ urlpatterns = [
         name="data_set_product_source_sync",
     ),
     path("api/data_sets/<int:data_set_id>/documents", views.DocumentListView.as_view(), name="data_set_document_list"),
+    path(
+        "api/data_sets/<int:data_set_id>/documents/import",
+        views.DocumentImportView.as_view(),
+        name="data_set_document_import",
+    ),
+    path(
+        "api/data_sets/<int:data_set_id>/documents/export",
+        views.DocumentExportView.as_view(),
+        name="data_set_document_export",
+    ),
     path(
         "api/data_sets/<int:data_set_id>/document_sources",
         views.DataSetDocumentSourceListView.as_view(),
@@ -1,10 +1,18 @@
+from typing import AsyncIterator, Iterator
+
+from asgiref.sync import sync_to_async
+from celery.result import AsyncResult
+from celery.utils import uuid
 from django.db import transaction
 from django.db.models import Count
+from django.http import StreamingHttpResponse
+from django.shortcuts import get_object_or_404
 from drf_yasg import openapi
 from drf_yasg.utils import swagger_auto_schema
 from rest_framework import status
 from rest_framework.generics import GenericAPIView, ListAPIView, ListCreateAPIView, RetrieveAPIView
 from rest_framework.pagination import PageNumberPagination
+from rest_framework.parsers import MultiPartParser
 from rest_framework.permissions import IsAdminUser, IsAuthenticated
 from rest_framework.response import Response
 from rest_framework.views import APIView
@@ -16,7 +24,11 @@ from agent.core.registries.language_models import LanguageModelRegistry
 from agent.models import AgenticExecution, Message
 from agent.models.conversation import ConversationFile
 from agent.services import AgentPreconfigurationService
+from sync.locks import SyncLease
 from sync.tasks import (
+    DOCUMENT_SOURCE,
+    ECOMMERCE_INTEGRATION,
+    PRODUCT_SOURCE,
     sync_all_document_sources,
     sync_all_product_sources,
     sync_all_sources,
@@ -28,8 +40,16 @@ from sync.tasks import (
     sync_product_source,
 )
 
+from .bulk import DOCUMENTS, PRODUCTS, BulkImportError, CatalogExporter, CatalogImporter, CatalogTable, detect_format
+from .cloning import create_data_set_clone
 from .models import DataSet, DocumentSource, ECommerceIntegration, ProductSource
 from .serializers import (
+    CatalogExportQuerySerializer,
+    CatalogImportResultSerializer,
+    CatalogImportSerializer,
+    DataSetCloneResponseSerializer,
+    DataSetCloneSerializer,
+    DataSetCloneStatusSerializer,
     DataSetCreateSerializer,
     DataSetSerializer,
     DocumentSerializer,
@@ -38,7 +58,9 @@ from .serializers import (
     ProductSerializer,
     ProductSourceSerializer,
     SyncResponseSerializer,
+    SyncStatusSerializer,
 )
+from .tasks import clone_data_set_task
 
 
 class SyncAllSourcesView(APIView):
@@ -155,6 +177,56 @@ class DataSetDetailView(RetrieveAPIView):
         return Response(status=status.HTTP_204_NO_CONTENT)
 
 
+class DataSetCloneView(APIView):
+    permission_classes = [IsAdminUser]
+
+    @swagger_auto_schema(
+        operation_description="Clone a data set with its products, documents, embeddings, sources and agents",
+        request_body=DataSetCloneSerializer,
+        manual_parameters=[
+            openapi.Parameter(
+                "data_set_id", openapi.IN_PATH, description="ID of the data set", type=openapi.TYPE_INTEGER
+            )
+        ],
+        responses={202: DataSetCloneResponseSerializer},
+    )
+    def post(self, request, data_set_id, *args, **kwargs):
+        data_set = get_object_or_404(DataSet, id=data_set_id)
+        serializer = DataSetCloneSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        clone = create_data_set_clone(data_set, serializer.validated_data["name"])
+        task_id = uuid()
+        # The task reads the new data set, so it's only queued once the data set is committed.
+        transaction.on_commit(lambda: clone_data_set_task.apply_async(args=[data_set.id, clone.id], task_id=task_id))
+        response = DataSetCloneResponseSerializer({"task_id": task_id, "data_set_id": clone.id})
+        return Response(response.data, status=status.HTTP_202_ACCEPTED)
+
+
+class DataSetCloneStatusView(APIView):
+    permission_classes = [IsAdminUser]
+
+    @swagger_auto_schema(
+        operation_description="Get progress of a data set clone",
+        manual_parameters=[
+            openapi.Parameter("task_id", openapi.IN_PATH, description="ID of the clone task", type=openapi.TYPE_STRING)
+        ],
+        responses={200: DataSetCloneStatusSerializer},
+    )
+    def get(self, request, task_id, *args, **kwargs):
+        task_result = AsyncResult(task_id)
+        progress = task_result.info if task_result.status == "PROGRESS" else {}
+        response = {
+            "task_id": task_id,
+            "status": task_result.status,
+            "stage": progress.get("stage"),
+            "copied": progress.get("copied"),
+            "total": progress.get("total"),
+            "error": str(task_result.result) if task_result.status == "FAILURE" else None,
+        }
+        return Response(DataSetCloneStatusSerializer(response).data)
+
+
 class DataSetUserListView(ListCreateAPIView):
     serializer_class = UserSerializer
     permission_classes = [IsAdminUser]
@@ -256,7 +328,7 @@ class DataSetProductSourceListView(ListCreateAPIView):
         # Get data set from URL (it's not passed via request body).
         data_set_id = self.kwargs.get("data_set_id")
         source = serializer.save(data_set_id=data_set_id)
-        task = sync_product_source.apply_async(args=[source.id])
+        task = sync_product_source.apply_async_for_data_set(data_set_id, args=[source.id])
         return task.id
 
 
@@ -334,12 +406,20 @@ class SyncDataSetProductSourcesView(APIView):
 class SyncDataSetProductSourceView(APIView):
     permission_classes = [IsAdminUser]
 
+    @swagger_auto_schema(
+        operation_description="Get synchronization status of a product source",
+        responses={200: SyncStatusSerializer},
+    )
+    def get(self, request, *args, **kwargs):
+        state = SyncLease(PRODUCT_SOURCE, kwargs["product_source_id"]).get_state()
+        return Response(SyncStatusSerializer(state).data)
+
     @swagger_auto_schema(
         operation_description="Sync a product source",
         responses={200: SyncResponseSerializer},
     )
     def post(self, request, *args, **kwargs):
-        task = sync_product_source.apply_async(args=[kwargs["product_source_id"]])
+        task = sync_product_source.apply_async_for_data_set(kwargs["data_set_id"], args=[kwargs["product_source_id"]])
         serializer = SyncResponseSerializer({"task_id": task.id})
         return Response(serializer.data, status=status.HTTP_202_ACCEPTED)
 
@@ -392,6 +472,124 @@ class DocumentListView(ListAPIView):
         return data_set.documents.annotate(chunks_count=Count("chunks")).all()
 
 
+def get_accessible_data_set(request, data_set_id: int) -> DataSet:
+    if request.user.is_staff:
+        return get_object_or_404(DataSet, id=data_set_id)
+    return get_object_or_404(DataSet, id=data_set_id, users=request.user)
+
+
+def stream_async(pieces: Iterator[str]) -> AsyncIterator[str]:
+    """Serves a synchronous iterator to ASGI servers without consuming it upfront.
+
+    Django would read a synchronous streaming response into memory before sending it under ASGI. Pieces are instead
+    pulled one by one on the thread that runs sync code, which keeps using the same database connection.
+    """
+    next_piece = sync_to_async(next, thread_sensitive=True)
+
+    async def stream():
+        while (piece := await next_piece(pieces, None)) is not None:
+            yield piece
+
+    return stream()
+
+
+class CatalogImportView(APIView):
+    parser_classes = (MultiPartParser,)
+    permission_classes = [IsAdminUser]
+    catalog_table: CatalogTable
+
+    def import_catalog(self, request, data_set_id: int) -> Response:
+        data_set = get_object_or_404(DataSet, id=data_set_id)
+        serializer = CatalogImportSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        file = serializer.validated_data["file"]
+        try:
+            result = CatalogImporter(self.catalog_table, data_set).import_file(file, detect_format(file.name))
+        except BulkImportError as e:
+            return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+        return Response(CatalogImportResultSerializer(result).data)
+
+
+class CatalogExportView(APIView):
+    permission_classes = [IsAuthenticated]
+    catalog_table: CatalogTable
+
+    def export_catalog(self, request, data_set_id: int) -> StreamingHttpResponse:
+        data_set = get_accessible_data_set(request, data_set_id)
+        serializer = CatalogExportQuerySerializer(data=request.query_params)
+        serializer.is_valid(raise_exception=True)
+        pieces = CatalogExporter(self.catalog_table, data_set).export(serializer.validated_data["include_embeddings"])
+        return StreamingHttpResponse(stream_async(pieces), content_type="application/x-ndjson")
+
+
+CATALOG_IMPORT_PARAMETERS = [
+    openapi.Parameter("data_set_id", openapi.IN_PATH, description="ID of the data set", type=openapi.TYPE_INTEGER),
+    openapi.Parameter(
+        "file",
+        openapi.IN_FORM,
+        description="CSV or NDJSON file, NDJSON rows may include chunks with embeddings",
+        type=openapi.TYPE_FILE,
+        required=True,
+    ),
+]
+
+CATALOG_EXPORT_PARAMETERS = [
+    openapi.Parameter("data_set_id", openapi.IN_PATH, description="ID of the data set", type=openapi.TYPE_INTEGER),
+    openapi.Parameter(
+        "include_embeddings",
+        openapi.IN_QUERY,
+        description="Include chunks with their embeddings",
+        type=openapi.TYPE_BOOLEAN,
+    ),
+]
+
+
+class ProductImportView(CatalogImportView):
+    catalog_table = PRODUCTS
+
+    @swagger_auto_schema(
+        operation_description="Import products into a data set from a CSV or NDJSON file",
+        manual_parameters=CATALOG_IMPORT_PARAMETERS,
+        responses={200: CatalogImportResultSerializer},
+    )
+    def post(self, request, data_set_id, *args, **kwargs):
+        return self.import_catalog(request, data_set_id)
+
+
+class ProductExportView(CatalogExportView):
+    catalog_table = PRODUCTS
+
+    @swagger_auto_schema(
+        operation_description="Export products of a data set as NDJSON",
+        manual_parameters=CATALOG_EXPORT_PARAMETERS,
+    )
+    def get(self, request, data_set_id, *args, **kwargs):
+        return self.export_catalog(request, data_set_id)
+
+
+class DocumentImportView(CatalogImportView):
+    catalog_table = DOCUMENTS
+
+    @swagger_auto_schema(
+        operation_description="Import documents into a data set from a CSV or NDJSON file",
+        manual_parameters=CATALOG_IMPORT_PARAMETERS,
+        responses={200: CatalogImportResultSerializer},
+    )
+    def post(self, request, data_set_id, *args, **kwargs):
+        return self.import_catalog(request, data_set_id)
+
+
+class DocumentExportView(CatalogExportView):
+    catalog_table = DOCUMENTS
+
+    @swagger_auto_schema(
+        operation_description="Export documents of a data set as NDJSON",
+        manual_parameters=CATALOG_EXPORT_PARAMETERS,
+    )
+    def get(self, request, data_set_id, *args, **kwargs):
+        return self.export_catalog(request, data_set_id)
+
+
 class DataSetDocumentSourceListView(ListCreateAPIView):
     serializer_class = DocumentSourceSerializer
     permission_classes = [IsAdminUser]
@@ -420,7 +618,7 @@ class DataSetDocumentSourceListView(ListCreateAPIView):
         # Get data set from URL (it's not passed via request body).
         data_set_id = self.kwargs.get("data_set_id")
         source = serializer.save(data_set_id=data_set_id)
-        task = sync_document_source.apply_async(args=[source.id])
+        task = sync_document_source.apply_async_for_data_set(data_set_id, args=[source.id])
         return task.id
 
     def create(self, request, *args, **kwargs):
@@ -512,12 +710,20 @@ class SyncDataSetDocumentSourcesView(APIView):
 class SyncDataSetDocumentSourceView(APIView):
     permission_classes = [IsAdminUser]
 
+    @swagger_auto_schema(
+        operation_description="Get synchronization status of a document source",
+        responses={200: SyncStatusSerializer},
+    )
+    def get(self, request, *args, **kwargs):
+        state = SyncLease(DOCUMENT_SOURCE, kwargs["document_source_id"]).get_state()
+        return Response(SyncStatusSerializer(state).data)
+
     @swagger_auto_schema(
         operation_description="Sync a document source",
         responses={200: SyncResponseSerializer},
     )
     def post(self, request, *args, **kwargs):
-        task = sync_document_source.apply_async(args=[kwargs["document_source_id"]])
+        task = sync_document_source.apply_async_for_data_set(kwargs["data_set_id"], args=[kwargs["document_source_id"]])
         serializer = SyncResponseSerializer({"task_id": task.id})
         return Response(serializer.data, status=status.HTTP_202_ACCEPTED)
 
@@ -563,7 +769,7 @@ class DataSetECommerceIntegrationView(GenericAPIView):
         serializer = self.get_serializer(data=request.data)
         serializer.is_valid(raise_exception=True)
         ecommerce_integration = serializer.save(data_set_id=data_set_id)
-        task = sync_ecommerce_integration.apply_async(args=[ecommerce_integration.id])
+        task = sync_ecommerce_integration.apply_async_for_data_set(data_set_id, args=[ecommerce_integration.id])
         response_data = dict(serializer.data)
         response_data["task_id"] = task.task_id
         return Response(response_data, status=status.HTTP_201_CREATED)
@@ -605,6 +811,18 @@ class DataSetECommerceIntegrationView(GenericAPIView):
 class DataSetECommerceIntegrationSyncView(GenericAPIView):
     permission_classes = [IsAdminUser]
 
+    @swagger_auto_schema(
+        operation_description="Get synchronization status of the ecommerce integration",
+        responses={200: SyncStatusSerializer},
+    )
+    def get(self, request, *args, **kwargs):
+        try:
+            ecommerce_integration = ECommerceIntegration.objects.get(data_set_id=kwargs["data_set_id"])
+        except ECommerceIntegration.DoesNotExist:
+            return Response({}, status=status.HTTP_404_NOT_FOUND)
+        state = SyncLease(ECOMMERCE_INTEGRATION, ecommerce_integration.pk).get_state()
+        return Response(SyncStatusSerializer(state).data)
+
     @swagger_auto_schema(
         operation_description="Sync a document source",
         responses={200: SyncResponseSerializer},
@@ -613,7 +831,7 @@ class DataSetECommerceIntegrationSyncView(GenericAPIView):
         data_set_id = kwargs["data_set_id"]
         try:
             ecommerce_integration = ECommerceIntegration.objects.get(data_set_id=data_set_id)
-            task = sync_ecommerce_integration.apply_async(args=(ecommerce_integration.pk,))
+            task = sync_ecommerce_integration.apply_async_for_data_set(data_set_id, args=(ecommerce_integration.pk,))
             serializer = SyncResponseSerializer({"task_id": task.id})
             return Response(serializer.data, status=status.HTTP_202_ACCEPTED)
         except ECommerceIntegration.DoesNotExist:
@@ -1,7 +1,7 @@
 #!/bin/sh
 
 if [ "$RUN_WORKER" = "True" ]; then
-    exec celery -A pecl.celery worker
+    exec celery -A pecl.celery worker ${WORKER_QUEUES:+-Q "$WORKER_QUEUES"}
 elif [ "$RUN_BEAT" = "True" ]; then
     exec celery -A pecl.celery beat --loglevel=info
 else
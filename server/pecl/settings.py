@@ -17,6 +17,7 @@ from datetime import timedelta
 from pathlib import Path
 
 from environ import Env
+from kombu import Queue
 
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
 BASE_DIR = Path(__file__).resolve().parent.parent
@@ -80,6 +81,7 @@ INSTALLED_APPS = [
     "sync",
     "drf_yasg",
     "django_filters",
+    "django_celery_beat",
 ]
 
 MIDDLEWARE = [
@@ -218,13 +220,96 @@ CELERY_BROKER_URL = env.str("ECL_CELERY_BROKER_URL")
 CELERY_RESULT_BACKEND = env.str("ECL_CELERY_RESULT_BACKEND")
 CELERY_TIMEZONE = env.str("ECL_CELERY_TIMEZONE")
 CELERY_BROKER_CONNECTION_RETRY_ON_STARTUP = True
+# Periodic tasks are kept in the database, so that source sync schedules can be managed through the API.
+CELERY_BEAT_SCHEDULER = "django_celery_beat.schedulers:DatabaseScheduler"
 CELERY_BEAT_SCHEDULE = {
     "clean_uploaded_files": {
         "task": "agent.tasks.clean_uploaded_files",
         "schedule": timedelta(hours=1),
     },
+    "clean_graph_checkpoints": {
+        "task": "agent.tasks.clean_graph_checkpoints",
+        "schedule": timedelta(hours=1),
+    },
+}
+
+# Interactive work gets its own queues, so that a large sync or re-index doesn't delay chat responses.
+# Lower priority values are served first within a queue (Redis transport).
+CELERY_TASK_ROUTES = {
+    "agent.tasks.respond_to_user_message_task": {"queue": "interactive", "priority": 0},
+    "agent.tasks.process_file_upload_task": {"queue": "interactive", "priority": 3},
+    "agent.tasks.compact_conversation_memory_task": {"queue": "agentic", "priority": 9},
+    "agent.agentic_execution.tasks.run_agentic_execution_task": {"queue": "agentic", "priority": 3},
+    "sync.tasks.sync_all_sources": {"queue": "sync", "priority": 3},
+    "sync.tasks.sync_all_product_sources": {"queue": "sync", "priority": 3},
+    "sync.tasks.sync_all_document_sources": {"queue": "sync", "priority": 3},
+    "sync.tasks.sync_all_ecommerce_integrations": {"queue": "sync", "priority": 3},
+    "sync.tasks.sync_data_set_all_sources": {"queue": "sync", "priority": 3},
+    "sync.tasks.sync_data_set_product_sources": {"queue": "sync", "priority": 3},
+    "sync.tasks.sync_data_set_document_sources": {"queue": "sync", "priority": 3},
+    "sync.tasks.sync_ecommerce_integrations": {"queue": "sync", "priority": 3},
+    "sync.tasks.sync_product_source": {"queue": "sync", "priority": 6},
+    "sync.tasks.sync_document_source": {"queue": "sync", "priority": 6},
+    "sync.tasks.sync_ecommerce_integration": {"queue": "sync", "priority": 6},
+    "sync.tasks.sync_product_webhook": {"queue": "sync", "priority": 0},
+    "catalog.tasks.clone_data_set_task": {"queue": "sync", "priority": 3},
+    "catalog.tasks.index_all_documents_task": {"queue": "indexing", "priority": 3},
+    "catalog.tasks.index_document_task": {"queue": "indexing", "priority": 6},
+    "catalog.tasks.index_product_task": {"queue": "indexing", "priority": 6},
+}
+# Bulk queues split into shards by data set. Workers poll their queues in turns,
+# so a data set flooding its shard doesn't starve data sets in the other shards.
+TASK_FAIR_QUEUE_SHARDS = {
+    "sync": 4,
+    "indexing": 8,
+}
+CELERY_TASK_QUEUES = [
+    Queue(name, routing_key=name)
+    for name in ["celery", "interactive", "agentic", "sync", "indexing"]
+    + [f"{queue}.{shard}" for queue, shards in TASK_FAIR_QUEUE_SHARDS.items() for shard in range(shards)]
+]
+# Workers reserve one task at a time, so queued bulk work isn't held back from other workers.
+CELERY_WORKER_PREFETCH_MULTIPLIER = 1
+# Agentic executions are acknowledged only once they're done, and the broker hands tasks that weren't acknowledged
+# within the visibility timeout to another worker. Executions are stopped after the soft time limit, and killed a
+# little later if they don't stop, so that one still running is never delivered again.
+# The visibility timeout applies to all tasks of the broker: tasks of a worker that was lost as a whole, rather than
+# one of its processes, are only delivered to another worker after it runs out.
+AGENTIC_EXECUTION_TIME_LIMIT_SECONDS = env.int("ECL_AGENTIC_EXECUTION_TIME_LIMIT_SECONDS", 2 * 60 * 60)
+AGENTIC_EXECUTION_HARD_TIME_LIMIT_SECONDS = AGENTIC_EXECUTION_TIME_LIMIT_SECONDS + 5 * 60
+CELERY_BROKER_TRANSPORT_OPTIONS = {
+    "visibility_timeout": env.int(
+        "ECL_CELERY_VISIBILITY_TIMEOUT_SECONDS", AGENTIC_EXECUTION_HARD_TIME_LIMIT_SECONDS + 15 * 60
+    ),
 }
 
+# Lease preventing the same source from being synchronized by two workers at once.
+# It's renewed while the sync runs, so the timeout only decides how long a source stays blocked when its worker dies.
+SYNC_LOCK_REDIS_URL = env.str("ECL_SYNC_LOCK_REDIS_URL", CELERY_BROKER_URL)
+SYNC_LOCK_TIMEOUT_SECONDS = env.int("ECL_SYNC_LOCK_TIMEOUT_SECONDS", 10 * 60)
+
+# Streamed LLM tokens are sent to the conversation's WebSocket group in batches, every this many milliseconds
+# or once this many characters are buffered. 0 sends every token as a separate event.
+CHAT_STREAM_FLUSH_INTERVAL_MS = env.int("ECL_CHAT_STREAM_FLUSH_INTERVAL_MS", 50)
+CHAT_STREAM_FLUSH_MAX_CHARS = env.int("ECL_CHAT_STREAM_FLUSH_MAX_CHARS", 256)
+
+# Answers requested from the conversation stream endpoint run on the ASGI server's event loop instead of a Celery
+# worker, at most this many at once per server process. 0 disables the endpoint.
+CHAT_IN_PROCESS_MAX_CONCURRENCY = env.int("ECL_CHAT_IN_PROCESS_MAX_CONCURRENCY", 0)
+
+# Conversation summaries are generated in the background, at most once per this many seconds per conversation.
+# The lock timeout only matters when a worker dies mid-compaction.
+MEMORY_COMPACTION_DEBOUNCE_SECONDS = env.int("ECL_MEMORY_COMPACTION_DEBOUNCE_SECONDS", 30)
+MEMORY_COMPACTION_LOCK_TIMEOUT_SECONDS = env.int("ECL_MEMORY_COMPACTION_LOCK_TIMEOUT_SECONDS", 5 * 60)
+
+# Agent turns run from Celery save their progress after every step, so that a retried turn resumes where it failed.
+# Progress of turns that were neither completed nor retried is removed after this many hours.
+GRAPH_CHECKPOINT_RETENTION_PERIOD_HOURS = env.int("ECL_GRAPH_CHECKPOINT_RETENTION_PERIOD_HOURS", 24)
+
+# Products synced less than this many seconds ago answer e-commerce connector lookups by SKU from the catalog,
+# instead of the platform's API. 0 disables the cache.
+ECOMMERCE_PRODUCT_CACHE_MAX_AGE_SECONDS = env.int("ECL_ECOMMERCE_PRODUCT_CACHE_MAX_AGE_SECONDS", 15 * 60)
+
 CATALOG_LANGUAGE_MODEL_PROVIDERS = [
     "enthusiast_model_openai.OpenAILanguageModelProvider",
 ]
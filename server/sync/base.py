@@ -1,9 +1,14 @@
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from typing import Generic, List, Type, TypeVar
+from datetime import datetime
+from typing import Generic, List, Optional, Type, TypeVar
 
 from utils.base_registry import BaseRegistry
 
+PRODUCT_SOURCE = "product_source"
+DOCUMENT_SOURCE = "document_source"
+ECOMMERCE_INTEGRATION = "ecommerce_integration"
+
 
 @dataclass
 class DataSetSource:
@@ -63,12 +68,13 @@ class SyncManager(ABC, Generic[T]):
     def __init__(self):
         self.registry = self._build_registry()
 
-    def sync(self, source_id: int):
+    def sync(self, source_id: int, updated_since: Optional[datetime] = None):
         source = self._get_data_set_source(source_id)
-        self.sync_plugin(source)
+        self.sync_plugin(source, updated_since=updated_since)
 
-    def sync_plugin(self, source: DataSetSource):
+    def sync_plugin(self, source: DataSetSource, updated_since: Optional[datetime] = None):
         plugin = self.registry.get_plugin_instance(source)
+        plugin.updated_since = updated_since
         for item_data in plugin.fetch():
             self._sync_item(data_set_id=plugin.data_set_id, item_data=item_data)
 
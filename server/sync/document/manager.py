@@ -32,4 +32,4 @@ class DocumentSyncManager(SyncManager[DocumentDetails]):
                 "content": item_data.content,
             },
         )
-        index_document_task.apply_async([item.id])
+        index_document_task.apply_async_for_data_set(data_set_id, [item.id])
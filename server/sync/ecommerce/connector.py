@@ -0,0 +1,141 @@
+import logging
+from datetime import timedelta
+from typing import Optional, Union
+
+from django.db import DatabaseError, transaction
+from django.utils import timezone
+from enthusiast_common.connectors import ECommercePlatformConnector
+from enthusiast_common.structures import Address, ProductDetails, ProductUpdateDetails, ProductUpsertOutcome
+
+from catalog.models import Product
+
+logger = logging.getLogger(__name__)
+
+
+class CatalogCachedConnector(ECommercePlatformConnector):
+    """Answers SKU lookups of an e-commerce connector from the data set's synced products when possible.
+
+    Products synced or looked up less than ``max_age_seconds`` ago are read from the ``Product`` table instead of
+    the platform's API. Other SKUs are looked up through the wrapped connector, and products it finds are saved to
+    the catalog, so the next lookup is served locally. Products changed through the connector are marked stale.
+    All other calls are passed through.
+    """
+
+    def __init__(self, connector: ECommercePlatformConnector, data_set_id: int, max_age_seconds: int):
+        self._connector = connector
+        self._data_set_id = data_set_id
+        self._max_age = timedelta(seconds=max_age_seconds)
+        self.required_product_create_fields = connector.required_product_create_fields
+        self.max_batch_workers = connector.max_batch_workers
+
+    def get_product_by_sku(self, sku: str) -> Optional[ProductDetails]:
+        result = self.get_products_by_skus([sku])[sku]
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+    def get_products_by_skus(self, skus: list[str]) -> dict[str, Union[Optional[ProductDetails], Exception]]:
+        skus = list(dict.fromkeys(skus))
+        results: dict[str, Union[Optional[ProductDetails], Exception]] = {
+            sku: self._to_product_details(product) for sku, product in self._get_fresh_products(skus).items()
+        }
+
+        missing_skus = [sku for sku in skus if sku not in results]
+        if missing_skus:
+            fetched = self._connector.get_products_by_skus(missing_skus)
+            for product_details in fetched.values():
+                if isinstance(product_details, ProductDetails):
+                    self._save_product(product_details)
+            results.update(fetched)
+
+        return {sku: results[sku] for sku in skus}
+
+    def upsert_products(
+        self, products: list[tuple[str, ProductUpdateDetails]]
+    ) -> dict[str, Union[ProductUpsertOutcome, Exception]]:
+        """Upserts products, deciding between create and update from a single batch lookup.
+
+        Database work happens before and after the concurrent part, which only calls the platform's API.
+        """
+        details_by_sku: dict[str, list[ProductUpdateDetails]] = {}
+        for sku, product_details in products:
+            details_by_sku.setdefault(sku, []).append(product_details)
+        existing_products = self.get_products_by_skus(list(details_by_sku))
+
+        def upsert_all(sku: str) -> ProductUpsertOutcome:
+            existing_product = existing_products[sku]
+            if isinstance(existing_product, Exception):
+                raise existing_product
+            exists = existing_product is not None
+            outcome = None
+            for product_details in details_by_sku[sku]:
+                outcome = self._connector.create_or_update_product(sku, product_details, exists)
+                exists = True
+            return outcome
+
+        results = self._map_concurrently(upsert_all, list(details_by_sku))
+        self._mark_stale(list(details_by_sku))
+        return results
+
+    def create_product(self, product_details: ProductDetails) -> str:
+        product_id = self._connector.create_product(product_details)
+        self._mark_stale([product_details.sku])
+        return product_id
+
+    def update_product(self, sku: str, product_details: ProductUpdateDetails) -> bool:
+        updated = self._connector.update_product(sku, product_details)
+        self._mark_stale([sku])
+        return updated
+
+    def update_stock(self, sku: str, quantity: int) -> bool:
+        return self._connector.update_stock(sku, quantity)
+
+    def update_stock_many(self, items: list[tuple[str, int]]) -> dict[str, Union[bool, Exception]]:
+        return self._connector.update_stock_many(items)
+
+    def create_empty_order(self, email: Optional[str] = None, address: Optional[Address] = None) -> str:
+        return self._connector.create_empty_order(email, address)
+
+    def add_to_order(self, order_id: str, sku: str, quantity: int) -> bool:
+        return self._connector.add_to_order(order_id, sku, quantity)
+
+    def create_order_with_items(
+        self, items: list[tuple[str, int]], email: Optional[str] = None, address: Optional[Address] = None
+    ) -> str:
+        return self._connector.create_order_with_items(items, email, address)
+
+    def get_admin_url_for_order_id(self, order_id: str) -> str:
+        return self._connector.get_admin_url_for_order_id(order_id)
+
+    def _get_fresh_products(self, skus: list[str]) -> dict[str, Product]:
+        products = Product.objects.filter(
+            data_set_id=self._data_set_id, sku__in=skus, synced_at__gte=timezone.now() - self._max_age
+        ).order_by("synced_at")
+        # The most recently synced product wins if several share a SKU.
+        return {product.sku: product for product in products}
+
+    def _save_product(self, product_details: ProductDetails) -> None:
+        from sync.ecommerce.manager import ECommerceSyncManager
+
+        try:
+            with transaction.atomic():
+                ECommerceSyncManager().sync_product(self._data_set_id, product_details)
+        except DatabaseError as e:
+            # The lookup itself succeeded, a product the catalog can't store is just looked up remotely next time.
+            logger.warning(f"Could not save product {product_details.entry_id} to the catalog: {e}")
+
+    def _mark_stale(self, skus: list[str]) -> None:
+        Product.objects.filter(data_set_id=self._data_set_id, sku__in=skus).update(synced_at=None)
+
+    @staticmethod
+    def _to_product_details(product: Product) -> ProductDetails:
+        return ProductDetails(
+            entry_id=product.entry_id,
+            name=product.name,
+            slug=product.slug,
+            description=product.description,
+            sku=product.sku,
+            properties=product.properties,
+            categories=product.categories,
+            price=product.price,
+        )
@@ -1,3 +1,7 @@
+from datetime import datetime
+from typing import Optional
+
+from django.utils import timezone
 from enthusiast_common import ProductDetails
 
 from catalog.models import ECommerceIntegration, Product
@@ -8,25 +12,34 @@ from sync.ecommerce.registry import ECommerceIntegrationPluginRegistry
 class ECommerceSyncManager:
     """Orchestrates synchronisation activities of registered product plugins."""
 
-    def sync(self, source_id: int):
+    def sync(self, source_id: int, updated_since: Optional[datetime] = None):
         integration = ECommerceIntegration.objects.get(id=source_id)
         plugin = self._build_registry().get_plugin_instance(integration)
         product_source = plugin.build_product_source()
+        product_source.updated_since = updated_since
 
         for product_data in product_source.fetch():
-            self._sync_item(data_set_id=plugin.data_set_id, product_data=product_data)
+            self.sync_product(data_set_id=plugin.data_set_id, product_data=product_data)
 
     def _build_registry(self):
         return ECommerceIntegrationPluginRegistry()
 
-    def _sync_item(self, data_set_id: int, product_data: ProductDetails):
-        """Creates a product in the database.
+    def sync_product(self, data_set_id: int, product_data: ProductDetails):
+        """Creates or updates a product in the database and schedules its indexing.
+
+        Products are only indexed again when their content changed, so products confirmed by a sync or a lookup
+        without changes don't cost embedding calls.
 
         Args:
             data_set_id (int): obligatory, a data set to which imported data belongs to.
             product_data (dict): item details.
         """
-        item, created = Product.objects.update_or_create(
+        previous = (
+            Product.objects.filter(data_set_id=data_set_id, entry_id=product_data.entry_id)
+            .only("name", "description")
+            .first()
+        )
+        item, _ = Product.objects.update_or_create(
             data_set_id=data_set_id,
             entry_id=product_data.entry_id,
             defaults={
@@ -37,6 +50,8 @@ class ECommerceSyncManager:
                 "properties": product_data.properties,
                 "categories": product_data.categories,
                 "price": product_data.price,
+                "synced_at": timezone.now(),
             },
         )
-        index_product_task.apply_async([item.id])
+        if previous is None or previous.get_content() != item.get_content() or not item.chunks.exists():
+            index_product_task.apply_async_for_data_set(data_set_id, [item.id])
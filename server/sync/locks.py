@@ -0,0 +1,133 @@
+import logging
+import threading
+import uuid
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Iterator, Optional
+
+import redis
+from django.conf import settings
+
+# Takes the lease, or marks a follow-up run as requested when someone else holds it.
+# Both happen in one script, so a request can't slip in between a failed acquire and the holder's release.
+ACQUIRE_OR_REQUEST_FOLLOW_UP = """
+if redis.call("SET", KEYS[1], ARGV[1], "NX", "EX", ARGV[2]) then
+    return 1
+end
+redis.call("SET", KEYS[2], "1", "EX", ARGV[2])
+return 0
+"""
+
+# Extends the lease, and a follow-up request made while it's held, if the lease is still ours.
+RENEW = """
+if redis.call("GET", KEYS[1]) == ARGV[1] then
+    redis.call("PEXPIRE", KEYS[2], ARGV[2])
+    return redis.call("PEXPIRE", KEYS[1], ARGV[2])
+end
+return 0
+"""
+
+# Releases the lease if it's still ours and returns whether a follow-up run was requested meanwhile,
+# or LEASE_LOST when the lease expired or was taken over.
+LEASE_LOST = -1
+RELEASE = """
+if redis.call("GET", KEYS[1]) == ARGV[1] then
+    redis.call("DEL", KEYS[1])
+    return redis.call("DEL", KEYS[2])
+end
+return -1
+"""
+
+logger = logging.getLogger(__name__)
+
+_client: Optional[redis.Redis] = None
+
+
+def get_redis_client() -> redis.Redis:
+    global _client
+    if _client is None:
+        _client = redis.Redis.from_url(settings.SYNC_LOCK_REDIS_URL, decode_responses=True)
+    return _client
+
+
+@dataclass
+class SyncLeaseState:
+    running: bool
+    follow_up_requested: bool
+    expires_in: Optional[int]
+
+
+class SyncLease:
+    """Redis lease guaranteeing that a single source is never synchronised by two workers at once.
+
+    A sync that can't take the lease records that a follow-up run was requested instead of running. Any number
+    of such requests collapse into one flag, which the holder reads when releasing the lease, so a source gets
+    at most one extra run after the current one, no matter how many times it was triggered in the meantime.
+
+    The lease expires after ``SYNC_LOCK_TIMEOUT_SECONDS`` so that a crashed worker doesn't block the source forever.
+    While the sync runs, ``kept_alive`` renews it every third of that time, so a long sync keeps it.
+    """
+
+    def __init__(self, source_type: str, source_id: int, client: Optional[redis.Redis] = None):
+        self._client = client or get_redis_client()
+        self._timeout = settings.SYNC_LOCK_TIMEOUT_SECONDS
+        self._token = uuid.uuid4().hex
+        self._lease_key = f"sync:lease:{source_type}:{source_id}"
+        self._follow_up_key = f"sync:follow_up:{source_type}:{source_id}"
+
+    def acquire(self) -> bool:
+        """Takes the lease. When it's already held, requests a follow-up run and returns False."""
+        acquired = self._client.eval(
+            ACQUIRE_OR_REQUEST_FOLLOW_UP, 2, self._lease_key, self._follow_up_key, self._token, self._timeout
+        )
+        return bool(acquired)
+
+    def renew(self) -> bool:
+        """Extends the lease by ``SYNC_LOCK_TIMEOUT_SECONDS``. Returns False if it's no longer held."""
+        renewed = self._client.eval(
+            RENEW, 2, self._lease_key, self._follow_up_key, self._token, int(self._timeout * 1000)
+        )
+        return bool(renewed)
+
+    @contextmanager
+    def kept_alive(self) -> Iterator[None]:
+        """Renews the lease in a background thread while the block runs."""
+        stopped = threading.Event()
+
+        def renew_until_stopped():
+            while not stopped.wait(self._timeout / 3):
+                if not self.renew():
+                    logger.error(f"Lease {self._lease_key} was lost before the sync finished.")
+                    return
+
+        heartbeat = threading.Thread(target=renew_until_stopped, name=f"{self._lease_key}:heartbeat", daemon=True)
+        heartbeat.start()
+        try:
+            yield
+        finally:
+            stopped.set()
+            heartbeat.join()
+
+    def release(self) -> bool:
+        """Releases the lease and returns True if another run was requested while it was held.
+
+        If the lease was lost before, e.g. because Redis couldn't be reached to renew it, requests made meanwhile
+        can't be told apart, so True is returned as well and the source is synced again.
+        """
+        follow_up = self._client.eval(RELEASE, 2, self._lease_key, self._follow_up_key, self._token)
+        if follow_up == LEASE_LOST:
+            logger.error(f"Lease {self._lease_key} was lost before the sync finished, requesting another run.")
+            return True
+        return bool(follow_up)
+
+    def get_state(self) -> SyncLeaseState:
+        pipeline = self._client.pipeline()
+        pipeline.ttl(self._lease_key)
+        pipeline.exists(self._follow_up_key)
+        ttl, follow_up_requested = pipeline.execute()
+        running = ttl >= 0
+        return SyncLeaseState(
+            running=running,
+            follow_up_requested=running and bool(follow_up_requested),
+            expires_in=ttl if running else None,
+        )
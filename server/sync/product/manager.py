@@ -1,4 +1,4 @@
-from enthusiast_common import ProductDetails
+from enthusiast_common import ProductDetails, ProductWebhookAction, ProductWebhookEvent
 
 from catalog.models import Product, ProductSource
 from catalog.tasks import index_product_task
@@ -16,6 +16,13 @@ class ProductSyncManager(SyncManager[ProductDetails]):
         source = ProductSource.objects.get(id=source_id)
         return DataSetSource(plugin_name=source.plugin_name, data_set_id=source.data_set_id, config=source.config)
 
+    def apply_webhook_event(self, data_set_id: int, event: ProductWebhookEvent):
+        """Upserts or deletes a single product pushed by a platform webhook."""
+        if event.action == ProductWebhookAction.DELETE:
+            Product.objects.filter(data_set_id=data_set_id, entry_id=event.entry_id).delete()
+        else:
+            self._sync_item(data_set_id=data_set_id, item_data=event.product)
+
     def _sync_item(self, data_set_id: int, item_data: ProductDetails):
         """Creates a product in the database.
 
@@ -34,6 +41,9 @@ class ProductSyncManager(SyncManager[ProductDetails]):
                 "properties": item_data.properties,
                 "categories": item_data.categories,
                 "price": item_data.price,
+                # A product source isn't necessarily the platform behind the e-commerce connector, so its data
+                # mustn't be served by the connector's catalog cache.
+                "synced_at": None,
             },
         )
-        index_product_task.apply_async([item.id])
+        index_product_task.apply_async_for_data_set(data_set_id, [item.id])
@@ -0,0 +1,81 @@
+import json
+
+from celery.schedules import crontab
+from django.conf import settings
+from django.db import transaction
+from django_celery_beat.models import CrontabSchedule, IntervalSchedule, PeriodicTask
+from utils.tasks import get_data_set_queue
+
+from catalog.models import DocumentSource, ECommerceIntegration, ProductSource, ScheduledSyncMixin, SyncMode
+
+SYNC_TASKS = {
+    ProductSource: "sync.tasks.sync_product_source",
+    DocumentSource: "sync.tasks.sync_document_source",
+    ECommerceIntegration: "sync.tasks.sync_ecommerce_integration",
+}
+
+
+def parse_cron(expression: str) -> dict[str, str]:
+    """Splits a standard five-field cron expression (minute, hour, day of month, month, day of week) into fields.
+
+    Raises:
+        ValueError: When the expression is malformed.
+    """
+    fields = expression.split()
+    if len(fields) != 5:
+        raise ValueError("Cron expression must have 5 fields: minute, hour, day of month, month and day of week.")
+    spec = dict(zip(["minute", "hour", "day_of_month", "month_of_year", "day_of_week"], fields))
+    crontab(**spec)
+    return spec
+
+
+class SyncScheduleService:
+    """Keeps the periodic task read by the database beat scheduler in line with a source's sync schedule."""
+
+    @transaction.atomic
+    def apply(self, source: ScheduledSyncMixin) -> None:
+        if not source.is_sync_scheduled:
+            self.remove(source)
+            return
+
+        periodic_task = source.sync_periodic_task or PeriodicTask(name=self._get_task_name(source))
+        periodic_task.task = SYNC_TASKS[type(source)]
+        periodic_task.args = json.dumps([source.pk])
+        periodic_task.kwargs = json.dumps({"incremental": source.sync_mode == SyncMode.INCREMENTAL})
+        periodic_task.queue = get_data_set_queue(periodic_task.task, source.data_set_id)
+        periodic_task.interval = self._get_interval(source)
+        periodic_task.crontab = self._get_crontab(source)
+        periodic_task.enabled = True
+        periodic_task.save()
+
+        if source.sync_periodic_task_id != periodic_task.pk:
+            source.sync_periodic_task = periodic_task
+            source.save(update_fields=["sync_periodic_task"])
+
+    def remove(self, source: ScheduledSyncMixin) -> None:
+        if source.sync_periodic_task_id is None:
+            return
+        PeriodicTask.objects.filter(pk=source.sync_periodic_task_id).delete()
+        source.sync_periodic_task = None
+
+    @staticmethod
+    def _get_task_name(source: ScheduledSyncMixin) -> str:
+        return f"Sync {source._meta.verbose_name} {source.pk}"
+
+    @staticmethod
+    def _get_interval(source: ScheduledSyncMixin):
+        if source.sync_cron:
+            return None
+        interval, _ = IntervalSchedule.objects.get_or_create(
+            every=source.sync_interval, period=IntervalSchedule.MINUTES
+        )
+        return interval
+
+    @staticmethod
+    def _get_crontab(source: ScheduledSyncMixin):
+        if not source.sync_cron:
+            return None
+        schedule, _ = CrontabSchedule.objects.get_or_create(
+            **parse_cron(source.sync_cron), timezone=settings.CELERY_TIMEZONE
+        )
+        return schedule
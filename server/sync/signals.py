@@ -0,0 +1,13 @@
+from django.db.models.signals import post_delete
+from django.dispatch import receiver
+from django_celery_beat.models import PeriodicTask
+
+from catalog.models import DocumentSource, ECommerceIntegration, ProductSource
+
+
+@receiver(post_delete, sender=ProductSource)
+@receiver(post_delete, sender=DocumentSource)
+@receiver(post_delete, sender=ECommerceIntegration)
+def delete_sync_periodic_task(sender, instance, **kwargs):
+    if instance.sync_periodic_task_id is not None:
+        PeriodicTask.objects.filter(pk=instance.sync_periodic_task_id).delete()
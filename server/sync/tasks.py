@@ -1,72 +1,100 @@
 import logging
 
 from celery import shared_task
+from django.utils import timezone
+from utils.tasks import DataSetFairTask
 
-from catalog.models import DocumentSource, ECommerceIntegration, ProductSource
+from catalog.models import DocumentSource, ECommerceIntegration, ProductSource, ScheduledSyncMixin
+from sync.base import DOCUMENT_SOURCE, ECOMMERCE_INTEGRATION, PRODUCT_SOURCE
 from sync.document.manager import DocumentSyncManager
 from sync.ecommerce.manager import ECommerceSyncManager
+from sync.locks import SyncLease
 from sync.product.manager import ProductSyncManager
+from sync.webhooks import ProductWebhookService
 
 logger = logging.getLogger(__name__)
 
 
-@shared_task
-def sync_product_source(source_id: int):
+def _sync_exclusively(
+    task: DataSetFairTask, source_type: str, source: ScheduledSyncMixin, manager, incremental: bool
+) -> None:
+    lease = SyncLease(source_type, source.pk)
+    if not lease.acquire():
+        logger.info(f"{source_type} {source.pk} is already being synchronized, follow-up run requested.")
+        return
+    try:
+        # Items changed while the sync runs may be missed by it, so the next incremental sync starts from here.
+        started_at = timezone.now()
+        updated_since = source.last_synced_at if incremental else None
+        with lease.kept_alive():
+            manager.sync(source_id=source.pk, updated_since=updated_since)
+        type(source).objects.filter(pk=source.pk).update(last_synced_at=started_at)
+    finally:
+        if lease.release():
+            task.apply_async_for_data_set(source.data_set_id, [source.pk])
+
+
+@shared_task(base=DataSetFairTask)
+def sync_product_source(source_id: int, incremental: bool = False):
     product_source = ProductSource.objects.get(pk=source_id)
     if product_source.corrupted:
         logger.info(f"Product source: {product_source.plugin_name} {source_id} corrupted, skipping synchronization.")
         return
-    manager = ProductSyncManager()
-    manager.sync(source_id=source_id)
+    _sync_exclusively(sync_product_source, PRODUCT_SOURCE, product_source, ProductSyncManager(), incremental)
 
 
-@shared_task
-def sync_ecommerce_integration(integration_id: int):
-    _integration = ECommerceIntegration.objects.get(pk=integration_id)
-    manager = ECommerceSyncManager()
-    manager.sync(source_id=integration_id)
+@shared_task(base=DataSetFairTask)
+def sync_ecommerce_integration(integration_id: int, incremental: bool = False):
+    integration = ECommerceIntegration.objects.get(pk=integration_id)
+    _sync_exclusively(
+        sync_ecommerce_integration, ECOMMERCE_INTEGRATION, integration, ECommerceSyncManager(), incremental
+    )
 
 @shared_task
 def sync_data_set_product_sources(data_set_id: int):
     for source in ProductSource.objects.filter(data_set_id=data_set_id):
-        sync_product_source.apply_async([source.id])
+        sync_product_source.apply_async_for_data_set(data_set_id, [source.id])
 
 
 @shared_task
 def sync_all_product_sources():
     for source in ProductSource.objects.all():
-        sync_product_source.apply_async([source.id])
+        sync_product_source.apply_async_for_data_set(source.data_set_id, [source.id])
 
 @shared_task
 def sync_ecommerce_integrations(data_set_id: int):
     for integration in ECommerceIntegration.objects.filter(data_set_id=data_set_id):
-        sync_ecommerce_integration.apply_async((integration.id,))
+        sync_ecommerce_integration.apply_async_for_data_set(data_set_id, (integration.id,))
 
 @shared_task
 def sync_all_ecommerce_integrations():
     for integration in ECommerceIntegration.objects.all():
-        sync_ecommerce_integration.apply_async((integration.id,))
+        sync_ecommerce_integration.apply_async_for_data_set(integration.data_set_id, (integration.id,))
 
-@shared_task
-def sync_document_source(source_id: int):
+@shared_task(base=DataSetFairTask)
+def sync_document_source(source_id: int, incremental: bool = False):
     document_source = DocumentSource.objects.get(pk=source_id)
     if document_source.corrupted:
         logger.info(f"Document source: {document_source.plugin_name} {source_id} corrupted, skipping synchronization.")
         return
-    manager = DocumentSyncManager()
-    manager.sync(source_id=source_id)
+    _sync_exclusively(sync_document_source, DOCUMENT_SOURCE, document_source, DocumentSyncManager(), incremental)
 
 
 @shared_task
 def sync_data_set_document_sources(data_set_id: int):
     for source in DocumentSource.objects.filter(data_set_id=data_set_id):
-        sync_document_source.apply_async([source.id])
+        sync_document_source.apply_async_for_data_set(data_set_id, [source.id])
 
 
 @shared_task
 def sync_all_document_sources():
     for source in DocumentSource.objects.all():
-        sync_document_source.apply_async([source.id])
+        sync_document_source.apply_async_for_data_set(source.data_set_id, [source.id])
+
+
+@shared_task(base=DataSetFairTask)
+def sync_product_webhook(source_type: str, source_id: int, headers: dict[str, str], body: str):
+    ProductWebhookService().apply(source_type, source_id, headers, body.encode())
 
 
 @shared_task
@@ -0,0 +1,209 @@
+from datetime import timedelta
+from unittest.mock import Mock, patch
+
+import pytest
+from django.utils import timezone
+from enthusiast_common import ProductDetails
+from enthusiast_common.structures import ProductUpdateDetails, ProductUpsertOutcome
+from model_bakery import baker
+
+from catalog.models import Product, ProductContentChunk
+from sync.ecommerce.connector import CatalogCachedConnector
+from sync.product.manager import ProductSyncManager
+
+pytestmark = pytest.mark.django_db
+
+MAX_AGE_SECONDS = 600
+
+
+def make_product_details(sku: str) -> ProductDetails:
+    return ProductDetails(
+        entry_id=f"remote-{sku}",
+        name="Remote product",
+        slug="remote-product",
+        description="",
+        sku=sku,
+        properties="",
+        categories="",
+        price=12.5,
+    )
+
+
+@pytest.fixture
+def inner_connector():
+    connector = Mock()
+    connector.required_product_create_fields = {"name"}
+    connector.max_batch_workers = 4
+    return connector
+
+
+@pytest.fixture
+def connector(inner_connector, data_set):
+    return CatalogCachedConnector(inner_connector, data_set.id, MAX_AGE_SECONDS)
+
+
+@pytest.fixture(autouse=True)
+def index_product_task():
+    with patch("sync.ecommerce.manager.index_product_task") as task:
+        yield task
+
+
+class TestGetProductsBySkus:
+    def test_returns_fresh_product_from_catalog(self, connector, inner_connector, data_set):
+        # Given
+        baker.make(Product, data_set=data_set, sku="SKU-1", entry_id="local-1", price=5, synced_at=timezone.now())
+
+        # When
+        product = connector.get_product_by_sku("SKU-1")
+
+        # Then
+        assert product.entry_id == "local-1"
+        inner_connector.get_products_by_skus.assert_not_called()
+
+    def test_looks_up_stale_product_remotely_and_saves_it(self, connector, inner_connector, data_set):
+        # Given
+        stale_at = timezone.now() - timedelta(seconds=MAX_AGE_SECONDS + 1)
+        baker.make(Product, data_set=data_set, sku="SKU-1", entry_id="remote-SKU-1", price=5, synced_at=stale_at)
+        inner_connector.get_products_by_skus.return_value = {"SKU-1": make_product_details("SKU-1")}
+
+        # When
+        product = connector.get_product_by_sku("SKU-1")
+
+        # Then
+        assert product.entry_id == "remote-SKU-1"
+        inner_connector.get_products_by_skus.assert_called_once_with(["SKU-1"])
+        saved_product = Product.objects.get(data_set=data_set, entry_id="remote-SKU-1")
+        assert saved_product.price == 12.5
+        assert saved_product.synced_at > stale_at
+
+    def test_does_not_index_looked_up_product_again_when_content_is_unchanged(
+        self, connector, inner_connector, data_set, index_product_task
+    ):
+        # Given
+        stale_at = timezone.now() - timedelta(seconds=MAX_AGE_SECONDS + 1)
+        product = baker.make(
+            Product,
+            data_set=data_set,
+            sku="SKU-1",
+            entry_id="remote-SKU-1",
+            name="Remote product",
+            description="",
+            price=5,
+            synced_at=stale_at,
+        )
+        baker.make(ProductContentChunk, product=product, content="Remote product")
+        inner_connector.get_products_by_skus.return_value = {"SKU-1": make_product_details("SKU-1")}
+
+        # When
+        connector.get_product_by_sku("SKU-1")
+
+        # Then
+        product.refresh_from_db()
+        assert product.price == 12.5
+        assert product.synced_at > stale_at
+        index_product_task.apply_async_for_data_set.assert_not_called()
+
+    def test_indexes_looked_up_product_when_content_changed(
+        self, connector, inner_connector, data_set, index_product_task
+    ):
+        # Given
+        stale_at = timezone.now() - timedelta(seconds=MAX_AGE_SECONDS + 1)
+        product = baker.make(
+            Product,
+            data_set=data_set,
+            sku="SKU-1",
+            entry_id="remote-SKU-1",
+            name="Old name",
+            price=5,
+            synced_at=stale_at,
+        )
+        baker.make(ProductContentChunk, product=product, content="Old name")
+        inner_connector.get_products_by_skus.return_value = {"SKU-1": make_product_details("SKU-1")}
+
+        # When
+        connector.get_product_by_sku("SKU-1")
+
+        # Then
+        index_product_task.apply_async_for_data_set.assert_called_once_with(data_set.id, [product.id])
+
+    def test_only_looks_up_missing_skus_remotely(self, connector, inner_connector, data_set):
+        # Given
+        baker.make(Product, data_set=data_set, sku="SKU-1", price=5, synced_at=timezone.now())
+        error = RuntimeError("API unavailable")
+        inner_connector.get_products_by_skus.return_value = {"SKU-2": None, "SKU-3": error}
+
+        # When
+        results = connector.get_products_by_skus(["SKU-1", "SKU-2", "SKU-3"])
+
+        # Then
+        inner_connector.get_products_by_skus.assert_called_once_with(["SKU-2", "SKU-3"])
+        assert results["SKU-1"].sku == "SKU-1"
+        assert results["SKU-2"] is None
+        assert results["SKU-3"] is error
+
+    @patch("sync.product.manager.index_product_task")
+    def test_does_not_trust_products_from_product_sources(self, _, connector, inner_connector, data_set):
+        # Given
+        ProductSyncManager()._sync_item(data_set_id=data_set.id, item_data=make_product_details("SKU-1"))
+        inner_connector.get_products_by_skus.return_value = {"SKU-1": None}
+
+        # When
+        product = connector.get_product_by_sku("SKU-1")
+
+        # Then
+        assert product is None
+        inner_connector.get_products_by_skus.assert_called_once_with(["SKU-1"])
+
+    def test_ignores_products_of_other_data_sets(self, connector, inner_connector):
+        # Given
+        baker.make(Product, sku="SKU-1", price=5, synced_at=timezone.now())
+        inner_connector.get_products_by_skus.return_value = {"SKU-1": None}
+
+        # When
+        product = connector.get_product_by_sku("SKU-1")
+
+        # Then
+        assert product is None
+
+
+class TestUpsertProducts:
+    def test_decides_between_create_and_update_from_catalog(self, connector, inner_connector, data_set):
+        # Given
+        baker.make(Product, data_set=data_set, sku="SKU-1", price=5, synced_at=timezone.now())
+        inner_connector.get_products_by_skus.return_value = {"SKU-2": None}
+        inner_connector.create_or_update_product.side_effect = lambda sku, details, exists: (
+            ProductUpsertOutcome.UPDATED if exists else ProductUpsertOutcome.CREATED
+        )
+
+        # When
+        results = connector.upsert_products(
+            [("SKU-1", ProductUpdateDetails(name="A")), ("SKU-2", ProductUpdateDetails(name="B"))]
+        )
+
+        # Then
+        assert results == {"SKU-1": ProductUpsertOutcome.UPDATED, "SKU-2": ProductUpsertOutcome.CREATED}
+        inner_connector.get_products_by_skus.assert_called_once_with(["SKU-2"])
+
+    def test_marks_upserted_products_stale(self, connector, inner_connector, data_set):
+        # Given
+        product = baker.make(Product, data_set=data_set, sku="SKU-1", price=5, synced_at=timezone.now())
+        inner_connector.create_or_update_product.return_value = ProductUpsertOutcome.UPDATED
+
+        # When
+        connector.upsert_products([("SKU-1", ProductUpdateDetails(name="A"))])
+
+        # Then
+        product.refresh_from_db()
+        assert product.synced_at is None
+
+    def test_reports_lookup_errors_per_sku(self, connector, inner_connector):
+        # Given
+        error = RuntimeError("API unavailable")
+        inner_connector.get_products_by_skus.return_value = {"SKU-1": error}
+
+        # When
+        results = connector.upsert_products([("SKU-1", ProductUpdateDetails(name="A"))])
+
+        # Then
+        assert results == {"SKU-1": error}
+        inner_connector.create_or_update_product.assert_not_called()
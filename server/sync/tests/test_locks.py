@@ -0,0 +1,75 @@
+import threading
+import time
+from unittest.mock import MagicMock
+
+import pytest
+
+from sync.locks import LEASE_LOST, RENEW, SyncLease
+
+
+@pytest.fixture
+def client():
+    return MagicMock()
+
+
+@pytest.fixture
+def short_timeout(settings):
+    settings.SYNC_LOCK_TIMEOUT_SECONDS = 0.03
+
+
+class TestSyncLease:
+    def test_renews_lease_while_sync_runs(self, client, short_timeout):
+        # Given
+        lease = SyncLease("product_source", 1, client=client)
+        renewed = threading.Event()
+        client.eval.side_effect = lambda script, *args: renewed.set() or 1
+
+        # When
+        with lease.kept_alive():
+            assert renewed.wait(timeout=1)
+        calls_after_sync = client.eval.call_count
+
+        # Then
+        script, keys_count, lease_key, follow_up_key, token, timeout_ms = client.eval.call_args.args
+        assert script == RENEW
+        assert (lease_key, follow_up_key, timeout_ms) == (
+            "sync:lease:product_source:1",
+            "sync:follow_up:product_source:1",
+            30,
+        )
+        time.sleep(0.05)
+        assert client.eval.call_count == calls_after_sync
+
+    def test_stops_renewing_lost_lease(self, client, short_timeout):
+        # Given
+        client.eval.return_value = 0
+        lease = SyncLease("product_source", 1, client=client)
+
+        # When
+        with lease.kept_alive():
+            time.sleep(0.1)
+
+        # Then
+        assert client.eval.call_count == 1
+
+    def test_requests_another_run_when_lease_was_lost(self, client):
+        # Given
+        client.eval.return_value = LEASE_LOST
+        lease = SyncLease("product_source", 1, client=client)
+
+        # When
+        follow_up = lease.release()
+
+        # Then
+        assert follow_up is True
+
+    def test_release_reports_no_follow_up_when_none_was_requested(self, client):
+        # Given
+        client.eval.return_value = 0
+        lease = SyncLease("product_source", 1, client=client)
+
+        # When
+        follow_up = lease.release()
+
+        # Then
+        assert follow_up is False
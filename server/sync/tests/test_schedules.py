@@ -0,0 +1,103 @@
+import json
+
+import pytest
+from django_celery_beat.models import PeriodicTask
+from model_bakery import baker
+
+from catalog.models import DocumentSource, ProductSource, SyncMode
+from sync.schedules import SyncScheduleService, parse_cron
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture
+def service():
+    return SyncScheduleService()
+
+
+class TestParseCron:
+    def test_splits_expression_into_fields(self):
+        assert parse_cron("*/15 2-5 * * 1-5") == {
+            "minute": "*/15",
+            "hour": "2-5",
+            "day_of_month": "*",
+            "month_of_year": "*",
+            "day_of_week": "1-5",
+        }
+
+    @pytest.mark.parametrize("expression", ["* * * *", "70 * * * *", "* * * * funday"])
+    def test_rejects_invalid_expression(self, expression):
+        with pytest.raises(ValueError):
+            parse_cron(expression)
+
+
+class TestSyncScheduleService:
+    def test_creates_interval_task(self, service, data_set):
+        # Given
+        source = baker.make(ProductSource, data_set=data_set, sync_interval=30)
+
+        # When
+        service.apply(source)
+
+        # Then
+        periodic_task = PeriodicTask.objects.get(pk=source.sync_periodic_task_id)
+        assert periodic_task.task == "sync.tasks.sync_product_source"
+        assert json.loads(periodic_task.args) == [source.pk]
+        assert json.loads(periodic_task.kwargs) == {"incremental": False}
+        assert periodic_task.interval.every == 30
+        assert periodic_task.crontab is None
+
+    def test_creates_incremental_cron_task(self, service, data_set):
+        # Given
+        source = baker.make(DocumentSource, data_set=data_set, sync_cron="0 2 * * *", sync_mode=SyncMode.INCREMENTAL)
+
+        # When
+        service.apply(source)
+
+        # Then
+        periodic_task = PeriodicTask.objects.get(pk=source.sync_periodic_task_id)
+        assert periodic_task.task == "sync.tasks.sync_document_source"
+        assert json.loads(periodic_task.kwargs) == {"incremental": True}
+        assert periodic_task.interval is None
+        assert (periodic_task.crontab.minute, periodic_task.crontab.hour) == ("0", "2")
+
+    def test_updates_existing_task(self, service, data_set):
+        # Given
+        source = baker.make(ProductSource, data_set=data_set, sync_interval=30)
+        service.apply(source)
+        periodic_task_id = source.sync_periodic_task_id
+
+        # When
+        source.sync_interval = None
+        source.sync_cron = "0 3 * * *"
+        service.apply(source)
+
+        # Then
+        assert PeriodicTask.objects.count() == 1
+        periodic_task = PeriodicTask.objects.get(pk=periodic_task_id)
+        assert periodic_task.interval is None
+        assert periodic_task.crontab.hour == "3"
+
+    def test_removes_task_when_schedule_is_cleared(self, service, data_set):
+        # Given
+        source = baker.make(ProductSource, data_set=data_set, sync_interval=30)
+        service.apply(source)
+
+        # When
+        source.sync_interval = None
+        service.apply(source)
+
+        # Then
+        assert not PeriodicTask.objects.exists()
+        assert source.sync_periodic_task is None
+
+    def test_task_is_deleted_with_source(self, service, data_set):
+        # Given
+        source = baker.make(ProductSource, data_set=data_set, sync_interval=30)
+        service.apply(source)
+
+        # When
+        ProductSource.objects.filter(pk=source.pk).delete()
+
+        # Then
+        assert not PeriodicTask.objects.exists()
@@ -0,0 +1,140 @@
+from datetime import datetime, timezone
+from unittest.mock import patch
+
+import pytest
+from model_bakery import baker
+from utils.tasks import get_shard_queue
+
+from catalog.models import ProductSource
+from sync.tasks import PRODUCT_SOURCE, sync_product_source
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture
+def product_source(data_set):
+    return baker.make(ProductSource, data_set=data_set, corrupted=False)
+
+
+@pytest.fixture
+def lease():
+    with patch("sync.tasks.SyncLease") as lease_class:
+        yield lease_class.return_value
+
+
+@pytest.fixture
+def manager():
+    with patch("sync.tasks.ProductSyncManager") as manager_class:
+        yield manager_class.return_value
+
+
+@pytest.fixture
+def apply_async():
+    with patch("sync.tasks.sync_product_source.apply_async") as mock:
+        yield mock
+
+
+class TestSyncProductSource:
+    def test_syncs_source_when_lease_is_acquired(self, product_source, lease, manager, apply_async):
+        # Given
+        lease.acquire.return_value = True
+        lease.release.return_value = False
+
+        # When
+        sync_product_source(product_source.id)
+
+        # Then
+        manager.sync.assert_called_once_with(source_id=product_source.id, updated_since=None)
+        lease.kept_alive.assert_called_once()
+        lease.release.assert_called_once()
+        apply_async.assert_not_called()
+
+    def test_skips_sync_when_source_is_already_being_synced(self, product_source, lease, manager, apply_async):
+        # Given
+        lease.acquire.return_value = False
+
+        # When
+        sync_product_source(product_source.id)
+
+        # Then
+        manager.sync.assert_not_called()
+        lease.release.assert_not_called()
+        apply_async.assert_not_called()
+
+    def test_schedules_follow_up_run_when_requested_during_sync(
+        self, product_source, lease, manager, apply_async, settings
+    ):
+        # Given
+        lease.acquire.return_value = True
+        lease.release.return_value = True
+        settings.TASK_FAIR_QUEUE_SHARDS = {"sync": 4}
+
+        # When
+        sync_product_source(product_source.id)
+
+        # Then
+        shard_queue = get_shard_queue("sync", product_source.data_set_id, 4)
+        apply_async.assert_called_once_with([product_source.id], None, queue=shard_queue)
+
+    def test_releases_lease_when_sync_fails(self, product_source, lease, manager, apply_async):
+        # Given
+        lease.acquire.return_value = True
+        lease.release.return_value = False
+        manager.sync.side_effect = RuntimeError("API unavailable")
+
+        # When
+        with pytest.raises(RuntimeError):
+            sync_product_source(product_source.id)
+
+        # Then
+        lease.release.assert_called_once()
+
+    def test_uses_lease_scoped_to_source(self, product_source, manager, apply_async):
+        # Given
+        with patch("sync.tasks.SyncLease") as lease_class:
+            lease_class.return_value.acquire.return_value = False
+
+            # When
+            sync_product_source(product_source.id)
+
+        # Then
+        lease_class.assert_called_once_with(PRODUCT_SOURCE, product_source.id)
+
+    def test_incremental_sync_fetches_changes_since_last_sync(self, product_source, lease, manager, apply_async):
+        # Given
+        lease.acquire.return_value = True
+        lease.release.return_value = False
+        last_synced_at = datetime(2026, 1, 1, tzinfo=timezone.utc)
+        ProductSource.objects.filter(pk=product_source.pk).update(last_synced_at=last_synced_at)
+
+        # When
+        sync_product_source(product_source.id, incremental=True)
+
+        # Then
+        manager.sync.assert_called_once_with(source_id=product_source.id, updated_since=last_synced_at)
+
+    def test_records_sync_time_after_successful_sync(self, product_source, lease, manager, apply_async):
+        # Given
+        lease.acquire.return_value = True
+        lease.release.return_value = False
+
+        # When
+        sync_product_source(product_source.id)
+
+        # Then
+        product_source.refresh_from_db()
+        assert product_source.last_synced_at is not None
+
+    def test_does_not_record_sync_time_when_sync_fails(self, product_source, lease, manager, apply_async):
+        # Given
+        lease.acquire.return_value = True
+        lease.release.return_value = False
+        manager.sync.side_effect = RuntimeError("API unavailable")
+
+        # When
+        with pytest.raises(RuntimeError):
+            sync_product_source(product_source.id)
+
+        # Then
+        product_source.refresh_from_db()
+        assert product_source.last_synced_at is None
@@ -0,0 +1,158 @@
+import base64
+import hashlib
+import hmac
+import json
+from unittest.mock import patch
+
+import pytest
+from django.urls import reverse
+from enthusiast_common import (
+    ProductDetails,
+    ProductSourcePlugin,
+    ProductWebhookAction,
+    ProductWebhookEvent,
+    ProductWebhookHandler,
+)
+from enthusiast_common.http import verify_hmac_signature
+from enthusiast_common.utils import RequiredFieldsModel
+from model_bakery import baker
+from rest_framework import status
+
+from catalog.models import Product, ProductSource
+from sync.base import PRODUCT_SOURCE
+from sync.webhooks import ProductWebhookService
+
+pytestmark = pytest.mark.django_db
+
+SECRET = "s3cret"
+
+
+class WebhookSourceConfig(RequiredFieldsModel):
+    webhook_secret: str
+
+
+class WebhookProductSource(ProductSourcePlugin, ProductWebhookHandler):
+    NAME = "Webhook source"
+    CONFIGURATION_ARGS = WebhookSourceConfig
+
+    def fetch(self) -> list[ProductDetails]:
+        return []
+
+    def verify_webhook(self, headers, body) -> bool:
+        return verify_hmac_signature(self.CONFIGURATION_ARGS.webhook_secret, body, headers.get("x-signature"))
+
+    def parse_webhook(self, headers, body) -> list[ProductWebhookEvent]:
+        payload = json.loads(body)
+        if payload["deleted"]:
+            return [ProductWebhookEvent(action=ProductWebhookAction.DELETE, entry_id=payload["id"])]
+        product = ProductDetails(
+            entry_id=payload["id"],
+            name=payload["name"],
+            slug="slug",
+            description="",
+            sku="SKU-1",
+            properties="",
+            categories="",
+            price=10.0,
+        )
+        return [ProductWebhookEvent(action=ProductWebhookAction.UPSERT, entry_id=payload["id"], product=product)]
+
+
+@pytest.fixture(autouse=True)
+def plugins(settings):
+    settings.CATALOG_PRODUCT_SOURCE_PLUGINS = [
+        "sync.tests.test_webhooks.WebhookProductSource",
+        "enthusiast_source_sample.SampleProductSource",
+    ]
+
+
+@pytest.fixture
+def product_source(data_set):
+    return baker.make(
+        ProductSource,
+        data_set=data_set,
+        plugin_name="Webhook source",
+        config={"configuration_args": {"webhook_secret": SECRET}},
+    )
+
+
+@pytest.fixture
+def url(product_source):
+    return reverse("product_source_webhook", kwargs={"source_id": product_source.id})
+
+
+def sign(body: bytes) -> str:
+    return base64.b64encode(hmac.new(SECRET.encode(), body, hashlib.sha256).digest()).decode()
+
+
+class TestProductSourceWebhookView:
+    @patch("sync.views.sync_product_webhook.apply_async_for_data_set")
+    def test_accepts_signed_webhook(self, mock_task, api_client, url, product_source):
+        # Given
+        body = json.dumps({"id": "1", "name": "Product", "deleted": False}).encode()
+
+        # When
+        response = api_client.post(url, body, content_type="application/json", HTTP_X_SIGNATURE=sign(body))
+
+        # Then
+        assert response.status_code == status.HTTP_202_ACCEPTED
+        data_set_id, (source_type, source_id, headers, sent_body) = mock_task.call_args.args
+        assert (data_set_id, source_type, source_id) == (product_source.data_set_id, PRODUCT_SOURCE, product_source.id)
+        assert headers["x-signature"] == sign(body)
+        assert sent_body == body.decode()
+
+    @patch("sync.views.sync_product_webhook.apply_async_for_data_set")
+    def test_rejects_invalid_signature(self, mock_task, api_client, url):
+        # Given
+        body = json.dumps({"id": "1", "name": "Product", "deleted": False}).encode()
+
+        # When
+        response = api_client.post(url, body, content_type="application/json", HTTP_X_SIGNATURE=sign(b"other"))
+
+        # Then
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+        mock_task.assert_not_called()
+
+    def test_returns_not_found_for_source_without_webhook_support(self, api_client, data_set):
+        # Given
+        source = baker.make(ProductSource, data_set=data_set, plugin_name="Sample Product Source", config={})
+        url = reverse("product_source_webhook", kwargs={"source_id": source.id})
+
+        # When
+        response = api_client.post(url, b"{}", content_type="application/json")
+
+        # Then
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
+    def test_returns_not_found_for_missing_source(self, api_client):
+        url = reverse("product_source_webhook", kwargs={"source_id": 0})
+
+        response = api_client.post(url, b"{}", content_type="application/json")
+
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
+
+class TestProductWebhookService:
+    @patch("sync.product.manager.index_product_task.apply_async_for_data_set")
+    def test_upserts_product_and_triggers_indexing(self, mock_index, product_source):
+        # Given
+        body = json.dumps({"id": "1", "name": "Updated product", "deleted": False}).encode()
+
+        # When
+        ProductWebhookService().apply(PRODUCT_SOURCE, product_source.id, {}, body)
+
+        # Then
+        product = Product.objects.get(data_set=product_source.data_set, entry_id="1")
+        assert product.name == "Updated product"
+        mock_index.assert_called_once_with(product_source.data_set_id, [product.id])
+
+    def test_deletes_product(self, product_source):
+        # Given
+        baker.make(Product, data_set=product_source.data_set, entry_id="1")
+        body = json.dumps({"id": "1", "deleted": True}).encode()
+
+        # When
+        ProductWebhookService().apply(PRODUCT_SOURCE, product_source.id, {}, body)
+
+        # Then
+        assert not Product.objects.filter(entry_id="1").exists()
@@ -6,4 +6,14 @@ urlpatterns = [
     path("api/plugins/document_source_plugins", views.GetDocumentSourcePlugins.as_view()),
     path("api/plugins/product_source_plugins", views.GetProductSourcePlugins.as_view()),
     path("api/plugins/ecommerce_integration_plugins", views.GetECommerceIntegrationPlugins.as_view()),
+    path(
+        "api/webhooks/product_sources/<int:source_id>",
+        views.ProductSourceWebhookView.as_view(),
+        name="product_source_webhook",
+    ),
+    path(
+        "api/webhooks/ecommerce_integrations/<int:source_id>",
+        views.ECommerceIntegrationWebhookView.as_view(),
+        name="ecommerce_integration_webhook",
+    ),
 ]
@@ -1,13 +1,18 @@
+from django.core.exceptions import ObjectDoesNotExist
 from drf_yasg.utils import swagger_auto_schema
-from rest_framework.permissions import IsAuthenticated
+from rest_framework import status
+from rest_framework.permissions import AllowAny, IsAuthenticated
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
+from sync.base import ECOMMERCE_INTEGRATION, PRODUCT_SOURCE
 from sync.document.registry import DocumentSourcePluginRegistry
 from sync.ecommerce.registry import ECommerceIntegrationPluginRegistry
 from sync.product.registry import ProductSourcePluginRegistry
 from sync.serializers import AvailablePluginsResponseSerializer
+from sync.tasks import sync_product_webhook
 from sync.utils import PluginTypesMixin
+from sync.webhooks import ProductWebhookService
 
 
 class GetDocumentSourcePlugins(APIView, PluginTypesMixin):
@@ -65,3 +70,41 @@ class GetECommerceIntegrationPlugins(APIView, PluginTypesMixin):
         serializer = self.serializer_class(data=self.get_choices(ECommerceIntegrationPluginRegistry))
         serializer.is_valid(raise_exception=True)
         return Response(serializer.data)
+
+
+class ProductSourceWebhookView(APIView):
+    """
+    View receiving product webhooks from the platform a product source is connected to.
+
+    Requests are authenticated by the platform's signature, verified with the secret configured for the source.
+    """
+
+    authentication_classes = []
+    permission_classes = [AllowAny]
+    source_type = PRODUCT_SOURCE
+
+    @swagger_auto_schema(operation_description="Receive a product webhook", responses={202: "Webhook accepted"})
+    def post(self, request, source_id):
+        body = request.body
+        headers = {name.lower(): value for name, value in request.headers.items()}
+        try:
+            handler = ProductWebhookService().get_handler(self.source_type, source_id)
+        except ObjectDoesNotExist:
+            return Response({}, status=status.HTTP_404_NOT_FOUND)
+        if handler is None:
+            return Response({"error": "Source does not support webhooks"}, status=status.HTTP_404_NOT_FOUND)
+        if not handler.verify_webhook(headers, body):
+            return Response({"error": "Invalid signature"}, status=status.HTTP_401_UNAUTHORIZED)
+
+        sync_product_webhook.apply_async_for_data_set(
+            handler.data_set_id, [self.source_type, source_id, headers, body.decode()]
+        )
+        return Response({}, status=status.HTTP_202_ACCEPTED)
+
+
+class ECommerceIntegrationWebhookView(ProductSourceWebhookView):
+    """
+    View receiving product webhooks from the platform an ecommerce integration is connected to.
+    """
+
+    source_type = ECOMMERCE_INTEGRATION
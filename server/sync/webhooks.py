@@ -0,0 +1,38 @@
+from typing import Mapping, Optional
+
+from enthusiast_common import ProductWebhookHandler
+
+from catalog.models import ECommerceIntegration, ProductSource
+from sync.base import ECOMMERCE_INTEGRATION, PRODUCT_SOURCE
+from sync.ecommerce.registry import ECommerceIntegrationPluginRegistry
+from sync.product.manager import ProductSyncManager
+from sync.product.registry import ProductSourcePluginRegistry
+
+
+class ProductWebhookService:
+    """Applies product changes pushed by e-commerce platform webhooks, one product at a time."""
+
+    def get_handler(self, source_type: str, source_id: int) -> Optional[ProductWebhookHandler]:
+        """Returns the configured product source, or None when its plugin doesn't support webhooks.
+
+        Raises:
+            ObjectDoesNotExist: When the source doesn't exist.
+        """
+        if source_type == PRODUCT_SOURCE:
+            source = ProductSource.objects.get(pk=source_id)
+            plugin = ProductSourcePluginRegistry().get_plugin_instance(source)
+        elif source_type == ECOMMERCE_INTEGRATION:
+            integration = ECommerceIntegration.objects.get(pk=source_id)
+            plugin = ECommerceIntegrationPluginRegistry().get_plugin_instance(integration).build_product_source()
+        else:
+            raise ValueError(f"Webhooks are not supported for {source_type}")
+
+        return plugin if isinstance(plugin, ProductWebhookHandler) else None
+
+    def apply(self, source_type: str, source_id: int, headers: Mapping[str, str], body: bytes) -> None:
+        handler = self.get_handler(source_type, source_id)
+        if handler is None:
+            return
+        manager = ProductSyncManager()
+        for event in handler.parse_webhook(headers, body):
+            manager.apply_webhook_event(data_set_id=handler.data_set_id, event=event)
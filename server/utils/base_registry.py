@@ -1,18 +1,47 @@
 import inspect
+import threading
 from importlib import import_module
 from typing import Generic, Type, TypeVar
 
+from django.core.signals import setting_changed
+
 T = TypeVar("T")
 U = TypeVar("U")
 
-class BaseRegistry(Generic[T]):
-    plugin_base: Type[T]
 
-    def _get_plugin_class_by_path(self, path: str) -> Type[T]:
-        return self._get_class_by_path(path, self.plugin_base)
+class ResolvedClassIndex:
+    """Process-wide index of classes resolved from the dotted paths listed in settings.
+
+    Resolving a path imports its module and scans it for subclasses of the base class, which registries used to
+    repeat on every lookup. Each (path, base class) pair is now resolved once per process and shared by all
+    registries. Failed resolutions are remembered too, so optional modules such as an agent's builder aren't
+    looked for again on every call. The index is cleared whenever settings change.
+    """
+
+    def __init__(self):
+        self._classes: dict[tuple[str, type], type | Exception] = {}
+        self._lock = threading.Lock()
+
+    def resolve(self, path: str, base_class: Type[U]) -> Type[U]:
+        key = (path, base_class)
+        result = self._classes.get(key)
+        if result is None:
+            try:
+                result = self._find_class(path, base_class)
+            except (ModuleNotFoundError, ValueError) as e:
+                result = e
+            with self._lock:
+                self._classes[key] = result
+        if isinstance(result, Exception):
+            raise type(result)(*result.args) from result.__cause__
+        return result
+
+    def clear(self) -> None:
+        with self._lock:
+            self._classes.clear()
 
     @staticmethod
-    def _get_class_by_path(path: str, base_class: Type[U]) -> Type[U]:
+    def _find_class(path: str, base_class: Type[U]) -> Type[U]:
         if "." in path:
             module_path, plugin_name = path.rsplit(".", 1)
         else:
@@ -29,3 +58,24 @@ class BaseRegistry(Generic[T]):
         if not plugins:
             raise ValueError(f"No valid plugin classes found in module '{module_path}'.")
         return getattr(plugin_module, plugins[0])
+
+
+resolved_class_index = ResolvedClassIndex()
+
+
+def _clear_resolved_class_index(**kwargs):
+    resolved_class_index.clear()
+
+
+setting_changed.connect(_clear_resolved_class_index, dispatch_uid="clear_resolved_class_index")
+
+
+class BaseRegistry(Generic[T]):
+    plugin_base: Type[T]
+
+    def _get_plugin_class_by_path(self, path: str) -> Type[T]:
+        return self._get_class_by_path(path, self.plugin_base)
+
+    @staticmethod
+    def _get_class_by_path(path: str, base_class: Type[U]) -> Type[U]:
+        return resolved_class_index.resolve(path, base_class)
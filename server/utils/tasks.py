@@ -0,0 +1,32 @@
+from typing import Optional
+
+from celery import Task
+from django.conf import settings
+
+
+class DataSetFairTask(Task):
+    """Task routed to a per-data-set shard of its queue.
+
+    Bulk queues listed in ``TASK_FAIR_QUEUE_SHARDS`` are split into shards, and tasks enqueued with
+    ``apply_async_for_data_set`` go to the shard of their data set. Workers consume shards in turns,
+    so one data set enqueuing thousands of tasks only delays the data sets that share its shard.
+    """
+
+    def apply_async_for_data_set(self, data_set_id: int, args=None, kwargs=None, **options):
+        queue = get_data_set_queue(self.name, data_set_id, options.get("queue"))
+        if queue:
+            options["queue"] = queue
+        return self.apply_async(args, kwargs, **options)
+
+
+def get_data_set_queue(task_name: str, data_set_id: int, queue: Optional[str] = None) -> Optional[str]:
+    """Returns the data set's shard of the task's queue, or None when the queue isn't sharded."""
+    queue = queue or settings.CELERY_TASK_ROUTES.get(task_name, {}).get("queue")
+    shards = settings.TASK_FAIR_QUEUE_SHARDS.get(queue)
+    if not shards:
+        return None
+    return get_shard_queue(queue, data_set_id, shards)
+
+
+def get_shard_queue(queue: str, data_set_id: int, shards: int) -> str:
+    return f"{queue}.{data_set_id % shards}"
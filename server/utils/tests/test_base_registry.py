@@ -0,0 +1,81 @@
+import sys
+from types import ModuleType
+from unittest.mock import patch
+
+import pytest
+from django.test import override_settings
+from utils.base_registry import BaseRegistry, resolved_class_index
+
+
+class Plugin:
+    pass
+
+
+class FirstPlugin(Plugin):
+    pass
+
+
+class SecondPlugin(Plugin):
+    pass
+
+
+plugins_module = ModuleType("registry_test_plugins")
+plugins_module.Plugin = Plugin
+plugins_module.FirstPlugin = FirstPlugin
+plugins_module.SecondPlugin = SecondPlugin
+sys.modules["registry_test_plugins"] = plugins_module
+
+
+class PluginRegistry(BaseRegistry[Plugin]):
+    plugin_base = Plugin
+
+
+@pytest.fixture(autouse=True)
+def clear_index():
+    resolved_class_index.clear()
+    yield
+    resolved_class_index.clear()
+
+
+@pytest.fixture
+def import_module():
+    with patch("utils.base_registry.import_module", wraps=__import__) as mock_import_module:
+        yield mock_import_module
+
+
+def test_resolves_class_by_path():
+    assert PluginRegistry()._get_plugin_class_by_path("registry_test_plugins.SecondPlugin") is SecondPlugin
+
+
+def test_resolves_each_path_once_across_registries(import_module):
+    # When
+    for _ in range(3):
+        PluginRegistry()._get_plugin_class_by_path("registry_test_plugins.FirstPlugin")
+        BaseRegistry._get_class_by_path("registry_test_plugins.FirstPlugin", Plugin)
+
+    # Then
+    import_module.assert_called_once_with("registry_test_plugins")
+
+
+def test_remembers_failed_resolutions(import_module):
+    # When
+    for _ in range(2):
+        with pytest.raises(ModuleNotFoundError, match="Cannot import module 'registry_test_missing'"):
+            PluginRegistry()._get_plugin_class_by_path("registry_test_missing.Plugin")
+        with pytest.raises(ValueError, match="No valid plugin classes"):
+            PluginRegistry()._get_plugin_class_by_path("registry_test_plugins.MissingPlugin")
+
+    # Then
+    assert import_module.call_count == 2
+
+
+def test_clears_index_when_settings_change(import_module):
+    # Given
+    PluginRegistry()._get_plugin_class_by_path("registry_test_plugins.FirstPlugin")
+
+    # When
+    with override_settings(AVAILABLE_AGENTS=[]):
+        PluginRegistry()._get_plugin_class_by_path("registry_test_plugins.FirstPlugin")
+
+    # Then
+    assert import_module.call_count == 2
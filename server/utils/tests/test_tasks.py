@@ -0,0 +1,52 @@
+from unittest.mock import patch
+
+import pytest
+from celery import shared_task
+from utils.tasks import DataSetFairTask
+
+
+@shared_task(base=DataSetFairTask, name="utils.tests.fair_task")
+def fair_task(item_id: int):
+    pass
+
+
+@shared_task(base=DataSetFairTask, name="utils.tests.unsharded_task")
+def unsharded_task(item_id: int):
+    pass
+
+
+@pytest.fixture(autouse=True)
+def routing(settings):
+    settings.CELERY_TASK_ROUTES = {
+        "utils.tests.fair_task": {"queue": "indexing", "priority": 6},
+        "utils.tests.unsharded_task": {"queue": "interactive", "priority": 0},
+    }
+    settings.TASK_FAIR_QUEUE_SHARDS = {"indexing": 4}
+
+
+class TestDataSetFairTask:
+    @patch.object(fair_task, "apply_async")
+    def test_routes_task_to_data_set_shard(self, apply_async):
+        # When
+        fair_task.apply_async_for_data_set(6, [1])
+
+        # Then
+        apply_async.assert_called_once_with([1], None, queue="indexing.2")
+
+    @patch.object(fair_task, "apply_async")
+    def test_keeps_data_sets_in_the_same_shard(self, apply_async):
+        # When
+        fair_task.apply_async_for_data_set(3, [1])
+        fair_task.apply_async_for_data_set(3, [2])
+
+        # Then
+        queues = {call.kwargs["queue"] for call in apply_async.call_args_list}
+        assert queues == {"indexing.3"}
+
+    @patch.object(unsharded_task, "apply_async")
+    def test_leaves_queues_without_shards_to_the_router(self, apply_async):
+        # When
+        unsharded_task.apply_async_for_data_set(6, [1])
+
+        # Then
+        apply_async.assert_called_once_with([1], None)